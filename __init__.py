@@ -14,53 +14,20 @@ import bpy
 
 # Импортируем основные компоненты
 from .core.factories.registration import auto_register_modules, auto_unregister_modules
-# Импортируем обработчики событий напрямую из event_handlers
-from .core.utils.event_handlers import (
-    cloner_chain_update_handler,
-    cloner_collection_update_handler,
-    register_effector_update_handler,
-    unregister_effector_update_handler
-)
-# Импортируем утилиты клонера из duplicator.py
-from .core.utils.duplicator import (
-    get_or_create_duplicate_for_cloner,
-    restore_original_object,
-    cleanup_empty_cloner_collections
-)
-# Импорт функций из различных модулей
-from .core.utils.cloner_effector_utils import update_cloner_with_effectors
-from .core.utils.service_utils import force_update_cloners
-from .operations.cloner_helpers import ClonerChainUpdateHandler
-# Импортируем операторы обновления клонеров
-from .operations.fix_recursion import CLONER_OT_fix_recursion_depth, CLONER_OT_update_all_effectors
-from .operations.fix_recursion_improved import CLONER_OT_fix_effector_issues
-
-# Импортируем UI операторы
-from .ui.operators.cloner_ui_ops import (
-    CLONER_OT_add_effector,
-    CLONER_OT_remove_effector,
-    CLONER_OT_update_active_collection,
-    CLONER_OT_toggle_expanded,
-    CLONER_OT_link_effector,
-    CLONER_OT_unlink_effector,
-    CLONER_OT_add_effector_to_cloner,
-    CLONER_OT_set_active_in_chain,
-    CLONER_OT_refresh_effector
-)
-from .ui.operators.effector_ui_ops import (
-    EFFECTOR_OT_toggle_expanded,
-    EFFECTOR_OT_add_field,
-    EFFECTOR_OT_remove_field,
-    EFFECTOR_OT_auto_link,
-    EFFECTOR_OT_update_stacked_cloners
-)
-from .ui.operators.field_ui_ops import (
-    FIELD_OT_toggle_expanded,
-    FIELD_OT_create_field,
-    FIELD_OT_select_gizmo,
-    FIELD_OT_create_sphere_gizmo,
-    FIELD_OT_adjust_field_strength
-)
+# Обработчики событий устанавливаются по манифесту регистрации
+from .core.utils.event_handlers import register_core_handlers, unregister_core_handlers
+# Восстановление оригиналов и очистка коллекций клонеров при отключении
+from .core.utils.duplicator import restore_original_object, cleanup_empty_cloner_collections
+from .core.utils.config_utils import stop_config_writer
+from .core.utils.preset_store import preload_preset_stores
+from .core.utils import worker_pool
+from . import preferences
+# Операторы регистрируются модулями ui.operators, operations.fix_recursion и
+# operations.fix_recursion_improved по манифесту регистрации
+
+from .core.utils.logging_utils import get_logger
+
+log = get_logger("addon")
 
 
 # Свойства для UI
@@ -146,124 +113,52 @@ def unregister_ui_properties():
     if hasattr(bpy.types.Scene, "effector_to_link"):
         del bpy.types.Scene.effector_to_link
 
-# Классы UI операторов для регистрации
-ui_operators_classes = (
-    # Операторы клонеров
-    CLONER_OT_add_effector,
-    CLONER_OT_remove_effector,
-    CLONER_OT_update_active_collection,
-    CLONER_OT_toggle_expanded,
-    CLONER_OT_link_effector,
-    CLONER_OT_unlink_effector,
-    CLONER_OT_add_effector_to_cloner,
-    CLONER_OT_set_active_in_chain,
-    CLONER_OT_refresh_effector,
-    CLONER_OT_fix_recursion_depth,       # Оператор для исправления проблем с рекурсией
-    CLONER_OT_update_all_effectors,      # Оператор для обновления всех клонеров с эффекторами
-    CLONER_OT_fix_effector_issues,       # Оператор для исправления проблем с эффекторами
-
-    # Операторы эффекторов
-    EFFECTOR_OT_toggle_expanded,
-    EFFECTOR_OT_add_field,
-    EFFECTOR_OT_remove_field,
-    EFFECTOR_OT_auto_link,
-    EFFECTOR_OT_update_stacked_cloners,
-
-    # Операторы полей
-    FIELD_OT_toggle_expanded,
-    FIELD_OT_create_field,
-    FIELD_OT_select_gizmo,
-    FIELD_OT_create_sphere_gizmo,
-    FIELD_OT_adjust_field_strength,
-)
-
 # РЕГИСТРАЦИЯ
 
 def register():
-    print("Registering Advanced Cloners addon...")
+    # Настройки аддона регистрируются первыми: они задают уровни журналирования
+    preferences.register()
+
+    log.debug("Registering Advanced Cloners addon...")
 
     # Register UI properties
-    print("Registering UI properties...")
+    log.debug("Registering UI properties...")
     register_ui_properties()
-    print("UI properties registered")
-
-    # Напрямую регистрируем UI операторы
-    print("Registering UI operators...")
-    for cls in ui_operators_classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"Error registering {cls.__name__}: {e}")
-    print("UI operators registered")
+    log.debug("UI properties registered")
 
     # Register GN modules с использованием автоматической регистрации
-    print("Registering GN modules...")
+    log.debug("Registering GN modules...")
 
     # Автоматическая регистрация эффекторов, клонеров и полей
     auto_register_modules('advanced_cloners.models.effectors')
     auto_register_modules('advanced_cloners.models.cloners')
     auto_register_modules('advanced_cloners.models.fields')
 
-    print("GN modules registered")
+    log.debug("GN modules registered")
 
     # Register UI components с использованием улучшенной автоматической регистрации
-    print("Registering UI components...")
+    log.debug("Registering UI components...")
     auto_register_modules('advanced_cloners.ui')
-    print("UI components registered")
+    log.debug("UI components registered")
 
     # Register operators
-    print("Registering operators...")
+    log.debug("Registering operators...")
     auto_register_modules('advanced_cloners.operations')
-    print("Operators registered")
-
-    # Регистрация обработчика сцены для отслеживания выделения в цепочке клонеров
-    if hasattr(bpy.app.handlers, 'depsgraph_update_post'):
-        if cloner_chain_update_handler not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(cloner_chain_update_handler)
+    log.debug("Operators registered")
 
-    # Регистрация обработчика для обновления выбранной коллекции
-    if hasattr(bpy.app.handlers, 'scene_update_post'):
-        if cloner_collection_update_handler not in bpy.app.handlers.scene_update_post:
-            bpy.app.handlers.scene_update_post.append(cloner_collection_update_handler)
-    elif hasattr(bpy.app.handlers, 'depsgraph_update_post'):
-        if cloner_collection_update_handler not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(cloner_collection_update_handler)
+    # Обработчики bpy.app.handlers из манифеста регистрации
+    register_core_handlers()
 
-    # Регистрация обработчика цепочки клонеров для синхронизации изменений параметров
-    ClonerChainUpdateHandler.register()
+    # Индексы библиотек пресетов строятся в фоновом потоке
+    preload_preset_stores()
 
-    # Регистрация обработчика изменений эффекторов
-    register_effector_update_handler()
-
-    print("Advanced Cloners addon registered successfully")
+    log.debug("Advanced Cloners addon registered successfully")
 
 def unregister():
-    print("Unregistering Advanced Cloners addon...")
-
-    # Напрямую отменяем регистрацию UI операторов
-    print("Unregistering UI operators...")
-    for cls in reversed(ui_operators_classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"Error unregistering {cls.__name__}: {e}")
-    print("UI operators unregistered")
-
-    # Удаляем обработчики сцены
-    if hasattr(bpy.app.handlers, 'depsgraph_update_post'):
-        if cloner_chain_update_handler in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.remove(cloner_chain_update_handler)
-        if cloner_collection_update_handler in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.remove(cloner_collection_update_handler)
-    if hasattr(bpy.app.handlers, 'scene_update_post'):
-        if cloner_collection_update_handler in bpy.app.handlers.scene_update_post:
-            bpy.app.handlers.scene_update_post.remove(cloner_collection_update_handler)
-
-    # Отмена регистрации обработчика цепочки клонеров
-    ClonerChainUpdateHandler.unregister()
-
-    # Отмена регистрации обработчика изменений эффекторов
-    unregister_effector_update_handler()
+    log.debug("Unregistering Advanced Cloners addon...")
+
+    # Снимаем обработчики, перечисленные в манифесте регистрации
+    unregister_core_handlers()
 
     # Восстанавливаем все оригинальные объекты и удаляем дубликаты
     try:
@@ -276,31 +171,39 @@ def unregister():
         cleanup_empty_cloner_collections()
 
     except Exception as e:
-        print(f"Ошибка при восстановлении оригинальных объектов: {e}")
+        log.error("Ошибка при восстановлении оригинальных объектов: %s", e)
+
+    # Дописываем конфигурации, ожидающие фоновой записи
+    stop_config_writer()
+
+    # Останавливаем пул рабочих потоков; незавершенные задачи отменяются
+    worker_pool.shutdown()
 
     # Unregister operators
-    print("Unregistering operators...")
+    log.debug("Unregistering operators...")
     auto_unregister_modules('advanced_cloners.operations')
-    print("Operators unregistered")
+    log.debug("Operators unregistered")
 
     # Unregister UI components с использованием улучшенной автоматической отмены регистрации
-    print("Unregistering UI components...")
+    log.debug("Unregistering UI components...")
     auto_unregister_modules('advanced_cloners.ui')
-    print("UI components unregistered")
+    log.debug("UI components unregistered")
 
     # Unregister GN modules с использованием автоматической отмены регистрации
-    print("Unregistering GN modules...")
+    log.debug("Unregistering GN modules...")
     auto_unregister_modules('advanced_cloners.models.fields')
     auto_unregister_modules('advanced_cloners.models.cloners')
     auto_unregister_modules('advanced_cloners.models.effectors')
-    print("GN modules unregistered")
+    log.debug("GN modules unregistered")
 
     # Unregister UI properties
-    print("Unregistering UI properties...")
+    log.debug("Unregistering UI properties...")
     unregister_ui_properties()
-    print("UI properties unregistered")
+    log.debug("UI properties unregistered")
+
+    log.debug("Advanced Cloners addon unregistered successfully")
 
-    print("Advanced Cloners addon unregistered successfully")
+    preferences.unregister()
 
 # Для поддержки запуска аддона напрямую из Blender Text Editor
 if __name__ == "__main__":
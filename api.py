@@ -0,0 +1,207 @@
+"""
+Python API аддона для скриптов пайплайна.
+
+Пример:
+    import advanced_cloners.api as ac
+    ac.create_cloners([
+        {"type": "GRID", "source": "Cube", "params": {"Count X": 10}},
+        {"type": "LINEAR", "source": "Props", "source_type": "COLLECTION"},
+    ])
+"""
+
+import bpy
+from typing import Dict, List, Any
+
+from .core.utils.transaction import cloner_transaction, request_view_layer_update
+from .core.utils.config_utils import apply_cloner_config, apply_config_values
+from .core.utils.modifiers import reorder_modifiers
+from .models.cloners import AVAILABLE_CLONERS
+
+from .core.utils.logging_utils import get_logger
+
+log = get_logger("addon")
+
+
+def _resolve_source(spec: Dict[str, Any], source_type: str):
+    """
+    Находит исходный объект или коллекцию для спецификации клонера.
+
+    Args:
+        spec: Спецификация клонера
+        source_type: Тип источника ('OBJECT' или 'COLLECTION')
+
+    Returns:
+        bpy.types.Object | bpy.types.Collection | None
+    """
+    source = spec.get("source")
+    if source is None:
+        return None
+
+    data = bpy.data.collections if source_type == 'COLLECTION' else bpy.data.objects
+    if isinstance(source, str):
+        return data.get(source)
+    return source
+
+
+def _get_shared_logic_group(shared_groups: Dict[str, Any], cloner_type: str):
+    """
+    Возвращает общую группу логики для типа клонера, создавая её один раз на пакет.
+
+    Args:
+        shared_groups: Словарь уже созданных общих групп
+        cloner_type: Тип клонера
+
+    Returns:
+        bpy.types.NodeGroup: Группа логики или None, если тип её не использует
+    """
+    # Общая группа логики используется только объектным Grid клонером
+    if cloner_type != "GRID":
+        return None
+
+    if cloner_type not in shared_groups:
+        from .models.cloners.grid_cloner import GridCloner
+        shared_groups[cloner_type] = GridCloner.create_logic_group("_Shared")
+    return shared_groups[cloner_type]
+
+
+def _create_one(context, spec: Dict[str, Any], shared_groups: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Создает один клонер по спецификации без обновления view layer.
+
+    Args:
+        context: Контекст Blender
+        spec: Спецификация клонера
+        shared_groups: Общие группы логики пакета
+
+    Returns:
+        dict: Результат создания {"success", "object", "modifier", "error"}
+    """
+    from .operations.helpers.object_cloner import create_object_cloner
+    from .operations.helpers.collection_cloner import create_collection_cloner
+    from .operations.helpers.stacked_cloner import create_stacked_cloner
+
+    result = {"success": False, "object": None, "modifier": None, "error": None}
+
+    cloner_type = spec.get("type", "GRID")
+    if cloner_type not in AVAILABLE_CLONERS:
+        result["error"] = f"Unknown cloner type: {cloner_type}"
+        return result
+
+    source_type = spec.get("source_type", "OBJECT")
+    source = _resolve_source(spec, source_type)
+    if source is None:
+        result["error"] = f"Source not found: {spec.get('source')}"
+        return result
+
+    modifier = None
+    cloner_obj = None
+
+    if source_type == 'COLLECTION':
+        if create_collection_cloner(context, cloner_type, source.name, update_view_layer=False):
+            cloner_obj = context.view_layer.objects.active
+    elif spec.get("stacked", False):
+        modifier, success = create_stacked_cloner(context, cloner_type, source)
+        if success:
+            cloner_obj = source
+    else:
+        logic_group = _get_shared_logic_group(shared_groups, cloner_type)
+        if create_object_cloner(context, cloner_type, source,
+                                logic_group=logic_group, update_view_layer=False):
+            cloner_obj = context.view_layer.objects.active
+
+    if cloner_obj is None:
+        result["error"] = f"Failed to create {cloner_type} cloner for {spec.get('source')}"
+        return result
+
+    # Модификатор клонера - последний модификатор геометрических нодов на объекте
+    if modifier is None:
+        for mod in reversed(cloner_obj.modifiers):
+            if mod.type == 'NODES' and mod.node_group:
+                modifier = mod
+                break
+
+    if modifier is not None:
+        if spec.get("preset"):
+            apply_cloner_config(modifier, cloner_type, preset_name=spec["preset"])
+        if spec.get("params"):
+            apply_config_values(modifier, spec["params"])
+
+    result["success"] = True
+    result["object"] = cloner_obj.name
+    result["modifier"] = modifier.name if modifier else None
+    return result
+
+
+def create_cloners(specs: List[Dict[str, Any]], context=None) -> List[Dict[str, Any]]:
+    """
+    Создает множество клонеров за одну операцию.
+
+    Обработчики аддона приостановлены на время создания, группы логики
+    одного типа общие для всего пакета, а depsgraph вычисляется один раз в конце.
+
+    Args:
+        specs: Список спецификаций клонеров. Ключи спецификации:
+            type: Тип клонера ('GRID', 'LINEAR', 'CIRCLE'), по умолчанию 'GRID'
+            source: Исходный объект/коллекция или их имя
+            source_type: 'OBJECT' (по умолчанию) или 'COLLECTION'
+            stacked: Создать стековый клонер на исходном объекте
+            preset: Имя пресета из библиотеки пресетов клонеров
+            params: Словарь параметров (имя сокета -> значение)
+        context: Контекст Blender (по умолчанию bpy.context)
+
+    Returns:
+        list: Результаты в порядке спецификаций {"success", "object", "modifier", "error"}
+    """
+    if context is None:
+        context = bpy.context
+
+    results = []
+    shared_groups = {}
+
+    with cloner_transaction(context):
+        for spec in specs:
+            try:
+                results.append(_create_one(context, spec, shared_groups))
+            except Exception as e:
+                log.error("Error creating cloner from spec %s: %s", spec, e)
+                results.append({"success": False, "object": None, "modifier": None, "error": str(e)})
+
+        # Одно вычисление depsgraph на весь пакет - при выходе из транзакции
+        request_view_layer_update(context)
+
+    created = sum(1 for r in results if r["success"])
+    log.debug("Created %s of %s cloners", created, len(specs))
+    return results
+
+
+def reorder_stack(obj, names: List[str], context=None) -> int:
+    """
+    Переставляет стековые клонеры и эффекторы объекта в заданном порядке.
+
+    Перечисленные модификаторы занимают свои прежние позиции стека в порядке
+    names, остальные не двигаются. Перестановка выполняется одним проходом без
+    bpy.ops, а depsgraph вычисляется один раз.
+
+    Args:
+        obj: Объект или его имя
+        names: Имена модификаторов в нужном порядке
+        context: Контекст Blender (по умолчанию bpy.context)
+
+    Returns:
+        int: Число перемещений
+    """
+    if context is None:
+        context = bpy.context
+    if isinstance(obj, str):
+        obj = bpy.data.objects.get(obj)
+    if obj is None:
+        return 0
+
+    with cloner_transaction(context):
+        moves = reorder_modifiers(obj, names)
+        if moves:
+            obj.update_tag()
+            request_view_layer_update(context)
+
+    log.debug("Reordered %s modifiers on %s", moves, obj.name)
+    return moves
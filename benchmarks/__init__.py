@@ -0,0 +1,9 @@
+"""
+Бенчмарки аддона для запуска в Blender без интерфейса.
+
+Набор бенчмарков (см. suite.py):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import suite; suite.main()" -- --output bench.json
+
+Сравнение с сохранённым эталоном (без Blender):
+    python benchmarks/compare.py bench.json benchmarks/baseline.json
+"""
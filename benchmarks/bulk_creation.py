@@ -0,0 +1,84 @@
+"""
+Бенчмарк пакетного создания клонеров: цикл оператора против api.create_cloners.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python benchmarks/bulk_creation.py -- --count 500
+"""
+
+import argparse
+import sys
+import time
+
+import bpy
+import addon_utils
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Bulk cloner creation benchmark")
+    parser.add_argument("--count", type=int, default=500, help="Количество клонеров")
+    parser.add_argument("--type", default="GRID", choices=["GRID", "LINEAR", "CIRCLE"])
+    return parser.parse_args(argv)
+
+
+def reset_scene(count):
+    """Очищает сцену и создает исходные объекты для клонирования."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable("advanced_cloners", default_set=True)
+
+    sources = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"BenchSource_{i:04d}_Mesh")
+        obj = bpy.data.objects.new(f"BenchSource_{i:04d}", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        sources.append(obj.name)
+    return sources
+
+
+def bench_operator_loop(sources, cloner_type):
+    """Один вызов оператора на каждый клонер - как в текущем UI."""
+    start = time.perf_counter()
+    for name in sources:
+        obj = bpy.data.objects[name]
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.create_cloner(cloner_type=cloner_type, source_type='OBJECT')
+    bpy.context.view_layer.update()
+    return time.perf_counter() - start
+
+
+def bench_bulk_api(sources, cloner_type):
+    """Все клонеры одним вызовом api.create_cloners."""
+    import advanced_cloners.api as api
+
+    specs = [{"type": cloner_type, "source": name} for name in sources]
+    start = time.perf_counter()
+    results = api.create_cloners(specs)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r["success"]]
+    if failed:
+        print(f"Bulk API failed for {len(failed)} specs, first error: {failed[0]['error']}")
+    return elapsed
+
+
+def main():
+    args = parse_args()
+
+    sources = reset_scene(args.count)
+    operator_time = bench_operator_loop(sources, args.type)
+    operator_groups = len(bpy.data.node_groups)
+
+    sources = reset_scene(args.count)
+    bulk_time = bench_bulk_api(sources, args.type)
+    bulk_groups = len(bpy.data.node_groups)
+
+    print("")
+    print(f"Cloners: {args.count} x {args.type}")
+    print(f"Operator loop: {operator_time:8.3f} s  ({operator_groups} node groups)")
+    print(f"Bulk API:      {bulk_time:8.3f} s  ({bulk_groups} node groups)")
+    if bulk_time > 0:
+        print(f"Speedup:       {operator_time / bulk_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Сравнение результатов бенчмарков с сохранённым эталоном. Blender не нужен.
+
+    python benchmarks/compare.py bench.json benchmarks/baseline.json --threshold 0.15
+    python benchmarks/compare.py bench.json benchmarks/baseline.json --update-baseline
+
+Код возврата 1, если медиана какого-либо случая выросла больше порога.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare benchmark results with a baseline")
+    parser.add_argument("results", help="JSON с результатами suite.py")
+    parser.add_argument("baseline", help="JSON с эталонными результатами")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Допустимый относительный рост медианы (0.10 = 10%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="Изменения меньше этого значения, мс, не считаются регрессией")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Сохранить результаты как новый эталон")
+    return parser.parse_args(argv)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.10, min_delta_ms=0.05):
+    """
+    Сравнивает медианы случаев.
+
+    Args:
+        results: Новые результаты ({"results": {случай: статистика}})
+        baseline: Эталонные результаты
+        threshold: Допустимый относительный рост медианы
+        min_delta_ms: Минимальное абсолютное изменение, мс, для регрессии
+
+    Returns:
+        list: Строки (случай, эталон мс, текущее мс, отношение, статус)
+    """
+    rows = []
+    current = results.get("results", {})
+    reference = baseline.get("results", {})
+
+    for case in sorted(set(current) | set(reference)):
+        if case not in reference:
+            rows.append((case, None, current[case]["median_ms"], None, "new"))
+            continue
+        if case not in current:
+            rows.append((case, reference[case]["median_ms"], None, None, "missing"))
+            continue
+
+        old = reference[case]["median_ms"]
+        new = current[case]["median_ms"]
+        ratio = new / old if old > 0 else float("inf")
+
+        status = "ok"
+        if new - old > min_delta_ms and ratio > 1.0 + threshold:
+            status = "REGRESSION"
+        elif old - new > min_delta_ms and ratio < 1.0 - threshold:
+            status = "faster"
+        rows.append((case, old, new, ratio, status))
+
+    return rows
+
+
+def _fmt(value, spec):
+    return format(value, spec) if value is not None else "-"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        shutil.copyfile(args.results, args.baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    results = load(args.results)
+    baseline = load(args.baseline)
+
+    params = results.get("meta", {}).get("params")
+    base_params = baseline.get("meta", {}).get("params")
+    if params != base_params:
+        print(f"Warning: parameters differ: results {params}, baseline {base_params}")
+
+    rows = compare(results, baseline, args.threshold, args.min_delta_ms)
+
+    print(f"{'case':24s} {'baseline ms':>12s} {'current ms':>12s} {'ratio':>7s}  status")
+    for case, old, new, ratio, status in rows:
+        print(f"{case:24s} {_fmt(old, '12.3f')} {_fmt(new, '12.3f')} {_fmt(ratio, '7.2f')}  {status}")
+
+    regressions = [row for row in rows if row[4] == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Задержка связи и отвязки эффектора в зависимости от длины цепочки эффекторов.
+
+Для каждого размера цепочки строится один клонер с N связанными эффекторами,
+затем последний эффектор многократно отвязывается и связывается снова через
+update_cloner_with_effectors. При обновлении цепочки по разнице
+(patch_effector_chain) задержка почти не зависит от N.
+
+Результаты пишутся в формате suite.py (ключи "effector_link/N", "effector_unlink/N"),
+поэтому сравниваются с эталоном через benchmarks/compare.py.
+
+Бенчмарк еще не запускался в Blender: замеров до и после patch_effector_chain
+нет, и утверждение о независимости от N пока не проверено. Для сравнения
+запустите его на ревизии до patch_effector_chain (с --output before.json) и на
+текущей, затем:
+    python benchmarks/compare.py effector_chain.json before.json
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import effector_chain; effector_chain.main()" -- \
+        --sizes 1,20 --repeat 20 --output effector_chain.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import bpy
+
+from . import scene as bench_scene
+from .suite import summarize, timed
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Effector link/unlink latency by chain length")
+    parser.add_argument("--sizes", default="1,20", help="Длины цепочек эффекторов через запятую")
+    parser.add_argument("--repeat", type=int, default=20, help="Число пар отвязка/связь на размер")
+    parser.add_argument("--output", default="effector_chain.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def bench_chain(size, repeat):
+    """
+    Отвязка и связь последнего эффектора цепочки длины size.
+
+    Returns:
+        tuple: (выборки связи, выборки отвязки) в секундах
+    """
+    scene_info = bench_scene.build_scene(cloners=1, effectors=size)
+    if not scene_info["effectors"]:
+        return [], []
+
+    obj_name, effector_name = scene_info["effectors"][-1]
+    obj = bpy.data.objects[obj_name]
+    cloner_mod = bench_scene.find_cloner_modifier(obj)
+
+    link_samples = []
+    unlink_samples = []
+    for _ in range(repeat):
+        unlink_samples.append(timed(bench_scene.unlink_effector, obj, cloner_mod, effector_name))
+        link_samples.append(timed(bench_scene.link_effector, obj, cloner_mod, effector_name))
+    return link_samples, unlink_samples
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    results = {}
+    for size in sizes:
+        link_samples, unlink_samples = bench_chain(size, args.repeat)
+        if not link_samples:
+            print(f"effectors={size}: no effectors created, skipped")
+            continue
+        results[f"effector_link/{size}"] = summarize(link_samples)
+        results[f"effector_unlink/{size}"] = summarize(unlink_samples)
+        print(f"effectors={size:3d}  link {results[f'effector_link/{size}']['median_ms']:8.2f} ms  "
+              f"unlink {results[f'effector_unlink/{size}']['median_ms']:8.2f} ms")
+
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"sizes": sizes, "repeat": args.repeat},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
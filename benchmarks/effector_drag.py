@@ -0,0 +1,113 @@
+"""
+Время обработчиков аддона при перетаскивании параметра эффектора.
+
+Сцена строится дважды: с прежним копированием параметров обработчиком
+(effector_drivers.ENABLED = False) и с передачей параметров драйверами.
+На каждом шаге «перетаскивания» меняется Strength эффектора и пересчитывается
+depsgraph; время обработчиков берется из интервалов профилировщика (категория handler).
+
+Результаты пишутся в формате suite.py (ключи "effector_drag_handler/<режим>",
+"effector_drag_step/<режим>"), сравнение - benchmarks/compare.py.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import effector_drag; effector_drag.main()" -- \
+        --cloners 10 --steps 60 --output effector_drag.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import bpy
+
+from . import scene as bench_scene
+from .suite import summarize, find_input_identifier
+
+MODES = ("legacy", "drivers")
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Handler time during an effector parameter drag")
+    parser.add_argument("--cloners", type=int, default=10, help="Количество клонеров, каждый со своим эффектором")
+    parser.add_argument("--steps", type=int, default=60, help="Шагов перетаскивания")
+    parser.add_argument("--output", default="effector_drag.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def drag(mode, cloners, steps):
+    """
+    Перетаскивание Strength первого эффектора.
+
+    Returns:
+        tuple: (время обработчиков на шаг, полное время шага) в секундах
+    """
+    from advanced_cloners.core.utils import effector_drivers, profiling
+
+    effector_drivers.ENABLED = mode == "drivers"
+    scene_info = bench_scene.build_scene(cloners=cloners, effectors=1)
+    if not scene_info["effectors"]:
+        return [], []
+
+    obj_name, effector_name = scene_info["effectors"][0]
+    obj = bpy.data.objects[obj_name]
+    modifier = obj.modifiers[effector_name]
+    identifier = find_input_identifier(modifier, "Strength")
+    if identifier is None:
+        return [], []
+
+    profiling.set_enabled(True)
+    handler_samples = []
+    step_samples = []
+    try:
+        for i in range(steps):
+            profiling.clear_events()
+            start = time.perf_counter()
+            modifier[identifier] = (i % 20) / 20.0
+            obj.update_tag()
+            bpy.context.view_layer.update()
+            step_samples.append(time.perf_counter() - start)
+            handler_us = sum(event["dur"] for event in profiling.get_events() if event["cat"] == "handler")
+            handler_samples.append(handler_us / 1e6)
+    finally:
+        profiling.set_enabled(False)
+        profiling.clear_events()
+        effector_drivers.ENABLED = True
+
+    return handler_samples, step_samples
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    results = {}
+    for mode in MODES:
+        handler_samples, step_samples = drag(mode, args.cloners, args.steps)
+        if not step_samples:
+            print(f"{mode}: no effector created, skipped")
+            continue
+        results[f"effector_drag_handler/{mode}"] = summarize(handler_samples)
+        results[f"effector_drag_step/{mode}"] = summarize(step_samples)
+        print(f"{mode:8s} handlers {results[f'effector_drag_handler/{mode}']['median_ms']:8.3f} ms  "
+              f"step {results[f'effector_drag_step/{mode}']['median_ms']:8.3f} ms")
+
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"cloners": args.cloners, "steps": args.steps},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,600 @@
+"""
+Лёгкая замена bpy на чистом Python для юнит-бенчмарков слоя оркестрации.
+
+Воспроизводит только ту часть API, которой пользуются обработчики, классификация
+компонентов и обход цепочек клонеров:
+    - коллекции bpy.data (objects, node_groups, collections, meshes, scenes) с доступом по имени и индексу;
+    - сцены с scene.objects и object.users_scene по объектам, связанным с scene.collection;
+    - объекты, модификаторы и группы узлов с IDProperty (keys/get/in/[]);
+    - интерфейс групп узлов (interface.items_tree) с сокетами Socket_N;
+    - depsgraph с updates и id_type_updated;
+    - bpy.types/bpy.props/bpy.utils/bpy.app в объёме, достаточном для импорта модулей аддона.
+
+Рендеринг, узлы и оценка геометрии не моделируются: замеры показывают стоимость
+Python-кода аддона, а не Blender. Внутри Blender модуль не используется.
+
+Использование:
+    from benchmarks import fake_bpy
+    bpy = fake_bpy.install()
+    addon = fake_bpy.load_addon()
+"""
+
+import importlib
+import importlib.util
+import itertools
+import os
+import sys
+import types
+
+ADDON = "advanced_cloners"
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# IDProperty и ID-блоки
+
+class IDPropertyOwner:
+    """Хранилище пользовательских свойств, как у ID-блоков и модификаторов Blender."""
+
+    def __init__(self):
+        self._props = {}
+
+    def as_pointer(self):
+        return id(self)
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def __delitem__(self, key):
+        del self._props[key]
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def keys(self):
+        return self._props.keys()
+
+    def values(self):
+        return self._props.values()
+
+    def items(self):
+        return self._props.items()
+
+
+_session_uids = itertools.count(1)
+
+
+class ID(IDPropertyOwner):
+    """Базовый ID-блок: имя, session_uid, original и update_tag."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.session_uid = next(_session_uids)
+        self.users = 0
+        self.tag_count = 0
+
+    @property
+    def original(self):
+        return self
+
+    def update_tag(self, refresh=None):
+        self.tag_count += 1
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class PropCollection:
+    """
+    Аналог bpy_prop_collection: упорядоченная коллекция с доступом по имени и индексу.
+    Имена уникальны; при совпадении добавляется суффикс .001, как в Blender.
+    """
+
+    def __init__(self, factory=None):
+        self._items = {}
+        self._factory = factory
+
+    def _unique_name(self, name):
+        if name not in self._items:
+            return name
+        index = 1
+        while f"{name}.{index:03d}" in self._items:
+            index += 1
+        return f"{name}.{index:03d}"
+
+    def link(self, item):
+        item.name = self._unique_name(item.name)
+        self._items[item.name] = item
+        return item
+
+    def new(self, name, *args, **kwargs):
+        return self.link(self._factory(name, *args, **kwargs))
+
+    def remove(self, item, **kwargs):
+        self._items.pop(item.name, None)
+
+    def rename(self, item, new_name):
+        """Переименование с сохранением порядка; в Blender это присваивание .name."""
+        new_name = self._unique_name(new_name)
+        self._items = {(new_name if k == item.name else k): v for k, v in self._items.items()}
+        item.name = new_name
+
+    def clear(self):
+        self._items.clear()
+
+    def get(self, key, default=None):
+        return self._items.get(key, default)
+
+    def find(self, key):
+        for index, name in enumerate(self._items):
+            if name == key:
+                return index
+        return -1
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def values(self):
+        return list(self._items.values())
+
+    def items(self):
+        return list(self._items.items())
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __reversed__(self):
+        return reversed(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+
+# Группы узлов
+
+class InterfaceSocket:
+    """Элемент interface.items_tree группы узлов."""
+
+    def __init__(self, name, in_out, socket_type, identifier, default_value=None):
+        self.name = name
+        self.in_out = in_out
+        self.socket_type = socket_type
+        self.identifier = identifier
+        self.default_value = default_value
+        self.item_type = 'SOCKET'
+
+
+class NodeTreeInterface:
+    def __init__(self):
+        self.items_tree = []
+
+    def new_socket(self, name, in_out='INPUT', socket_type='NodeSocketFloat', default_value=None):
+        identifier = f"Socket_{len(self.items_tree)}"
+        socket = InterfaceSocket(name, in_out, socket_type, identifier, default_value)
+        self.items_tree.append(socket)
+        return socket
+
+
+class NodeTree(ID):
+    def __init__(self, name, type='GeometryNodeTree'):
+        super().__init__(name)
+        self.bl_idname = type
+        self.interface = NodeTreeInterface()
+        self.nodes = PropCollection()
+        self.links = []
+
+
+# Объекты и модификаторы
+
+class Modifier(IDPropertyOwner):
+    def __init__(self, name, type='NODES'):
+        super().__init__()
+        self.name = name
+        self.type = type
+        self.node_group = None
+        self.show_viewport = True
+        self.show_render = True
+        self.show_expanded = True
+
+    def __repr__(self):
+        return f"<Modifier {self.name!r}>"
+
+
+class ModifierCollection(PropCollection):
+    def __init__(self, owner=None):
+        super().__init__(Modifier)
+        self._owner = owner
+        self._persistent_uids = itertools.count(1)
+
+    def link(self, item):
+        item.id_data = self._owner
+        item.persistent_uid = next(self._persistent_uids)
+        return super().link(item)
+
+    def move(self, from_index, to_index):
+        """Перемещение модификатора по индексу (ObjectModifiers.move)."""
+        items = list(self._items.items())
+        items.insert(to_index, items.pop(from_index))
+        self._items = dict(items)
+
+
+class Object(ID):
+    def __init__(self, name, data=None):
+        super().__init__(name)
+        self.data = data
+        self.type = 'MESH' if data is not None else 'EMPTY'
+        self.modifiers = ModifierCollection(self)
+        self.location = [0.0, 0.0, 0.0]
+        self.hide_viewport = False
+        self.parent = None
+        self._selected = False
+        self._hidden = False
+
+    def select_set(self, state):
+        self._selected = bool(state)
+
+    def select_get(self):
+        return self._selected
+
+    def hide_set(self, state):
+        self._hidden = bool(state)
+
+    def hide_get(self):
+        return self._hidden or self.hide_viewport
+
+    @property
+    def users_scene(self):
+        bpy = sys.modules["bpy"]
+        return tuple(scene for scene in bpy.data.scenes if scene.objects.get(self.name) is self)
+
+
+class Mesh(ID):
+    pass
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = PropCollection()
+        self.children = PropCollection()
+
+    @property
+    def all_objects(self):
+        view = PropCollection()
+        for obj in self.objects:
+            view._items[obj.name] = obj
+        for child in self.children:
+            view._items.update(child.all_objects._items)
+        return view
+
+
+class Scene(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.collection = Collection("Scene Collection")
+
+    @property
+    def objects(self):
+        """Объекты scene.collection и вложенных коллекций, как Scene.objects в Blender."""
+        return self.collection.all_objects
+
+
+class BlendData:
+    def __init__(self):
+        self.objects = PropCollection(Object)
+        self.node_groups = PropCollection(NodeTree)
+        self.collections = PropCollection(Collection)
+        self.meshes = PropCollection(Mesh)
+        self.scenes = PropCollection(Scene)
+
+    def clear(self):
+        """Удаляет данные, сцены остаются пустыми."""
+        for collection in (self.objects, self.node_groups, self.collections, self.meshes):
+            collection.clear()
+        for scene in self.scenes:
+            scene.collection.objects.clear()
+            scene.collection.children.clear()
+
+
+# Depsgraph
+
+class DepsgraphUpdate:
+    def __init__(self, id_block, is_updated_geometry=False, is_updated_transform=False):
+        self.id = id_block
+        self.is_updated_geometry = is_updated_geometry
+        self.is_updated_transform = is_updated_transform
+
+
+class Depsgraph:
+    """Depsgraph с заранее заданным списком обновлений."""
+
+    def __init__(self, updated_ids=()):
+        self.updates = [DepsgraphUpdate(id_block) for id_block in updated_ids]
+
+    def id_type_updated(self, id_type):
+        if id_type == 'OBJECT':
+            return any(isinstance(u.id, Object) for u in self.updates)
+        if id_type == 'NODETREE':
+            return any(isinstance(u.id, NodeTree) for u in self.updates)
+        return False
+
+
+# Модули bpy
+
+class _Placeholder:
+    """Базовый класс для типов bpy, которые аддон только наследует или упоминает в аннотациях."""
+    bl_rna = None
+
+    @classmethod
+    def is_registered(cls):
+        return False
+
+
+def _types_module():
+    module = types.ModuleType("bpy.types")
+    known = {
+        "ID": ID,
+        "Object": Object,
+        "Modifier": Modifier,
+        "NodesModifier": Modifier,
+        "NodeTree": NodeTree,
+        "GeometryNodeTree": NodeTree,
+        "Collection": Collection,
+        "Mesh": Mesh,
+        "Scene": Scene,
+    }
+    for name, cls in known.items():
+        setattr(module, name, cls)
+
+    def __getattr__(name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = type(name, (_Placeholder,), {})
+        setattr(module, name, cls)
+        return cls
+
+    module.__getattr__ = __getattr__
+    return module
+
+
+def _props_module():
+    module = types.ModuleType("bpy.props")
+
+    def make_property(kind):
+        def prop(**kwargs):
+            return (kind, kwargs)
+        prop.__name__ = kind
+        return prop
+
+    for kind in ("BoolProperty", "IntProperty", "FloatProperty", "StringProperty", "EnumProperty",
+                 "PointerProperty", "CollectionProperty", "FloatVectorProperty", "IntVectorProperty",
+                 "BoolVectorProperty"):
+        setattr(module, kind, make_property(kind))
+    return module
+
+
+def _utils_module():
+    module = types.ModuleType("bpy.utils")
+    module.registered_classes = []
+
+    def register_class(cls):
+        module.registered_classes.append(cls)
+
+    def unregister_class(cls):
+        if cls in module.registered_classes:
+            module.registered_classes.remove(cls)
+
+    module.register_class = register_class
+    module.unregister_class = unregister_class
+    return module
+
+
+HANDLER_LISTS = ("depsgraph_update_pre", "depsgraph_update_post", "load_pre", "load_post",
+                 "save_pre", "save_post", "undo_pre", "undo_post", "redo_pre", "redo_post",
+                 "frame_change_post")
+
+
+def _app_modules():
+    app = types.ModuleType("bpy.app")
+    handlers = types.ModuleType("bpy.app.handlers")
+    for name in HANDLER_LISTS:
+        setattr(handlers, name, [])
+    handlers.persistent = lambda func: func
+
+    timers = types.ModuleType("bpy.app.timers")
+    timers.registered = []
+    timers.register = lambda func, first_interval=0.0, persistent=False: timers.registered.append(func)
+    timers.unregister = lambda func: timers.registered.remove(func) if func in timers.registered else None
+    timers.is_registered = lambda func: func in timers.registered
+
+    app.handlers = handlers
+    app.timers = timers
+    app.version = (4, 2, 0)
+    app.version_string = "4.2.0 (fake)"
+    app.background = True
+    app.binary_path = ""
+    return app, handlers, timers
+
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = types.SimpleNamespace(active=None)
+        self.update_count = 0
+
+    def update(self):
+        self.update_count += 1
+
+
+class _Ops:
+    """bpy.ops.<категория>.<оператор>(...) - вызов ничего не делает и возвращает {'FINISHED'}."""
+
+    def __getattr__(self, category):
+        if category.startswith("__"):
+            raise AttributeError(category)
+        return _OpsCategory()
+
+
+class _OpsCategory:
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: {'FINISHED'}
+
+
+def _bpy_module():
+    bpy = types.ModuleType("bpy")
+    bpy.types = _types_module()
+    bpy.props = _props_module()
+    bpy.utils = _utils_module()
+    bpy.app, handlers, timers = _app_modules()
+    bpy.data = BlendData()
+    bpy.ops = _Ops()
+
+    view_layer = ViewLayer()
+    scene = bpy.data.scenes.new("Scene")
+    bpy.context = types.SimpleNamespace(
+        scene=scene,
+        view_layer=view_layer,
+        active_object=None,
+        preferences=types.SimpleNamespace(addons={}),
+        evaluated_depsgraph_get=lambda: Depsgraph(),
+    )
+    return bpy, handlers, timers
+
+
+class _Vector(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0)):
+        return super().__new__(cls, values)
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+    z = property(lambda self: self[2])
+
+
+def _math_modules():
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = _Vector
+    mathutils.Euler = _Vector
+    mathutils.Color = _Vector
+    mathutils.Matrix = type("Matrix", (), {"Identity": staticmethod(lambda size: None)})
+
+    bmesh = types.ModuleType("bmesh")
+    bmesh.new = lambda: None
+    bmesh.ops = types.SimpleNamespace()
+    return mathutils, bmesh
+
+
+def install():
+    """
+    Регистрирует фальшивые bpy, mathutils и bmesh в sys.modules.
+
+    Returns:
+        module: Фальшивый модуль bpy
+
+    Raises:
+        RuntimeError: Если настоящий bpy уже импортирован (запуск внутри Blender)
+    """
+    existing = sys.modules.get("bpy")
+    if existing is not None:
+        if isinstance(getattr(existing, "data", None), BlendData):
+            return existing
+        raise RuntimeError("Real bpy is already imported; fake_bpy must run under plain CPython")
+
+    bpy, handlers, timers = _bpy_module()
+    mathutils, bmesh = _math_modules()
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.types": bpy.types,
+        "bpy.props": bpy.props,
+        "bpy.utils": bpy.utils,
+        "bpy.app": bpy.app,
+        "bpy.app.handlers": handlers,
+        "bpy.app.timers": timers,
+        "mathutils": mathutils,
+        "bmesh": bmesh,
+    })
+    return bpy
+
+
+def reset():
+    """Очищает bpy.data и счётчики контекста между замерами."""
+    bpy = sys.modules["bpy"]
+    bpy.data.clear()
+    bpy.context.view_layer.update_count = 0
+    bpy.context.view_layer.objects.active = None
+
+
+def load_addon(path=ADDON_DIR, name=ADDON):
+    """
+    Импортирует аддон из каталога исходников как пакет name.
+    Нужен, когда каталог репозитория называется не так, как пакет аддона.
+
+    Returns:
+        module: Пакет аддона (register() не вызывается)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(path, "__init__.py"), submodule_search_locations=[path])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module
+
+
+# Построение сцен
+
+def add_node_group(name, sockets=(), **props):
+    """
+    Создает группу узлов с входными сокетами и пользовательскими свойствами.
+
+    Args:
+        name: Имя группы
+        sockets: Имена входных сокетов
+        **props: IDProperty группы
+
+    Returns:
+        NodeTree: Созданная группа
+    """
+    bpy = sys.modules["bpy"]
+    group = bpy.data.node_groups.new(name)
+    for socket_name in sockets:
+        group.interface.new_socket(socket_name)
+    for key, value in props.items():
+        group[key] = value
+    return group
+
+
+def add_nodes_modifier(obj, name, node_group, **props):
+    """Добавляет модификатор NODES с группой и заполняет Socket_N значениями по умолчанию."""
+    mod = obj.modifiers.new(name, 'NODES')
+    mod.node_group = node_group
+    node_group.users += 1
+    for socket in node_group.interface.items_tree:
+        if socket.in_out == 'INPUT':
+            mod[socket.identifier] = socket.default_value if socket.default_value is not None else 0.0
+    for key, value in props.items():
+        mod[key] = value
+    return mod
@@ -0,0 +1,133 @@
+"""
+Время включения аддона и запуска Blender с включённым аддоном, проверка бюджета импорта.
+
+Проверяет, что:
+    - включение аддона укладывается в бюджет (--budget-ms);
+    - модели и тяжёлые помощники операций не импортируются при включении;
+    - манифест регистрации соответствует исходникам.
+Код возврата 1, если какая-либо проверка не прошла, поэтому скрипт можно запускать в CI.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python benchmarks/import_time.py -- --budget-ms 150 --startup-runs 3
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import bpy
+import addon_utils
+
+ADDON = "advanced_cloners"
+
+# Модули, которые должны импортироваться только при первом использовании
+LAZY_MODULES = (
+    "advanced_cloners.models.cloners.grid_cloner",
+    "advanced_cloners.models.cloners.linear_cloner",
+    "advanced_cloners.models.cloners.circle_cloner",
+    "advanced_cloners.models.effectors.random_effector",
+    "advanced_cloners.models.fields.sphere_field",
+    "advanced_cloners.operations.helpers.object_cloner",
+    "advanced_cloners.operations.helpers.stacked_cloner",
+    "advanced_cloners.operations.helpers.chain_utils",
+)
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Add-on enable time and import budget check")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Бюджет времени включения аддона, мс")
+    parser.add_argument("--runs", type=int, default=5, help="Количество замеров включения")
+    parser.add_argument("--startup-runs", type=int, default=0, help="Количество запусков Blender для замера старта")
+    return parser.parse_args(argv)
+
+
+def purge_addon_modules():
+    """Удаляет модули аддона из sys.modules, чтобы следующий замер импортировал их заново."""
+    for name in [n for n in sys.modules if n == ADDON or n.startswith(ADDON + ".")]:
+        del sys.modules[name]
+
+
+def measure_enable():
+    """Включает аддон с чистым импортом. Возвращает (время, мс; число модулей аддона)."""
+    addon_utils.disable(ADDON, default_set=True)
+    purge_addon_modules()
+
+    start = time.perf_counter()
+    addon_utils.enable(ADDON, default_set=True)
+    elapsed = (time.perf_counter() - start) * 1000.0
+
+    module_count = sum(1 for n in sys.modules if n.startswith(ADDON + "."))
+    return elapsed, module_count
+
+
+def measure_startup(runs, with_addon):
+    """Время запуска Blender в фоне до выхода, мс (лучший из runs)."""
+    cmd = [bpy.app.binary_path, "-b", "--factory-startup"]
+    if with_addon:
+        cmd += ["--addons", ADDON]
+    cmd += ["--python-expr", "import sys; sys.exit(0)"]
+
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def check_manifest():
+    """Проверяет, что манифест регистрации соответствует исходникам."""
+    import importlib
+    builder = importlib.import_module(ADDON + ".core.factories.manifest_builder")
+    current = ""
+    if os.path.exists(builder.MANIFEST_PATH):
+        with open(builder.MANIFEST_PATH, encoding="utf-8") as f:
+            current = f.read()
+    return current == builder.render_manifest(builder.build_manifest())
+
+
+def main():
+    args = parse_args()
+    failures = []
+
+    times = []
+    module_count = 0
+    for _ in range(args.runs):
+        elapsed, module_count = measure_enable()
+        times.append(elapsed)
+    best = min(times)
+
+    print("")
+    print(f"Add-on enable: best {best:8.1f} ms, median {sorted(times)[len(times) // 2]:8.1f} ms, "
+          f"{module_count} modules imported")
+    if best > args.budget_ms:
+        failures.append(f"enable time {best:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+
+    eager = [name for name in LAZY_MODULES if name in sys.modules]
+    for name in eager:
+        failures.append(f"{name} imported at enable time")
+
+    if not check_manifest():
+        failures.append("registration manifest is out of date (run core/factories/manifest_builder.py)")
+
+    if args.startup_runs > 0:
+        base = measure_startup(args.startup_runs, with_addon=False)
+        with_addon = measure_startup(args.startup_runs, with_addon=True)
+        print(f"Blender startup: {base:8.1f} ms without add-on, {with_addon:8.1f} ms with add-on "
+              f"(+{with_addon - base:.1f} ms)")
+
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("Import budget check passed")
+
+
+if __name__ == "__main__":
+    main()
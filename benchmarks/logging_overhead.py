@@ -0,0 +1,153 @@
+"""
+Бенчмарк стоимости журналирования в обработчиках аддона: уровень WARNING (релиз) против DEBUG.
+
+Сравнивает:
+    1. Вызовы log.debug с аргументами при выключенном и включенном уровне
+       против прежнего print(f"...") - без Blender-данных, чистый Python.
+    2. Изменение параметра эффектора с пересчетом depsgraph, при котором
+       срабатывают обработчики аддона.
+
+Вывод в консоль при уровне DEBUG перенаправляется в /dev/null,
+чтобы измерялась стоимость форматирования, а не скорость терминала.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python benchmarks/logging_overhead.py -- --updates 200
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+import bpy
+import addon_utils
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--calls", type=int, default=1000000, help="Количество вызовов в микробенчмарке")
+    parser.add_argument("--updates", type=int, default=200, help="Количество изменений параметра эффектора")
+    parser.add_argument("--cloners", type=int, default=20, help="Количество клонеров с эффектором")
+    return parser.parse_args(argv)
+
+
+@contextlib.contextmanager
+def silenced_stdout():
+    """Перенаправляет stdout в /dev/null."""
+    with open(os.devnull, "w") as devnull:
+        old_stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            sys.stdout = old_stdout
+
+
+def bench_micro(calls):
+    """Стоимость одного отладочного сообщения с тремя аргументами."""
+    from advanced_cloners.core.utils.logging_utils import get_logger, set_default_level
+
+    log = get_logger("handlers")
+    name, index, value = "GridCloner_Cube", 42, 0.125
+    results = {}
+
+    set_default_level('WARNING')
+    start = time.perf_counter()
+    for _ in range(calls):
+        log.debug("Обновлен клонер %s [%s] = %s", name, index, value)
+    results["log.debug, level WARNING"] = time.perf_counter() - start
+
+    with silenced_stdout():
+        set_default_level('DEBUG')
+        start = time.perf_counter()
+        for _ in range(calls):
+            log.debug("Обновлен клонер %s [%s] = %s", name, index, value)
+        results["log.debug, level DEBUG"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            print(f"[DEBUG] Обновлен клонер {name} [{index}] = {value}")
+        results["print(f-string)"] = time.perf_counter() - start
+
+    set_default_level('WARNING')
+    return results
+
+
+def build_scene(cloner_count):
+    """Создает клонеры с эффектором на каждом. Возвращает (объект эффектора, модификатор)."""
+    from advanced_cloners.benchmarks import scene as bench_scene
+
+    scene_info = bench_scene.build_scene(cloners=cloner_count, effectors=1, depth=1)
+    if not scene_info["effectors"]:
+        return None, None
+
+    obj_name, effector_name = scene_info["effectors"][0]
+    effector_obj = bpy.data.objects[obj_name]
+    return effector_obj, effector_obj.modifiers[effector_name]
+
+
+def find_strength_identifier(modifier):
+    """Возвращает идентификатор сокета Strength модификатора эффектора."""
+    for item in modifier.node_group.interface.items_tree:
+        if getattr(item, "in_out", None) == 'INPUT' and item.name == "Strength":
+            return item.identifier
+    return None
+
+
+def bench_updates(effector_obj, effector_mod, updates, level):
+    """Изменяет параметр эффектора updates раз при заданном уровне журналирования."""
+    from advanced_cloners.core.utils.logging_utils import set_default_level
+
+    identifier = find_strength_identifier(effector_mod)
+    if identifier is None:
+        return None
+
+    set_default_level(level)
+    try:
+        with silenced_stdout():
+            start = time.perf_counter()
+            for i in range(updates):
+                effector_mod[identifier] = (i % 100) / 100.0
+                effector_obj.update_tag()
+                bpy.context.view_layer.update()
+            return time.perf_counter() - start
+    finally:
+        set_default_level('WARNING')
+
+
+def main():
+    args = parse_args()
+
+    addon_utils.enable("advanced_cloners", default_set=True)
+
+    print("")
+    print(f"Micro benchmark: {args.calls} calls")
+    for label, elapsed in bench_micro(args.calls).items():
+        print(f"  {label:28s} {elapsed:8.3f} s  ({elapsed / args.calls * 1e9:7.1f} ns/call)")
+
+    effector_obj, effector_mod = build_scene(args.cloners)
+    if effector_mod is None:
+        print("Failed to create effector")
+        return
+
+    # Прогрев: первый пересчет строит кеши depsgraph
+    bench_updates(effector_obj, effector_mod, 5, 'WARNING')
+
+    print("")
+    print(f"Effector updates: {args.updates} updates, {args.cloners} cloners")
+    times = {}
+    for level in ('WARNING', 'DEBUG'):
+        times[level] = bench_updates(effector_obj, effector_mod, args.updates, level)
+        if times[level] is None:
+            print("Effector has no Strength input")
+            return
+        print(f"  Level {level:8s} {times[level]:8.3f} s  ({times[level] / args.updates * 1e3:7.2f} ms/update)")
+
+    if times['WARNING'] > 0:
+        print(f"  DEBUG / WARNING: {times['DEBUG'] / times['WARNING']:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
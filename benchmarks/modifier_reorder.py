@@ -0,0 +1,126 @@
+"""
+Перестановка модификаторов: пошаговые bpy.ops против ObjectModifiers.move.
+
+На объекте со стеком из N модификаторов:
+    controller_insert - новый модификатор-контроллер встает сразу после первого
+                        модификатора стека (как в BaseComponentController.create)
+    stack_reverse     - весь стек переставляется в обратном порядке
+
+Вариант "ops" повторяет прежний путь: modifier_move_up по одному шагу для
+контроллера и modifier_move_to_index на каждый модификатор для перестановки.
+Вариант "move" использует place_modifier_after и reorder_modifiers.
+
+Результаты пишутся в формате suite.py (ключи "controller_insert/<ops|move>",
+"stack_reverse/<ops|move>"), поэтому сравниваются с эталоном через benchmarks/compare.py.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import modifier_reorder; modifier_reorder.main()" -- \\
+        --modifiers 50 --repeat 20 --output modifier_reorder.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import bpy
+
+from . import scene as bench_scene
+from .suite import summarize, timed
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Modifier reordering with bpy.ops versus ObjectModifiers.move")
+    parser.add_argument("--modifiers", type=int, default=50, help="Размер стека модификаторов")
+    parser.add_argument("--repeat", type=int, default=20, help="Число повторов каждого случая")
+    parser.add_argument("--output", default="modifier_reorder.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def build_stack(count):
+    """Объект с count модификаторами Geometry Nodes без групп."""
+    bench_scene.reset_scene()
+    mesh = bpy.data.meshes.new("BenchStackMesh")
+    obj = bpy.data.objects.new("BenchStack", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    for i in range(count):
+        obj.modifiers.new(name=f"Stack {i:03d}", type='NODES')
+    return obj
+
+
+def insert_controller_ops(obj):
+    """Прежний путь: контроллер добавляется в конец и поднимается по шагу."""
+    mod = obj.modifiers.new(name="Controller", type='NODES')
+    with bpy.context.temp_override(object=obj, active_object=obj):
+        for _ in range(len(obj.modifiers) - 2):
+            bpy.ops.object.modifier_move_up(modifier=mod.name)
+    return mod
+
+
+def insert_controller_move(obj):
+    from advanced_cloners.core.utils.modifiers import place_modifier_after
+
+    mod = obj.modifiers.new(name="Controller", type='NODES')
+    place_modifier_after(obj, mod, obj.modifiers[0])
+    return mod
+
+
+def reverse_ops(obj):
+    """Прежний путь: один оператор на модификатор."""
+    names = [mod.name for mod in reversed(obj.modifiers)]
+    with bpy.context.temp_override(object=obj, active_object=obj):
+        for index, name in enumerate(names):
+            bpy.ops.object.modifier_move_to_index(modifier=name, index=index)
+
+
+def reverse_move(obj):
+    from advanced_cloners.core.utils.modifiers import reorder_modifiers
+
+    reorder_modifiers(obj, [mod.name for mod in reversed(obj.modifiers)])
+
+
+def bench_insert(obj, insert, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        mod = insert(obj)
+        samples.append(time.perf_counter() - start)
+        assert obj.modifiers[1] == mod
+        obj.modifiers.remove(mod)
+    return samples
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    obj = build_stack(args.modifiers)
+
+    results = {
+        "controller_insert/ops": summarize(bench_insert(obj, insert_controller_ops, args.repeat)),
+        "controller_insert/move": summarize(bench_insert(obj, insert_controller_move, args.repeat)),
+        "stack_reverse/ops": summarize([timed(reverse_ops, obj) for _ in range(args.repeat)]),
+        "stack_reverse/move": summarize([timed(reverse_move, obj) for _ in range(args.repeat)]),
+    }
+    for key, summary in results.items():
+        print(f"{key:24s} {summary['median_ms']:8.3f} ms")
+
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"modifiers": args.modifiers, "repeat": args.repeat},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Размер графов узлов компонентов и проверка бюджета узлов (config/node_budgets.json).
+
+Создает каждый тип клонера, эффектора и поля через фабрику компонентов, а также
+клонеры объекта и стековые клонеры оператором, и печатает по видам компонентов
+число узлов, связей, сокетов интерфейса и время построения.
+Код возврата 1, если какой-либо компонент превышает бюджет, поэтому скрипт можно запускать в CI.
+Пока бюджеты отмечены provisional (оценены, а не измерены), превышения печатаются
+как предупреждение и код возврата 0.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python benchmarks/node_budget.py -- --output graphs.json
+    blender -b --factory-startup --python benchmarks/node_budget.py -- --update-budgets --headroom 0.2
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+
+import bpy
+import addon_utils
+
+ADDON = "advanced_cloners"
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Node graph size report and node budget check")
+    parser.add_argument("--output", default="", help="Файл отчета JSON")
+    parser.add_argument("--update-budgets", action="store_true",
+                        help="Записать измеренные размеры с запасом в config/node_budgets.json")
+    parser.add_argument("--headroom", type=float, default=0.2, help="Запас при обновлении бюджетов (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def build_components():
+    """Строит графы всех компонентов; записи собирает graph_profiler."""
+    from advanced_cloners.core.factories.component_factory import ComponentFactory
+    from advanced_cloners.models.cloners import CLONER_GROUP_NAMES
+    from advanced_cloners.models.effectors import EFFECTOR_GROUP_NAMES
+    from advanced_cloners.models.fields import FIELD_GROUP_NAMES
+
+    for cloner_type in CLONER_GROUP_NAMES:
+        ComponentFactory.create_cloner(cloner_type)
+    for effector_type in EFFECTOR_GROUP_NAMES:
+        ComponentFactory.create_effector(effector_type)
+    for field_type in FIELD_GROUP_NAMES:
+        ComponentFactory.create_field(field_type)
+
+    scene = bpy.context.scene
+    for stacked in (False, True):
+        for cloner_type in CLONER_GROUP_NAMES:
+            mesh = bpy.data.meshes.new(f"BudgetSource_{cloner_type}_Mesh")
+            obj = bpy.data.objects.new(f"BudgetSource_{cloner_type}", mesh)
+            scene.collection.objects.link(obj)
+            bpy.context.view_layer.objects.active = obj
+            bpy.ops.object.create_cloner(cloner_type=cloner_type, source_type='OBJECT',
+                                         use_stacked_modifiers=stacked)
+
+
+def update_budgets(report, headroom):
+    """Записывает бюджеты по измеренным размерам с запасом и снимает отметку provisional."""
+    from advanced_cloners.core.utils import graph_profiler
+    from advanced_cloners.core.utils.config_utils import get_addon_path
+
+    budgets = dict(graph_profiler.load_budgets(force_reload=True))
+    for row in report:
+        budgets[row["component"]] = int(math.ceil(row["nodes"] * (1.0 + headroom)))
+
+    path = os.path.join(get_addon_path(), graph_profiler.BUDGETS_FILE)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"provisional": False, "budgets": dict(sorted(budgets.items()))}, f, indent=4)
+        f.write("\n")
+    print(f"Budgets written to {path}")
+
+
+def main():
+    args = parse_args()
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable(ADDON, default_set=True)
+
+    from advanced_cloners.core.utils import graph_profiler
+    graph_profiler.clear_records()
+    graph_profiler.set_enabled(True)
+    try:
+        build_components()
+    finally:
+        graph_profiler.set_enabled(False)
+    report = graph_profiler.build_report()
+
+    print("")
+    print(f"{'component':26s} {'nodes':>6s} {'budget':>7s} {'links':>6s} {'sockets':>8s} {'groups':>7s} {'build ms':>9s}")
+    for row in report:
+        budget = "-" if row["budget"] is None else str(row["budget"])
+        flag = "  OVER" if row["over_budget"] else ""
+        print(f"{row['component']:26s} {row['nodes']:6d} {budget:>7s} {row['links']:6d} {row['sockets']:8d} "
+              f"{row['groups']:7d} {row['build_ms_max']:9.1f}{flag}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"report": report, "records": graph_profiler.get_records()}, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.update_budgets:
+        update_budgets(report, args.headroom)
+        return
+
+    failures = graph_profiler.check_budgets()
+    if failures and graph_profiler.budgets_provisional():
+        print("WARNING: budgets are provisional; run with --update-budgets to record measured values")
+        for failure in failures:
+            print(f"  - {failure}")
+        return
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("Node budget check passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Эффект дедупликации групп узлов на рабочем файле: размер, загрузка, построение depsgraph.
+
+Файл открывается, измеряются время загрузки и первого построения depsgraph,
+затем выполняется deduplicate_node_groups, результат сохраняется копией
+во временный файл и те же замеры повторяются для копии. Исходный файл не меняется.
+
+Результаты пишутся в формате suite.py (ключи "file_load/<before|after>",
+"depsgraph_build/<before|after>"), размеры файлов и число групп - в meta.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import node_dedup; node_dedup.main()" -- \\
+        --file production.blend --repeat 5 --output node_dedup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import bpy
+
+from .suite import summarize, timed
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="File size, load and depsgraph build time before and after node group dedup")
+    parser.add_argument("--file", required=True, help="Исходный .blend")
+    parser.add_argument("--repeat", type=int, default=5, help="Число загрузок каждого файла")
+    parser.add_argument("--output", default="node_dedup.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def build_depsgraph():
+    bpy.context.view_layer.update()
+    bpy.context.evaluated_depsgraph_get()
+
+
+def measure(path, repeat):
+    """
+    Загрузка файла и первое построение depsgraph после нее.
+
+    Returns:
+        tuple: (выборки загрузки, выборки построения depsgraph) в секундах
+    """
+    load_samples = []
+    build_samples = []
+    for _ in range(repeat):
+        load_samples.append(timed(bpy.ops.wm.open_mainfile, filepath=path))
+        build_samples.append(timed(build_depsgraph))
+    return load_samples, build_samples
+
+
+def main(argv=None):
+    from advanced_cloners.core.utils import node_dedup
+
+    args = parse_args(argv)
+    source = os.path.abspath(args.file)
+    deduplicated = os.path.join(tempfile.gettempdir(), "advanced_cloners_dedup.blend")
+
+    # Обработчик load_post не должен менять исходный файл при замерах "до"
+    node_dedup.set_dedup_on_load(False)
+
+    results = {}
+    load_samples, build_samples = measure(source, args.repeat)
+    results["file_load/before"] = summarize(load_samples)
+    results["depsgraph_build/before"] = summarize(build_samples)
+
+    bpy.ops.wm.open_mainfile(filepath=source)
+    report = node_dedup.deduplicate_node_groups()
+    groups_after = len(bpy.data.node_groups)
+    bpy.ops.wm.save_as_mainfile(filepath=deduplicated, copy=True)
+
+    load_samples, build_samples = measure(deduplicated, args.repeat)
+    results["file_load/after"] = summarize(load_samples)
+    results["depsgraph_build/after"] = summarize(build_samples)
+
+    size_before = os.path.getsize(source)
+    size_after = os.path.getsize(deduplicated)
+    try:
+        os.remove(deduplicated)
+    except OSError:
+        pass
+
+    print(f"node groups  {report['groups_before']:8d} -> {groups_after:8d}")
+    print(f"file size    {size_before / 1e6:8.2f} -> {size_after / 1e6:8.2f} MB")
+    for key in ("file_load", "depsgraph_build"):
+        print(f"{key:16s} {results[f'{key}/before']['median_ms']:8.2f} -> "
+              f"{results[f'{key}/after']['median_ms']:8.2f} ms")
+
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"file": os.path.basename(source), "repeat": args.repeat},
+            "node_groups": {"before": report["groups_before"], "after": groups_after},
+            "nodes_removed": report["nodes_removed"],
+            "file_size": {"before": size_before, "after": size_after},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Кривые масштабирования слоя оркестрации аддона на фальшивом bpy (benchmarks/fake_bpy.py).
+
+Запускается обычным CPython, без Blender, и показывает, как стоимость Python-кода
+аддона растёт с числом объектов сцены (по умолчанию до 100k):
+    classify_components     - ComponentPropertyManager._get_component_type для всех модификаторов, на модификатор
+    chain_lookup            - get_cloner_chain_for_object для последнего клонера цепочки
+    effector_handler_idle   - effector_parameter_update_handler без изменений параметров
+    effector_handler_change - то же после изменения параметра эффектора (поиск связанных клонеров)
+    dependency_rename       - ComponentDependencyManager.update_after_modifier_rename
+
+Для каждого случая печатается показатель роста k из аппроксимации time ~ N^k:
+k≈0 - стоимость не зависит от размера сцены, k≈1 - линейный обход сцены.
+
+Запуск:
+    python benchmarks/orchestration_scaling.py --sizes 100,1000,10000,100000 --output scaling.json
+
+Результаты записываются в формате suite.py ("случай/N"), поэтому их можно
+сравнивать с эталоном через benchmarks/compare.py.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+
+if __package__:
+    from . import fake_bpy
+else:
+    import fake_bpy
+
+ALL_CASES = (
+    "classify_components",
+    "chain_lookup",
+    "effector_handler_idle",
+    "effector_handler_change",
+    "dependency_rename",
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Orchestration layer scaling benchmark (no Blender)")
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="Размеры сцены через запятую (число клонеров)")
+    parser.add_argument("--depth", type=int, default=3, help="Глубина цепочек клонеров")
+    parser.add_argument("--repeat", type=int, default=20, help="Максимум выборок на случай и размер")
+    parser.add_argument("--budget", type=float, default=1.0, help="Бюджет времени на случай и размер, с")
+    parser.add_argument("--cases", default="", help="Случаи через запятую (по умолчанию все)")
+    parser.add_argument("--output", default="", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def summarize(samples):
+    """Сводная статистика по выборкам в секундах, как в suite.py."""
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "min_ms": min(ms),
+        "median_ms": statistics.median(ms),
+        "mean_ms": statistics.fmean(ms),
+        "max_ms": max(ms),
+        "samples": len(ms),
+    }
+
+
+def sample(func, repeat, budget):
+    """
+    Выполняет func до repeat раз, но не дольше budget секунд (минимум 3 выборки).
+
+    Returns:
+        list: Время каждого вызова в секундах
+    """
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < repeat:
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+        if len(samples) >= 3 and time.perf_counter() - started > budget:
+            break
+    return samples
+
+
+def growth_exponent(points):
+    """
+    Показатель k в time ~ N^k по методу наименьших квадратов в логарифмах.
+
+    Args:
+        points: Список (N, время)
+
+    Returns:
+        float: k или None, если точек меньше двух
+    """
+    points = [(n, t) for n, t in points if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+
+# Сцена
+
+EFFECTOR_SOCKETS = ("Enable", "Strength", "Position", "Rotation", "Scale")
+CLONER_SOCKETS = ("Count X", "Count Y", "Count Z", "Spacing")
+
+
+def build_fake_scene(size, depth=3):
+    """
+    Заполняет фальшивый bpy.data: size объектов клонеров с эффектором на каждом.
+
+    Клонеры объединены в цепочки глубины depth через коллекции, как клонеры коллекций:
+    звено хранит chain_source_collection, предыдущее - cloner_collection.
+    Имена групп узлов начинаются с префиксов из constants, чтобы их распознавали обработчики.
+
+    Returns:
+        dict: {"cloners": [(obj, mod)], "effectors": [(obj, mod)], "chain_tails": [последние звенья полных цепочек]}
+    """
+    fake_bpy.reset()
+    bpy = sys.modules["bpy"]
+    info = {"cloners": [], "effectors": [], "chain_tails": []}
+
+    for i in range(size):
+        obj = bpy.data.objects.new(f"Cloner_{i:06d}")
+
+        effector_group = fake_bpy.add_node_group(f"RandomEffector.{i:06d}", EFFECTOR_SOCKETS)
+        effector_mod = fake_bpy.add_nodes_modifier(obj, "Random Effector", effector_group)
+
+        position = i % depth
+        cloner_group = fake_bpy.add_node_group(
+            f"AdvancedGridCloner.{i:06d}", CLONER_SOCKETS,
+            linked_effectors=[effector_mod.name])
+        cloner_mod = fake_bpy.add_nodes_modifier(
+            obj, "Grid Cloner", cloner_group,
+            cloner_collection=f"ClonerTo_{i:06d}",
+            original_collection=f"ClonerFrom_{i:06d}")
+        if position > 0:
+            cloner_mod["is_chained_cloner"] = True
+            cloner_mod["chain_source_collection"] = f"ClonerTo_{i - 1:06d}"
+        if position == depth - 1:
+            info["chain_tails"].append(obj)
+
+        info["cloners"].append((obj, cloner_mod))
+        info["effectors"].append((obj, effector_mod))
+
+    return info
+
+
+# Случаи
+
+def bench_classify(info, repeat, budget):
+    from advanced_cloners.core.utils.property_utils.property_manager import ComponentPropertyManager
+
+    bpy = sys.modules["bpy"]
+    pairs = [(obj, mod.name) for obj in bpy.data.objects for mod in obj.modifiers]
+
+    def classify():
+        for obj, name in pairs:
+            ComponentPropertyManager._get_component_type(obj, name)
+
+    # Время на один модификатор, чтобы k≈0 означал линейную общую стоимость
+    return [s / len(pairs) for s in sample(classify, repeat, budget)]
+
+
+def bench_chain_lookup(info, repeat, budget):
+    from advanced_cloners.core.utils.duplicator import get_cloner_chain_for_object
+
+    # Последняя полная цепочка: её звенья в конце bpy.data.objects, поиск по коллекциям обходит всю сцену
+    tail = info["chain_tails"][-1] if info["chain_tails"] else info["cloners"][-1][0]
+    return sample(lambda: get_cloner_chain_for_object(tail), repeat, budget)
+
+
+def _reset_effector_handler():
+    from advanced_cloners.core.utils import event_handlers
+    event_handlers._effector_last_parameters.clear()
+    event_handlers._effector_handler_blocked = False
+    event_handlers._effector_handler_call_count = 0
+    return event_handlers.effector_parameter_update_handler
+
+
+def bench_effector_handler(info, repeat, budget, change):
+    handler = _reset_effector_handler()
+    bpy = sys.modules["bpy"]
+    scene = bpy.context.scene
+
+    obj, effector_mod = info["effectors"][len(info["effectors"]) // 2]
+    depsgraph = fake_bpy.Depsgraph([obj])
+    identifier = effector_mod.node_group.interface.items_tree[1].identifier
+
+    # Первый вызов запоминает параметры эффектора
+    handler(scene, depsgraph)
+
+    counter = [0]
+
+    def tick():
+        if change:
+            counter[0] += 1
+            effector_mod[identifier] = (counter[0] % 100) / 100.0
+        handler(scene, depsgraph)
+
+    return sample(tick, repeat, budget)
+
+
+def bench_dependency_rename(info, repeat, budget):
+    from advanced_cloners.core.utils.property_utils.dependency_manager import ComponentDependencyManager
+
+    manager = ComponentDependencyManager()
+    # Граф всей сцены строится из linked_effectors групп узлов
+    for obj, _ in info["cloners"]:
+        manager.ensure_object(obj)
+
+    obj, effector_mod = info["effectors"][len(info["effectors"]) // 2]
+    names = ["Random Effector", "Random Effector.001"]
+    counter = [0]
+
+    def rename():
+        old_name, new_name = names[counter[0] % 2], names[(counter[0] + 1) % 2]
+        counter[0] += 1
+        obj.modifiers.rename(effector_mod, new_name)
+        manager.update_after_modifier_rename(obj, old_name, new_name)
+
+    return sample(rename, repeat, budget)
+
+
+CASE_RUNNERS = {
+    "classify_components": bench_classify,
+    "chain_lookup": bench_chain_lookup,
+    "effector_handler_idle": lambda info, repeat, budget: bench_effector_handler(info, repeat, budget, change=False),
+    "effector_handler_change": lambda info, repeat, budget: bench_effector_handler(info, repeat, budget, change=True),
+    "dependency_rename": bench_dependency_rename,
+}
+
+
+def run_scaling(sizes, depth=3, repeat=20, budget=1.0, cases=None):
+    """
+    Строит сцены заданных размеров и замеряет выбранные случаи.
+
+    Args:
+        sizes: Размеры сцены (число клонеров)
+        depth: Глубина цепочек
+        repeat: Максимум выборок на случай и размер
+        budget: Бюджет времени на случай и размер, с
+        cases: Имена случаев (по умолчанию все)
+
+    Returns:
+        dict: {"meta": {...}, "results": {"случай/N": статистика}, "curves": {случай: {...}}}
+    """
+    fake_bpy.install()
+    fake_bpy.load_addon()
+
+    selected = [c for c in ALL_CASES if not cases or c in cases]
+    results = {}
+    curves = {case: [] for case in selected}
+
+    for size in sizes:
+        info = build_fake_scene(size, depth)
+        for case in selected:
+            stats = summarize(CASE_RUNNERS[case](info, repeat, budget))
+            results[f"{case}/{size}"] = stats
+            curves[case].append((size, stats["median_ms"]))
+
+    return {
+        "meta": {
+            "blender": "fake_bpy",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"sizes": list(sizes), "depth": depth, "repeat": repeat, "budget": budget},
+        },
+        "results": results,
+        "curves": {
+            case: {"points": points, "exponent": growth_exponent(points)}
+            for case, points in curves.items()
+        },
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()] or None
+
+    unknown = [c for c in cases or [] if c not in ALL_CASES]
+    if unknown:
+        print(f"Unknown cases: {', '.join(unknown)}")
+        sys.exit(2)
+
+    data = run_scaling(sizes, args.depth, args.repeat, args.budget, cases)
+
+    print("")
+    print(f"{'case':26s} " + " ".join(f"{size:>11d}" for size in sizes) + "      k")
+    for case, curve in data["curves"].items():
+        row = " ".join(f"{ms:11.4f}" for _, ms in curve["points"])
+        exponent = curve["exponent"]
+        print(f"{case:26s} {row}  {exponent:5.2f}" if exponent is not None else f"{case:26s} {row}")
+    print("(median ms per call; classify_components is per modifier)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
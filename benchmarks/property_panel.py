@@ -0,0 +1,120 @@
+"""
+Кастомные свойства компонентов: отрисовка панели и чтение значений.
+
+На объекте с N модификаторами клонеров создается группа свойств, у каждого
+модификатора - несколько свойств (по умолчанию 64 свойства на объекте):
+    panel_draw     - CUSTOM_PT_properties_panel.draw с заглушкой layout
+    get_property   - чтение всех свойств по одному через get_property
+    get_properties - то же одним вызовом get_properties
+    component_type - _get_component_type для всех модификаторов (кэш по указателю)
+
+Результаты пишутся в формате suite.py (ключи "<случай>/<N свойств>"),
+поэтому сравниваются с эталоном через benchmarks/compare.py.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import property_panel; property_panel.main()" -- \\
+        --modifiers 16 --per-modifier 4 --repeat 50 --output property_panel.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import bpy
+
+from . import scene as bench_scene
+from .suite import make_panel_stub, summarize, timed
+
+GROUP_ID = "bench_properties"
+PROPERTY_TYPES = ("float", "int", "bool", "vector")
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Custom component properties: panel draw and bulk reads")
+    parser.add_argument("--modifiers", type=int, default=16, help="Число модификаторов клонеров")
+    parser.add_argument("--per-modifier", type=int, default=4, help="Число свойств на модификатор")
+    parser.add_argument("--repeat", type=int, default=50, help="Число повторов каждого случая")
+    parser.add_argument("--output", default="property_panel.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def build_object(modifiers, per_modifier):
+    """Объект с модификаторами клонеров и группой свойств на них."""
+    from advanced_cloners.core.utils.property_utils.property_manager import ComponentPropertyManager
+
+    bench_scene.reset_scene()
+    mesh = bpy.data.meshes.new("BenchPropsMesh")
+    obj = bpy.data.objects.new("BenchProps", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+
+    ComponentPropertyManager.add_property_group_to_object(obj, GROUP_ID, "Bench Properties")
+    properties = []
+    for i in range(modifiers):
+        node_group = bpy.data.node_groups.new(f"GridCloner_Bench_{i:03d}", 'GeometryNodeTree')
+        mod = obj.modifiers.new(name=f"Grid Cloner {i:03d}", type='NODES')
+        mod.node_group = node_group
+        for j in range(per_modifier):
+            property_id = f"value_{j}"
+            ComponentPropertyManager.add_property_to_group(
+                obj, GROUP_ID, property_id, PROPERTY_TYPES[j % len(PROPERTY_TYPES)], mod.name)
+            properties.append((property_id, mod.name))
+    return obj, properties
+
+
+def main(argv=None):
+    from advanced_cloners.core.utils.property_utils.property_manager import (
+        ComponentPropertyManager,
+        CUSTOM_PT_properties_panel,
+    )
+
+    args = parse_args(argv)
+    obj, properties = build_object(args.modifiers, args.per_modifier)
+    count = len(properties)
+    names = [mod.name for mod in obj.modifiers]
+
+    panel = make_panel_stub(CUSTOM_PT_properties_panel)
+
+    def read_each():
+        for property_id, component_name in properties:
+            ComponentPropertyManager.get_property(obj, GROUP_ID, property_id, component_name)
+
+    def classify():
+        for name in names:
+            ComponentPropertyManager._get_component_type(obj, name)
+
+    try:
+        results = {
+            f"panel_draw/{count}": summarize([timed(panel.draw, bpy.context) for _ in range(args.repeat)]),
+            f"get_property/{count}": summarize([timed(read_each) for _ in range(args.repeat)]),
+            f"get_properties/{count}": summarize([timed(ComponentPropertyManager.get_properties, obj, GROUP_ID)
+                                                  for _ in range(args.repeat)]),
+            f"component_type/{count}": summarize([timed(classify) for _ in range(args.repeat)]),
+        }
+    finally:
+        ComponentPropertyManager.remove_property_group(GROUP_ID)
+
+    for key, summary in results.items():
+        print(f"{key:24s} {summary['median_ms']:8.3f} ms")
+
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"modifiers": args.modifiers, "per_modifier": args.per_modifier, "repeat": args.repeat},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
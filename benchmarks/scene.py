@@ -0,0 +1,124 @@
+"""
+Генерация синтетических сцен для бенчмарков: N клонеров × M эффекторов × глубина цепочки.
+"""
+
+import bpy
+import addon_utils
+
+ADDON = "advanced_cloners"
+
+
+def reset_scene():
+    """Сбрасывает сцену к пустой и включает аддон."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable(ADDON, default_set=True)
+
+
+def create_sources(count, prefix="BenchSource"):
+    """
+    Создает исходные меш-объекты для клонирования.
+
+    Args:
+        count: Количество объектов
+        prefix: Префикс имён
+
+    Returns:
+        list: Имена созданных объектов
+    """
+    names = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"{prefix}_{i:04d}_Mesh")
+        obj = bpy.data.objects.new(f"{prefix}_{i:04d}", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        names.append(obj.name)
+    return names
+
+
+def find_cloner_modifier(obj):
+    """Возвращает последний модификатор клонера на объекте или None."""
+    for mod in reversed(obj.modifiers):
+        if mod.type == 'NODES' and mod.node_group and mod.node_group.get("linked_effectors") is not None:
+            return mod
+    return None
+
+
+def create_effector(obj, effector_type="RANDOM"):
+    """
+    Создает эффектор на объекте клонера через оператор аддона.
+
+    Returns:
+        str: Имя модификатора эффектора или None
+    """
+    before = {m.name for m in obj.modifiers}
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.create_effector(effector_type=effector_type)
+    created = [m.name for m in obj.modifiers if m.name not in before]
+    return created[0] if created else None
+
+
+def link_effector(obj, cloner_mod, effector_name, update=True):
+    """Связывает эффектор с клонером и, при необходимости, пересобирает клонер."""
+    from advanced_cloners.core.utils.cloner_effector_utils import update_cloner_with_effectors
+    from advanced_cloners.core.utils.property_utils.dependency_manager import dependency_manager
+
+    dependency_manager.link_effector_to_cloner(obj, cloner_mod, obj.modifiers[effector_name])
+    if update:
+        update_cloner_with_effectors(obj, cloner_mod)
+
+
+def unlink_effector(obj, cloner_mod, effector_name, update=True):
+    """Отвязывает эффектор от клонера и, при необходимости, пересобирает клонер."""
+    from advanced_cloners.core.utils.cloner_effector_utils import update_cloner_with_effectors
+    from advanced_cloners.core.utils.property_utils.dependency_manager import dependency_manager
+
+    dependency_manager.unlink_effector_from_cloner(obj, cloner_mod, effector_name)
+    if update:
+        update_cloner_with_effectors(obj, cloner_mod)
+
+
+def build_scene(cloners=10, effectors=1, depth=1, cloner_type="GRID", effector_type="RANDOM"):
+    """
+    Строит синтетическую сцену.
+
+    Каждая из cloners цепочек начинается с исходного объекта и содержит depth клонеров,
+    каждый следующий клонирует предыдущий. На последнем клонере каждой цепочки
+    создаются effectors эффекторов, связанных с ним.
+
+    Args:
+        cloners: Количество цепочек клонеров
+        effectors: Количество эффекторов на цепочку
+        depth: Глубина цепочки
+        cloner_type: Тип клонеров
+        effector_type: Тип эффекторов
+
+    Returns:
+        dict: {"cloners": [(объект, модификатор)], "effectors": [(объект, модификатор)]}
+    """
+    import advanced_cloners.api as api
+
+    reset_scene()
+    sources = create_sources(cloners)
+
+    scene = {"cloners": [], "effectors": []}
+    level = sources
+    for _ in range(max(1, depth)):
+        results = api.create_cloners([{"type": cloner_type, "source": name} for name in level])
+        level = []
+        for result in results:
+            if result["success"]:
+                scene["cloners"].append((result["object"], result["modifier"]))
+                level.append(result["object"])
+
+    for obj_name in level:
+        obj = bpy.data.objects[obj_name]
+        cloner_mod = find_cloner_modifier(obj)
+        for _ in range(effectors):
+            effector_name = create_effector(obj, effector_type)
+            if effector_name is None:
+                continue
+            scene["effectors"].append((obj_name, effector_name))
+            if cloner_mod is not None:
+                link_effector(obj, cloner_mod, effector_name)
+
+    bpy.context.view_layer.update()
+    return scene
@@ -0,0 +1,341 @@
+"""
+Набор бенчмарков ключевых путей аддона для запуска в Blender без интерфейса.
+
+Запуск (аддон должен быть установлен как advanced_cloners):
+    blender -b --factory-startup --python-expr "from advanced_cloners.benchmarks import suite; suite.main()" -- \
+        --cloners 20 --effectors 2 --depth 2 --output bench.json
+
+Случаи:
+    create_grid, create_linear, create_circle - создание клонера оператором, на клонер
+    effector_link, effector_unlink            - связь/отвязка эффектора через update_cloner_with_effectors
+    handler_tick                              - один вызов всех обработчиков depsgraph аддона
+    effector_param_update                     - изменение параметра эффектора с пересчетом depsgraph
+    depsgraph_eval                            - полный пересчет всех клонеров сцены
+    panel_draw                                - отрисовка панелей аддона с заглушкой layout
+    file_save, file_load                      - сохранение и загрузка .blend
+
+Результаты пишутся в JSON; сравнение с эталоном - benchmarks/compare.py.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import bpy
+
+from . import scene as bench_scene
+
+ALL_CASES = (
+    "create_grid",
+    "create_linear",
+    "create_circle",
+    "effector_link",
+    "effector_unlink",
+    "handler_tick",
+    "effector_param_update",
+    "depsgraph_eval",
+    "panel_draw",
+    "file_save",
+    "file_load",
+)
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Advanced Cloners benchmark suite")
+    parser.add_argument("--cloners", type=int, default=20, help="Количество цепочек клонеров")
+    parser.add_argument("--effectors", type=int, default=2, help="Количество эффекторов на цепочку")
+    parser.add_argument("--depth", type=int, default=2, help="Глубина цепочки клонеров")
+    parser.add_argument("--repeat", type=int, default=20, help="Повторы для случаев без естественного числа выборок")
+    parser.add_argument("--cases", default="", help="Случаи через запятую (по умолчанию все)")
+    parser.add_argument("--output", default="bench.json", help="Файл результатов JSON")
+    return parser.parse_args(argv)
+
+
+def summarize(samples):
+    """
+    Сводная статистика по выборкам в секундах.
+
+    Returns:
+        dict: min/median/mean/max в миллисекундах и число выборок
+    """
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "min_ms": min(ms),
+        "median_ms": statistics.median(ms),
+        "mean_ms": statistics.fmean(ms),
+        "max_ms": max(ms),
+        "samples": len(ms),
+    }
+
+
+def timed(func, *args, **kwargs):
+    """Выполняет функцию и возвращает затраченное время в секундах."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+# Случаи
+
+def bench_create(cloner_type, count):
+    """Создание клонеров оператором: одна выборка на клонер."""
+    bench_scene.reset_scene()
+    sources = bench_scene.create_sources(count)
+
+    samples = []
+    for name in sources:
+        bpy.context.view_layer.objects.active = bpy.data.objects[name]
+        samples.append(timed(bpy.ops.object.create_cloner, cloner_type=cloner_type, source_type='OBJECT'))
+    return samples
+
+
+def bench_effector_link(scene_info):
+    """Связь и отвязка эффектора: по одной выборке на клонер с эффектором."""
+    link_samples = []
+    unlink_samples = []
+
+    for obj_name, effector_name in scene_info["effectors"]:
+        obj = bpy.data.objects.get(obj_name)
+        cloner_mod = bench_scene.find_cloner_modifier(obj) if obj else None
+        if cloner_mod is None:
+            continue
+        unlink_samples.append(timed(bench_scene.unlink_effector, obj, cloner_mod, effector_name))
+        link_samples.append(timed(bench_scene.link_effector, obj, cloner_mod, effector_name))
+
+    return link_samples, unlink_samples
+
+
+def addon_handlers():
+    """Обработчики depsgraph_update_post, добавленные аддоном."""
+    from advanced_cloners.core.utils.event_handlers import _is_addon_handler
+    return [h for h in bpy.app.handlers.depsgraph_update_post if _is_addon_handler(h)]
+
+
+def bench_handler_tick(repeat):
+    """Прямой вызов всех обработчиков аддона с текущим depsgraph."""
+    handlers = addon_handlers()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    scene = bpy.context.scene
+
+    def tick():
+        for handler in handlers:
+            handler(scene, depsgraph)
+
+    return [timed(tick) for _ in range(repeat)]
+
+
+def find_input_identifier(modifier, socket_name):
+    """Идентификатор входного сокета модификатора по имени."""
+    for item in modifier.node_group.interface.items_tree:
+        if getattr(item, "in_out", None) == 'INPUT' and item.name == socket_name:
+            return item.identifier
+    return None
+
+
+def bench_effector_param_update(scene_info, repeat):
+    """Изменение Strength эффектора и пересчет depsgraph - путь, по которому идут правки в UI."""
+    if not scene_info["effectors"]:
+        return []
+
+    obj_name, effector_name = scene_info["effectors"][0]
+    obj = bpy.data.objects[obj_name]
+    modifier = obj.modifiers[effector_name]
+    identifier = find_input_identifier(modifier, "Strength")
+    if identifier is None:
+        return []
+
+    samples = []
+    for i in range(repeat):
+        def update():
+            modifier[identifier] = (i % 10) / 10.0
+            obj.update_tag()
+            bpy.context.view_layer.update()
+        samples.append(timed(update))
+    return samples
+
+
+def bench_depsgraph_eval(scene_info, repeat):
+    """Полный пересчет: все объекты клонеров помечаются измененными."""
+    objects = [bpy.data.objects[name] for name, _ in scene_info["cloners"] if name in bpy.data.objects]
+
+    def evaluate():
+        for obj in objects:
+            obj.update_tag()
+        bpy.context.view_layer.update()
+        bpy.context.evaluated_depsgraph_get()
+
+    return [timed(evaluate) for _ in range(repeat)]
+
+
+class StubLayout:
+    """
+    Заглушка UILayout: принимает любые вызовы и атрибуты.
+    Позволяет измерить стоимость Python-кода draw() панелей без окна.
+    """
+
+    def __getattr__(self, name):
+        return self._call
+
+    def _call(self, *args, **kwargs):
+        return StubLayout()
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __bool__(self):
+        return True
+
+
+def make_panel_stub(panel_cls):
+    """
+    Экземпляр панели для вызова draw() с заглушкой layout.
+    Классы панелей Blender нельзя создать вне окна, поэтому методы копируются в простой класс.
+    """
+    namespace = {k: v for k, v in vars(panel_cls).items() if not k.startswith("__")}
+    stub = type(f"{panel_cls.__name__}Stub", (), namespace)()
+    stub.layout = StubLayout()
+    return stub
+
+
+def addon_panel_classes():
+    """Классы панелей аддона."""
+    import importlib
+    classes = []
+    for module_name in ("cloner_panel", "effector_panel", "field_panel"):
+        module = importlib.import_module(f"advanced_cloners.ui.panels.{module_name}")
+        for value in vars(module).values():
+            if isinstance(value, type) and issubclass(value, bpy.types.Panel) and value.__module__ == module.__name__:
+                classes.append(value)
+    return classes
+
+
+def bench_panel_draw(scene_info, repeat):
+    """Отрисовка всех панелей аддона для каждого объекта клонера."""
+    panels = addon_panel_classes()
+    objects = [bpy.data.objects[name] for name, _ in scene_info["cloners"] if name in bpy.data.objects]
+    if not objects:
+        return []
+
+    view_layer = bpy.context.view_layer
+
+    def draw_all():
+        for obj in objects:
+            view_layer.objects.active = obj
+            context = bpy.context
+            for panel_cls in panels:
+                poll = getattr(panel_cls, "poll", None)
+                if poll is not None and not poll(context):
+                    continue
+                make_panel_stub(panel_cls).draw(context)
+
+    return [timed(draw_all) for _ in range(max(1, repeat // 4))]
+
+
+def bench_file_save_load(repeat):
+    """Сохранение и загрузка .blend с текущей сценой."""
+    path = os.path.join(tempfile.gettempdir(), "advanced_cloners_bench.blend")
+    save_samples = []
+    load_samples = []
+    for _ in range(repeat):
+        save_samples.append(timed(bpy.ops.wm.save_as_mainfile, filepath=path, copy=True))
+        load_samples.append(timed(bpy.ops.wm.open_mainfile, filepath=path))
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return save_samples, load_samples
+
+
+def run_suite(cloners=20, effectors=2, depth=2, repeat=20, cases=None):
+    """
+    Выполняет выбранные случаи и возвращает результаты.
+
+    Args:
+        cloners: Количество цепочек клонеров
+        effectors: Количество эффекторов на цепочку
+        depth: Глубина цепочки
+        repeat: Количество повторов для случаев без естественного числа выборок
+        cases: Имена случаев (по умолчанию все)
+
+    Returns:
+        dict: {"meta": {...}, "results": {случай: статистика}}
+    """
+    selected = [c for c in ALL_CASES if not cases or c in cases]
+    results = {}
+
+    for cloner_type in ("GRID", "LINEAR", "CIRCLE"):
+        case = f"create_{cloner_type.lower()}"
+        if case in selected:
+            results[case] = summarize(bench_create(cloner_type, cloners))
+
+    scene_cases = [c for c in selected if not c.startswith("create_")]
+    if scene_cases:
+        scene_info = bench_scene.build_scene(cloners, effectors, depth)
+
+        if "effector_link" in selected or "effector_unlink" in selected:
+            link_samples, unlink_samples = bench_effector_link(scene_info)
+            if link_samples and "effector_link" in selected:
+                results["effector_link"] = summarize(link_samples)
+            if unlink_samples and "effector_unlink" in selected:
+                results["effector_unlink"] = summarize(unlink_samples)
+
+        simple_cases = (
+            ("handler_tick", lambda: bench_handler_tick(repeat)),
+            ("effector_param_update", lambda: bench_effector_param_update(scene_info, repeat)),
+            ("depsgraph_eval", lambda: bench_depsgraph_eval(scene_info, repeat)),
+            ("panel_draw", lambda: bench_panel_draw(scene_info, repeat)),
+        )
+        for case, run in simple_cases:
+            if case in selected:
+                samples = run()
+                if samples:
+                    results[case] = summarize(samples)
+
+        # Загрузка файла заменяет сцену, поэтому этот случай последний
+        if "file_save" in selected or "file_load" in selected:
+            save_samples, load_samples = bench_file_save_load(max(1, repeat // 4))
+            if "file_save" in selected:
+                results["file_save"] = summarize(save_samples)
+            if "file_load" in selected:
+                results["file_load"] = summarize(load_samples)
+
+    import advanced_cloners
+    return {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "addon_version": list(advanced_cloners.bl_info.get("version", ())),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {"cloners": cloners, "effectors": effectors, "depth": depth, "repeat": repeat},
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()] or None
+
+    unknown = [c for c in cases or [] if c not in ALL_CASES]
+    if unknown:
+        print(f"Unknown cases: {', '.join(unknown)}")
+        sys.exit(2)
+
+    data = run_suite(args.cloners, args.effectors, args.depth, args.repeat, cases)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+    print("")
+    print(f"{'case':24s} {'median ms':>10s} {'min ms':>10s} {'samples':>8s}")
+    for case, stats in data["results"].items():
+        print(f"{case:24s} {stats['median_ms']:10.3f} {stats['min_ms']:10.3f} {stats['samples']:8d}")
+    print(f"Results written to {args.output}")
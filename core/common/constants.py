@@ -28,31 +28,30 @@ SOCKET_RANDOM_POSITION = "Socket_6"  # random_position
 SOCKET_RANDOM_ROTATION = "Socket_7"  # random_rotation
 SOCKET_RANDOM_SCALE = "Socket_11"    # random_scale
 
-# Импортируем необходимые классы для создания нод-групп
-from ...models.cloners.grid_cloner import GridCloner
-from ...models.cloners.linear_cloner import LinearCloner
-from ...models.cloners.circle_cloner import CircleCloner
-from ...models.effectors.random_effector import RandomEffector
-from ...models.effectors.noise_effector import NoiseEffector
-from ...models.fields.sphere_field import SphereField
-
-# Определяем функции создания нод-групп
+# Определяем функции создания нод-групп.
+# Классы моделей импортируются при вызове, чтобы не загружать их при включении аддона
 def gridcloner3d_node_group():
+    from ...models.cloners.grid_cloner import GridCloner
     return GridCloner.create_node_group()
 
 def advancedlinearcloner_node_group():
+    from ...models.cloners.linear_cloner import LinearCloner
     return LinearCloner.create_node_group()
 
 def circlecloner_node_group():
+    from ...models.cloners.circle_cloner import CircleCloner
     return CircleCloner.create_node_group()
 
 def randomeffector_node_group():
+    from ...models.effectors.random_effector import RandomEffector
     return RandomEffector.create_node_group()
 
 def noiseeffector_node_group():
+    from ...models.effectors.noise_effector import NoiseEffector
     return NoiseEffector.create_node_group()
 
 def spherefield_node_group():
+    from ...models.fields.sphere_field import SphereField
     return SphereField.create_node_group()
 
 # Функции создания для каждого типа эффектора
@@ -9,6 +9,11 @@ from ...models.effectors import AVAILABLE_EFFECTORS, EFFECTOR_CREATORS, EFFECTOR
 from ...models.fields import AVAILABLE_FIELDS, FIELD_CREATORS, FIELD_GROUP_NAMES
 from ..utils.node_utils import create_independent_node_group
 
+from ...core.utils.logging_utils import get_logger
+from ..utils.graph_profiler import tracks_graph_build
+
+log = get_logger("core")
+
 class ComponentFactory:
     """
     Фабрика для создания компонентов аддона (клонеров, эффекторов, полей).
@@ -16,6 +21,7 @@ class ComponentFactory:
     """
     
     @classmethod
+    @tracks_graph_build("cloner", "cloner_type")
     def create_cloner(cls, cloner_type: str, use_custom_group: bool = True, **kwargs) -> Optional[bpy.types.NodeGroup]:
         """
         Создает группу узлов клонера указанного типа.
@@ -30,7 +36,7 @@ class ComponentFactory:
         """
         # Проверяем, есть ли такой тип клонера
         if cloner_type not in AVAILABLE_CLONERS:
-            print(f"Unknown cloner type: {cloner_type}")
+            log.debug("Unknown cloner type: %s", cloner_type)
             return None
         
         # Получаем класс клонера и имена
@@ -57,6 +63,7 @@ class ComponentFactory:
         return node_group
     
     @classmethod
+    @tracks_graph_build("effector", "effector_type")
     def create_effector(cls, effector_type: str, use_custom_group: bool = True, **kwargs) -> Optional[bpy.types.NodeGroup]:
         """
         Создает группу узлов эффектора указанного типа.
@@ -71,7 +78,7 @@ class ComponentFactory:
         """
         # Проверяем, есть ли такой тип эффектора
         if effector_type not in EFFECTOR_CREATORS:
-            print(f"Unknown effector type: {effector_type}")
+            log.debug("Unknown effector type: %s", effector_type)
             return None
         
         base_node_name = EFFECTOR_GROUP_NAMES[effector_type]
@@ -107,6 +114,7 @@ class ComponentFactory:
         return node_group
     
     @classmethod
+    @tracks_graph_build("field", "field_type")
     def create_field(cls, field_type: str, use_custom_group: bool = True, **kwargs) -> Optional[bpy.types.NodeGroup]:
         """
         Создает группу узлов поля указанного типа.
@@ -121,7 +129,7 @@ class ComponentFactory:
         """
         # Проверяем, есть ли такой тип поля
         if field_type not in FIELD_CREATORS:
-            print(f"Unknown field type: {field_type}")
+            log.debug("Unknown field type: %s", field_type)
             return None
         
         base_node_name = FIELD_GROUP_NAMES[field_type]
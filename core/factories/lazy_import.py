@@ -0,0 +1,110 @@
+"""
+Ленивый импорт модулей аддона.
+
+Модули моделей и тяжёлые помощники операций импортируются при первом
+обращении к экспортируемому имени, а не при включении аддона.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Dict, Callable, Iterator, Any
+
+
+def lazy_exports(package_name: str, exports: Dict[str, str]):
+    """
+    Создает функции __getattr__ и __dir__ для ленивого реэкспорта имён пакета (PEP 562).
+
+    Пример:
+        __getattr__, __dir__ = lazy_exports(__name__, {"GridCloner": ".grid_cloner"})
+
+    Args:
+        package_name: Имя модуля или пакета (__name__)
+        exports: Словарь имя -> относительное имя модуля, в котором оно определено
+
+    Returns:
+        tuple: (__getattr__, __dir__) для модуля пакета
+    """
+    module_globals = importlib.import_module(package_name).__dict__
+    # Относительные имена разрешаются от пакета, в котором находится модуль
+    anchor = module_globals.get("__package__") or package_name
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, anchor), name)
+        # Кешируем в пространстве имён пакета, чтобы __getattr__ больше не вызывался
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class LazyClassMap(Mapping):
+    """
+    Словарь тип -> значение, значения которого загружаются при первом обращении.
+    Проверка наличия ключа и перечисление типов не импортируют модули.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]):
+        self._loaders = dict(loaders)
+        self._values = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __repr__(self) -> str:
+        return f"LazyClassMap({list(self._loaders)})"
+
+
+def class_loader(package_name: str, module_name: str, class_name: str) -> Callable[[], Any]:
+    """
+    Возвращает функцию, импортирующую класс из модуля пакета.
+
+    Args:
+        package_name: Имя пакета, относительно которого задан модуль
+        module_name: Относительное имя модуля (например, '.grid_cloner')
+        class_name: Имя класса
+
+    Returns:
+        callable: Функция без аргументов, возвращающая класс
+    """
+    def load():
+        return getattr(importlib.import_module(module_name, package_name), class_name)
+    return load
+
+
+def attribute_loader(package_name: str, module_name: str, class_name: str, attribute: str) -> Callable[[], Any]:
+    """
+    Возвращает функцию, получающую атрибут класса из модуля пакета
+    (например, метод create_node_group).
+
+    Args:
+        package_name: Имя пакета, относительно которого задан модуль
+        module_name: Относительное имя модуля
+        class_name: Имя класса
+        attribute: Имя атрибута класса
+
+    Returns:
+        callable: Функция без аргументов, возвращающая атрибут
+    """
+    load_class = class_loader(package_name, module_name, class_name)
+
+    def load():
+        return getattr(load_class(), attribute)
+    return load
@@ -0,0 +1,257 @@
+"""
+Генератор манифеста регистрации аддона.
+
+Манифест перечисляет модули, которые auto_register_modules должен импортировать
+и зарегистрировать при включении аддона, их классы для регистрации и обработчики
+bpy.app.handlers из кортежей app_handlers = (("<список>", <обработчик>), ...)
+модулей. По разделу обработчиков регистрация их и устанавливает
+(register_manifest_handlers). Исходники разбираются через ast без импорта, поэтому
+генератор работает без Blender:
+
+    python core/factories/manifest_builder.py           # перезаписать манифест
+    python core/factories/manifest_builder.py --check   # код 1, если манифест устарел
+
+Модули с пустыми register/unregister (только pass) в манифест не попадают
+и при включении аддона не импортируются.
+"""
+
+import ast
+import os
+import sys
+from typing import Dict, List, Any, Optional
+
+# Корень аддона: core/factories/manifest_builder.py -> ../../
+ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Пакеты, которые регистрирует __init__.py через auto_register_modules
+REGISTERED_PACKAGES = (
+    "models.effectors",
+    "models.cloners",
+    "models.fields",
+    "ui",
+    "operations",
+)
+
+# Модули, пропускаемые при регистрации (см. DEPRECATED_FILES в registration.py)
+SKIPPED_MODULES = (
+    "src.ui.cloner_panel",
+    "src.ui.effector_panel",
+    "src.ui.field_panel",
+)
+
+MANIFEST_PATH = os.path.join(ADDON_ROOT, "core", "factories", "registration_manifest.py")
+
+MANIFEST_HEADER = '''"""
+Манифест регистрации аддона.
+
+Файл сгенерирован core/factories/manifest_builder.py - не редактируйте вручную.
+"""
+
+'''
+
+
+def _parse(path: str) -> Optional[ast.Module]:
+    """Разбирает файл модуля. Возвращает None для нечитаемых файлов."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return ast.parse(f.read(), filename=path)
+    except (UnicodeDecodeError, SyntaxError, OSError):
+        return None
+
+
+def _is_trivial(func: ast.FunctionDef) -> bool:
+    """Проверяет, что тело функции состоит только из pass и строк документации."""
+    for stmt in func.body:
+        if isinstance(stmt, ast.Pass):
+            continue
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str):
+            continue
+        return False
+    return True
+
+
+def _top_level_functions(tree: ast.Module) -> Dict[str, ast.FunctionDef]:
+    return {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+
+def _defines_name(tree: ast.Module, name: str) -> bool:
+    """Проверяет, определяет ли модуль имя на верхнем уровне (функцией, присваиванием или импортом)."""
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name == name:
+            return True
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                names = target.elts if isinstance(target, ast.Tuple) else [target]
+                if any(isinstance(n, ast.Name) and n.id == name for n in names):
+                    return True
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if any((alias.asname or alias.name) == name for alias in node.names):
+                return True
+    return False
+
+
+def _needs_registration(tree: ast.Module) -> bool:
+    """Проверяет, есть ли у модуля register/unregister с реальной работой."""
+    if not _defines_name(tree, "register"):
+        return False
+
+    functions = _top_level_functions(tree)
+    register = functions.get("register")
+    unregister = functions.get("unregister")
+    if register is None:
+        # register задан присваиванием или импортом - считаем нетривиальным
+        return True
+    return not (_is_trivial(register) and (unregister is None or _is_trivial(unregister)))
+
+
+def _registered_classes(tree: ast.Module) -> List[str]:
+    """Возвращает имена из списка classes = (...) модуля."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "classes" for t in node.targets):
+            if isinstance(node.value, (ast.Tuple, ast.List)):
+                return [ast.unparse(elt) for elt in node.value.elts]
+    return []
+
+
+def _declared_handlers(tree: ast.Module) -> List[List[str]]:
+    """Возвращает пары [список, обработчик] из app_handlers = (("<список>", <обработчик>), ...) модуля."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "app_handlers" for t in node.targets):
+            if not isinstance(node.value, (ast.Tuple, ast.List)):
+                return []
+            found = []
+            for elt in node.value.elts:
+                if (isinstance(elt, ast.Tuple) and len(elt.elts) == 2
+                        and isinstance(elt.elts[0], ast.Constant) and isinstance(elt.elts[0].value, str)):
+                    found.append([elt.elts[0].value, ast.unparse(elt.elts[1])])
+            return found
+    return []
+
+
+def _iter_package(package_dir: str):
+    """Перебирает модули и подпакеты каталога в порядке pkgutil.iter_modules."""
+    for name in sorted(os.listdir(package_dir)):
+        path = os.path.join(package_dir, name)
+        if os.path.isdir(path) and os.path.isfile(os.path.join(path, "__init__.py")):
+            yield name, path, True
+        elif name.endswith(".py") and name != "__init__.py":
+            yield name[:-3], path, False
+
+
+def _collect_package(package: str) -> List[Dict[str, Any]]:
+    """
+    Повторяет обход auto_register_modules для пакета и возвращает записи манифеста.
+
+    Args:
+        package: Имя пакета относительно корня аддона (например, 'models.cloners')
+
+    Returns:
+        list: Записи {"module", "is_package", "classes"} в порядке регистрации
+    """
+    entries = []
+    package_dir = os.path.join(ADDON_ROOT, *package.split("."))
+
+    for name, path, is_pkg in _iter_package(package_dir):
+        module = f"{package}.{name}"
+        if module in SKIPPED_MODULES:
+            continue
+
+        if is_pkg:
+            tree = _parse(os.path.join(path, "__init__.py"))
+            if tree is None:
+                continue
+            if _defines_name(tree, "register"):
+                if _needs_registration(tree):
+                    entries.append({"module": module, "is_package": True, "classes": _registered_classes(tree)})
+            else:
+                entries.extend(_collect_package(module))
+        else:
+            tree = _parse(path)
+            if tree is not None and _needs_registration(tree):
+                entries.append({"module": module, "is_package": False, "classes": _registered_classes(tree)})
+
+    return entries
+
+
+def _collect_handlers() -> List[List[str]]:
+    """Возвращает обработчики bpy.app.handlers, добавляемые аддоном: [список, модуль, обработчик]."""
+    handlers = []
+    for dirpath, dirnames, filenames in os.walk(ADDON_ROOT):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")) and d != "benchmarks")
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, filename)
+            tree = _parse(path)
+            if tree is None:
+                continue
+            module = os.path.relpath(path, ADDON_ROOT)[:-3].replace(os.sep, ".")
+            if module.endswith(".__init__"):
+                module = module[:-len(".__init__")]
+            elif module == "__init__":
+                module = ""
+            for handler_list, handler in _declared_handlers(tree):
+                handlers.append([handler_list, module, handler])
+    return handlers
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Строит манифест регистрации по исходникам аддона.
+
+    Returns:
+        dict: {"version", "packages": {пакет: [записи]}, "handlers": [[список, модуль, обработчик]]}
+    """
+    return {
+        "version": 1,
+        "packages": {package: _collect_package(package) for package in REGISTERED_PACKAGES},
+        "handlers": _collect_handlers(),
+    }
+
+
+def render_manifest(manifest: Dict[str, Any]) -> str:
+    """Возвращает исходный код модуля манифеста."""
+    lines = [MANIFEST_HEADER + "MANIFEST = {", f'    "version": {manifest["version"]},', '    "packages": {']
+    for package, entries in manifest["packages"].items():
+        if not entries:
+            lines.append(f'        "{package}": [],')
+            continue
+        lines.append(f'        "{package}": [')
+        for entry in entries:
+            lines.append(f'            {{"module": "{entry["module"]}", "is_package": {entry["is_package"]}, '
+                         f'"classes": {entry["classes"]!r}}},'.replace("'", '"'))
+        lines.append('        ],')
+    lines.append('    },')
+    lines.append('    "handlers": [')
+    for handler_list, module, handler in manifest["handlers"]:
+        lines.append(f'        ["{handler_list}", "{module}", "{handler}"],')
+    lines.append('    ],')
+    lines.append('}')
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str]) -> int:
+    source = render_manifest(build_manifest())
+
+    current = None
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            current = f.read()
+
+    if "--check" in argv:
+        if current != source:
+            print(f"Registration manifest is out of date: {MANIFEST_PATH}")
+            print("Run: python core/factories/manifest_builder.py")
+            return 1
+        print("Registration manifest is up to date")
+        return 0
+
+    if current != source:
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+            f.write(source)
+        print(f"Written {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -9,6 +9,10 @@ import pkgutil
 from typing import Type, List, Dict, Any, Optional, Callable, Union
 import os.path
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("core")
+
 # Список устаревших файлов, которые нужно игнорировать при регистрации
 DEPRECATED_FILES = [
     "advanced_cloners.src.ui.cloner_panel",
@@ -16,9 +20,159 @@ DEPRECATED_FILES = [
     "advanced_cloners.src.ui.field_panel"
 ]
 
+def _manifest_entries(package_path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Возвращает записи манифеста регистрации для пакета.
+
+    Args:
+        package_path: Полный путь к пакету (например, 'advanced_cloners.models.cloners')
+
+    Returns:
+        Список записей или None, если пакета нет в манифесте
+    """
+    try:
+        from .registration_manifest import MANIFEST
+    except ImportError:
+        return None
+
+    root, _, relative = package_path.partition('.')
+    entries = MANIFEST.get("packages", {}).get(relative)
+    if entries is None:
+        return None
+    return [dict(entry, name=f"{root}.{entry['module']}") for entry in entries]
+
+
+def register_from_manifest(package_path: str) -> Optional[List[Any]]:
+    """
+    Регистрирует модули пакета по манифесту, не обходя файлы пакета.
+    Импортируются только модули, у которых есть что регистрировать.
+
+    Args:
+        package_path: Полный путь к пакету
+
+    Returns:
+        Список зарегистрированных модулей или None, если пакета нет в манифесте
+    """
+    entries = _manifest_entries(package_path)
+    if entries is None:
+        return None
+
+    registered_items = []
+    for entry in entries:
+        name = entry["name"]
+        try:
+            module = importlib.import_module(name)
+            module.register()
+            registered_items.append(module)
+            log.debug("Registered %s: %s", "sub-package" if entry["is_package"] else "module", name)
+        except Exception as e:
+            log.error("Error registering module %s: %s", name, e)
+
+    return registered_items
+
+
+def unregister_from_manifest(package_path: str) -> bool:
+    """
+    Отменяет регистрацию модулей пакета по манифесту в обратном порядке.
+
+    Args:
+        package_path: Полный путь к пакету
+
+    Returns:
+        bool: False, если пакета нет в манифесте
+    """
+    entries = _manifest_entries(package_path)
+    if entries is None:
+        return False
+
+    for entry in reversed(entries):
+        name = entry["name"]
+        try:
+            module = importlib.import_module(name)
+            if hasattr(module, 'unregister'):
+                module.unregister()
+                log.debug("Unregistered %s: %s", "sub-package" if entry["is_package"] else "module", name)
+        except Exception as e:
+            log.error("Error unregistering module %s: %s", name, e)
+
+    return True
+
+
+def _manifest_handlers(root: str) -> List[tuple]:
+    """
+    Возвращает обработчики из раздела handlers манифеста.
+
+    Args:
+        root: Имя корневого пакета аддона
+
+    Returns:
+        list: Пары (имя списка bpy.app.handlers, обработчик); недоступные пропускаются
+    """
+    try:
+        from .registration_manifest import MANIFEST
+    except ImportError:
+        return []
+
+    handlers = []
+    for handler_list, module_name, path in MANIFEST.get("handlers", []):
+        if not hasattr(bpy.app.handlers, handler_list):
+            continue
+        try:
+            target = importlib.import_module(f"{root}.{module_name}" if module_name else root)
+            for attr in path.split("."):
+                target = getattr(target, attr)
+        except Exception as e:
+            log.error("Cannot resolve handler %s.%s: %s", module_name, path, e)
+            continue
+        handlers.append((handler_list, target))
+    return handlers
+
+
+def register_manifest_handlers(root: str) -> int:
+    """
+    Устанавливает обработчики bpy.app.handlers, перечисленные в манифесте.
+
+    Args:
+        root: Имя корневого пакета аддона
+
+    Returns:
+        int: Число добавленных обработчиков
+    """
+    added = 0
+    for handler_list, handler in _manifest_handlers(root):
+        handlers = getattr(bpy.app.handlers, handler_list)
+        if handler not in handlers:
+            handlers.append(handler)
+            added += 1
+    log.debug("Registered %s handlers from manifest", added)
+    return added
+
+
+def unregister_manifest_handlers(root: str) -> int:
+    """
+    Снимает обработчики bpy.app.handlers, перечисленные в манифесте.
+
+    Args:
+        root: Имя корневого пакета аддона
+
+    Returns:
+        int: Число снятых обработчиков
+    """
+    removed = 0
+    for handler_list, handler in _manifest_handlers(root):
+        handlers = getattr(bpy.app.handlers, handler_list)
+        while handler in handlers:
+            handlers.remove(handler)
+            removed += 1
+    log.debug("Unregistered %s handlers from manifest", removed)
+    return removed
+
+
 def auto_register_modules(package_path: str, base_class: Optional[Type] = None) -> List[Any]:
     """
     Автоматически регистрирует все модули из указанного пакета и его подпакетов.
+    Если пакет есть в манифесте регистрации, модули берутся из манифеста
+    без обхода и импорта всех файлов пакета.
     
     Args:
         package_path: Путь к пакету (например, 'advanced_cloners.src.effectors')
@@ -27,6 +181,11 @@ def auto_register_modules(package_path: str, base_class: Optional[Type] = None)
     Returns:
         Список зарегистрированных модулей или классов
     """
+    if base_class is None:
+        registered_items = register_from_manifest(package_path)
+        if registered_items is not None:
+            return registered_items
+
     registered_items = []
     
     try:
@@ -37,7 +196,7 @@ def auto_register_modules(package_path: str, base_class: Optional[Type] = None)
         for _, name, is_pkg in pkgutil.iter_modules(package.__path__, package.__name__ + '.'):
             # Пропускаем устаревшие файлы
             if name in DEPRECATED_FILES:
-                print(f"Skipping deprecated module: {name}")
+                log.debug("Skipping deprecated module: %s", name)
                 continue
 
             if is_pkg:
@@ -49,13 +208,13 @@ def auto_register_modules(package_path: str, base_class: Optional[Type] = None)
                     if hasattr(sub_package, 'register'):
                         sub_package.register()
                         registered_items.append(sub_package)
-                        print(f"Registered sub-package: {name}")
+                        log.debug("Registered sub-package: %s", name)
                     else:
                         # Если у подпакета нет методов register/unregister, рекурсивно обрабатываем его
                         sub_items = auto_register_modules(name, base_class)
                         registered_items.extend(sub_items)
                 except Exception as e:
-                    print(f"Error registering sub-package {name}: {e}")
+                    log.error("Error registering sub-package %s: %s", name, e)
             
             else:  # Если это модуль
                 try:
@@ -70,19 +229,19 @@ def auto_register_modules(package_path: str, base_class: Optional[Type] = None)
                                 if hasattr(obj, 'register'):
                                     obj.register()
                                     registered_items.append(obj)
-                                    print(f"Registered class: {obj.__name__}")
+                                    log.debug("Registered class: %s", obj.__name__)
                     else:
                         # Регистрируем сам модуль, если у него есть метод register
                         if hasattr(module, 'register'):
                             module.register()
                             registered_items.append(module)
-                            print(f"Registered module: {name}")
+                            log.debug("Registered module: %s", name)
                 
                 except Exception as e:
-                    print(f"Error registering module {name}: {e}")
+                    log.error("Error registering module %s: %s", name, e)
     
     except Exception as e:
-        print(f"Error during auto-registration: {e}")
+        log.error("Error during auto-registration: %s", e)
     
     return registered_items
 
@@ -95,6 +254,9 @@ def auto_unregister_modules(package_path: str, base_class: Optional[Type] = None
         package_path: Путь к пакету
         base_class: Если указан, отменяет регистрацию только классов-наследников этого класса
     """
+    if base_class is None and unregister_from_manifest(package_path):
+        return
+
     try:
         # Импортируем пакет
         package = importlib.import_module(package_path)
@@ -106,7 +268,7 @@ def auto_unregister_modules(package_path: str, base_class: Optional[Type] = None
         for _, name, is_pkg in modules:
             # Пропускаем устаревшие файлы
             if name in DEPRECATED_FILES:
-                print(f"Skipping deprecated module: {name}")
+                log.debug("Skipping deprecated module: %s", name)
                 continue
 
             if is_pkg:
@@ -117,12 +279,12 @@ def auto_unregister_modules(package_path: str, base_class: Optional[Type] = None
                     # Проверяем, есть ли у подпакета методы register/unregister
                     if hasattr(sub_package, 'unregister'):
                         sub_package.unregister()
-                        print(f"Unregistered sub-package: {name}")
+                        log.debug("Unregistered sub-package: %s", name)
                     else:
                         # Если у подпакета нет методов register/unregister, рекурсивно обрабатываем его
                         auto_unregister_modules(name, base_class)
                 except Exception as e:
-                    print(f"Error unregistering sub-package {name}: {e}")
+                    log.error("Error unregistering sub-package %s: %s", name, e)
             
             else:  # Если это модуль
                 try:
@@ -136,15 +298,15 @@ def auto_unregister_modules(package_path: str, base_class: Optional[Type] = None
                                 # Отменяем регистрацию найденного класса
                                 if hasattr(obj, 'unregister'):
                                     obj.unregister()
-                                    print(f"Unregistered class: {obj.__name__}")
+                                    log.debug("Unregistered class: %s", obj.__name__)
                     else:
                         # Отменяем регистрацию самого модуля
                         if hasattr(module, 'unregister'):
                             module.unregister()
-                            print(f"Unregistered module: {name}")
+                            log.debug("Unregistered module: %s", name)
                 
                 except Exception as e:
-                    print(f"Error unregistering module {name}: {e}")
+                    log.error("Error unregistering module %s: %s", name, e)
     
     except Exception as e:
-        print(f"Error during auto-unregistration: {e}") 
\ No newline at end of file
+        log.error("Error during auto-unregistration: %s", e) 
\ No newline at end of file
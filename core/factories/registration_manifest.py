@@ -0,0 +1,48 @@
+"""
+Манифест регистрации аддона.
+
+Файл сгенерирован core/factories/manifest_builder.py - не редактируйте вручную.
+"""
+
+MANIFEST = {
+    "version": 1,
+    "packages": {
+        "models.effectors": [
+            {"module": "models.effectors.noise_effector", "is_package": False, "classes": []},
+        ],
+        "models.cloners": [],
+        "models.fields": [],
+        "ui": [
+            {"module": "ui.operators", "is_package": True, "classes": []},
+            {"module": "ui.panels", "is_package": True, "classes": []},
+        ],
+        "operations": [
+            {"module": "operations.cloner_ops", "is_package": False, "classes": ["CLONER_OT_create_cloner", "CLONER_OT_delete_cloner", "CLONER_OT_move_modifier"]},
+            {"module": "operations.effector_ops", "is_package": False, "classes": ["EFFECTOR_OT_create_effector", "EFFECTOR_OT_delete_effector", "EFFECTOR_OT_move_modifier"]},
+            {"module": "operations.fix_recursion", "is_package": False, "classes": []},
+            {"module": "operations.fix_recursion_improved", "is_package": False, "classes": []},
+            {"module": "operations.maintenance_ops", "is_package": False, "classes": ["CLONER_OT_deduplicate_node_groups", "CLONER_OT_collect_garbage", "CLONER_OT_cancel_job"]},
+            {"module": "operations.stats_ops", "is_package": False, "classes": ["CLONER_OT_reset_modifier_stats", "CLONER_OT_export_modifier_stats", "CLONER_OT_analyze_instances", "CLONER_OT_export_instance_report", "CLONER_OT_export_profile_trace", "CLONER_OT_clear_profile_trace"]},
+        ],
+    },
+    "handlers": [
+        ["depsgraph_update_post", "core.utils.anti_recursion_utils", "cloner_tree_revision_handler"],
+        ["load_post", "core.utils.anti_recursion_utils", "cloner_health_load_handler"],
+        ["depsgraph_update_post", "core.utils.event_handlers", "cloner_chain_update_handler"],
+        ["depsgraph_update_post", "core.utils.event_handlers", "cloner_collection_update_handler"],
+        ["depsgraph_update_post", "core.utils.event_handlers", "effector_parameter_update_handler"],
+        ["depsgraph_update_post", "core.utils.instance_guard", "instance_guard_handler"],
+        ["load_pre", "core.utils.job_queue", "job_queue_reset_handler"],
+        ["undo_pre", "core.utils.job_queue", "job_queue_reset_handler"],
+        ["redo_pre", "core.utils.job_queue", "job_queue_reset_handler"],
+        ["load_post", "core.utils.migrations", "node_group_migration_handler"],
+        ["depsgraph_update_post", "core.utils.modifier_stats", "modifier_stats_update_handler"],
+        ["frame_change_post", "core.utils.modifier_stats", "modifier_stats_frame_handler"],
+        ["load_post", "core.utils.node_dedup", "node_dedup_load_handler"],
+        ["save_pre", "core.utils.property_utils.dependency_manager", "dependency_graph_save_handler"],
+        ["load_post", "core.utils.property_utils.dependency_manager", "dependency_graph_load_handler"],
+        ["undo_post", "core.utils.property_utils.dependency_manager", "dependency_graph_load_handler"],
+        ["redo_post", "core.utils.property_utils.dependency_manager", "dependency_graph_load_handler"],
+        ["depsgraph_update_post", "operations.helpers.chain_handler", "ClonerChainUpdateHandler.depsgraph_update_post"],
+    ],
+}
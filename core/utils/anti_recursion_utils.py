@@ -4,102 +4,185 @@ Utilities for managing anti-recursion settings in cloners.
 
 import bpy
 import importlib
+from . import job_queue
+from .node_utils import GroupExtender
+
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("core")
+
+# Name markers of top-level cloner node groups
+CLONER_GROUP_MARKERS = ("GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner")
+
+# Background job name of the anti-recursion toggle
+TOGGLE_JOB_NAME = "Anti-Recursion"
+
+# Node tree revisions {session_uid: counter}, bumped by cloner_tree_revision_handler
+_tree_revisions = {}
+
+# Cached health {session_uid: (fingerprint, health)}
+_health_cache = {}
+
+
+def _tree_key(node_group):
+    return getattr(node_group, "session_uid", None) or node_group.name
+
+
+def is_cloner_node_group(node_group):
+    """Top-level cloner node group (by name)."""
+    return any(prefix in node_group.name for prefix in CLONER_GROUP_MARKERS)
+
+
+def iter_cloner_modifiers(mesh_only=True):
+    """
+    Yields (object, modifier) for every cloner modifier in the file.
+
+    Args:
+        mesh_only: Skip non-mesh objects (cloners always live on meshes)
+    """
+    for obj in bpy.data.objects:
+        if mesh_only and obj.type != 'MESH':
+            continue
+        for modifier in obj.modifiers:
+            if modifier.type == 'NODES' and modifier.node_group and is_cloner_node_group(modifier.node_group):
+                yield obj, modifier
+
+
+def tree_fingerprint(node_group):
+    """
+    Cheap structural fingerprint: tree revision from the depsgraph handler plus
+    node, link and linked effector counts (ID property edits do not tag the tree).
+    """
+    linked = node_group.get("linked_effectors")
+    return (_tree_revisions.get(_tree_key(node_group), 0), len(node_group.nodes),
+            len(node_group.links), len(linked) if linked else 0)
+
+
+def get_cloner_health(node_group):
+    """
+    Cached check_cloner_anti_recursion_health: recomputed only when the tree fingerprint changes.
+    """
+    key = _tree_key(node_group)
+    fingerprint = tree_fingerprint(node_group)
+    cached = _health_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    health = check_cloner_anti_recursion_health(node_group)
+    _health_cache[key] = (fingerprint, health)
+    return health
+
+
+def _realize_item(node_group):
+    for item in node_group.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == "Realize Instances":
+            return item
+    return None
+
+
+def _needs_toggle(node_group, use_anti_recursion):
+    """The tree has a pending schema migration or its Realize Instances default differs."""
+    if GroupExtender.needs_migration(node_group):
+        return True
+    item = _realize_item(node_group)
+    return item is not None and item.default_value != use_anti_recursion
+
+
+def _apply_toggle(obj, modifier, use_anti_recursion):
+    """
+    Brings one cloner to the current anti-recursion setting.
+
+    Returns:
+        bool: True if a migration changed the tree structure
+    """
+    node_group = modifier.node_group
+    item = _realize_item(node_group)
+    if item is not None and item.default_value != use_anti_recursion:
+        item.default_value = use_anti_recursion
+
+    # Missing or outdated anti-recursion structure is fixed by a schema migration;
+    # trees that already match the schema are only stamped
+    if not GroupExtender.migrate_node_group(node_group):
+        return False
+    log.debug("Applied improved anti-recursion to %s", node_group.name)
+
+    # Effectors are relinked only when the structure around them changed;
+    # relinked here rather than deferred so the job slice accounts for the work
+    if "linked_effectors" in node_group and node_group["linked_effectors"]:
+        try:
+            from .cloner_effector_utils import update_cloner_with_effectors
+            update_cloner_with_effectors(obj, modifier)
+        except Exception as e:
+            log.error("Failed to update effectors for %s: %s", node_group.name, e)
+    return True
+
+
+def _toggle_step(use_anti_recursion):
+    """Job step: (object name, modifier name) -> True if the tree was migrated."""
+    def step(item):
+        obj = bpy.data.objects.get(item[0])
+        modifier = obj.modifiers.get(item[1]) if obj else None
+        if modifier is None or modifier.node_group is None:
+            return False
+        return _apply_toggle(obj, modifier, use_anti_recursion)
+    return step
+
+
+def _toggle_finished(job):
+    if job.changed and not job.cancelled:
+        log.info("Updated %s cloners with improved anti-recursion system", job.changed)
+
 
 def update_anti_recursion_for_all_cloners(context):
     """
-    Update the Realize Instances parameter for all cloners based on the current anti-recursion setting.
-    Uses improved anti-recursion system that fixes red connections and effector issues.
+    Bring all cloners to the current anti-recursion setting.
+    Only trees with a pending migration or a different Realize Instances default are touched;
+    the work runs as a background job, so large scenes are processed in time slices.
 
     Args:
         context: Blender context
     """
-    # Get the current anti-recursion setting
     use_anti_recursion = context.scene.use_anti_recursion
 
-    # Import necessary functions
-    try:
-        cloner_effector_utils = importlib.import_module("advanced_cloners.core.utils.cloner_effector_utils")
-        update_cloner_with_effectors = cloner_effector_utils.update_cloner_with_effectors
-        
-        fix_recursion = importlib.import_module("advanced_cloners.operations.fix_recursion")
-        apply_anti_recursion_to_cloner = fix_recursion.apply_anti_recursion_to_cloner
-    except ImportError as e:
-        print(f"[ERROR] Failed to import required modules: {e}")
+    # A newer toggle supersedes the unfinished one
+    job_queue.cancel(name=TOGGLE_JOB_NAME)
+
+    work = [(obj.name, modifier.name) for obj, modifier in iter_cloner_modifiers()
+            if _needs_toggle(modifier.node_group, use_anti_recursion)]
+    if work:
+        job_queue.submit(TOGGLE_JOB_NAME, work, _toggle_step(use_anti_recursion),
+                         on_finish=_toggle_finished, context=context)
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def cloner_tree_revision_handler(scene, depsgraph):
+    """
+    Bumps the revision of every node tree updated in the depsgraph.
+    """
+    if not depsgraph.id_type_updated('NODETREE'):
         return
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.NodeTree):
+            key = _tree_key(id_data.original)
+            _tree_revisions[key] = _tree_revisions.get(key, 0) + 1
 
-    # Update all objects in the scene
-    updated_count = 0
-    for obj in bpy.data.objects:
-        if obj.type != 'MESH':
-            continue
 
-        # Find all geometry nodes modifiers that are cloners
-        for modifier in obj.modifiers:
-            if modifier.type != 'NODES' or not modifier.node_group:
-                continue
-
-            node_group = modifier.node_group
-
-            # Check if this is a cloner node group
-            is_cloner = False
-            for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                if prefix in node_group.name:
-                    is_cloner = True
-                    break
-
-            if not is_cloner:
-                continue
-
-            # Update or add the Realize Instances parameter
-            has_realize_param = False
-            for socket in node_group.interface.items_tree:
-                if socket.item_type == 'SOCKET' and socket.in_out == 'INPUT' and socket.name == "Realize Instances":
-                    # Update the parameter value
-                    socket.default_value = use_anti_recursion
-                    has_realize_param = True
-                    break
-
-            # If the parameter doesn't exist, apply anti-recursion system
-            if not has_realize_param:
-                if apply_anti_recursion_to_cloner(node_group):
-                    print(f"[DEBUG] Applied improved anti-recursion to {node_group.name}")
-                    updated_count += 1
-
-            # Check if we need to update the node structure
-            has_anti_recursion_switch = False
-            has_problematic_structure = False
-            
-            for node in node_group.nodes:
-                if node.name == "Anti-Recursion Switch":
-                    has_anti_recursion_switch = True
-                    
-                    # Check for problematic old structure (Join Geometry node)
-                    for other_node in node_group.nodes:
-                        if other_node.name == "Anti-Recursion Join Geometry":
-                            has_problematic_structure = True
-                            break
-                    
-                    break
-
-            # If we have old problematic structure, update it
-            if has_anti_recursion_switch and has_problematic_structure:
-                print(f"[DEBUG] Updating problematic anti-recursion structure in {node_group.name}")
-                if apply_anti_recursion_to_cloner(node_group):
-                    updated_count += 1
-
-            # Update cloner with effectors if it has any
-            if "linked_effectors" in node_group and node_group["linked_effectors"]:
-                try:
-                    print(f"[DEBUG] Updating effectors for {node_group.name}")
-                    update_cloner_with_effectors(obj, modifier)
-                except Exception as e:
-                    print(f"[ERROR] Failed to update effectors for {node_group.name}: {e}")
-
-    # Force update the view
-    context.view_layer.update()
-    
-    if updated_count > 0:
-        print(f"[INFO] Updated {updated_count} cloners with improved anti-recursion system")
+@bpy.app.handlers.persistent
+def cloner_health_load_handler(*args):
+    """
+    Drops cached revisions and health after a file load.
+    """
+    _tree_revisions.clear()
+    _health_cache.clear()
+
+
+# Module handlers; installed from the registration manifest
+app_handlers = (
+    ("depsgraph_update_post", cloner_tree_revision_handler),
+    ("load_post", cloner_health_load_handler),
+)
 
 
 def update_anti_recursion_callback(self, context):
@@ -211,7 +294,7 @@ def fix_unhealthy_cloner(node_group, context=None):
         
         return apply_anti_recursion_to_cloner(node_group)
     except Exception as e:
-        print(f"[ERROR] Failed to fix unhealthy cloner: {e}")
+        log.error("Failed to fix unhealthy cloner: %s", e)
         return False
 
 
@@ -233,38 +316,20 @@ def diagnose_all_cloners(context):
         'issues_found': []
     }
     
-    for obj in bpy.data.objects:
-        if obj.type != 'MESH':
-            continue
+    for obj, modifier in iter_cloner_modifiers():
+        node_group = modifier.node_group
+        summary['total_cloners'] += 1
         
-        for modifier in obj.modifiers:
-            if modifier.type != 'NODES' or not modifier.node_group:
-                continue
-            
-            node_group = modifier.node_group
-            
-            # Check if this is a cloner
-            is_cloner = False
-            for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                if prefix in node_group.name:
-                    is_cloner = True
-                    break
-            
-            if not is_cloner:
-                continue
-            
-            summary['total_cloners'] += 1
-            
-            # Check health
-            health = check_cloner_anti_recursion_health(node_group)
-            
-            if health['healthy']:
-                summary['healthy_cloners'] += 1
-            else:
-                summary['unhealthy_cloners'] += 1
-                summary['issues_found'].extend([f"{node_group.name}: {issue}" for issue in health['issues']])
-            
-            if health['has_effectors']:
-                summary['cloners_with_effectors'] += 1
+        # Cached health, recomputed only for trees changed since the last check
+        health = get_cloner_health(node_group)
+        
+        if health['healthy']:
+            summary['healthy_cloners'] += 1
+        else:
+            summary['unhealthy_cloners'] += 1
+            summary['issues_found'].extend([f"{node_group.name}: {issue}" for issue in health['issues']])
+        
+        if health['has_effectors']:
+            summary['cloners_with_effectors'] += 1
     
     return summary
@@ -5,6 +5,13 @@
 import bpy
 from ...models.effectors import EFFECTOR_NODE_GROUP_PREFIXES
 
+from .logging_utils import get_logger
+from .profiling import profiled
+from .effector_drivers import bind_effector_node, unbind_effector_node, mark_python_propagation
+from .property_utils.dependency_manager import dependency_manager
+
+log = get_logger("effectors")
+
 
 def safe_link_new(links, from_socket, to_socket):
     """
@@ -21,22 +28,22 @@ def safe_link_new(links, from_socket, to_socket):
     # Проверяем, что сокеты принадлежат разным узлам
     if hasattr(from_socket, 'node') and hasattr(to_socket, 'node'):
         if from_socket.node == to_socket.node:
-            print(f"[SAFE_LINK] Заблокировано самоподключение узла: {from_socket.node.name}")
+            log.debug("[SAFE_LINK] Заблокировано самоподключение узла: %s", from_socket.node.name)
             return False
 
         # Дополнительная проверка по имени (на случай если узлы разные объекты, но одинаковые)
         if hasattr(from_socket.node, 'name') and hasattr(to_socket.node, 'name'):
             if from_socket.node.name == to_socket.node.name:
-                print(f"[SAFE_LINK] Заблокировано самоподключение по имени: {from_socket.node.name}")
+                log.debug("[SAFE_LINK] Заблокировано самоподключение по имени: %s", from_socket.node.name)
                 return False
 
     try:
         links.new(from_socket, to_socket)
         if hasattr(from_socket, 'node') and hasattr(to_socket, 'node'):
-            print(f"[SAFE_LINK] Создана связь: {from_socket.node.name}.{from_socket.name} -> {to_socket.node.name}.{to_socket.name}")
+            log.debug("[SAFE_LINK] Создана связь: %s.%s -> %s.%s", from_socket.node.name, from_socket.name, to_socket.node.name, to_socket.name)
         return True
     except Exception as e:
-        print(f"[SAFE_LINK] Ошибка создания связи: {e}")
+        log.error("[SAFE_LINK] Ошибка создания связи: %s", e)
         return False
 
 def get_effector_modifiers(obj):
@@ -70,6 +77,7 @@ def get_effector_modifiers(obj):
     return effector_mods
 
 
+@profiled(category="effector")
 def update_cloner_with_effectors(obj, cloner_mod):
     """
     Улучшенная функция обновления клонера с эффекторами.
@@ -80,9 +88,13 @@ def update_cloner_with_effectors(obj, cloner_mod):
         cloner_mod: Модификатор клонера с нод-группой
     """
     if not cloner_mod or not cloner_mod.node_group:
-        print("[DEBUG] update_cloner_with_effectors: Модификатор не имеет нод-группы")
+        log.debug("update_cloner_with_effectors: Модификатор не имеет нод-группы")
         return
 
+    # Список эффекторов в группе узлов - зеркало графа зависимостей;
+    # после переименования эффекторов имена в нем обновляются здесь
+    dependency_manager.sync_node_group(obj, cloner_mod)
+
     # Проверяем, является ли клонер стековым
     mod_is_stacked = cloner_mod.get("is_stacked_cloner", False)
     node_is_stacked = cloner_mod.node_group.get("is_stacked_cloner", False)
@@ -90,7 +102,7 @@ def update_cloner_with_effectors(obj, cloner_mod):
 
     # Для стековых клонеров используем существующую логику
     if is_stacked_cloner:
-        print(f"[DEBUG] Обработка стекового клонера {cloner_mod.name}")
+        log.debug("Обработка стекового клонера %s", cloner_mod.name)
         return update_stacked_cloner_with_effectors(obj, cloner_mod)
 
     # Для обычных клонеров используем улучшенную логику
@@ -108,7 +120,7 @@ def update_standard_cloner_with_effectors(obj, cloner_mod):
     """
     node_group = cloner_mod.node_group
     linked_effectors = node_group.get("linked_effectors", [])
-    print(f"[DEBUG] Связанные эффекторы: {linked_effectors}")
+    log.debug("Связанные эффекторы: %s", linked_effectors)
 
     # Проверяем валидность списка эффекторов
     valid_linked_effectors = []
@@ -119,12 +131,12 @@ def update_standard_cloner_with_effectors(obj, cloner_mod):
             is_effector = any(eff_mod.node_group.name.startswith(p) for p in EFFECTOR_NODE_GROUP_PREFIXES)
             if is_effector:
                 valid_linked_effectors.append(eff_name)
-                print(f"[DEBUG] Валидный эффектор: {eff_name}")
+                log.debug("Валидный эффектор: %s", eff_name)
 
     # Обновляем список эффекторов
     if len(valid_linked_effectors) != len(linked_effectors):
-        print(f"[DEBUG] Обновляем список эффекторов с {len(linked_effectors)} на {len(valid_linked_effectors)}")
-        node_group["linked_effectors"] = valid_linked_effectors
+        log.debug("Обновляем список эффекторов с %s на %s", len(linked_effectors), len(valid_linked_effectors))
+        dependency_manager.set_cloner_effectors(obj, cloner_mod, valid_linked_effectors)
         linked_effectors = valid_linked_effectors
 
     # Находим ключевые узлы
@@ -144,7 +156,7 @@ def update_standard_cloner_with_effectors(obj, cloner_mod):
             final_realize_switch = node
 
     if not group_output:
-        print("[DEBUG] Не найден выходной узел")
+        log.debug("Не найден выходной узел")
         return
 
     # Используем Final Realize Switch если он есть, иначе Anti-Recursion Switch
@@ -152,28 +164,182 @@ def update_standard_cloner_with_effectors(obj, cloner_mod):
 
     # Если нет эффекторов, восстанавливаем прямые связи и Realize узел для анти-рекурсии
     if not linked_effectors:
-        print("[DEBUG] Нет эффекторов, восстанавливаем прямые связи и Realize узел")
+        log.debug("Нет эффекторов, восстанавливаем прямые связи и Realize узел")
         # Удаляем старые узлы эффекторов
         old_effector_nodes = [n for n in nodes if n.name.startswith('Effector_')]
+        old_effector_names = [n.name.replace('Effector_', '') for n in old_effector_nodes]
         for node in old_effector_nodes:
+            unbind_effector_node(node)
             nodes.remove(node)
-            print(f"[DEBUG] Удален старый узел эффектора: {node.name}")
+        log.debug("Удалены старые узлы эффекторов: %s", old_effector_names)
 
         # Восстанавливаем Realize узел для анти-рекурсии, если его нет
         restore_realize_node_for_anti_recursion(node_group, target_switch)
 
         restore_direct_connection_improved(node_group)
         # Включаем видимость всех отвязанных эффекторов
-        for eff_name in [n.name.replace('Effector_', '') for n in old_effector_nodes]:
+        for eff_name in old_effector_names:
             eff_mod = obj.modifiers.get(eff_name)
             if eff_mod:
                 eff_mod.show_render = True
         return
 
+    # Существующая цепочка меняется только на разницу со списком эффекторов
+    if patch_effector_chain(obj, node_group, linked_effectors):
+        log.debug("Цепочка эффекторов обновлена по разнице")
+        return
+
     # НОВАЯ ЛОГИКА: Заменяем проблемные узлы на эффекторы
     replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors)
 
-    print("[DEBUG] Цепочка эффекторов создана успешно")
+    log.debug("Цепочка эффекторов создана успешно")
+
+
+def _effector_node_links(node):
+    """Связи выхода Geometry узла эффектора."""
+    output = node.outputs.get('Geometry')
+    return list(output.links) if output is not None else []
+
+
+def find_effector_chain(node_group):
+    """
+    Находит существующую цепочку узлов Effector_* в группе клонера.
+
+    Returns:
+        tuple: (узлы цепочки по порядку, исходящий сокет перед цепочкой,
+                входящие сокеты после цепочки) или None, если цепочки нет
+                или узлы эффекторов не образуют одну линейную цепочку
+    """
+    # Effector_Input - узел-заглушка анти-рекурсии, а не эффектор
+    effector_nodes = [n for n in node_group.nodes
+                      if n.name.startswith('Effector_') and n.name != "Effector_Input"]
+    if not effector_nodes:
+        return None
+    effector_set = set(effector_nodes)
+
+    # Голова цепочки - эффектор, вход которого идет не от эффектора
+    heads = []
+    for node in effector_nodes:
+        geometry_input = node.inputs.get('Geometry')
+        if geometry_input is None or not geometry_input.is_linked:
+            return None
+        if geometry_input.links[0].from_node not in effector_set:
+            heads.append(node)
+    if len(heads) != 1:
+        return None
+
+    chain = [heads[0]]
+    while True:
+        next_nodes = [link.to_node for link in _effector_node_links(chain[-1]) if link.to_node in effector_set]
+        if not next_nodes:
+            break
+        if len(next_nodes) > 1 or next_nodes[0] in chain:
+            return None
+        chain.append(next_nodes[0])
+    if len(chain) != len(effector_nodes):
+        return None
+
+    upstream = chain[0].inputs['Geometry'].links[0].from_socket
+    downstream = [link.to_socket for link in _effector_node_links(chain[-1])]
+    if not downstream:
+        return None
+    return chain, upstream, downstream
+
+
+def _ensure_link(links, from_socket, to_socket):
+    """Создает связь, только если вход еще не подключен к этому выходу."""
+    if to_socket.is_linked and to_socket.links[0].from_socket == from_socket:
+        return False
+    return safe_link_new(links, from_socket, to_socket)
+
+
+def patch_effector_chain(obj, node_group, linked_effectors):
+    """
+    Приводит существующую цепочку эффекторов к списку linked_effectors,
+    меняя только разницу: удаляет узлы отвязанных эффекторов, добавляет узлы
+    новых и переподключает только связи, которые не совпадают с нужным порядком.
+    Узлы и связи неизменной части цепочки не трогаются, поэтому связи depsgraph
+    не перестраиваются.
+
+    Args:
+        obj: Объект с модификатором
+        node_group: Группа узлов клонера
+        linked_effectors: Нужный порядок эффекторов
+
+    Returns:
+        bool: True, если цепочка обновлена; False, если цепочки нет или она
+              нарушена и нужна полная сборка
+    """
+    found = find_effector_chain(node_group)
+    if found is None:
+        return False
+    chain, upstream, downstream = found
+
+    nodes = node_group.nodes
+    links = node_group.links
+
+    desired = []
+    for effector_name in linked_effectors:
+        effector_mod = obj.modifiers.get(effector_name)
+        if effector_mod and effector_mod.node_group:
+            desired.append((effector_name, effector_mod))
+    if not desired:
+        return False
+
+    existing = {node.name[len('Effector_'):]: node for node in chain}
+    desired_names = {name for name, _ in desired}
+    anchor_x, anchor_y = chain[0].location.x, chain[0].location.y
+
+    # Удаляем узлы отвязанных эффекторов
+    removed = 0
+    for name, node in existing.items():
+        if name in desired_names:
+            continue
+        unbind_effector_node(node)
+        nodes.remove(node)
+        removed += 1
+        effector_mod = obj.modifiers.get(name)
+        if effector_mod:
+            effector_mod.show_render = True
+
+    # Собираем нужный порядок, добавляя недостающие узлы
+    ordered = []
+    added = 0
+    for i, (name, effector_mod) in enumerate(desired):
+        node = existing.get(name)
+        if node is None:
+            node = nodes.new('GeometryNodeGroup')
+            node.name = f"Effector_{name}"
+            node.node_tree = effector_mod.node_group
+            node.location = (anchor_x + i * 250, anchor_y)
+            added += 1
+        elif node.node_tree != effector_mod.node_group:
+            node.node_tree = effector_mod.node_group
+
+        copy_effector_parameters(effector_mod, node)
+        bind_effector_node(obj, effector_mod, node)
+        effector_mod.show_render = False
+        effector_mod.show_viewport = True
+        ordered.append(node)
+
+    # Переподключаем только несовпадающие связи
+    relinked = 0
+    previous_output = upstream
+    for node in ordered:
+        relinked += _ensure_link(links, previous_output, node.inputs['Geometry'])
+        previous_output = node.outputs['Geometry']
+    for to_socket in downstream:
+        relinked += _ensure_link(links, previous_output, to_socket)
+
+    # Связи от эффекторов, оказавшихся не в конце, к входам после цепочки
+    downstream_set = set(downstream)
+    for node in ordered[:-1]:
+        for link in _effector_node_links(node):
+            if link.to_socket in downstream_set:
+                links.remove(link)
+
+    log.debug("Цепочка эффекторов: добавлено %s, удалено %s, переподключено %s связей", added, removed, relinked)
+    return True
 
 
 def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
@@ -195,20 +361,20 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
     for node in nodes:
         if node.name in ["Anti-Recursion Join Geometry", "Effector_Input"]:
             problematic_nodes.append(node)
-            print(f"[DEBUG] Найден проблемный узел для замены: {node.name}")
+            log.debug("Найден проблемный узел для замены: %s", node.name)
         elif node.name == "Anti-Recursion Realize":
             # При привязке эффекторов удаляем Realize узел
             realize_nodes_to_remove.append(node)
-            print(f"[DEBUG] Найден Realize узел для удаления при привязке эффекторов: {node.name}")
+            log.debug("Найден Realize узел для удаления при привязке эффекторов: %s", node.name)
 
     # Если есть Realize узлы для удаления, добавляем их к проблемным узлам
     if realize_nodes_to_remove:
-        print(f"[DEBUG] Добавляем {len(realize_nodes_to_remove)} Realize узлов к проблемным узлам")
+        log.debug("Добавляем %s Realize узлов к проблемным узлам", len(realize_nodes_to_remove))
         problematic_nodes.extend(realize_nodes_to_remove)
 
     # Если нет проблемных узлов (включая Realize узлы), используем стандартную логику
     if not problematic_nodes:
-        print("[DEBUG] Проблемные узлы не найдены, используем стандартную логику")
+        log.debug("Проблемные узлы не найдены, используем стандартную логику")
         create_standard_effector_chain(obj, node_group, linked_effectors)
         return
 
@@ -229,15 +395,15 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
         elif link.from_node == target_node:
             outgoing_links.append((link.from_socket, link.to_node, link.to_socket))
 
-    print(f"[DEBUG] Сохранено {len(incoming_links)} входящих и {len(outgoing_links)} исходящих связей")
+    log.debug("Сохранено %s входящих и %s исходящих связей", len(incoming_links), len(outgoing_links))
 
     # Удаляем все проблемные узлы
     for node in problematic_nodes:
         try:
             nodes.remove(node)
-            print(f"[DEBUG] Удален проблемный узел: {node.name}")
+            log.debug("Удален проблемный узел: %s", node.name)
         except:
-            print(f"[DEBUG] Узел уже был удален")
+            log.debug("Узел уже был удален")
 
     # Создаем цепочку эффекторов на месте проблемного узла
     current_output = None
@@ -246,7 +412,7 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
     for i, effector_name in enumerate(linked_effectors):
         effector_mod = obj.modifiers.get(effector_name)
         if not effector_mod or not effector_mod.node_group:
-            print(f"[DEBUG] Пропускаем неверный эффектор: {effector_name}")
+            log.debug("Пропускаем неверный эффектор: %s", effector_name)
             continue
 
         # Создаем узел эффектора
@@ -267,12 +433,13 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
 
         # Копируем параметры эффектора
         copy_effector_parameters(effector_mod, effector_node)
+        bind_effector_node(obj, effector_mod, effector_node)
 
         # Отключаем рендер оригинального эффектора
         effector_mod.show_render = False
         effector_mod.show_viewport = True
 
-        print(f"[DEBUG] Создан узел эффектора: {effector_name}")
+        log.debug("Создан узел эффектора: %s", effector_name)
 
     # Восстанавливаем входящие связи к первому эффектору
     input_connected = False
@@ -294,40 +461,40 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
             try:
                 # ВАЖНО: Проверяем, что не подключаем узел сам к себе
                 if from_node == first_effector_node:
-                    print(f"[DEBUG] Пропущена связь (самоподключение): {from_node.name} -> сам себе")
+                    log.debug("Пропущена связь (самоподключение): %s -> сам себе", from_node.name)
                     continue
 
                 # Дополнительная проверка по имени узла (для Noise эффектора)
                 if hasattr(from_node, 'name') and hasattr(first_effector_node, 'name'):
                     if from_node.name == first_effector_node.name:
-                        print(f"[DEBUG] Пропущена связь (самоподключение по имени): {from_node.name} -> {first_effector_node.name}")
+                        log.debug("Пропущена связь (самоподключение по имени): %s -> %s", from_node.name, first_effector_node.name)
                         continue
 
                 # Подключаем к входу Geometry первого эффектора
                 if to_socket.name == 'Geometry' or 'Geometry' in to_socket.name:
-                    print(f"[DEBUG] Попытка подключения: {from_node.name}.{from_socket.name} -> {first_effector_node.name}.{first_effector_input.name}")
+                    log.debug("Попытка подключения: %s.%s -> %s.%s", from_node.name, from_socket.name, first_effector_node.name, first_effector_input.name)
                     if safe_link_new(links, from_socket, first_effector_input):
-                        print(f"[DEBUG] Восстановлена входящая связь: {from_node.name}.{from_socket.name} -> первый эффектор")
+                        log.debug("Восстановлена входящая связь: %s.%s -> первый эффектор", from_node.name, from_socket.name)
                         input_connected = True
                 else:
-                    print(f"[DEBUG] Пропущена входящая связь (не Geometry): {to_socket.name}")
+                    log.debug("Пропущена входящая связь (не Geometry): %s", to_socket.name)
             except Exception as e:
-                print(f"[DEBUG] Не удалось восстановить входящую связь: {e}")
+                log.debug("Не удалось восстановить входящую связь: %s", e)
 
     # Если входящие связи не были восстановлены, ищем Transform Geometry узел
     if not input_connected and first_effector_input:
-        print("[DEBUG] Входящие связи не восстановлены, ищем Transform Geometry узел")
+        log.debug("Входящие связи не восстановлены, ищем Transform Geometry узел")
         for node in nodes:
             if ('Transform' in node.name or 'Transform' in getattr(node, 'bl_idname', '')) and hasattr(node, 'outputs'):
                 for output in node.outputs:
                     if output.name == 'Geometry':
                         try:
                             if safe_link_new(links, output, first_effector_input):
-                                print(f"[DEBUG] Подключен {node.name}.{output.name} к первому эффектору")
+                                log.debug("Подключен %s.%s к первому эффектору", node.name, output.name)
                                 input_connected = True
                                 break
                         except Exception as e:
-                            print(f"[DEBUG] Не удалось подключить {node.name}: {e}")
+                            log.debug("Не удалось подключить %s: %s", node.name, e)
                 if input_connected:
                     break
 
@@ -351,24 +518,24 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
             try:
                 # ВАЖНО: Проверяем, что не подключаем узел сам к себе
                 if to_node == last_effector_node:
-                    print(f"[DEBUG] Пропущена связь (самоподключение): последний эффектор -> сам себе")
+                    log.debug("Пропущена связь (самоподключение): последний эффектор -> сам себе")
                     continue
 
                 # Дополнительная проверка по имени узла (для Noise эффектора)
                 if hasattr(to_node, 'name') and hasattr(last_effector_node, 'name'):
                     if to_node.name == last_effector_node.name:
-                        print(f"[DEBUG] Пропущена связь (самоподключение по имени): {last_effector_node.name} -> {to_node.name}")
+                        log.debug("Пропущена связь (самоподключение по имени): %s -> %s", last_effector_node.name, to_node.name)
                         continue
 
                 # Подключаем выход последнего эффектора
                 if from_socket.name == 'Geometry' or 'Geometry' in from_socket.name:
-                    print(f"[DEBUG] Попытка подключения: {last_effector_node.name}.{current_output.name} -> {to_node.name}.{to_socket.name}")
+                    log.debug("Попытка подключения: %s.%s -> %s.%s", last_effector_node.name, current_output.name, to_node.name, to_socket.name)
                     if safe_link_new(links, current_output, to_socket):
-                        print(f"[DEBUG] Восстановлена исходящая связь: последний эффектор -> {to_node.name}.{to_socket.name}")
+                        log.debug("Восстановлена исходящая связь: последний эффектор -> %s.%s", to_node.name, to_socket.name)
                 else:
-                    print(f"[DEBUG] Пропущена исходящая связь (не Geometry): {from_socket.name}")
+                    log.debug("Пропущена исходящая связь (не Geometry): %s", from_socket.name)
             except Exception as e:
-                print(f"[DEBUG] Не удалось восстановить исходящую связь: {e}")
+                log.debug("Не удалось восстановить исходящую связь: %s", e)
 
     # Дополнительная проверка: убеждаемся, что эффектор подключен к Switch узлу
     if current_output:
@@ -392,12 +559,12 @@ def replace_problematic_nodes_with_effectors(obj, node_group, linked_effectors):
                 try:
                     if len(switch_node.inputs) > 1:
                         links.new(current_output, switch_node.inputs[1])  # False вход
-                        print(f"[DEBUG] Дополнительно подключен эффектор к Switch узлу (False вход)")
+                        log.debug("Дополнительно подключен эффектор к Switch узлу (False вход)")
                     elif len(switch_node.inputs) > 0:
                         links.new(current_output, switch_node.inputs[0])  # Первый доступный вход
-                        print(f"[DEBUG] Дополнительно подключен эффектор к Switch узлу (первый вход)")
+                        log.debug("Дополнительно подключен эффектор к Switch узлу (первый вход)")
                 except Exception as e:
-                    print(f"[DEBUG] Не удалось дополнительно подключить к Switch: {e}")
+                    log.debug("Не удалось дополнительно подключить к Switch: %s", e)
 
 
 def restore_realize_node_for_anti_recursion(node_group, switch_node=None):
@@ -420,7 +587,7 @@ def restore_realize_node_for_anti_recursion(node_group, switch_node=None):
                 break
 
     if not switch_node:
-        print("[DEBUG] Switch узел не найден, Realize узел не нужен")
+        log.debug("Switch узел не найден, Realize узел не нужен")
         return
 
     # Определяем тип Switch узла и соответствующий Realize узел
@@ -435,7 +602,7 @@ def restore_realize_node_for_anti_recursion(node_group, switch_node=None):
             break
 
     if realize_node:
-        print(f"[DEBUG] {realize_node_name} узел уже существует")
+        log.debug("%s узел уже существует", realize_node_name)
         return
 
     # Создаем новый Realize узел
@@ -458,9 +625,9 @@ def restore_realize_node_for_anti_recursion(node_group, switch_node=None):
         safe_link_new(links, false_input_socket, realize_node.inputs['Geometry'])
         # Подключаем Realize узел к True входу Switch
         safe_link_new(links, realize_node.outputs['Geometry'], switch_node.inputs['True'])
-        print(f"[DEBUG] Восстановлен {realize_node_name} узел для анти-рекурсии")
+        log.debug("Восстановлен %s узел для анти-рекурсии", realize_node_name)
     else:
-        print("[DEBUG] Не найден источник для подключения Realize узла")
+        log.debug("Не найден источник для подключения Realize узла")
 
 
 def restore_connections_bypassing_realize(node_group, realize_connections):
@@ -492,9 +659,9 @@ def restore_connections_bypassing_realize(node_group, realize_connections):
     for from_node, from_socket in inputs_to_realize:
         for to_node, to_socket in outputs_from_realize:
             if safe_link_new(links, from_socket, to_socket):
-                print(f"[DEBUG] Восстановлена связь, минуя Realize: {from_node.name} -> {to_node.name}")
+                log.debug("Восстановлена связь, минуя Realize: %s -> %s", from_node.name, to_node.name)
             else:
-                print(f"[DEBUG] Не удалось восстановить связь, минуя Realize")
+                log.debug("Не удалось восстановить связь, минуя Realize")
 
 
 def create_standard_effector_chain(obj, node_group, linked_effectors):
@@ -512,8 +679,9 @@ def create_standard_effector_chain(obj, node_group, linked_effectors):
     # Удаляем старые узлы эффекторов
     old_effector_nodes = [n for n in nodes if n.name.startswith('Effector_')]
     for node in old_effector_nodes:
+        log.debug("Удален старый узел эффектора: %s", node.name)
+        unbind_effector_node(node)
         nodes.remove(node)
-        print(f"[DEBUG] Удален старый узел эффектора: {node.name}")
 
     # Находим анти-рекурсию (старую или новую структуру)
     anti_recursion_switch = None
@@ -531,7 +699,7 @@ def create_standard_effector_chain(obj, node_group, linked_effectors):
     effector_insertion_point = find_effector_insertion_point(node_group, target_switch)
 
     if not effector_insertion_point:
-        print("[DEBUG] Не найдена точка подключения эффекторов")
+        log.debug("Не найдена точка подключения эффекторов")
         return
 
     source_node, source_output, target_node, target_input = effector_insertion_point
@@ -541,12 +709,12 @@ def create_standard_effector_chain(obj, node_group, linked_effectors):
     pos_x = source_node.location.x + 200
     pos_y = source_node.location.y
 
-    print(f"[DEBUG] Создаем стандартную цепочку из {len(linked_effectors)} эффекторов")
+    log.debug("Создаем стандартную цепочку из %s эффекторов", len(linked_effectors))
 
     for i, effector_name in enumerate(linked_effectors):
         effector_mod = obj.modifiers.get(effector_name)
         if not effector_mod or not effector_mod.node_group:
-            print(f"[DEBUG] Пропускаем неверный эффектор: {effector_name}")
+            log.debug("Пропускаем неверный эффектор: %s", effector_name)
             continue
 
         # Создаем узел эффектора
@@ -561,12 +729,13 @@ def create_standard_effector_chain(obj, node_group, linked_effectors):
 
         # Копируем параметры эффектора
         copy_effector_parameters(effector_mod, effector_node)
+        bind_effector_node(obj, effector_mod, effector_node)
 
         # Отключаем рендер оригинального эффектора
         effector_mod.show_render = False
         effector_mod.show_viewport = True
 
-        print(f"[DEBUG] Создан узел эффектора: {effector_name}")
+        log.debug("Создан узел эффектора: %s", effector_name)
 
     # Подключаем последний эффектор к целевому узлу
     if target_node and target_input:
@@ -578,7 +747,7 @@ def create_standard_effector_chain(obj, node_group, linked_effectors):
 
         # Подключаем цепочку эффекторов
         safe_link_new(links, current_output, target_input)
-        print(f"[DEBUG] Подключена цепочка эффекторов к {target_node.name}")
+        log.debug("Подключена цепочка эффекторов к %s", target_node.name)
 
         # Если у нас есть анти-рекурсия, убеждаемся что True путь тоже настроен правильно
         if target_switch and target_node == target_switch:
@@ -622,7 +791,7 @@ def find_effector_insertion_point(node_group, anti_recursion_switch):
 
     # Если есть новая структура анти-рекурсии (Final Realize Switch)
     if final_realize_switch:
-        print("[DEBUG] Поиск точки вставки для новой структуры анти-рекурсии (Final Realize Switch)")
+        log.debug("Поиск точки вставки для новой структуры анти-рекурсии (Final Realize Switch)")
 
         # Ищем узел, подключенный к False входу Final Realize Switch (прямой путь)
         source_node = None
@@ -639,11 +808,11 @@ def find_effector_insertion_point(node_group, anti_recursion_switch):
             return (source_node, source_output,
                    final_realize_switch, final_realize_switch.inputs[False])
         else:
-            print("[DEBUG] Не найден источник для False входа Final Realize Switch")
+            log.debug("Не найден источник для False входа Final Realize Switch")
 
     # Если есть старая структура анти-рекурсии (Anti-Recursion Switch)
     elif anti_recursion_switch:
-        print("[DEBUG] Поиск точки вставки для старой структуры анти-рекурсии")
+        log.debug("Поиск точки вставки для старой структуры анти-рекурсии")
 
         # Ищем узел, подключенный к False входу Switch (прямой путь)
         source_node = None
@@ -660,37 +829,54 @@ def find_effector_insertion_point(node_group, anti_recursion_switch):
             return (source_node, source_output,
                    anti_recursion_switch, anti_recursion_switch.inputs[False])
         else:
-            print("[DEBUG] Не найден источник для False входа анти-рекурсии")
+            log.debug("Не найден источник для False входа анти-рекурсии")
 
     # Если нет узла анти-рекурсии, подключаем эффекторы перед выходом
-    print("[DEBUG] Поиск точки вставки для системы без анти-рекурсии")
+    log.debug("Поиск точки вставки для системы без анти-рекурсии")
 
-    # Ищем узел, подключенный к выходу
+    # Ищем узел, подключенный к выходу (или к узлу прореживания перед ним)
+    target_node, target_input = _output_target(node_group, group_output)
     source_node = None
     source_output = None
 
     for link in links:
-        if link.to_node == group_output and link.to_socket.name == 'Geometry':
+        if link.to_node == target_node and link.to_socket == target_input:
             source_node = link.from_node
             source_output = link.from_socket
             break
 
     if source_node and source_output:
-        return (source_node, source_output,
-               group_output, group_output.inputs['Geometry'])
+        return (source_node, source_output, target_node, target_input)
     else:
-        print("[DEBUG] Не найден источник для выходного узла")
+        log.debug("Не найден источник для выходного узла")
 
         # Пытаемся найти любой подходящий узел
         for node in nodes:
-            if (node != group_output and node.type != 'GROUP_INPUT' and
+            if (node != group_output and node != target_node and node.type != 'GROUP_INPUT' and
                 not node.name.startswith('Effector_')):
                 for output in node.outputs:
                     if output.name in ['Geometry', 'Instances']:
-                        return (node, output, group_output, group_output.inputs['Geometry'])
+                        return (node, output, target_node, target_input)
         return None
 
 
+def _output_target(node_group, group_output):
+    """
+    Узел и вход, куда приходит результат клонера. Узел прореживания Viewport Density
+    (ClonerBase.setup_viewport_density) стоит перед выходом группы и остается последним:
+    эффекторы вставляются и прямая связь восстанавливается до него.
+
+    Returns:
+        tuple: (узел, входной сокет Geometry)
+    """
+    from ...models.cloners.base import ClonerBase
+
+    density_node = node_group.nodes.get(ClonerBase.VIEWPORT_DENSITY_NODE)
+    if density_node is not None:
+        return density_node, density_node.inputs['Geometry']
+    return group_output, group_output.inputs['Geometry']
+
+
 def setup_anti_recursion_true_path(node_group, anti_recursion_switch, effector_chain_output):
     """
     Настраивает True путь для узла анти-рекурсии после подключения эффекторов.
@@ -727,9 +913,9 @@ def setup_anti_recursion_true_path(node_group, anti_recursion_switch, effector_c
 
             # Подключаем цепочку эффекторов к существующему Final Realize узлу
             links.new(effector_chain_output, existing_realize.inputs['Geometry'])
-            print("[DEBUG] Обновлен существующий Final Realize узел для True пути")
+            log.debug("Обновлен существующий Final Realize узел для True пути")
         else:
-            print("[DEBUG] Final Realize Instances узел не найден")
+            log.debug("Final Realize Instances узел не найден")
     else:
         # Для старой структуры (Anti-Recursion Switch) ищем Anti-Recursion Realize
         existing_realize = None
@@ -751,7 +937,7 @@ def setup_anti_recursion_true_path(node_group, anti_recursion_switch, effector_c
 
             # Подключаем цепочку эффекторов к существующему Realize узлу
             links.new(effector_chain_output, existing_realize.inputs['Geometry'])
-            print("[DEBUG] Обновлен существующий Anti-Recursion Realize узел для True пути")
+            log.debug("Обновлен существующий Anti-Recursion Realize узел для True пути")
         else:
             # Проверяем, подключен ли уже True вход
             true_input_connected = False
@@ -772,7 +958,7 @@ def setup_anti_recursion_true_path(node_group, anti_recursion_switch, effector_c
                 links.new(effector_chain_output, realize_true.inputs['Geometry'])
                 links.new(realize_true.outputs['Geometry'], anti_recursion_switch.inputs[True])
 
-                print("[DEBUG] Создан новый Realize узел для True пути анти-рекурсии")
+                log.debug("Создан новый Realize узел для True пути анти-рекурсии")
 
 
 def copy_effector_parameters(effector_mod, effector_node):
@@ -793,11 +979,11 @@ def copy_effector_parameters(effector_mod, effector_node):
                 if socket.identifier in effector_mod:
                     try:
                         effector_node.inputs[socket.name].default_value = effector_mod[socket.identifier]
-                        print(f"[DEBUG] Скопирован параметр {socket.name} = {effector_mod[socket.identifier]}")
+                        log.debug("Скопирован параметр %s = %s", socket.name, effector_mod[socket.identifier])
                     except (KeyError, TypeError, AttributeError) as e:
-                        print(f"[DEBUG] Не удалось скопировать параметр {socket.name}: {e}")
+                        log.debug("Не удалось скопировать параметр %s: %s", socket.name, e)
     except Exception as e:
-        print(f"[DEBUG] Ошибка при копировании параметров эффектора: {e}")
+        log.debug("Ошибка при копировании параметров эффектора: %s", e)
 
 
 def restore_direct_connection_improved(node_group):
@@ -819,7 +1005,7 @@ def restore_direct_connection_improved(node_group):
             break
 
     if not group_output:
-        print("[DEBUG] Не найден выходной узел для восстановления связей")
+        log.debug("Не найден выходной узел для восстановления связей")
         return
 
     # Находим узел анти-рекурсии
@@ -830,10 +1016,10 @@ def restore_direct_connection_improved(node_group):
             break
 
     if anti_recursion_switch:
-        print("[DEBUG] Восстановление связей для системы с анти-рекурсией")
+        log.debug("Восстановление связей для системы с анти-рекурсией")
         restore_anti_recursion_connections(node_group, anti_recursion_switch)
     else:
-        print("[DEBUG] Восстановление связей для системы без анти-рекурсии")
+        log.debug("Восстановление связей для системы без анти-рекурсии")
         restore_direct_output_connection(node_group, group_output)
 
 
@@ -871,7 +1057,7 @@ def restore_anti_recursion_connections(node_group, anti_recursion_switch):
     if source_candidates:
         source_node, source_output = source_candidates[-1]
 
-        print(f"[DEBUG] Выбран исходный узел: {source_node.name} с выходом {source_output.name}")
+        log.debug("Выбран исходный узел: %s с выходом %s", source_node.name, source_output.name)
 
         # Удаляем существующие связи к False входу
         links_to_remove = [link for link in links
@@ -883,9 +1069,9 @@ def restore_anti_recursion_connections(node_group, anti_recursion_switch):
         # Подключаем исходный узел к False входу
         links.new(source_output, anti_recursion_switch.inputs[False])
 
-        print("[DEBUG] Восстановлены связи для анти-рекурсии")
+        log.debug("Восстановлены связи для анти-рекурсии")
     else:
-        print("[DEBUG] Не найдены подходящие исходные узлы")
+        log.debug("Не найдены подходящие исходные узлы")
 
 
 def restore_direct_output_connection(node_group, group_output):
@@ -898,20 +1084,21 @@ def restore_direct_output_connection(node_group, group_output):
     """
     nodes = node_group.nodes
     links = node_group.links
+    target_node, target_input = _output_target(node_group, group_output)
 
     # Ищем подходящий исходный узел
     for node in nodes:
-        if (node.type != 'GROUP_OUTPUT' and node.type != 'GROUP_INPUT' and
+        if (node.type != 'GROUP_OUTPUT' and node.type != 'GROUP_INPUT' and node != target_node and
             not node.name.startswith('Effector_')):
 
             for output in node.outputs:
                 if output.name in ['Geometry', 'Instances']:
                     # Создаем прямую связь к выходу
-                    links.new(output, group_output.inputs['Geometry'])
-                    print(f"[DEBUG] Восстановлена прямая связь: {node.name}.{output.name} -> Output")
+                    links.new(output, target_input)
+                    log.debug("Восстановлена прямая связь: %s.%s -> Output", node.name, output.name)
                     return
 
-    print("[DEBUG] Не удалось найти узел для восстановления прямой связи")
+    log.debug("Не удалось найти узел для восстановления прямой связи")
 
 
 def update_stacked_cloner_with_effectors(obj, cloner_mod):
@@ -928,13 +1115,14 @@ def update_stacked_cloner_with_effectors(obj, cloner_mod):
     node_group = cloner_mod.node_group
     linked_effectors = node_group.get("linked_effectors", [])
 
-    print(f"[DEBUG] Обработка стекового клонера с {len(linked_effectors)} эффекторами")
+    log.debug("Обработка стекового клонера с %s эффекторами", len(linked_effectors))
 
     # Применяем каждый эффектор к стековому клонеру
     for effector_name in linked_effectors:
         effector_mod = obj.modifiers.get(effector_name)
         if effector_mod:
-            print(f"[DEBUG] Применение эффектора {effector_name} к стековому клонеру")
+            log.debug("Применение эффектора %s к стековому клонеру", effector_name)
+            mark_python_propagation(effector_mod)
             apply_effector_to_stacked_cloner(obj, cloner_mod, effector_mod)
 
 
@@ -944,6 +1132,7 @@ restore_direct_connection = restore_direct_connection_improved
 
 # СТАРАЯ ЛОГИКА ДЛЯ СТЕКОВЫХ КЛОНЕРОВ (сохраняем как есть)
 
+@profiled(category="effector")
 def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
     """Применяет параметры эффектора к стековому клонеру
 
@@ -1011,17 +1200,17 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
         if use_effector_socket:
             cloner_mod[use_effector_socket] = True
             use_effector_activated = True
-            print(f"[DEBUG] Активирован сокет Use Effector ({use_effector_socket}) для {cloner_mod.name}")
+            log.debug("Активирован сокет Use Effector (%s) для %s", use_effector_socket, cloner_mod.name)
         else:
             # Попробуем найти сокет по имени напрямую
             try:
                 cloner_mod["Use Effector"] = True
                 use_effector_activated = True
-                print(f"[DEBUG] Активирован сокет Use Effector (прямой доступ) для {cloner_mod.name}")
+                log.debug("Активирован сокет Use Effector (прямой доступ) для %s", cloner_mod.name)
             except Exception as inner_e:
-                print(f"[DEBUG] Не найден сокет Use Effector для {cloner_mod.name}: {inner_e}")
+                log.debug("Не найден сокет Use Effector для %s: %s", cloner_mod.name, inner_e)
     except Exception as e:
-        print(f"[DEBUG] Ошибка при активации сокета Use Effector: {e}")
+        log.debug("Ошибка при активации сокета Use Effector: %s", e)
 
     # Если не удалось активировать Use Effector, пробуем найти его по индексу
     if not use_effector_activated:
@@ -1036,21 +1225,21 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
                         if isinstance(current_val, bool) or current_val in [0, 1]:
                             cloner_mod[idx] = True
                             use_effector_activated = True
-                            print(f"[DEBUG] Активирован предполагаемый сокет Use Effector ({idx}) для {cloner_mod.name}")
+                            log.debug("Активирован предполагаемый сокет Use Effector (%s) для %s", idx, cloner_mod.name)
                             break
                 except:
                     continue
         except Exception as e:
-            print(f"[DEBUG] Ошибка при попытке активации Use Effector по индексу: {e}")
+            log.debug("Ошибка при попытке активации Use Effector по индексу: %s", e)
 
     # Используем альтернативный подход, основанный на старой версии кода,
     # для более стабильной работы с эффекторами
     try:
-        print(f"[DEBUG] apply_effector_to_stacked_cloner: Применение {effector_mod.name} к {cloner_mod.name} (старый метод)")
+        log.debug("apply_effector_to_stacked_cloner: Применение %s к %s (старый метод)", effector_mod.name, cloner_mod.name)
 
         # Проверяем наличие необходимых элементов
         if not cloner_mod.node_group or not effector_mod.node_group:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Нет node_group в клонере или эффекторе")
+            log.debug("apply_effector_to_stacked_cloner: Нет node_group в клонере или эффекторе")
             return False
 
         # Получаем группы узлов
@@ -1063,7 +1252,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
 
         # Убеждаемся, что у эффектора есть входы/выходы
         if 'Geometry' not in input_sockets or 'Geometry' not in output_sockets:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Эффектор не имеет нужных сокетов Geometry")
+            log.debug("apply_effector_to_stacked_cloner: Эффектор не имеет нужных сокетов Geometry")
             return False
 
         # Проверяем, существует ли уже узел этого эффектора в клонере
@@ -1075,7 +1264,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
 
         # Если узел уже существует, обновляем его параметры
         if existing_effector_node:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Обновляем существующий узел эффектора")
+            log.debug("apply_effector_to_stacked_cloner: Обновляем существующий узел эффектора")
             # Обновляем параметры
             for input_socket in [s for s in effector_group.interface.items_tree if s.item_type == 'SOCKET' and s.in_out == 'INPUT']:
                 if input_socket.name in ['Geometry']:
@@ -1089,13 +1278,13 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
                 try:
                     existing_effector_node.inputs[input_socket.name].default_value = effector_mod[input_socket.identifier]
                 except (KeyError, TypeError) as e:
-                    print(f"[DEBUG] apply_effector_to_stacked_cloner: Не удалось установить значение для {input_socket.name}: {e}")
+                    log.debug("apply_effector_to_stacked_cloner: Не удалось установить значение для %s: %s", input_socket.name, e)
                     pass
 
             return True
 
         # Создаем новый узел эффектора
-        print(f"[DEBUG] apply_effector_to_stacked_cloner: Создаем новый узел эффектора")
+        log.debug("apply_effector_to_stacked_cloner: Создаем новый узел эффектора")
 
         # Найдем выходной узел и его входящую связь
         group_output = None
@@ -1105,7 +1294,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
                 break
 
         if not group_output:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Нет выходного узла в клонере")
+            log.debug("apply_effector_to_stacked_cloner: Нет выходного узла в клонере")
             return False
 
         # Найдем последний узел трансформации или первый с геометрией перед выходом
@@ -1120,19 +1309,19 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
         for node in cloner_group.nodes:
             if node.name == "Anti-Recursion Switch":
                 anti_recursion_switch = node
-                print(f"[DEBUG] apply_effector_to_stacked_cloner: Найден узел анти-рекурсии")
+                log.debug("apply_effector_to_stacked_cloner: Найден узел анти-рекурсии")
                 break
 
         # Затем ищем узел Effector_Input
         for node in cloner_group.nodes:
             if node.name == "Effector_Input":
                 effector_input_node = node
-                print(f"[DEBUG] apply_effector_to_stacked_cloner: Найден узел Effector_Input")
+                log.debug("apply_effector_to_stacked_cloner: Найден узел Effector_Input")
                 break
 
         # Если есть узел Effector_Input и узел анти-рекурсии
         if effector_input_node and anti_recursion_switch:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Используем узел Effector_Input")
+            log.debug("apply_effector_to_stacked_cloner: Используем узел Effector_Input")
 
             # Находим исходный узел, который должен быть подключен к входу False узла анти-рекурсии
             # Ищем узел Transform или TransformGeometry
@@ -1142,7 +1331,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
                     if 'Geometry' in [s.name for s in node.outputs]:
                         source_node = node
                         source_socket = node.outputs['Geometry']
-                        print(f"[DEBUG] apply_effector_to_stacked_cloner: Найден исходный узел Transform: {source_node.name}")
+                        log.debug("apply_effector_to_stacked_cloner: Найден исходный узел Transform: %s", source_node.name)
                         break
 
             # Если не нашли узел трансформации, ищем любой узел с выходом Geometry
@@ -1153,20 +1342,20 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
                             if output.name == 'Geometry':
                                 source_node = node
                                 source_socket = output
-                                print(f"[DEBUG] apply_effector_to_stacked_cloner: Найден исходный узел с выходом Geometry: {source_node.name}")
+                                log.debug("apply_effector_to_stacked_cloner: Найден исходный узел с выходом Geometry: %s", source_node.name)
                                 break
                         if source_node:
                             break
 
         # Если есть только узел анти-рекурсии, ищем узел, который подключен к его входу False
         elif anti_recursion_switch:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Используем вход False узла анти-рекурсии")
+            log.debug("apply_effector_to_stacked_cloner: Используем вход False узла анти-рекурсии")
 
             for link in cloner_group.links:
                 if link.to_node == anti_recursion_switch and link.to_socket == anti_recursion_switch.inputs[False]:
                     source_node = link.from_node
                     source_socket = link.from_socket
-                    print(f"[DEBUG] apply_effector_to_stacked_cloner: Найден исходный узел через анти-рекурсию: {source_node.name}")
+                    log.debug("apply_effector_to_stacked_cloner: Найден исходный узел через анти-рекурсию: %s", source_node.name)
                     break
 
         # Если не нашли через анти-рекурсию, ищем стандартным способом
@@ -1184,7 +1373,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
 
         # Если не нашли, ищем любой узел перед выходом с геометрией
         if not source_node:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Не найден источник геометрии в клонере")
+            log.debug("apply_effector_to_stacked_cloner: Не найден источник геометрии в клонере")
             return False
 
         # Создаем новый узел эффектора
@@ -1210,7 +1399,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
             try:
                 effector_node.inputs[input_socket.name].default_value = effector_mod[input_socket.identifier]
             except (KeyError, TypeError) as e:
-                print(f"[DEBUG] apply_effector_to_stacked_cloner: Не удалось установить значение для {input_socket.name}: {e}")
+                log.debug("apply_effector_to_stacked_cloner: Не удалось установить значение для %s: %s", input_socket.name, e)
                 pass
 
         # Удаляем существующую связь от источника к выходу
@@ -1232,7 +1421,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
         if anti_recursion_switch:
             # Подключаем эффектор к входу False узла анти-рекурсии
             cloner_group.links.new(effector_node.outputs['Geometry'], anti_recursion_switch.inputs[False])
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Подключен эффектор к входу False узла анти-рекурсии")
+            log.debug("apply_effector_to_stacked_cloner: Подключен эффектор к входу False узла анти-рекурсии")
 
             # Удаляем узел Effector_Input, если он есть
             if effector_input_node:
@@ -1244,7 +1433,7 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
         else:
             # Иначе подключаем напрямую к выходу
             cloner_group.links.new(effector_node.outputs['Geometry'], group_output.inputs['Geometry'])
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Подключен эффектор к выходу")
+            log.debug("apply_effector_to_stacked_cloner: Подключен эффектор к выходу")
 
         # Отключаем рендер эффектора, т.к. его эффект уже применен через клонер
         effector_mod.show_render = False
@@ -1263,11 +1452,11 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
             cloner_mod["cloner_type"] = cloner_type
             cloner_group["cloner_type"] = cloner_type
 
-        print(f"[DEBUG] apply_effector_to_stacked_cloner: Эффектор успешно применен")
+        log.debug("apply_effector_to_stacked_cloner: Эффектор успешно применен")
         return True
 
     except Exception as e:
-        print(f"[DEBUG] apply_effector_to_stacked_cloner: Ошибка при применении старого метода: {e}")
+        log.debug("apply_effector_to_stacked_cloner: Ошибка при применении старого метода: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -1275,8 +1464,8 @@ def apply_effector_to_stacked_cloner(_, cloner_mod, effector_mod):
         try:
             # Используем функцию restore_direct_connection для восстановления связей
             restore_direct_connection_improved(cloner_mod.node_group)
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Восстановлена прямая связь после ошибки")
+            log.debug("apply_effector_to_stacked_cloner: Восстановлена прямая связь после ошибки")
         except Exception as restore_e:
-            print(f"[DEBUG] apply_effector_to_stacked_cloner: Ошибка при восстановлении связи: {restore_e}")
+            log.debug("apply_effector_to_stacked_cloner: Ошибка при восстановлении связи: %s", restore_e)
 
         return False
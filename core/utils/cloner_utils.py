@@ -15,11 +15,6 @@ from .cloner_effector_utils import (
     restore_direct_connection,
     apply_effector_to_stacked_cloner
 )
-# Импортируем функции из event_handlers
-from .event_handlers import (
-    register_effector_update_handler,
-    unregister_effector_update_handler
-)
 from .service_utils import (
     force_update_cloners
 )
@@ -4,6 +4,13 @@ Functions for creating and managing collection cloners.
 
 import bpy
 
+from .logging_utils import get_logger
+from .graph_profiler import tracks_graph_build
+from .node_utils import GroupExtender
+
+log = get_logger("core")
+
+@tracks_graph_build("collection_cloner", "cloner_type")
 def create_collection_cloner_nodetree(collection_obj, cloner_type, collection_name, use_anti_recursion=False):
     """
     Creates a node group for cloning a collection using Geometry Nodes
@@ -152,7 +159,7 @@ def create_collection_cloner_nodetree(collection_obj, cloner_type, collection_na
         pick_instance_socket.default_value = False
 
     except Exception as e:
-        print(f"Warning: Could not set default values for sockets: {e}")
+        log.warning("Could not set default values for sockets: %s", e)
 
     # Create nodes
     nodes = node_group.nodes
@@ -713,4 +720,7 @@ def create_collection_cloner_nodetree(collection_obj, cloner_type, collection_na
         # Если анти-рекурсия выключена, просто соединяем глобальный трансформ с выходом
         links.new(global_transform.outputs['Geometry'], group_out.inputs['Geometry'])
 
+    # A new group already has the current structure and needs no migrations
+    GroupExtender.stamp_latest_schema(node_group, "CollectionCloner")
+
     return node_group
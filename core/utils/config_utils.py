@@ -6,9 +6,16 @@
 import bpy
 import json
 import os
+import queue
+import tempfile
+import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
 from pathlib import Path
 
+from .logging_utils import get_logger
+
+log = get_logger("config")
+
 # Пути к конфигурационным файлам
 CONFIG_DIR = "config"
 CLONERS_CONFIG_DIR = os.path.join(CONFIG_DIR, "cloners")
@@ -20,6 +27,17 @@ _cloner_configs = {}
 _effector_configs = {}
 _field_configs = {}
 
+# Состояние фоновой записи конфигураций
+_write_queue = queue.Queue()
+_write_thread = None
+_write_lock = threading.Lock()
+# Последнее сериализованное содержимое, ожидающее записи, по пути файла
+_pending_writes = {}
+# Завершённые записи: (путь, успех, ошибка, callback), обрабатываются в главном потоке
+_completed_writes = queue.Queue()
+# Интервал опроса завершённых записей (секунды)
+_WRITE_POLL_INTERVAL = 0.1
+
 def get_addon_path() -> str:
     """
     Получает путь к директории аддона.
@@ -58,7 +76,7 @@ def ensure_config_dirs() -> bool:
         os.makedirs(fields_path, exist_ok=True)
         return True
     except Exception as e:
-        print(f"Error creating config directories: {e}")
+        log.error("Error creating config directories: %s", e)
         return False
 
 def load_config(config_type: str, component_type: str, use_cache: bool = True) -> Dict[str, Any]:
@@ -86,22 +104,30 @@ def load_config(config_type: str, component_type: str, use_cache: bool = True) -
         config_dir = os.path.join(addon_path, FIELDS_CONFIG_DIR)
         cache = _field_configs
     else:
-        print(f"Unknown config type: {config_type}")
+        log.debug("Unknown config type: %s", config_type)
         return {}
 
     # Проверяем, есть ли конфигурация в кэше и нужно ли использовать кэш
     cache_key = f"{config_type}_{component_type}"
     if use_cache and cache_key in cache:
-        print(f"Using cached config for {component_type}")
+        log.debug("Using cached config for %s", component_type)
         return cache[cache_key]
 
     # Формируем имя файла
     filename = f"{component_type.lower()}.json"
     config_file = os.path.join(config_dir, filename)
 
+    # Если файл ещё записывается в фоне, берём ожидающее содержимое
+    pending = get_pending_write(config_file)
+    if pending is not None:
+        try:
+            return json.loads(pending)
+        except Exception as e:
+            log.error("Error decoding pending config for %s: %s", config_file, e)
+
     # Проверяем существование файла
     if not os.path.exists(config_file):
-        print(f"Config file not found: {config_file}")
+        log.debug("Config file not found: %s", config_file)
         return {}
 
     # Загружаем конфигурацию из файла
@@ -111,65 +137,360 @@ def load_config(config_type: str, component_type: str, use_cache: bool = True) -
 
         # Кэшируем конфигурацию
         cache[cache_key] = config
-        print(f"Loaded config from {config_file}")
+        log.debug("Loaded config from %s", config_file)
 
         return config
     except Exception as e:
-        print(f"Error loading config from {config_file}: {e}")
+        log.error("Error loading config from %s: %s", config_file, e)
         return {}
 
-def save_config(config_type: str, component_type: str, config: Dict[str, Any]) -> bool:
+def _get_config_dir(config_type: str) -> Optional[str]:
+    """
+    Возвращает директорию конфигураций для указанного типа.
+
+    Args:
+        config_type: Тип конфигурации ('cloners', 'effectors', 'fields')
+
+    Returns:
+        str: Путь к директории или None для неизвестного типа
+    """
+    addon_path = get_addon_path()
+
+    if config_type == 'cloners':
+        return os.path.join(addon_path, CLONERS_CONFIG_DIR)
+    elif config_type == 'effectors':
+        return os.path.join(addon_path, EFFECTORS_CONFIG_DIR)
+    elif config_type == 'fields':
+        return os.path.join(addon_path, FIELDS_CONFIG_DIR)
+    return None
+
+def _write_file_atomic(file_path: str, data: str) -> None:
+    """
+    Атомарно записывает текст в файл через временный файл и переименование.
+    Читатель всегда видит либо старое, либо новое содержимое, но не обрезанный файл.
+
+    Args:
+        file_path: Путь к целевому файлу
+        data: Содержимое для записи
+    """
+    directory = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(file_path)}.",
+        suffix=".tmp",
+        dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except Exception:
+        # Не оставляем мусор рядом с конфигурацией
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _config_writer_loop() -> None:
+    """
+    Цикл фонового потока записи. Не обращается к bpy - только к файловой системе.
+    """
+    while True:
+        job = _write_queue.get()
+        if job is None:
+            _write_queue.task_done()
+            break
+
+        file_path, callback = job
+
+        # Берём самое свежее содержимое: несколько сохранений одного файла
+        # подряд схлопываются в одну запись
+        with _write_lock:
+            data = _pending_writes.get(file_path)
+
+        success = True
+        error = None
+        if data is not None:
+            try:
+                _write_file_atomic(file_path, data)
+            except Exception as e:
+                success = False
+                error = str(e)
+
+        with _write_lock:
+            # Снимаем отметку только если за время записи не пришло новое содержимое
+            if _pending_writes.get(file_path) is data:
+                _pending_writes.pop(file_path, None)
+
+        _completed_writes.put((file_path, success, error, callback))
+        _write_queue.task_done()
+
+def _ensure_writer_thread() -> None:
+    """
+    Запускает фоновый поток записи, если он ещё не запущен.
+    """
+    global _write_thread
+
+    if _write_thread is None or not _write_thread.is_alive():
+        _write_thread = threading.Thread(
+            target=_config_writer_loop,
+            name="AdvancedClonersConfigWriter",
+            daemon=True
+        )
+        _write_thread.start()
+
+def _process_completed_writes():
+    """
+    Таймер главного потока: вызывает callbacks завершённых записей.
+
+    Returns:
+        float: Интервал до следующего вызова или None, если ожидающих записей нет
+    """
+    while True:
+        try:
+            file_path, success, error, callback = _completed_writes.get_nowait()
+        except queue.Empty:
+            break
+
+        if success:
+            log.debug("Config saved to %s", file_path)
+        else:
+            log.error("Error saving config to %s: %s", file_path, error)
+
+        if callback:
+            try:
+                callback(file_path, success)
+            except Exception as e:
+                log.error("Error in config save callback: %s", e)
+
+    with _write_lock:
+        has_pending = bool(_pending_writes)
+
+    if has_pending or not _completed_writes.empty() or _write_queue.unfinished_tasks:
+        return _WRITE_POLL_INTERVAL
+    return None
+
+def _schedule_completion_timer() -> None:
+    """
+    Регистрирует таймер обработки завершённых записей, если он не зарегистрирован.
+    """
+    try:
+        if not bpy.app.timers.is_registered(_process_completed_writes):
+            bpy.app.timers.register(_process_completed_writes, first_interval=_WRITE_POLL_INTERVAL)
+    except Exception as e:
+        log.error("Error scheduling config write timer: %s", e)
+
+def write_json_async(file_path: str, data: Any, callback=None) -> bool:
+    """
+    Сериализует данные в главном потоке и ставит атомарную запись в фоновую очередь.
+
+    Args:
+        file_path: Путь к целевому файлу
+        data: Данные для записи (dict/list) или уже сериализованная строка
+        callback: Функция callback(file_path, success), вызываемая в главном потоке после записи
+
+    Returns:
+        bool: True, если запись поставлена в очередь
+    """
+    # Сериализация выполняется здесь: данные могут содержать значения из bpy,
+    # а фоновый поток не должен их касаться
+    try:
+        payload = data if isinstance(data, str) else json.dumps(data, indent=4, ensure_ascii=False)
+    except Exception as e:
+        log.error("Error serializing config for %s: %s", file_path, e)
+        return False
+
+    with _write_lock:
+        _pending_writes[file_path] = payload
+
+    _ensure_writer_thread()
+    _write_queue.put((file_path, callback))
+    _schedule_completion_timer()
+    return True
+
+def get_pending_write(file_path: str) -> Optional[str]:
+    """
+    Возвращает содержимое, ожидающее записи в файл, если оно есть.
+
+    Args:
+        file_path: Путь к файлу
+
+    Returns:
+        str: Сериализованное содержимое или None
+    """
+    with _write_lock:
+        return _pending_writes.get(file_path)
+
+def flush_pending_writes(timeout: float = 5.0) -> bool:
+    """
+    Дожидается завершения всех поставленных в очередь записей и вызывает их callbacks.
+    Используется при отключении аддона, чтобы не потерять данные.
+
+    Args:
+        timeout: Максимальное время ожидания в секундах
+
+    Returns:
+        bool: True, если все записи завершены
+    """
+    import time
+
+    deadline = time.monotonic() + timeout
+    while _write_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    finished = not _write_queue.unfinished_tasks
+    _process_completed_writes()
+    return finished
+
+def stop_config_writer(timeout: float = 5.0) -> None:
+    """
+    Дописывает ожидающие конфигурации и останавливает фоновый поток записи.
+
+    Args:
+        timeout: Максимальное время ожидания в секундах
+    """
+    global _write_thread
+
+    flush_pending_writes(timeout)
+
+    if _write_thread is not None and _write_thread.is_alive():
+        _write_queue.put(None)
+        _write_thread.join(timeout)
+    _write_thread = None
+
+    try:
+        if bpy.app.timers.is_registered(_process_completed_writes):
+            bpy.app.timers.unregister(_process_completed_writes)
+    except Exception:
+        pass
+
+def save_config(config_type: str, component_type: str, config: Dict[str, Any],
+                async_write: bool = True, callback=None) -> bool:
     """
     Сохраняет конфигурацию для указанного типа компонента.
+    Файл записывается атомарно (временный файл + переименование). По умолчанию
+    запись выполняется в фоновом потоке, а по её завершении кэш конфигурации сбрасывается.
 
     Args:
         config_type: Тип конфигурации ('cloners', 'effectors', 'fields')
         component_type: Тип компонента (например, 'GRID', 'RANDOM', 'SPHERE')
         config: Словарь с параметрами компонента
+        async_write: Записывать в фоновом потоке (True) или синхронно (False)
+        callback: Функция callback(file_path, success), вызываемая в главном потоке после записи
 
     Returns:
-        bool: True, если конфигурация была успешно сохранена
+        bool: True, если конфигурация сохранена (или поставлена в очередь на запись)
     """
     # Проверяем наличие директорий
     if not ensure_config_dirs():
         return False
 
     # Определяем путь к файлу конфигурации
-    addon_path = get_addon_path()
-
-    if config_type == 'cloners':
-        config_dir = os.path.join(addon_path, CLONERS_CONFIG_DIR)
-        cache = _cloner_configs
-    elif config_type == 'effectors':
-        config_dir = os.path.join(addon_path, EFFECTORS_CONFIG_DIR)
-        cache = _effector_configs
-    elif config_type == 'fields':
-        config_dir = os.path.join(addon_path, FIELDS_CONFIG_DIR)
-        cache = _field_configs
-    else:
-        print(f"Unknown config type: {config_type}")
+    config_dir = _get_config_dir(config_type)
+    if config_dir is None:
+        log.debug("Unknown config type: %s", config_type)
         return False
 
     # Формируем имя файла
     filename = f"{component_type.lower()}.json"
     config_file = os.path.join(config_dir, filename)
 
-    # Сохраняем конфигурацию в файл
-    try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+    if async_write:
+        # Сбрасываем кэш сразу: до завершения записи load_config вернёт ожидающее содержимое
+        clear_cache(config_type, component_type)
 
-        # Обновляем кэш
-        cache_key = f"{config_type}_{component_type}"
-        cache[cache_key] = config
+        def on_written(file_path, success):
+            # Кэш сбрасываем после записи, чтобы следующее чтение взяло файл
+            clear_cache(config_type, component_type)
+            if callback:
+                callback(file_path, success)
+
+        return write_json_async(config_file, config, on_written)
+
+    # Синхронная атомарная запись
+    try:
+        _write_file_atomic(config_file, json.dumps(config, indent=4, ensure_ascii=False))
+        clear_cache(config_type, component_type)
 
-        print(f"Config saved to {config_file}")
+        log.debug("Config saved to %s", config_file)
+        if callback:
+            callback(config_file, True)
         return True
     except Exception as e:
-        print(f"Error saving config to {config_file}: {e}")
+        log.error("Error saving config to %s: %s", config_file, e)
+        if callback:
+            callback(config_file, False)
         return False
 
-def apply_cloner_config(modifier, cloner_type: str, force_reload: bool = True) -> bool:
+def save_configs(config_type: str, configs: Dict[str, Dict[str, Any]], callback=None) -> bool:
+    """
+    Сохраняет несколько конфигураций одного типа в фоновом потоке.
+    Все конфигурации сериализуются сразу, запись идёт без блокировки интерфейса.
+
+    Args:
+        config_type: Тип конфигурации ('cloners', 'effectors', 'fields')
+        configs: Словарь {тип компонента: конфигурация}
+        callback: Функция callback(file_path, success) для каждой записи
+
+    Returns:
+        bool: True, если все конфигурации поставлены в очередь
+    """
+    result = True
+    for component_type, config in configs.items():
+        if not save_config(config_type, component_type, config, async_write=True, callback=callback):
+            result = False
+    return result
+
+def apply_config_values(modifier, config: Dict[str, Any]) -> List[str]:
+    """
+    Применяет параметры конфигурации к модификатору одной пакетной записью.
+    Сокеты ищутся за один проход по интерфейсу, значения приводятся к типам
+    сокетов заранее, затем записываются подряд с одним обновлением объекта.
+
+    Args:
+        modifier: Модификатор с нод-группой
+        config: Словарь параметров (имя сокета -> значение)
+
+    Returns:
+        list: Имена применённых параметров
+    """
+    if not modifier or not modifier.node_group:
+        return []
+
+    # Имя сокета -> идентификатор за один проход по интерфейсу
+    socket_ids = {}
+    for socket in modifier.node_group.interface.items_tree:
+        if socket.item_type == 'SOCKET' and socket.in_out == 'INPUT' and socket.name not in socket_ids:
+            socket_ids[socket.name] = socket.identifier
+
+    # Готовим значения до записи
+    values = []
+    for param_name, param_value in config.items():
+        socket_id = socket_ids.get(param_name)
+        if not socket_id:
+            continue
+
+        current_value = modifier.get(socket_id)
+        if isinstance(current_value, float) and isinstance(param_value, list):
+            # Если сокет ожидает float, а в конфиге список, берем первый элемент
+            param_value = param_value[0]
+        elif isinstance(param_value, list):
+            # Векторы и цвета записываются как tuple
+            param_value = tuple(param_value)
+
+        values.append((param_name, socket_id, param_value))
+
+    for _, socket_id, param_value in values:
+        modifier[socket_id] = param_value
+
+    # Одно обновление вместо обновления на каждый параметр
+    if values and modifier.id_data:
+        modifier.id_data.update_tag()
+
+    return [param_name for param_name, _, _ in values]
+
+def apply_cloner_config(modifier, cloner_type: str, force_reload: bool = True,
+                        preset_name: Optional[str] = None) -> bool:
     """
     Применяет конфигурацию к модификатору клонера.
 
@@ -177,18 +498,22 @@ def apply_cloner_config(modifier, cloner_type: str, force_reload: bool = True) -
         modifier: Модификатор клонера
         cloner_type: Тип клонера ('GRID', 'LINEAR', 'CIRCLE')
         force_reload: Принудительно перезагрузить конфигурацию из файла
+        preset_name: Имя пресета из библиотеки пресетов вместо конфигурации по умолчанию
 
     Returns:
         bool: True, если конфигурация была успешно применена
     """
     # Загружаем конфигурацию
-    if force_reload:
+    if preset_name:
+        from .preset_store import load_preset
+        config = load_preset('cloners', preset_name)
+    elif force_reload:
         config = reload_config('cloners', cloner_type)
     else:
         config = load_config('cloners', cloner_type)
 
     if not config:
-        print(f"No config found for cloner type: {cloner_type}")
+        log.debug("No config found for cloner type: %s", cloner_type)
         return False
 
     # Определяем тип клонера (объектный/коллекционный/стековый) - для логирования
@@ -206,41 +531,16 @@ def apply_cloner_config(modifier, cloner_type: str, force_reload: bool = True) -
 
     # Применяем параметры из конфигурации
     try:
-        for param_name, param_value in config.items():
-            # Ищем сокет по имени
-            socket_id = find_socket_by_name(modifier, param_name)
-            if socket_id:
-                # Проверяем тип текущего значения сокета
-                current_value = modifier[socket_id]
-
-                # Обрабатываем различные типы данных
-                if isinstance(current_value, float) and isinstance(param_value, list):
-                    # Если сокет ожидает float, а в конфиге список, берем первый элемент
-                    modifier[socket_id] = param_value[0]
-
-                    # Логирование для отладки
-                    cloner_type_str = "collection" if is_collection_cloner else "stacked" if is_stacked_cloner else "standard"
-                    print(f"Applied {param_name} = {param_value[0]} (converted from list) to {cloner_type_str} {cloner_type} cloner")
-
-                elif isinstance(current_value, tuple) and isinstance(param_value, list):
-                    # Если сокет ожидает tuple, а в конфиге список, преобразуем список в tuple
-                    modifier[socket_id] = tuple(param_value)
-
-                    # Логирование для отладки
-                    cloner_type_str = "collection" if is_collection_cloner else "stacked" if is_stacked_cloner else "standard"
-                    print(f"Applied {param_name} = {tuple(param_value)} (converted from list) to {cloner_type_str} {cloner_type} cloner")
-
-                else:
-                    # Стандартное присваивание для других типов данных
-                    modifier[socket_id] = param_value
+        applied = apply_config_values(modifier, config)
 
-                    # Логирование для отладки
-                    cloner_type_str = "collection" if is_collection_cloner else "stacked" if is_stacked_cloner else "standard"
-                    print(f"Applied {param_name} = {param_value} to {cloner_type_str} {cloner_type} cloner")
+        # Логирование для отладки
+        cloner_type_str = "collection" if is_collection_cloner else "stacked" if is_stacked_cloner else "standard"
+        source = f"preset '{preset_name}'" if preset_name else "config"
+        log.debug("Applied %s parameters from %s to %s %s cloner", len(applied), source, cloner_type_str, cloner_type)
 
         return True
     except Exception as e:
-        print(f"Error applying cloner config: {e}")
+        log.error("Error applying cloner config: %s", e)
         return False
 
 def apply_effector_config(modifier, effector_type: str, force_reload: bool = True) -> bool:
@@ -262,7 +562,7 @@ def apply_effector_config(modifier, effector_type: str, force_reload: bool = Tru
         config = load_config('effectors', effector_type)
 
     if not config:
-        print(f"No config found for effector type: {effector_type}")
+        log.debug("No config found for effector type: %s", effector_type)
         return False
 
     # Применяем параметры из конфигурации
@@ -277,18 +577,18 @@ def apply_effector_config(modifier, effector_type: str, force_reload: bool = Tru
                 if isinstance(current_value, float) and isinstance(param_value, list):
                     # Если сокет ожидает float, а в конфиге список, берем первый элемент
                     modifier[socket_id] = param_value[0]
-                    print(f"Applied {param_name} = {param_value[0]} (converted from list) to {effector_type} effector")
+                    log.debug("Applied %s = %s (converted from list) to %s effector", param_name, param_value[0], effector_type)
                 elif isinstance(current_value, tuple) and isinstance(param_value, list):
                     # Если сокет ожидает tuple, а в конфиге список, преобразуем список в tuple
                     modifier[socket_id] = tuple(param_value)
-                    print(f"Applied {param_name} = {tuple(param_value)} (converted from list) to {effector_type} effector")
+                    log.debug("Applied %s = %s (converted from list) to %s effector", param_name, tuple(param_value), effector_type)
                 else:
                     # Стандартное присваивание
                     modifier[socket_id] = param_value
-                    print(f"Applied {param_name} = {param_value} to {effector_type} effector")
+                    log.debug("Applied %s = %s to %s effector", param_name, param_value, effector_type)
         return True
     except Exception as e:
-        print(f"Error applying effector config: {e}")
+        log.error("Error applying effector config: %s", e)
         return False
 
 def apply_field_config(modifier, field_type: str, force_reload: bool = True) -> bool:
@@ -310,7 +610,7 @@ def apply_field_config(modifier, field_type: str, force_reload: bool = True) ->
         config = load_config('fields', field_type)
 
     if not config:
-        print(f"No config found for field type: {field_type}")
+        log.debug("No config found for field type: %s", field_type)
         return False
 
     # Применяем параметры из конфигурации
@@ -325,18 +625,18 @@ def apply_field_config(modifier, field_type: str, force_reload: bool = True) ->
                 if isinstance(current_value, float) and isinstance(param_value, list):
                     # Если сокет ожидает float, а в конфиге список, берем первый элемент
                     modifier[socket_id] = param_value[0]
-                    print(f"Applied {param_name} = {param_value[0]} (converted from list) to {field_type} field")
+                    log.debug("Applied %s = %s (converted from list) to %s field", param_name, param_value[0], field_type)
                 elif isinstance(current_value, tuple) and isinstance(param_value, list):
                     # Если сокет ожидает tuple, а в конфиге список, преобразуем список в tuple
                     modifier[socket_id] = tuple(param_value)
-                    print(f"Applied {param_name} = {tuple(param_value)} (converted from list) to {field_type} field")
+                    log.debug("Applied %s = %s (converted from list) to %s field", param_name, tuple(param_value), field_type)
                 else:
                     # Стандартное присваивание
                     modifier[socket_id] = param_value
-                    print(f"Applied {param_name} = {param_value} to {field_type} field")
+                    log.debug("Applied %s = %s to %s field", param_name, param_value, field_type)
         return True
     except Exception as e:
-        print(f"Error applying field config: {e}")
+        log.error("Error applying field config: %s", e)
         return False
 
 # Функции для управления кэшем
@@ -355,7 +655,7 @@ def clear_cache(config_type: str = None, component_type: str = None):
         _cloner_configs.clear()
         _effector_configs.clear()
         _field_configs.clear()
-        print("Cleared all configuration caches")
+        log.debug("Cleared all configuration caches")
         return
 
     # Выбираем нужный кэш
@@ -366,19 +666,19 @@ def clear_cache(config_type: str = None, component_type: str = None):
     elif config_type == 'fields':
         cache = _field_configs
     else:
-        print(f"Unknown config type: {config_type}")
+        log.debug("Unknown config type: %s", config_type)
         return
 
     if component_type is None:
         # Очищаем кэш для всех компонентов указанного типа
         cache.clear()
-        print(f"Cleared cache for all {config_type}")
+        log.debug("Cleared cache for all %s", config_type)
     else:
         # Очищаем кэш только для указанного компонента
         cache_key = f"{config_type}_{component_type}"
         if cache_key in cache:
             del cache[cache_key]
-            print(f"Cleared cache for {component_type} {config_type}")
+            log.debug("Cleared cache for %s %s", component_type, config_type)
 
 def reload_config(config_type: str, component_type: str) -> Dict[str, Any]:
     """
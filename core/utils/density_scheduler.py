@@ -0,0 +1,231 @@
+"""
+Распределение бюджета инстансов сцены по клонерам через плотность во вьюпорте.
+
+Режим 'SCALE' свойства cloner_instance_guard: когда оценка инстансов видимых
+клонеров (instance_guard.estimate_scene) превышает cloner_instance_budget,
+каждому клонеру выделяется доля бюджета пропорционально числу его инстансов,
+деленному на стоимость одного инстанса. Стоимость берется из измеренного
+Modifier.execution_time (modifier_stats); без замеров все клонеры считаются
+одинаково дорогими. Доли сверх собственного числа инстансов клонера
+перераспределяются между остальными (water-filling).
+
+Плотность записывается во вход Viewport Density последнего клонера объекта
+(ClonerBase.setup_viewport_density) и действует только во вьюпорте.
+Плотность клонера-источника цепочки действует и на клонеры, которые его копируют,
+поэтому для цепочек показывается не больше инстансов, чем выделено.
+Распределение пересчитывается только при изменении оценок или стоимостей (оценки
+приходят из кэша instance_guard.SceneEstimates и пересчитываются только для
+измененных объектов), а модификатор обновляется, только если его плотность
+изменилась больше чем на DENSITY_EPSILON. Распределение считается в обработчике
+depsgraph, а запись плотностей и добавление узлов прореживания выполняются таймером.
+"""
+
+import bpy
+
+from .modifier_stats import classify_modifier, modifier_stats
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Минимальное изменение плотности, при котором модификатор обновляется
+DENSITY_EPSILON = 0.02
+
+# Нижняя граница плотности, чтобы клонер не пропадал из вьюпорта полностью
+MIN_DENSITY = 0.001
+
+# Входные данные последнего распределения {имя объекта: (оценка, стоимость инстанса)}
+_last_inputs = None
+
+# Плотности последнего распределения для панели {имя объекта: плотность}
+last_allocation = {}
+
+# Плотности, ожидающие записи таймером: {имя сцены: {имя объекта: плотность}}
+_pending_densities = {}
+
+
+def _density_modifier(obj):
+    """Последний включенный во вьюпорте модификатор клонера объекта."""
+    for mod in reversed(obj.modifiers):
+        if classify_modifier(mod) == 'CLONER' and mod.show_viewport:
+            return mod
+    return None
+
+
+def _density_identifier(mod, create):
+    """
+    Идентификатор входа Viewport Density модификатора.
+
+    Args:
+        mod: Модификатор клонера
+        create: Добавить вход в группу узлов, если его нет
+
+    Returns:
+        str: Идентификатор сокета или None
+    """
+    from ...models.cloners.base import ClonerBase
+
+    if create and not ClonerBase.setup_viewport_density(mod.node_group):
+        return None
+    for item in mod.node_group.interface.items_tree:
+        if (item.item_type == 'SOCKET' and item.in_out == 'INPUT'
+                and item.name == ClonerBase.VIEWPORT_DENSITY_SOCKET):
+            return item.identifier
+    return None
+
+
+def _instance_costs(estimates):
+    """
+    Стоимость одного показанного инстанса по замерам execution_time.
+
+    Returns:
+        dict: {имя объекта: мс на инстанс}; объекты без замеров получают медиану остальных (или 1.0)
+    """
+    measured_ms = {}
+    for row in modifier_stats.rows():
+        if row["kind"] == 'CLONER' and row["object"] in estimates:
+            measured_ms[row["object"]] = measured_ms.get(row["object"], 0.0) + row["mean_ms"]
+
+    costs = {}
+    for name, ms in measured_ms.items():
+        shown = max(estimates[name] * last_allocation.get(name, 1.0), 1.0)
+        if ms > 0.0:
+            # Округление до 2 значащих цифр гасит шум замеров между пересчетами
+            costs[name] = float(f"{ms / shown:.2g}")
+
+    default = sorted(costs.values())[len(costs) // 2] if costs else 1.0
+    return {name: costs.get(name, default) for name in estimates}
+
+
+def allocate_densities(estimates, costs, budget):
+    """
+    Распределяет бюджет инстансов между клонерами.
+
+    Args:
+        estimates: {имя: оценка числа инстансов}
+        costs: {имя: стоимость одного инстанса}
+        budget: Бюджет инстансов
+
+    Returns:
+        dict: {имя: плотность 0..1}; при сумме оценок в пределах бюджета все плотности 1.0
+    """
+    densities = {name: 1.0 for name in estimates}
+    if sum(estimates.values()) <= budget:
+        return densities
+
+    remaining = dict(estimates)
+    left = float(budget)
+    while remaining:
+        weights = {name: count / max(costs.get(name, 1.0), 1e-9) for name, count in remaining.items()}
+        total_weight = sum(weights.values())
+        shares = {name: left * weight / total_weight for name, weight in weights.items()}
+
+        # Клонеры, которым доля позволяет показать все инстансы, выходят из распределения
+        saturated = [name for name, share in shares.items() if share >= remaining[name]]
+        if not saturated:
+            for name, share in shares.items():
+                densities[name] = max(share / remaining[name], MIN_DENSITY)
+            break
+        for name in saturated:
+            left -= remaining.pop(name)
+
+    return densities
+
+
+def reset_densities(scene):
+    """Возвращает всем клонерам сцены полную плотность во вьюпорте."""
+    global _last_inputs
+    from ...models.cloners.base import ClonerBase
+
+    for obj in scene.objects:
+        for mod in obj.modifiers:
+            if classify_modifier(mod) != 'CLONER':
+                continue
+            for item in mod.node_group.interface.items_tree:
+                if item.item_type == 'SOCKET' and item.name == ClonerBase.VIEWPORT_DENSITY_SOCKET:
+                    if mod.get(item.identifier, 1.0) != 1.0:
+                        mod[item.identifier] = 1.0
+                        obj.update_tag()
+                    break
+    _last_inputs = None
+    last_allocation.clear()
+    _pending_densities.pop(scene.name, None)
+
+
+def apply_viewport_density(scene, densities):
+    """
+    Записывает плотности во вход Viewport Density клонеров, при необходимости
+    добавляя узлы прореживания. Меняет группы узлов, поэтому вызывается вне
+    обработчиков depsgraph.
+
+    Args:
+        scene: Сцена
+        densities: {имя объекта: плотность}
+
+    Returns:
+        list: Имена объектов, плотность которых изменилась
+    """
+    changed = []
+    for name, density in densities.items():
+        obj = scene.objects.get(name)
+        mod = _density_modifier(obj) if obj is not None else None
+        if mod is None:
+            continue
+        # Полная плотность не требует узлов прореживания
+        identifier = _density_identifier(mod, create=density < 1.0)
+        if identifier is None:
+            continue
+        current = mod.get(identifier, 1.0)
+        if abs(current - density) > DENSITY_EPSILON or (density == 1.0 and current != 1.0):
+            mod[identifier] = density
+            obj.update_tag()
+            changed.append(name)
+
+    if changed:
+        log.debug("Viewport density updated for %s", changed)
+    return changed
+
+
+def _apply_pending_densities():
+    """Таймер: записывает плотности, распределенные в обработчике depsgraph."""
+    pending = dict(_pending_densities)
+    _pending_densities.clear()
+    for scene_name, densities in pending.items():
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            continue
+        try:
+            apply_viewport_density(scene, densities)
+        except Exception as e:
+            log.error("Viewport density update failed for scene %s: %s", scene_name, e)
+    return None
+
+
+def schedule_viewport_density(scene, estimates, budget):
+    """
+    Распределяет бюджет и откладывает запись изменившихся плотностей до таймера.
+
+    Args:
+        scene: Сцена
+        estimates: Оценки видимых клонеров {имя объекта: инстансы}
+        budget: Бюджет инстансов сцены
+
+    Returns:
+        dict: {имя объекта: плотность}
+    """
+    global _last_inputs
+
+    costs = _instance_costs(estimates)
+    inputs = {name: (estimates[name], costs[name]) for name in estimates}
+    if inputs == _last_inputs:
+        return last_allocation
+    _last_inputs = inputs
+
+    densities = allocate_densities(estimates, costs, budget)
+    changed = {name: density for name, density in densities.items() if last_allocation.get(name) != density}
+    last_allocation.clear()
+    last_allocation.update(densities)
+    if changed:
+        _pending_densities.setdefault(scene.name, {}).update(changed)
+        if not bpy.app.timers.is_registered(_apply_pending_densities):
+            bpy.app.timers.register(_apply_pending_densities, first_interval=0.0)
+    return last_allocation
@@ -10,6 +10,11 @@ from collections import OrderedDict
 from mathutils import Matrix
 from typing import Dict, List, Tuple, Optional, Union
 
+from .logging_utils import get_logger
+from .orphan_gc import is_addon_collection, mark_addon_collection
+
+log = get_logger("core")
+
 # Cache of already created duplicates for optimization
 mesh_duplicates_cache = OrderedDict()
 # Maximum cache size
@@ -38,12 +43,13 @@ def create_cloner_collection(base_name="cloner"):
     
     # Create new collection
     collection = bpy.data.collections.new(collection_name)
+    mark_addon_collection(collection)
     
     # Add collection to scene
     try:
         bpy.context.scene.collection.children.link(collection)
     except Exception as e:
-        print(f"Failed to add collection to scene: {e}")
+        log.error("Failed to add collection to scene: %s", e)
         # Try to find any collection to add it to
         for coll in bpy.data.collections:
             try:
@@ -247,8 +253,7 @@ def cleanup_empty_cloner_collections():
     count = 0
     
     # Find all cloner collections
-    cloner_collections = [c for c in bpy.data.collections 
-                          if c.name.startswith("cloner") or c.name.startswith("cloner_")]
+    cloner_collections = [c for c in bpy.data.collections if is_addon_collection(c)]
     
     # Delete empty collections
     for collection in cloner_collections:
@@ -257,7 +262,7 @@ def cleanup_empty_cloner_collections():
                 bpy.data.collections.remove(collection)
                 count += 1
             except Exception as e:
-                print(f"Failed to delete collection {collection.name}: {e}")
+                log.error("Failed to delete collection %s: %s", collection.name, e)
     
     return count
 
@@ -313,7 +318,7 @@ def get_or_create_duplicate_for_cloner(obj, cloner_modifier):
         # Если переходим с клонера коллекции на клонер меша
         if has_collection_cloner and new_source_type == "OBJECT" and original_collection:
             # Вместо дубликата пустого объекта, создаем новый объект с геометрией
-            print(f"Detected COLLECTION->OBJECT cloner chain. Creating mesh object for cloning.")
+            log.debug("Detected COLLECTION->OBJECT cloner chain. Creating mesh object for cloning.")
             
             # Получаем объект коллекции из имени
             coll_obj = None
@@ -636,7 +641,7 @@ def get_cloner_chain_for_object(obj):
             # Move up the chain
             if not found:
                 # Even if we don't find the exact modifier, we still want to continue up the chain
-                print(f"Warning: Could not find modifier that created {current_obj.name}")
+                log.warning("Could not find modifier that created %s", current_obj.name)
             
             current_obj = original_obj
         else:
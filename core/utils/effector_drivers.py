@@ -0,0 +1,137 @@
+"""
+Передача параметров эффектора во встроенные узлы эффекторов клонеров через драйверы.
+
+Входы узла Effector_* в группе клонера получают драйверы, читающие свойства
+модификатора эффектора (modifiers["Random Effector"]["Socket_3"]). Выражение
+драйвера - просто "var", такие выражения Blender вычисляет без Python,
+поэтому изменение параметра эффектора доходит до клонеров внутри depsgraph
+без обработчиков и копирования значений.
+
+Модификатор эффектора, все узлы которого связаны драйверами, отмечается
+свойством DRIVEN_FLAG; effector_parameter_update_handler такие эффекторы пропускает.
+Стековые клонеры получают параметры по-прежнему через apply_effector_to_stacked_cloner,
+поэтому их эффекторы отмечаются DRIVEN_FLAG = False.
+"""
+
+from .logging_utils import get_logger
+
+log = get_logger("effectors")
+
+# Передавать параметры драйверами (False - прежнее копирование значений обработчиком)
+ENABLED = True
+
+# Свойство модификатора эффектора: параметры доходят до клонеров без Python
+DRIVEN_FLAG = "param_drivers"
+
+# Типы сокетов, которые нельзя или не нужно связывать драйвером
+_UNDRIVABLE_SOCKET_TYPES = {
+    'NodeSocketGeometry', 'NodeSocketObject', 'NodeSocketCollection', 'NodeSocketMaterial',
+    'NodeSocketTexture', 'NodeSocketImage', 'NodeSocketString', 'NodeSocketMenu',
+}
+
+
+def _socket_paths(effector_mod, item, node_input):
+    """
+    Пары (индекс компонента, путь свойства модификатора) для входа узла.
+
+    Returns:
+        list: [(index, data_path)]; index -1 для скалярных сокетов
+    """
+    base = f'modifiers["{effector_mod.name}"]["{item.identifier}"]'
+    value = node_input.default_value
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return [(i, f"{base}[{i}]") for i in range(len(value))]
+    return [(-1, base)]
+
+
+def _add_driver(node_input, obj, index, data_path):
+    fcurve = node_input.driver_add("default_value", index)
+    driver = fcurve.driver
+    driver.type = 'SCRIPTED'
+    driver.expression = "var"
+
+    variable = driver.variables[0] if driver.variables else driver.variables.new()
+    variable.name = "var"
+    variable.type = 'SINGLE_PROP'
+    target = variable.targets[0]
+    target.id_type = 'OBJECT'
+    target.id = obj
+    target.data_path = data_path
+
+
+def _driver_matches(node_group, node_input, index, obj, data_path):
+    """Проверяет, что на входе уже стоит драйвер на то же свойство."""
+    animation_data = node_group.animation_data
+    if animation_data is None:
+        return False
+    fcurve = animation_data.drivers.find(node_input.path_from_id("default_value"), index=max(index, 0))
+    if fcurve is None or not fcurve.driver.variables:
+        return False
+    target = fcurve.driver.variables[0].targets[0]
+    return target.id == obj and target.data_path == data_path
+
+
+def bind_effector_node(obj, effector_mod, effector_node):
+    """
+    Связывает входы встроенного узла эффектора с параметрами модификатора эффектора.
+    Повторный вызов обновляет только драйверы с другим путем (например, после переименования).
+
+    Args:
+        obj: Объект с модификатором эффектора
+        effector_mod: Модификатор эффектора
+        effector_node: Узел Effector_* в группе клонера
+
+    Returns:
+        int: Число созданных драйверов
+    """
+    if not ENABLED:
+        return 0
+
+    node_group = effector_node.id_data
+    created = 0
+    for item in effector_mod.node_group.interface.items_tree:
+        if item.item_type != 'SOCKET' or item.in_out != 'INPUT':
+            continue
+        if item.socket_type in _UNDRIVABLE_SOCKET_TYPES or item.identifier not in effector_mod:
+            continue
+        node_input = effector_node.inputs.get(item.name)
+        if node_input is None or not hasattr(node_input, "default_value"):
+            continue
+
+        for index, data_path in _socket_paths(effector_mod, item, node_input):
+            if _driver_matches(node_group, node_input, index, obj, data_path):
+                continue
+            try:
+                _add_driver(node_input, obj, index, data_path)
+                created += 1
+            except (TypeError, RuntimeError) as e:
+                log.debug("Не удалось добавить драйвер %s: %s", data_path, e)
+
+    if DRIVEN_FLAG not in effector_mod:
+        effector_mod[DRIVEN_FLAG] = True
+    if created:
+        log.debug("Драйверы параметров %s -> %s: %s", effector_mod.name, effector_node.name, created)
+    return created
+
+
+def unbind_effector_node(effector_node):
+    """
+    Удаляет драйверы входов узла эффектора. Вызывается перед удалением узла,
+    иначе в animation_data группы остаются драйверы с несуществующими путями.
+    """
+    for node_input in effector_node.inputs:
+        if hasattr(node_input, "default_value"):
+            try:
+                node_input.driver_remove("default_value")
+            except (TypeError, RuntimeError):
+                pass
+
+
+def mark_python_propagation(effector_mod):
+    """Отмечает эффектор, параметры которого копируются обработчиком (стековые клонеры)."""
+    effector_mod[DRIVEN_FLAG] = False
+
+
+def is_driven(effector_mod):
+    """Параметры эффектора доходят до всех клонеров драйверами."""
+    return ENABLED and bool(effector_mod.get(DRIVEN_FLAG, False))
@@ -6,6 +6,11 @@ import bpy
 from ...models.effectors import EFFECTOR_NODE_GROUP_PREFIXES
 from .cloner_effector_utils import update_cloner_with_effectors, apply_effector_to_stacked_cloner
 
+from .property_utils.dependency_manager import dependency_manager
+from .logging_utils import get_logger
+
+log = get_logger("effectors")
+
 def link_effector_to_cloner(obj, cloner_mod, effector_mod):
     """
     Links an effector to a cloner, adding it to the linked_effectors list and configuring parameters
@@ -19,11 +24,11 @@ def link_effector_to_cloner(obj, cloner_mod, effector_mod):
         bool: True if linking successful, False in case of error
     """
     if not cloner_mod or not cloner_mod.node_group:
-        print("Error: cloner doesn't have a node group")
+        log.error("cloner doesn't have a node group")
         return False
 
     if not effector_mod or not effector_mod.node_group:
-        print("Error: effector doesn't have a node group")
+        log.error("effector doesn't have a node group")
         return False
 
     # Check that this is actually an effector
@@ -34,22 +39,14 @@ def link_effector_to_cloner(obj, cloner_mod, effector_mod):
             break
 
     if not is_effector:
-        print(f"Error: {effector_mod.name} is not an effector")
+        log.error("%s is not an effector", effector_mod.name)
         return False
 
-    # Get the list of linked effectors
-    node_group = cloner_mod.node_group
-    linked_effectors = list(node_group.get("linked_effectors", []))
-
-    # Check if the effector is already linked to the cloner
-    if effector_mod.name in linked_effectors:
-        print(f"Effector {effector_mod.name} is already linked to cloner {cloner_mod.name}")
+    # Add effector to the dependency graph (also updates linked_effectors of the node group)
+    if not dependency_manager.link_effector_to_cloner(obj, cloner_mod, effector_mod):
+        log.debug("Effector %s is already linked to cloner %s", effector_mod.name, cloner_mod.name)
         return True  # Consider this a success, since the effector is already linked
 
-    # Add effector to the linked list
-    linked_effectors.append(effector_mod.name)
-    node_group["linked_effectors"] = linked_effectors
-
     # Activate the effector by setting its parameters
     # Enable effector display since it's now linked
     effector_mod.show_viewport = True
@@ -79,7 +76,7 @@ def link_effector_to_cloner(obj, cloner_mod, effector_mod):
         # Not implementing collection cloner effectors yet - requires modifying the node setup
         # This would be a more complex implementation involving injecting effect nodes
         # into the node tree directly
-        print("Note: Effectors on collection cloners not fully implemented yet")
+        log.debug("Note: Effectors on collection cloners not fully implemented yet")
         # For now, we just mark it as linked but don't actually modify the node tree
         return True
 
@@ -104,11 +101,11 @@ def update_effector_connection(obj, cloner_mod, effector_mod):
         bool: True if update successful, False in case of error
     """
     if not cloner_mod or not cloner_mod.node_group:
-        print("Error: cloner doesn't have a node group")
+        log.error("cloner doesn't have a node group")
         return False
 
     if not effector_mod or not effector_mod.node_group:
-        print("Error: effector doesn't have a node group")
+        log.error("effector doesn't have a node group")
         return False
 
     # Check that this is actually an effector
@@ -119,16 +116,12 @@ def update_effector_connection(obj, cloner_mod, effector_mod):
             break
 
     if not is_effector:
-        print(f"Error: {effector_mod.name} is not an effector")
+        log.error("%s is not an effector", effector_mod.name)
         return False
 
-    # Get the list of linked effectors
-    node_group = cloner_mod.node_group
-    linked_effectors = list(node_group.get("linked_effectors", []))
-
     # Check if the effector is linked to the cloner
-    if effector_mod.name not in linked_effectors:
-        print(f"Error: Effector {effector_mod.name} is not linked to cloner {cloner_mod.name}")
+    if not dependency_manager.is_linked(obj, cloner_mod, effector_mod):
+        log.error("Effector %s is not linked to cloner %s", effector_mod.name, cloner_mod.name)
         return False
 
     # Determine if this is a stacked cloner
@@ -14,9 +14,18 @@ _SELECTION_COOLDOWN = 0.5  # Минимальное время между пер
 
 # Используем force_update_cloners из service_utils.py
 
-from ..common.constants import CLONER_NODE_GROUP_PREFIXES, EFFECTOR_NODE_GROUP_PREFIXES
+from ..common.constants import EFFECTOR_NODE_GROUP_PREFIXES
+from .transaction import in_transaction
+from .effector_drivers import is_driven
+from .property_utils.dependency_manager import dependency_manager
+
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("handlers")
 
 @bpy.app.handlers.persistent
+@profiled(category="handler")
 def cloner_chain_update_handler(scene, depsgraph):
     """
     Обработчик изменений в цепочке клонеров.
@@ -24,6 +33,10 @@ def cloner_chain_update_handler(scene, depsgraph):
     """
     global _last_selection_time, _last_selected_object
     
+    # Во время пакетной транзакции не реагируем на собственные изменения
+    if in_transaction():
+        return
+    
     # Проверяем, есть ли активный клонер в цепочке
     if not hasattr(scene, "active_cloner_in_chain") or not scene.active_cloner_in_chain:
         return
@@ -38,7 +51,7 @@ def cloner_chain_update_handler(scene, depsgraph):
     
     # Проверяем, существует ли объект с таким именем
     if obj_name not in bpy.data.objects:
-        print(f"[HANDLER] Объект {obj_name} не найден, сбрасываем активный клонер в цепочке")
+        log.debug("[HANDLER] Объект %s не найден, сбрасываем активный клонер в цепочке", obj_name)
         scene.active_cloner_in_chain = ""
         return
     
@@ -46,7 +59,7 @@ def cloner_chain_update_handler(scene, depsgraph):
     
     # Проверяем, существует ли модификатор с таким именем на объекте
     if mod_name not in obj.modifiers:
-        print(f"[HANDLER] Модификатор {mod_name} не найден на объекте {obj_name}, сбрасываем активный клонер в цепочке")
+        log.debug("[HANDLER] Модификатор %s не найден на объекте %s, сбрасываем активный клонер в цепочке", mod_name, obj_name)
         scene.active_cloner_in_chain = ""
         return
     
@@ -67,7 +80,7 @@ def cloner_chain_update_handler(scene, depsgraph):
         # Если первый объект пытается перехватить выбор слишком быстро,
         # игнорируем это, чтобы избежать циклического переключения
         if "Cloner_" in obj_name and obj_name.count("_") == 1:
-            print(f"[HANDLER] Блокировка частого переключения на {obj_name}")
+            log.debug("[HANDLER] Блокировка частого переключения на %s", obj_name)
             return
     
     # Проверяем, является ли объект уже активным и выделенным
@@ -80,7 +93,7 @@ def cloner_chain_update_handler(scene, depsgraph):
     
     # Для стековых клонеров мы не переключаем объект, только обновляем интерфейс
     if is_stacked_cloner:
-        print(f"[HANDLER] Обнаружен стековый клонер, только обновляем интерфейс")
+        log.debug("[HANDLER] Обнаружен стековый клонер, только обновляем интерфейс")
         # Обновляем интерфейс в следующем кадре
         def update_ui():
             for window in bpy.context.window_manager.windows:
@@ -112,7 +125,7 @@ def cloner_chain_update_handler(scene, depsgraph):
         # Обновляем view_layer для применения изменений
         bpy.context.view_layer.update()
     except Exception as e:
-        print(f"[HANDLER] Ошибка при переключении объекта: {e}")
+        log.error("[HANDLER] Ошибка при переключении объекта: %s", e)
     
     # Настройка таймера, который удалит защиту от повторного выбора через некоторое время
     def reset_selection_lock():
@@ -126,6 +139,7 @@ def cloner_chain_update_handler(scene, depsgraph):
         bpy.app.timers.register(reset_selection_lock, first_interval=1.0)
 
 @bpy.app.handlers.persistent
+@profiled(category="handler")
 def cloner_collection_update_handler(scene):
     """
     Обработчик обновления выбранной коллекции после клонирования.
@@ -149,6 +163,7 @@ def cloner_collection_update_handler(scene):
     return None
 
 @bpy.app.handlers.persistent
+@profiled(category="handler")
 def effector_parameter_update_handler(scene, depsgraph):
     """
     Обработчик изменений параметров эффекторов.
@@ -157,7 +172,7 @@ def effector_parameter_update_handler(scene, depsgraph):
     global _effector_handler_blocked, _effector_handler_call_count
     
     # Защита от бесконечного цикла - если обработчик уже выполняется, выходим
-    if _effector_handler_blocked:
+    if _effector_handler_blocked or in_transaction():
         return
     
     # Увеличиваем счетчик последовательных вызовов
@@ -165,7 +180,7 @@ def effector_parameter_update_handler(scene, depsgraph):
     
     # Проверяем, не превышен ли лимит последовательных вызовов
     if _effector_handler_call_count > _EFFECTOR_HANDLER_MAX_CALLS:
-        print(f"[WARNING] effector_parameter_update_handler: Достигнут лимит последовательных вызовов ({_EFFECTOR_HANDLER_MAX_CALLS}). Возможно, возник бесконечный цикл обновлений.")
+        log.warning("effector_parameter_update_handler: Достигнут лимит последовательных вызовов (%s). Возможно, возник бесконечный цикл обновлений.", _EFFECTOR_HANDLER_MAX_CALLS)
         _effector_handler_call_count = 0  # Сбрасываем счетчик
         return
     
@@ -207,7 +222,8 @@ def effector_parameter_update_handler(scene, depsgraph):
                                 if 'Enable' in param_names and 'Strength' in param_names:
                                     is_effector = True
                         
-                        if not is_effector:
+                        # Параметры доходят до клонеров драйверами, копировать нечего
+                        if not is_effector or is_driven(mod):
                             continue
                         
                         # Создаем уникальный ключ для этого модификатора
@@ -234,7 +250,8 @@ def effector_parameter_update_handler(scene, depsgraph):
                                     if (prop_name not in _effector_last_parameters[mod_key] or 
                                         _effector_last_parameters[mod_key][prop_name] != mod[prop_name]):
                                         parameters_changed = True
-                                        changed_parameters.append(f"{prop_name}={mod[prop_name]}")
+                                        if log.debug_enabled:
+                                            changed_parameters.append(f"{prop_name}={mod[prop_name]}")
                                         # Обновляем сохраненное значение
                                         _effector_last_parameters[mod_key][prop_name] = mod[prop_name]
                                 except:
@@ -242,83 +259,127 @@ def effector_parameter_update_handler(scene, depsgraph):
                         
                         # Если параметры изменились, запоминаем этот эффектор для обновления
                         if parameters_changed:
-                            print(f"[DEBUG] effector_parameter_update_handler: Изменены параметры эффектора {mod.name}: {' '.join(changed_parameters)}")
+                            if log.debug_enabled:
+                                log.debug("effector_parameter_update_handler: Изменены параметры эффектора %s: %s", mod.name, ' '.join(changed_parameters))
                             updated_effectors[mod_key] = (obj, mod)
         
         # Обновляем все клонеры, связанные с измененными эффекторами
         for mod_key, (obj, mod) in updated_effectors.items():
-            print(f"[DEBUG] effector_parameter_update_handler: Принудительное обновление клонеров для эффектора {mod.name}")
+            log.debug("effector_parameter_update_handler: Принудительное обновление клонеров для эффектора %s", mod.name)
             
             # Импортируем функцию здесь для избежания циклической зависимости
             from .cloner_effector_utils import apply_effector_to_stacked_cloner
             
-            # Поиск связанных клонеров и их обновление
-            for target_obj in bpy.data.objects:
-                if not target_obj.modifiers:
+            # Связанные клонеры берутся из обратного индекса графа зависимостей
+            for target_mod in dependency_manager.get_cloners_for_effector(obj, mod):
+                if not target_mod.node_group:
                     continue
-                    
-                for target_mod in target_obj.modifiers:
-                    if target_mod.type == 'NODES' and target_mod.node_group:
-                        # Проверяем, является ли модификатор клонером
-                        is_cloner = any(target_mod.node_group.name.startswith(p) for p in CLONER_NODE_GROUP_PREFIXES)
-                        
-                        if not is_cloner:
-                            continue
-                            
-                        # Проверяем, связан ли клонер с эффектором
-                        linked_effectors = target_mod.node_group.get("linked_effectors", [])
-                        if mod.name in linked_effectors:
-                            print(f"[DEBUG] effector_parameter_update_handler: Найден связанный клонер {target_mod.name}")
-                            
-                            # Проверяем, является ли клонер стековым
-                            is_stacked = target_mod.get("is_stacked_cloner", False) or target_mod.node_group.get("is_stacked_cloner", False)
-                            
-                            # Если это стековый клонер, применяем эффектор напрямую
-                            if is_stacked:
-                                print(f"[DEBUG] effector_parameter_update_handler: Применение эффектора к стековому клонеру")
-                                
-                                # Импортируем здесь для избежания циклической зависимости
-                                from .cloner_effector_utils import apply_effector_to_stacked_cloner
-                                apply_effector_to_stacked_cloner(target_obj, target_mod, mod)
-                            
-                            # Принудительное обновление клонера
-                            try:
-                                target_mod.show_viewport = False
-                                target_mod.show_viewport = True
-                                target_obj.update_tag(refresh={'OBJECT'})
-                            except Exception as e:
-                                print(f"[DEBUG] effector_parameter_update_handler: Ошибка при обновлении модификатора: {e}")
+                log.debug("effector_parameter_update_handler: Найден связанный клонер %s", target_mod.name)
+                
+                # Проверяем, является ли клонер стековым
+                is_stacked = target_mod.get("is_stacked_cloner", False) or target_mod.node_group.get("is_stacked_cloner", False)
+                
+                # Если это стековый клонер, применяем эффектор напрямую
+                if is_stacked:
+                    log.debug("effector_parameter_update_handler: Применение эффектора к стековому клонеру")
+                    apply_effector_to_stacked_cloner(obj, target_mod, mod)
+                
+                # Принудительное обновление клонера
+                try:
+                    target_mod.show_viewport = False
+                    target_mod.show_viewport = True
+                    obj.update_tag(refresh={'OBJECT'})
+                except Exception as e:
+                    log.debug("effector_parameter_update_handler: Ошибка при обновлении модификатора: %s", e)
             
             # Обновляем видимость всей сцены
             try:
                 bpy.context.view_layer.update()
             except Exception as e:
-                print(f"[DEBUG] effector_parameter_update_handler: Ошибка при обновлении view_layer: {e}")
+                log.debug("effector_parameter_update_handler: Ошибка при обновлении view_layer: %s", e)
     
     except Exception as e:
-        print(f"[ERROR] effector_parameter_update_handler: {e}")
+        log.error("effector_parameter_update_handler: %s", e)
     
     finally:
         # Сбрасываем блокировку и счетчик вызовов
         _effector_handler_blocked = False
         _effector_handler_call_count = 0
 
-def register_effector_update_handler():
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("depsgraph_update_post", cloner_chain_update_handler),
+    ("depsgraph_update_post", cloner_collection_update_handler),
+    ("depsgraph_update_post", effector_parameter_update_handler),
+)
+
+def register_core_handlers():
+    """
+    Устанавливает обработчики аддона по разделу handlers манифеста регистрации
+    и готовит их состояние. Вызывается из register() аддона.
+    """
+    from ..factories.registration import register_manifest_handlers
+    from .migrations import register_migrations
+    from .property_utils.dependency_manager import load_dependency_graph
+
+    register_migrations()
+    register_manifest_handlers(_ADDON_PACKAGE)
+    load_dependency_graph()
+
+def unregister_core_handlers():
     """
-    Регистрирует обработчик обновления эффекторов.
+    Снимает обработчики аддона, перечисленные в манифесте, и сбрасывает их состояние.
     """
-    if effector_parameter_update_handler not in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.append(effector_parameter_update_handler)
-        print("Зарегистрирован обработчик обновления эффекторов")
-    else:
-        print("Обработчик обновления эффекторов уже зарегистрирован")
+    from ..factories.registration import unregister_manifest_handlers
+    from . import job_queue
+    from .modifier_stats import modifier_stats
+    from .property_utils.dependency_manager import dependency_manager
 
-def unregister_effector_update_handler():
+    job_queue.shutdown()
+    unregister_manifest_handlers(_ADDON_PACKAGE)
+    modifier_stats.clear()
+    dependency_manager.clear()
+
+# Корневой пакет аддона - по нему определяются обработчики аддона
+_ADDON_PACKAGE = __name__.split(".")[0]
+
+# Списки обработчиков, которые приостанавливаются на время пакетных операций
+_SUSPENDABLE_HANDLER_LISTS = ("depsgraph_update_post", "depsgraph_update_pre")
+
+def _is_addon_handler(handler):
+    """
+    Проверяет, принадлежит ли обработчик этому аддону.
+    """
+    module = getattr(handler, "__module__", "") or ""
+    return module == _ADDON_PACKAGE or module.startswith(_ADDON_PACKAGE + ".")
+
+def suspend_handlers():
     """
-    Отменяет регистрацию обработчика обновления эффекторов.
+    Снимает все обработчики depsgraph этого аддона.
+    Используется транзакциями, чтобы обработчики не реагировали на их собственные изменения.
+
+    Returns:
+        list: Снятые обработчики для передачи в resume_handlers
+    """
+    suspended = []
+    for list_name in _SUSPENDABLE_HANDLER_LISTS:
+        handler_list = getattr(bpy.app.handlers, list_name, None)
+        if handler_list is None:
+            continue
+        for handler in list(handler_list):
+            if _is_addon_handler(handler):
+                handler_list.remove(handler)
+                suspended.append((list_name, handler))
+    return suspended
+
+def resume_handlers(suspended):
+    """
+    Возвращает обработчики, снятые suspend_handlers.
+
+    Args:
+        suspended: Список, возвращённый suspend_handlers
     """
-    if effector_parameter_update_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(effector_parameter_update_handler)
-        print("Отменена регистрация обработчика обновления эффекторов")
-    else:
-        print("Обработчик обновления эффекторов не был зарегистрирован") 
\ No newline at end of file
+    for list_name, handler in suspended:
+        handler_list = getattr(bpy.app.handlers, list_name, None)
+        if handler_list is not None and handler not in handler_list:
+            handler_list.append(handler)
@@ -0,0 +1,246 @@
+"""
+Профилирование построения графов узлов и проверка бюджета узлов.
+
+Функции, создающие группы узлов компонентов, оборачиваются декоратором
+tracks_graph_build. Для каждого построения записывается время и размер всех
+созданных групп: узлы, связи и сокеты интерфейса. Вложенные построения
+(например, фабрика внутри создания клонера объекта) входят во внешнюю запись.
+
+Записи ведутся, только пока включено профилирование аддона (core/utils/profiling)
+или запись построений включена set_enabled (benchmarks/node_budget.py). В остальное
+время декоратор стоит одну проверку флага на вызов.
+
+Бюджеты узлов на построение задаются в config/node_budgets.json (раздел
+"budgets") по ключу "вид:тип" (например, "cloner:GRID"). Превышение бюджета
+пишется в журнал как предупреждение; benchmarks/node_budget.py проверяет бюджеты
+в CI. Пока файл отмечен "provisional" (значения оценены, а не получены из
+замеров node_budget.py --update-budgets), превышение пишется только в отладочный журнал.
+"""
+
+import bpy
+import functools
+import inspect
+import json
+import os
+import time
+
+from . import profiling
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+BUDGETS_FILE = os.path.join("config", "node_budgets.json")
+
+# Сколько последних построений хранить
+MAX_RECORDS = 1000
+
+_records = []
+_depth = 0
+_budgets = None
+_provisional = False
+_enabled = False
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Включает или выключает запись построений независимо от профилирования аддона.
+
+    Args:
+        enabled: Записывать построения
+    """
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled or profiling.is_enabled()
+
+
+def measure_node_group(node_group):
+    """
+    Размер группы узлов.
+
+    Args:
+        node_group: Группа узлов
+
+    Returns:
+        dict: {"name", "nodes", "links", "sockets"}
+    """
+    sockets = 0
+    interface = getattr(node_group, "interface", None)
+    if interface is not None:
+        sockets = sum(1 for item in interface.items_tree if item.item_type == 'SOCKET')
+    return {
+        "name": node_group.name,
+        "nodes": len(node_group.nodes),
+        "links": len(node_group.links),
+        "sockets": sockets,
+    }
+
+
+def load_budgets(force_reload=False):
+    """
+    Загружает бюджеты узлов из config/node_budgets.json. Поддерживается и прежний
+    формат файла - плоский словарь бюджетов без отметки provisional.
+
+    Returns:
+        dict: {"вид:тип": максимум узлов на построение}
+    """
+    global _budgets, _provisional
+    if _budgets is not None and not force_reload:
+        return _budgets
+
+    from .config_utils import get_addon_path
+    path = os.path.join(get_addon_path(), BUDGETS_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if "budgets" in data:
+            _provisional = bool(data.get("provisional", False))
+            data = data["budgets"]
+        else:
+            _provisional = False
+        _budgets = {key: int(value) for key, value in data.items()}
+    except (OSError, ValueError, AttributeError) as e:
+        log.warning("Cannot load node budgets from %s: %s", path, e)
+        _budgets = {}
+        _provisional = False
+    return _budgets
+
+
+def budgets_provisional():
+    """
+    Бюджеты оценены, а не получены из замеров (отметка provisional в файле).
+
+    Returns:
+        bool: True, если превышения не выводятся как предупреждения
+    """
+    load_budgets()
+    return _provisional
+
+
+def _finish_record(component, start, groups_before):
+    build_ms = (time.perf_counter() - start) * 1000.0
+    groups = [measure_node_group(group) for group in bpy.data.node_groups if group.name not in groups_before]
+
+    record = {
+        "component": component,
+        "build_ms": build_ms,
+        "groups": groups,
+        "nodes": sum(g["nodes"] for g in groups),
+        "links": sum(g["links"] for g in groups),
+        "sockets": sum(g["sockets"] for g in groups),
+    }
+    _records.append(record)
+    if len(_records) > MAX_RECORDS:
+        del _records[0]
+
+    budget = load_budgets().get(component)
+    if budget is not None and record["nodes"] > budget:
+        if _provisional:
+            log.debug("%s: %s nodes exceed provisional budget of %s", component, record["nodes"], budget)
+        else:
+            log.warning("%s: %s nodes exceed budget of %s", component, record["nodes"], budget)
+    else:
+        log.debug("%s: %s nodes, %s links, %s sockets in %s groups, %.1f ms",
+                  component, record["nodes"], record["links"], record["sockets"], len(groups), build_ms)
+    return record
+
+
+def tracks_graph_build(kind, type_param):
+    """
+    Декоратор функций, создающих группы узлов компонента.
+
+    Args:
+        kind: Вид компонента ('cloner', 'stacked_cloner', 'effector', ...)
+        type_param: Имя параметра функции с типом компонента ('cloner_type', ...)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            global _depth
+            if _depth or not (_enabled or profiling.is_enabled()):
+                return func(*args, **kwargs)
+
+            try:
+                component_type = signature.bind_partial(*args, **kwargs).arguments.get(type_param, "")
+            except TypeError:
+                component_type = ""
+            component = f"{kind}:{component_type}"
+
+            groups_before = set(bpy.data.node_groups.keys())
+            start = time.perf_counter()
+            _depth += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _depth -= 1
+                try:
+                    _finish_record(component, start, groups_before)
+                except Exception as e:
+                    log.error("Graph build profiling failed for %s: %s", component, e)
+
+        return wrapper
+    return decorator
+
+
+def get_records():
+    """Возвращает копию записей построений."""
+    return list(_records)
+
+
+def clear_records():
+    """Удаляет записи построений."""
+    _records.clear()
+
+
+def build_report(records=None, budgets=None):
+    """
+    Сводка построений по видам компонентов.
+
+    Args:
+        records: Записи (по умолчанию - накопленные)
+        budgets: Бюджеты (по умолчанию - из config/node_budgets.json)
+
+    Returns:
+        list: Словари component, builds, nodes, links, sockets, groups, build_ms_mean,
+              build_ms_max, budget, over_budget; nodes/links/sockets - максимум по построениям
+    """
+    records = get_records() if records is None else records
+    budgets = load_budgets() if budgets is None else budgets
+
+    by_component = {}
+    for record in records:
+        by_component.setdefault(record["component"], []).append(record)
+
+    report = []
+    for component in sorted(by_component):
+        items = by_component[component]
+        nodes = max(r["nodes"] for r in items)
+        budget = budgets.get(component)
+        report.append({
+            "component": component,
+            "builds": len(items),
+            "nodes": nodes,
+            "links": max(r["links"] for r in items),
+            "sockets": max(r["sockets"] for r in items),
+            "groups": max(len(r["groups"]) for r in items),
+            "build_ms_mean": sum(r["build_ms"] for r in items) / len(items),
+            "build_ms_max": max(r["build_ms"] for r in items),
+            "budget": budget,
+            "over_budget": budget is not None and nodes > budget,
+        })
+    return report
+
+
+def check_budgets(records=None, budgets=None):
+    """
+    Проверяет построения на превышение бюджета узлов.
+
+    Returns:
+        list: Строки с описанием нарушений (пустой список - бюджеты соблюдены)
+    """
+    return [f"{row['component']}: {row['nodes']} nodes exceed budget of {row['budget']}"
+            for row in build_report(records, budgets) if row["over_budget"]]
@@ -0,0 +1,231 @@
+"""
+Учет инстансов и памяти клонеров по вычисленному depsgraph.
+
+Для каждого объекта с клонером считаются инстансы (depsgraph.object_instances),
+реализованная геометрия вычисленного меша и оценка занимаемой памяти.
+Клонер помечается, если включенный Realize Instances увеличивает память
+больше чем в REALIZE_FLAG_FACTOR раз по сравнению с теми же копиями в виде инстансов.
+
+Размеры в байтах - оценка по основным атрибутам Blender, а не точный учет аллокаций.
+"""
+
+import bpy
+import json
+import time
+
+from .modifier_stats import classify_modifier
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Оценка размера элементов геометрии, байт
+BYTES_PER_VERTEX = 24    # position + кешированная нормаль
+BYTES_PER_EDGE = 8       # индексы вершин
+BYTES_PER_FACE = 16      # смещение углов + кешированная нормаль
+BYTES_PER_CORNER = 8     # индексы вершины и ребра
+BYTES_PER_INSTANCE = 72  # матрица 4x4 + ссылка + id
+
+# Во сколько раз реализованная геометрия может превышать инстансы без предупреждения
+REALIZE_FLAG_FACTOR = 10.0
+
+REALIZE_SOCKET_NAME = "Realize Instances"
+
+# Последний отчет для панели
+last_report = None
+
+
+def mesh_bytes(vertices, edges, faces, corners):
+    """Оценка памяти меша, байт."""
+    return (vertices * BYTES_PER_VERTEX + edges * BYTES_PER_EDGE
+            + faces * BYTES_PER_FACE + corners * BYTES_PER_CORNER)
+
+
+def _mesh_counts(mesh):
+    if mesh is None or not hasattr(mesh, "vertices"):
+        return 0, 0, 0, 0
+    return len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)
+
+
+def _input_value(mod, socket_name):
+    """Значение входа модификатора по имени сокета или None."""
+    for item in mod.node_group.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == socket_name:
+            return mod.get(item.identifier)
+    return None
+
+
+def find_realize_nodes(node_group, _visited=None):
+    """
+    Имена незаглушенных узлов Realize Instances в группе и вложенных группах.
+
+    Returns:
+        list: Имена узлов ("Realize Instances (Anti-Recursion)", "Final Realize Instances", ...)
+    """
+    visited = _visited if _visited is not None else set()
+    if node_group is None or node_group.name in visited:
+        return []
+    visited.add(node_group.name)
+
+    names = []
+    for node in node_group.nodes:
+        if node.mute:
+            continue
+        if node.bl_idname == 'GeometryNodeRealizeInstances':
+            names.append(node.name)
+        elif node.bl_idname == 'GeometryNodeGroup':
+            names.extend(find_realize_nodes(node.node_tree, visited))
+    return names
+
+
+def _source_vertices(obj, mod):
+    """Число вершин исходной геометрии клонера (объект, коллекция или сам объект стекового клонера)."""
+    source_name = mod.get("original_object")
+    if source_name and source_name in bpy.data.objects:
+        return _mesh_counts(bpy.data.objects[source_name].data)[0]
+
+    collection_name = mod.get("original_collection")
+    if collection_name and collection_name in bpy.data.collections:
+        return sum(_mesh_counts(o.data)[0] for o in bpy.data.collections[collection_name].all_objects)
+
+    return _mesh_counts(obj.data)[0]
+
+
+def count_instances(depsgraph):
+    """
+    Считает инстансы по объектам, которые их создают.
+
+    Returns:
+        dict: {имя исходного объекта: (число инстансов, суммарные вершины инстансов)}
+    """
+    counts = {}
+    vertex_cache = {}
+    for instance in depsgraph.object_instances:
+        if not instance.is_instance or instance.parent is None:
+            continue
+        parent_name = instance.parent.original.name
+        data = instance.object.data
+        key = data.name if data is not None else None
+        if key not in vertex_cache:
+            vertex_cache[key] = _mesh_counts(data)[0]
+        count, vertices = counts.get(parent_name, (0, 0))
+        counts[parent_name] = (count + 1, vertices + vertex_cache[key])
+    return counts
+
+
+def analyze_cloner_object(obj, depsgraph, instance_counts):
+    """
+    Учет инстансов и памяти одного объекта с клонерами.
+
+    Args:
+        obj: Исходный объект
+        depsgraph: Вычисленный depsgraph
+        instance_counts: Результат count_instances
+
+    Returns:
+        dict: Запись отчета или None, если на объекте нет клонеров
+    """
+    cloner_mods = [mod for mod in obj.modifiers if classify_modifier(mod) == 'CLONER']
+    if not cloner_mods:
+        return None
+
+    evaluated = obj.evaluated_get(depsgraph)
+    vertices, edges, faces, corners = _mesh_counts(evaluated.data if evaluated.type == 'MESH' else None)
+    realized_bytes = mesh_bytes(vertices, edges, faces, corners)
+
+    instances, instanced_vertices = instance_counts.get(obj.name, (0, 0))
+    instance_bytes = instances * BYTES_PER_INSTANCE
+
+    realize_enabled = any(bool(_input_value(mod, REALIZE_SOCKET_NAME)) for mod in cloner_mods)
+    realize_nodes = []
+    for mod in cloner_mods:
+        realize_nodes.extend(find_realize_nodes(mod.node_group))
+    source_vertices = max(_source_vertices(obj, cloner_mods[0]), 1)
+
+    # Копии, превращенные в реальную геометрию, и память тех же копий в виде инстансов
+    realized_copies = vertices / source_vertices
+    source_bytes = source_vertices * BYTES_PER_VERTEX * 2
+    instanced_equivalent = realized_copies * BYTES_PER_INSTANCE + source_bytes
+    realize_factor = realized_bytes / instanced_equivalent if instanced_equivalent else 0.0
+
+    return {
+        "object": obj.name,
+        "modifiers": [mod.name for mod in cloner_mods],
+        "instances": instances,
+        "instanced_vertices": instanced_vertices,
+        "realized_vertices": vertices,
+        "realized_faces": faces,
+        "realized_bytes": realized_bytes,
+        "instance_bytes": instance_bytes,
+        "estimated_bytes": realized_bytes + instance_bytes,
+        "realize_enabled": realize_enabled,
+        "realize_nodes": sorted(set(realize_nodes)),
+        "realized_copies": realized_copies,
+        "realize_factor": realize_factor,
+        "flagged": realize_enabled and realize_factor > REALIZE_FLAG_FACTOR,
+    }
+
+
+def analyze_scene(scene, depsgraph=None):
+    """
+    Учет инстансов и памяти всех клонеров сцены. Результат сохраняется в last_report.
+
+    Returns:
+        dict: {"scene", "frame", "timestamp", "totals": {...}, "cloners": [записи по убыванию памяти]}
+    """
+    global last_report
+
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    instance_counts = count_instances(depsgraph)
+    cloners = []
+    for obj in scene.objects:
+        if not obj.modifiers:
+            continue
+        record = analyze_cloner_object(obj, depsgraph, instance_counts)
+        if record is not None:
+            cloners.append(record)
+    cloners.sort(key=lambda r: r["estimated_bytes"], reverse=True)
+
+    last_report = {
+        "scene": scene.name,
+        "frame": scene.frame_current,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "totals": {
+            "cloners": len(cloners),
+            "instances": sum(r["instances"] for r in cloners),
+            "realized_vertices": sum(r["realized_vertices"] for r in cloners),
+            "realized_faces": sum(r["realized_faces"] for r in cloners),
+            "estimated_bytes": sum(r["estimated_bytes"] for r in cloners),
+            "flagged": sum(1 for r in cloners if r["flagged"]),
+        },
+        "cloners": cloners,
+    }
+
+    for record in cloners:
+        if record["flagged"]:
+            log.warning("%s: Realize Instances uses %.0fx the memory of instances (%s realized vertices)",
+                        record["object"], record["realize_factor"], record["realized_vertices"])
+    return last_report
+
+
+def export_report(filepath, report=None):
+    """
+    Записывает отчет в JSON для предварительной проверки на рендер-ферме.
+
+    Raises:
+        ValueError: Если отчета нет
+    """
+    report = report or last_report
+    if report is None:
+        raise ValueError("No instance report, run the analysis first")
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def format_bytes(value):
+    """Размер в удобных единицах для интерфейса."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024.0 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024.0
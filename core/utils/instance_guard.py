@@ -0,0 +1,443 @@
+"""
+Статическая оценка числа инстансов клонеров и защита от взрывного роста до вычисления.
+
+Оценка проходит граф источников клонеров без вычисления геометрии:
+  - клонер объекта умножает оценку исходного объекта (original_object, в цепочке -
+    previous_cloner_object) на свое число копий;
+  - клонер коллекции умножает сумму оценок объектов коллекции (original_collection,
+    в цепочке - chain_source_collection);
+  - стековый клонер умножает результат предыдущих модификаторов того же объекта.
+Число копий - произведение заданных сокетов Count / Count X / Count Y / Count Z.
+
+Обработчик depsgraph_update_post сравнивает сумму оценок видимых клонеров с бюджетом
+сцены (cloner_instance_budget). Оценки кэшируются (SceneEstimates) и пересчитываются
+только для объектов из depsgraph.updates и зависящих от них клонеров; если обновление
+не затронуло ни одной оценки, проверка не повторяется. По умолчанию защита выключена
+('OFF'). В режиме 'WARN'
+превышение пишется в журнал, в режиме 'SCALE' бюджет распределяется плотностью во
+вьюпорте (density_scheduler), в режиме 'CLAMP' крупнейшие клонеры отключаются во
+вьюпорте и включаются обратно, когда оценка возвращается в бюджет. Обработчик только
+принимает решение: show_viewport меняется в таймере, вне обработчика depsgraph.
+"""
+
+import bpy
+
+from .modifier_stats import classify_modifier
+from .transaction import handlers_blocked
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("core")
+
+# Сокеты, задающие число копий клонера
+COUNT_SOCKET_NAMES = ("Count", "Count X", "Count Y", "Count Z")
+
+# Отметка модификатора, отключенного во вьюпорте защитой
+CLAMPED_FLAG = "instance_guard_clamped"
+
+# Последний результат проверки для панели
+last_estimate = {"total": 0, "budget": 0, "over_budget": False, "clamped": []}
+
+_last_warned_total = None
+
+# Оценки сброшены, пока обработчики были заблокированы; проверка не выполнялась
+_check_pending = False
+
+
+def modifier_count(mod):
+    """
+    Число копий одного модификатора клонера по заданным сокетам Count.
+
+    Args:
+        mod: Модификатор клонера
+
+    Returns:
+        int: Произведение значений сокетов Count (не меньше 1 на сокет)
+    """
+    count = 1
+    for item in mod.node_group.interface.items_tree:
+        if item.item_type != 'SOCKET' or item.in_out != 'INPUT' or item.name not in COUNT_SOCKET_NAMES:
+            continue
+        value = mod.get(item.identifier)
+        if value is None:
+            value = getattr(item, "default_value", 1)
+        count *= max(int(value), 1)
+    return count
+
+
+def _is_active(mod, requested):
+    """Модификатор вычисляется во вьюпорте; для запрошенной оценки - также отключенный защитой."""
+    return mod.show_viewport or (requested and bool(mod.get(CLAMPED_FLAG)))
+
+
+def _cloner_source(mod):
+    """
+    Источник клонера.
+
+    Returns:
+        tuple: ('OBJECT' или 'COLLECTION', имя) или None для стекового клонера
+    """
+    for key in ("original_object", "previous_cloner_object"):
+        name = mod.get(key)
+        if name and name in bpy.data.objects:
+            return 'OBJECT', name
+    for key in ("original_collection", "chain_source_collection"):
+        name = mod.get(key)
+        if name and name in bpy.data.collections:
+            return 'COLLECTION', name
+    return None
+
+
+def estimate_object_instances(obj, memo=None, requested=True, dependents=None, _visiting=None):
+    """
+    Оценка числа инстансов на выходе объекта без вычисления геометрии.
+
+    Args:
+        obj: Объект
+        memo: Словарь {имя объекта: оценка} для повторного использования между вызовами
+              (только с одним значением requested)
+        requested: Учитывать клонеры, отключенные защитой (запрошенное пользователем число);
+                   False - только то, что показывается во вьюпорте
+        dependents: Словарь {(тип, имя источника): {имена объектов}}, куда записываются
+                    зависимости оценок от источников (для инвалидации кэша)
+        _visiting: Объекты на текущем пути обхода (защита от циклов)
+
+    Returns:
+        int: Оценка; объект без клонеров дает 1
+    """
+    memo = {} if memo is None else memo
+    if obj.name in memo:
+        return memo[obj.name]
+
+    visiting = set() if _visiting is None else _visiting
+    if obj.name in visiting:
+        return 1
+    visiting.add(obj.name)
+
+    estimate = 1
+    for mod in obj.modifiers:
+        if classify_modifier(mod) != 'CLONER' or not _is_active(mod, requested):
+            continue
+
+        source_ref = _cloner_source(mod)
+        if source_ref is not None and dependents is not None:
+            dependents.setdefault(source_ref, set()).add(obj.name)
+
+        if source_ref is not None and source_ref[0] == 'OBJECT' and source_ref[1] != obj.name:
+            source = estimate_object_instances(bpy.data.objects[source_ref[1]], memo, requested,
+                                               dependents, visiting)
+        elif source_ref is not None and source_ref[0] == 'COLLECTION':
+            source = 0
+            for source_obj in bpy.data.collections[source_ref[1]].all_objects:
+                if dependents is not None:
+                    dependents.setdefault(('OBJECT', source_obj.name), set()).add(obj.name)
+                source += estimate_object_instances(source_obj, memo, requested, dependents, visiting)
+        else:
+            # Стековый клонер копирует результат предыдущих модификаторов
+            source = estimate
+
+        estimate = max(source, 1) * modifier_count(mod)
+
+    visiting.discard(obj.name)
+    memo[obj.name] = estimate
+    return estimate
+
+
+def estimate_scene(scene, requested=True):
+    """
+    Оценки всех видимых объектов с клонерами сцены.
+
+    Args:
+        scene: Сцена
+        requested: См. estimate_object_instances
+
+    Returns:
+        dict: {имя объекта: оценка числа инстансов}
+    """
+    memo = {}
+    estimates = {}
+    for obj in scene.objects:
+        if obj.hide_get() or not _has_cloner(obj):
+            continue
+        estimates[obj.name] = estimate_object_instances(obj, memo, requested)
+    return estimates
+
+
+def _has_cloner(obj):
+    return any(classify_modifier(mod) == 'CLONER' for mod in obj.modifiers)
+
+
+class SceneEstimates:
+    """
+    Оценки клонеров сцены между обновлениями depsgraph.
+
+    Оценки объектов хранятся в memo для обоих значений requested. Обновление
+    depsgraph сбрасывает оценки измененных объектов и всех клонеров, которые
+    от них зависят (источник, цепочка, коллекция), остальные берутся из кэша.
+    Удаление и добавление объектов в сцену ведет к полному пересчету.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.scene_key = None
+        self.object_count = -1
+        # Имена объектов сцены с клонерами, включая скрытые
+        self.cloners = set()
+        # requested -> {имя объекта: оценка}
+        self.memo = {True: {}, False: {}}
+        # (тип, имя источника) -> имена объектов, чьи оценки от него зависят
+        self.dependents = {}
+
+    def _rescan(self, scene):
+        self.clear()
+        self.scene_key = getattr(scene, "session_uid", None) or scene.name
+        self.object_count = len(scene.objects)
+        self.cloners = {obj.name for obj in scene.objects if obj.modifiers and _has_cloner(obj)}
+
+    def invalidate(self, scene, object_names=(), collection_names=()):
+        """
+        Сбрасывает оценки объектов и зависящих от них клонеров.
+
+        Args:
+            scene: Сцена
+            object_names: Имена измененных объектов
+            collection_names: Имена измененных коллекций
+
+        Returns:
+            bool: True, если сброшена хотя бы одна оценка или изменился набор клонеров
+        """
+        changed = False
+        pending = [('OBJECT', name) for name in object_names]
+        pending += [('COLLECTION', name) for name in collection_names]
+        seen = set()
+        while pending:
+            source_ref = pending.pop()
+            if source_ref in seen:
+                continue
+            seen.add(source_ref)
+            pending.extend(('OBJECT', dependent) for dependent in self.dependents.get(source_ref, ()))
+            kind, name = source_ref
+            if kind != 'OBJECT':
+                continue
+            for memo in self.memo.values():
+                if memo.pop(name, None) is not None:
+                    changed = True
+            obj = scene.objects.get(name)
+            is_cloner = obj is not None and bool(obj.modifiers) and _has_cloner(obj)
+            if is_cloner != (name in self.cloners):
+                changed = True
+                if is_cloner:
+                    self.cloners.add(name)
+                else:
+                    self.cloners.discard(name)
+        return changed
+
+    def update(self, scene, depsgraph=None):
+        """
+        Сбрасывает оценки по обновлениям depsgraph; без depsgraph, при смене сцены
+        или числа объектов в ней кэш пересобирается.
+
+        Returns:
+            bool: True, если кэш пересобран или сброшена хотя бы одна оценка
+        """
+        scene_key = getattr(scene, "session_uid", None) or scene.name
+        if depsgraph is None or scene_key != self.scene_key or len(scene.objects) != self.object_count:
+            self._rescan(scene)
+            return True
+
+        objects = []
+        collections = []
+        for update in depsgraph.updates:
+            id_data = getattr(update.id, "original", update.id)
+            if isinstance(id_data, bpy.types.Object):
+                objects.append(id_data.name)
+            elif isinstance(id_data, bpy.types.Collection):
+                collections.append(id_data.name)
+        if objects or collections:
+            return self.invalidate(scene, objects, collections)
+        return False
+
+    def estimate(self, scene, requested=True):
+        """
+        Оценки видимых объектов с клонерами, как estimate_scene, но из кэша.
+        """
+        memo = self.memo[requested]
+        estimates = {}
+        for name in self.cloners:
+            obj = scene.objects.get(name)
+            if obj is None or obj.hide_get():
+                continue
+            estimates[name] = estimate_object_instances(obj, memo, requested, self.dependents)
+        return estimates
+
+
+scene_estimates = SceneEstimates()
+
+
+def _last_active_cloner(obj):
+    for mod in reversed(obj.modifiers):
+        if classify_modifier(mod) == 'CLONER' and mod.show_viewport:
+            return mod
+    return None
+
+
+def _clamped_objects(scene, names=None):
+    """Объекты сцены (или объекты с именами names), у которых есть модификаторы, отключенные защитой."""
+    objects = scene.objects if names is None else filter(None, map(scene.objects.get, names))
+    return [obj for obj in objects if any(mod.get(CLAMPED_FLAG) for mod in obj.modifiers)]
+
+
+def _restore_clamped(scene, names=None):
+    restored = []
+    for obj in _clamped_objects(scene, names):
+        for mod in obj.modifiers:
+            if mod.get(CLAMPED_FLAG):
+                del mod[CLAMPED_FLAG]
+                mod.show_viewport = True
+                restored.append(f"{obj.name}: {mod.name}")
+    if restored:
+        log.info("Instance budget restored viewport display of %s", ", ".join(restored))
+
+
+def _clamp(scene, estimates, budget):
+    """Отключает во вьюпорте крупнейшие клонеры, пока оставшаяся оценка не войдет в бюджет."""
+    clamped = []
+    total = sum(estimates.values())
+    for name, estimate in sorted(estimates.items(), key=lambda item: item[1], reverse=True):
+        if total <= budget:
+            break
+        obj = scene.objects.get(name)
+        mod = _last_active_cloner(obj) if obj is not None else None
+        if mod is None:
+            continue
+        mod[CLAMPED_FLAG] = True
+        mod.show_viewport = False
+        total -= estimate
+        clamped.append(f"{name}: {mod.name}")
+    if clamped:
+        log.warning("Instance budget %s exceeded, viewport display disabled for %s", budget, ", ".join(clamped))
+    return clamped
+
+
+# Отложенные действия защиты: {имя сцены: (функция, аргументы)}
+_pending_actions = {}
+
+
+def _apply_pending_actions():
+    """Таймер: применяет отложенные изменения show_viewport вне обработчика depsgraph."""
+    actions = dict(_pending_actions)
+    _pending_actions.clear()
+    for scene_name, (action, args) in actions.items():
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            continue
+        try:
+            action(scene, *args)
+        except Exception as e:
+            log.error("Instance guard action failed for scene %s: %s", scene_name, e)
+    return None
+
+
+def _defer(scene, action, *args):
+    """
+    Откладывает действие защиты до таймера. Изменение show_viewport внутри
+    обработчика depsgraph снова помечает depsgraph и вызывает повторный пересчет.
+    """
+    _pending_actions[scene.name] = (action, args)
+    if not bpy.app.timers.is_registered(_apply_pending_actions):
+        bpy.app.timers.register(_apply_pending_actions, first_interval=0.0)
+
+
+def check_instance_budget(scene, estimates_cache=None):
+    """
+    Сравнивает оценку инстансов сцены с бюджетом и применяет режим защиты сцены.
+    Отключение и восстановление клонеров в режиме 'CLAMP' выполняются таймером.
+
+    Args:
+        scene: Сцена
+        estimates_cache: SceneEstimates с актуальными оценками (по умолчанию
+                         оценки считаются заново)
+
+    Returns:
+        dict: {"total" (запрошенная оценка), "budget", "over_budget", "clamped": [клонеры, отключенные защитой]}
+    """
+    global _last_warned_total
+
+    budget = scene.cloner_instance_budget
+    mode = scene.cloner_instance_guard
+    if estimates_cache is None:
+        estimates_cache = SceneEstimates()
+        estimates_cache.update(scene)
+    estimates = estimates_cache.estimate(scene, requested=True)
+    total = sum(estimates.values())
+    over_budget = total > budget
+    clamped_objects = _clamped_objects(scene, estimates_cache.cloners)
+
+    if mode == 'SCALE':
+        from .density_scheduler import schedule_viewport_density
+        schedule_viewport_density(scene, estimates, budget)
+    elif mode == 'CLAMP':
+        if not over_budget:
+            if clamped_objects:
+                _defer(scene, _restore_clamped, [obj.name for obj in clamped_objects])
+        else:
+            displayed = estimates_cache.estimate(scene, requested=False)
+            if sum(displayed.values()) > budget:
+                _defer(scene, _clamp, displayed, budget)
+    elif over_budget and total != _last_warned_total:
+        log.warning("Estimated %s instances exceed the scene budget of %s", total, budget)
+    _last_warned_total = total if over_budget else None
+
+    clamped = [f"{obj.name}: {mod.name}" for obj in clamped_objects for mod in obj.modifiers if mod.get(CLAMPED_FLAG)]
+    last_estimate.update(total=total, budget=budget, over_budget=over_budget, clamped=clamped)
+    return last_estimate
+
+
+def update_guard_mode(scene, context):
+    """
+    Обновление свойства cloner_instance_guard: вне режима 'CLAMP' отключенные клонеры
+    возвращаются, вне режима 'SCALE' восстанавливается полная плотность во вьюпорте.
+    """
+    scene_estimates.clear()
+    if scene.cloner_instance_guard != 'CLAMP':
+        _restore_clamped(scene)
+        last_estimate["clamped"] = []
+    if scene.cloner_instance_guard != 'SCALE':
+        from .density_scheduler import reset_densities
+        reset_densities(scene)
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def instance_guard_handler(scene, depsgraph=None):
+    """
+    Проверка бюджета инстансов после пересчета depsgraph (изменение Count, новые клонеры).
+    Пересчитываются только оценки объектов из depsgraph.updates; если ни одна оценка
+    не сброшена и бюджет не менялся, остается результат прошлой проверки. Пока
+    обработчики заблокированы (транзакция), оценки только сбрасываются, а проверка
+    откладывается до первого обновления после транзакции.
+    """
+    global _check_pending
+
+    if getattr(scene, "cloner_instance_guard", 'OFF') == 'OFF':
+        return
+
+    try:
+        changed = scene_estimates.update(scene, depsgraph)
+        if handlers_blocked():
+            _check_pending = _check_pending or changed
+            return
+        if not (changed or _check_pending) and last_estimate["budget"] == scene.cloner_instance_budget:
+            return
+        _check_pending = False
+        check_instance_budget(scene, scene_estimates)
+    except Exception as e:
+        log.error("instance_guard_handler: %s", e)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("depsgraph_update_post", instance_guard_handler),
+)
@@ -0,0 +1,212 @@
+"""
+Очередь фоновых задач, выполняемых по кусочкам в bpy.app.timers.
+
+Задача - список элементов (обычно пары имен объекта и модификатора) и функция
+шага, которая обрабатывает один элемент. Таймер обрабатывает элементы в
+пределах SLICE_MS за тик внутри одной транзакции cloner_transaction, поэтому
+интерфейс не замирает на больших сценах. Элементы хранят имена, а не ссылки
+на данные Blender, и разрешаются заново на каждом шаге.
+
+Загрузка файла и отмена (undo) отменяют все задачи: данные, на которые они
+ссылались, заменяются. Прогресс и отмена показываются в панели клонеров.
+
+Пример:
+    job = submit("Update Effectors", [(obj.name, mod.name) for obj, mod in cloners], step)
+"""
+
+import bpy
+import itertools
+import time
+from collections import deque
+
+from .transaction import cloner_transaction, request_view_layer_update
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Бюджет времени одного тика очереди и пауза между тиками
+SLICE_MS = 8.0
+SLICE_INTERVAL = 0.01
+
+_job_ids = itertools.count(1)
+
+# Очередь задач: выполняется первая, остальные ждут
+_jobs = deque()
+
+
+class Job:
+    """
+    Фоновая задача очереди.
+
+    Attributes:
+        id: Номер задачи
+        name: Имя для панели и логов
+        total: Число элементов
+        done: Обработано элементов
+        changed: Шагов, вернувших True
+        cancelled: Задача отменена
+        finished: Задача завершена (в том числе отменой)
+    """
+
+    def __init__(self, name, items, step, on_finish=None):
+        self.id = next(_job_ids)
+        self.name = name
+        self._items = deque(items)
+        self._step = step
+        self._on_finish = on_finish
+        self.total = len(self._items)
+        self.done = 0
+        self.changed = 0
+        self.cancelled = False
+        self.finished = False
+
+    @property
+    def progress(self):
+        """Доля обработанных элементов 0..1."""
+        return self.done / self.total if self.total else 1.0
+
+    def run(self, deadline):
+        """
+        Обрабатывает элементы до deadline (perf_counter).
+
+        Returns:
+            bool: True, если элементы закончились
+        """
+        while self._items:
+            item = self._items.popleft()
+            try:
+                if self._step(item):
+                    self.changed += 1
+            except Exception as e:
+                log.error("Job '%s' failed on %s: %s", self.name, item, e)
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        return not self._items
+
+    def finish(self, cancelled=False):
+        if self.finished:
+            return
+        self.finished = True
+        self.cancelled = cancelled
+        self._items.clear()
+        if self._on_finish is not None:
+            try:
+                self._on_finish(self)
+            except Exception as e:
+                log.error("Job '%s' finish callback failed: %s", self.name, e)
+        log.debug("Job '%s' %s: %s/%s items, %s changed", self.name,
+                  "cancelled" if cancelled else "finished", self.done, self.total, self.changed)
+
+
+def _tag_redraw():
+    """Перерисовка областей, где показывается прогресс."""
+    window_manager = getattr(bpy.context, "window_manager", None)
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type in {'VIEW_3D', 'PROPERTIES'}:
+                area.tag_redraw()
+
+
+def _run_slice(context=None):
+    """Один тик очереди в пределах SLICE_MS."""
+    deadline = time.perf_counter() + SLICE_MS / 1000.0
+    with cloner_transaction(context):
+        # Хотя бы один элемент за тик, даже если бюджет уже исчерпан
+        while _jobs:
+            job = _jobs[0]
+            if job.run(deadline):
+                _jobs.popleft()
+                job.finish()
+            if time.perf_counter() >= deadline:
+                break
+        request_view_layer_update(context)
+    _tag_redraw()
+
+
+def _tick():
+    if not _jobs:
+        return None
+    _run_slice()
+    return SLICE_INTERVAL if _jobs else None
+
+
+def submit(name, items, step, on_finish=None, context=None):
+    """
+    Ставит задачу в очередь. Первый тик выполняется сразу,
+    поэтому небольшие задачи завершаются до возврата из submit.
+
+    Args:
+        name: Имя задачи
+        items: Элементы для обработки
+        step: Функция (item) -> bool, True - элемент изменен
+        on_finish: Функция (job), вызывается по завершении или отмене
+        context: Контекст Blender для первого тика
+
+    Returns:
+        Job: Поставленная задача
+    """
+    job = Job(name, items, step, on_finish)
+    if not job.total:
+        job.finish()
+        return job
+
+    _jobs.append(job)
+    if len(_jobs) == 1:
+        _run_slice(context)
+    if _jobs and not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=SLICE_INTERVAL)
+    return job
+
+
+def cancel(job_id=None, name=None):
+    """
+    Отменяет задачи.
+
+    Args:
+        job_id: Номер задачи (None - все)
+        name: Отменить только задачи с этим именем
+
+    Returns:
+        int: Число отмененных задач
+    """
+    cancelled = [job for job in _jobs
+                 if (job_id is None or job.id == job_id) and (name is None or job.name == name)]
+    for job in cancelled:
+        _jobs.remove(job)
+        job.finish(cancelled=True)
+    if cancelled:
+        _tag_redraw()
+    return len(cancelled)
+
+
+def active_jobs():
+    """Задачи в очереди, первая выполняется."""
+    return list(_jobs)
+
+
+@bpy.app.handlers.persistent
+def job_queue_reset_handler(*args):
+    """
+    Отменяет все задачи перед загрузкой файла и отменой действия.
+    """
+    cancel()
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("load_pre", job_queue_reset_handler),
+    ("undo_pre", job_queue_reset_handler),
+    ("redo_pre", job_queue_reset_handler),
+)
+
+
+def shutdown():
+    """
+    Отменяет все задачи и таймер очереди. Вызывается при отключении аддона.
+    """
+    cancel()
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
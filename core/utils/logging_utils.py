@@ -0,0 +1,172 @@
+"""
+Журналирование аддона с уровнями по подсистемам.
+
+Сообщения форматируются лениво (в стиле %), поэтому при выключенном уровне
+вызов log.debug("... %s", value) сводится к одному сравнению целых чисел:
+строка не собирается и в консоль ничего не пишется.
+
+Пример:
+    from .logging_utils import get_logger
+    log = get_logger("handlers")
+    log.debug("Обновлен клонер %s", mod.name)
+"""
+
+from typing import Dict, Optional
+
+# Уровни журналирования (совпадают со значениями модуля logging)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVELS = {
+    'DEBUG': DEBUG,
+    'INFO': INFO,
+    'WARNING': WARNING,
+    'ERROR': ERROR,
+    'OFF': OFF,
+}
+
+_LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+# Уровень по умолчанию для релизной сборки: только предупреждения и ошибки
+DEFAULT_LEVEL = WARNING
+
+# Подсистемы аддона
+SUBSYSTEMS = (
+    'addon',        # регистрация и публичное API
+    'config',       # конфигурации и пресеты
+    'core',         # общие утилиты ядра
+    'handlers',     # обработчики depsgraph и таймеры
+    'effectors',    # связь эффекторов с клонерами
+    'models',       # построение групп узлов
+    'operations',   # операторы и создание клонеров
+    'ui',           # панели и UI-операторы
+)
+
+# Префикс вывода
+_PREFIX = "[AdvancedCloners"
+
+
+class AddonLogger:
+    """
+    Журнал одной подсистемы. Уровень хранится в самом объекте,
+    чтобы проверка на горячем пути была одним сравнением атрибута.
+    """
+
+    __slots__ = ("name", "level", "_explicit")
+
+    def __init__(self, name: str, level: int = DEFAULT_LEVEL):
+        self.name = name
+        self.level = level
+        # Уровень задан для подсистемы явно и не меняется вместе с общим уровнем
+        self._explicit = False
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Проверяет, будет ли выведено сообщение указанного уровня."""
+        return level >= self.level
+
+    @property
+    def debug_enabled(self) -> bool:
+        """True, если выводятся отладочные сообщения. Для защиты дорогих вычислений аргументов."""
+        return self.level <= DEBUG
+
+    def debug(self, msg, *args):
+        if self.level <= DEBUG:
+            self._emit(DEBUG, msg, args)
+
+    def info(self, msg, *args):
+        if self.level <= INFO:
+            self._emit(INFO, msg, args)
+
+    def warning(self, msg, *args):
+        if self.level <= WARNING:
+            self._emit(WARNING, msg, args)
+
+    def error(self, msg, *args):
+        if self.level <= ERROR:
+            self._emit(ERROR, msg, args)
+
+    def _emit(self, level: int, msg, args) -> None:
+        """
+        Форматирует и выводит сообщение. Вызывается только для включённых уровней.
+        """
+        try:
+            text = str(msg) % args if args else str(msg)
+        except Exception:
+            # Не роняем вызывающий код из-за ошибки в шаблоне сообщения
+            text = f"{msg} {args}"
+        print(f"{_PREFIX}:{self.name}] {_LEVEL_NAMES.get(level, level)}: {text}")
+
+
+# Журналы по подсистемам
+_loggers: Dict[str, AddonLogger] = {}
+# Общий уровень для подсистем без явного уровня
+_default_level = DEFAULT_LEVEL
+
+
+def get_logger(subsystem: str) -> AddonLogger:
+    """
+    Возвращает журнал подсистемы, создавая его при первом обращении.
+
+    Args:
+        subsystem: Имя подсистемы (см. SUBSYSTEMS)
+
+    Returns:
+        AddonLogger: Журнал подсистемы
+    """
+    logger = _loggers.get(subsystem)
+    if logger is None:
+        logger = AddonLogger(subsystem, _default_level)
+        _loggers[subsystem] = logger
+    return logger
+
+
+def set_default_level(level) -> None:
+    """
+    Устанавливает общий уровень для всех подсистем без явного уровня.
+
+    Args:
+        level: Уровень (число или имя из LEVELS)
+    """
+    global _default_level
+
+    _default_level = _to_level(level)
+    for logger in _loggers.values():
+        if not logger._explicit:
+            logger.level = _default_level
+
+
+def set_level(subsystem: str, level: Optional[object]) -> None:
+    """
+    Устанавливает уровень подсистемы.
+
+    Args:
+        subsystem: Имя подсистемы
+        level: Уровень (число или имя из LEVELS) или None/'DEFAULT' - использовать общий уровень
+    """
+    logger = get_logger(subsystem)
+    if level is None or level == 'DEFAULT':
+        logger._explicit = False
+        logger.level = _default_level
+    else:
+        logger._explicit = True
+        logger.level = _to_level(level)
+
+
+def get_levels() -> Dict[str, str]:
+    """
+    Возвращает текущие уровни всех созданных журналов.
+
+    Returns:
+        dict: Имя подсистемы -> имя уровня
+    """
+    return {name: _LEVEL_NAMES.get(logger.level, str(logger.level)) for name, logger in _loggers.items()}
+
+
+def _to_level(level) -> int:
+    """Преобразует имя уровня в число."""
+    if isinstance(level, str):
+        return LEVELS.get(level.upper(), DEFAULT_LEVEL)
+    return int(level)
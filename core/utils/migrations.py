@@ -0,0 +1,114 @@
+"""
+Миграции групп узлов клонеров через GroupExtender.
+
+Каждая группа хранит целую версию схемы (GroupExtender.SCHEMA_VERSION_KEY).
+После загрузки файла migrate_all_node_groups проходит по группам модификаторов
+клонеров и применяет только недостающие шаги; актуальные группы отмечаются
+в кэше сессии и при повторных проверках не читаются. Новые группы построители
+клонеров сразу отмечают последней версией (GroupExtender.stamp_latest_schema),
+а группы со старыми JSON-метаданными считаются группами версии 0.
+
+Шаг 1 для клонеров - прежнее исправление анти-рекурсии: структура
+достраивается через apply_anti_recursion_to_cloner только у групп без входа
+Realize Instances или со старым узлом Anti-Recursion Join Geometry.
+
+Коллекции клонеров из файлов старых версий при загрузке получают отметку
+коллекции аддона (orphan_gc.mark_legacy_collections).
+"""
+
+import bpy
+
+from .node_utils import GroupExtender
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("core")
+
+# Типы групп клонеров (вхождение в имя группы)
+CLONER_SCHEMA_TYPES = ("GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner")
+
+# Версия схемы с исправленной структурой анти-рекурсии
+SCHEMA_ANTI_RECURSION = 1
+
+
+def needs_anti_recursion_fix(node_group):
+    """Группа без входа Realize Instances или со старой структурой анти-рекурсии."""
+    has_realize_param = any(
+        item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == "Realize Instances"
+        for item in node_group.interface.items_tree
+    )
+    if not has_realize_param:
+        return True
+    return ("Anti-Recursion Switch" in node_group.nodes
+            and "Anti-Recursion Join Geometry" in node_group.nodes)
+
+
+def migrate_anti_recursion(node_group):
+    """
+    Шаг схемы SCHEMA_ANTI_RECURSION: достраивает анти-рекурсию, если она нужна.
+
+    Returns:
+        bool: True, если структура достроена, None, если исправление не нужно,
+              False, если исправление не удалось
+    """
+    if not needs_anti_recursion_fix(node_group):
+        return None
+    from ...operations.fix_recursion import apply_anti_recursion_to_cloner
+    return apply_anti_recursion_to_cloner(node_group)
+
+
+def register_migrations():
+    """Регистрирует шаги миграции групп клонеров."""
+    for node_type in CLONER_SCHEMA_TYPES:
+        GroupExtender.register_migration(node_type, SCHEMA_ANTI_RECURSION, migrate_anti_recursion)
+
+
+def migrate_all_node_groups():
+    """
+    Применяет недостающие миграции к группам модификаторов клонеров.
+
+    Returns:
+        int: Число обновленных групп
+    """
+    migrated = 0
+    seen = set()
+    for obj in bpy.data.objects:
+        for mod in obj.modifiers:
+            node_group = getattr(mod, "node_group", None)
+            if mod.type != 'NODES' or node_group is None or node_group.library is not None:
+                continue
+            if node_group.name in seen:
+                continue
+            seen.add(node_group.name)
+            if GroupExtender.migrate_node_group(node_group):
+                migrated += 1
+                obj.update_tag()
+
+    if migrated:
+        log.info("Migrated %s node groups to the current schema", migrated)
+    return migrated
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def node_group_migration_handler(*args):
+    """
+    Миграция групп узлов после загрузки файла.
+    """
+    GroupExtender.clear_session_cache()
+    try:
+        migrate_all_node_groups()
+    except Exception as e:
+        log.error("Node group migration on load failed: %s", e)
+
+    from .orphan_gc import mark_legacy_collections
+    try:
+        mark_legacy_collections()
+    except Exception as e:
+        log.error("Marking add-on collections on load failed: %s", e)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("load_post", node_group_migration_handler),
+)
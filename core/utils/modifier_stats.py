@@ -0,0 +1,296 @@
+"""
+Статистика времени вычисления модификаторов клонеров, эффекторов и полей.
+
+После каждого пересчета depsgraph считывается Modifier.execution_time вычисленных
+объектов и накапливаются скользящие min/mean/max по последним STATS_WINDOW выборкам.
+Сбор включается свойством сцены cloner_stats_enabled; при выключенном сборе
+обработчики выходят сразу.
+"""
+
+import bpy
+import csv
+import json
+from collections import deque
+
+from ..common.constants import (
+    CLONER_NODE_GROUP_PREFIXES,
+    EFFECTOR_NODE_GROUP_PREFIXES,
+    FIELD_NODE_GROUP_PREFIXES,
+)
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("core")
+
+# Размер окна скользящей статистики (выборок на модификатор)
+STATS_WINDOW = 120
+
+# Имена групп узлов клонеров объектов и коллекций, не входящие в CLONER_NODE_GROUP_PREFIXES
+_CLONER_NAME_MARKERS = ("ObjectCloner_", "CollectionCloner_")
+
+# Блокировка обработчиков на время сбора по диапазону кадров
+_collecting = False
+
+
+def classify_modifier(mod):
+    """
+    Определяет тип компонента аддона по модификатору.
+
+    Args:
+        mod: Модификатор
+
+    Returns:
+        str: 'CLONER', 'EFFECTOR', 'FIELD' или None для посторонних модификаторов
+    """
+    if mod.type != 'NODES' or not mod.node_group:
+        return None
+
+    name = mod.node_group.name
+    if name.startswith(tuple(CLONER_NODE_GROUP_PREFIXES)) or any(m in name for m in _CLONER_NAME_MARKERS):
+        return 'CLONER'
+    if name.startswith(tuple(EFFECTOR_NODE_GROUP_PREFIXES)):
+        return 'EFFECTOR'
+    if name.startswith(tuple(FIELD_NODE_GROUP_PREFIXES)):
+        return 'FIELD'
+    return None
+
+
+class _TimingEntry:
+    """Скользящая статистика одного модификатора."""
+
+    __slots__ = ("kind", "samples", "total_count", "last")
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.samples = deque(maxlen=STATS_WINDOW)
+        self.total_count = 0
+        self.last = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.total_count += 1
+        self.last = seconds
+
+
+class ModifierTimingStats:
+    """
+    Накопитель времени вычисления модификаторов по ключу (объект, модификатор).
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def add(self, obj_name, mod_name, kind, seconds):
+        """
+        Добавляет выборку времени вычисления.
+
+        Args:
+            obj_name: Имя объекта
+            mod_name: Имя модификатора
+            kind: Тип компонента ('CLONER', 'EFFECTOR', 'FIELD')
+            seconds: Modifier.execution_time
+        """
+        key = (obj_name, mod_name)
+        entry = self._entries.get(key)
+        if entry is None or entry.kind != kind:
+            entry = self._entries[key] = _TimingEntry(kind)
+        entry.add(seconds)
+
+    def rows(self):
+        """
+        Сводка по модификаторам, отсортированная по среднему времени (дорогие первыми).
+
+        Returns:
+            list: Словари object, modifier, kind, last_ms, min_ms, mean_ms, max_ms, samples
+        """
+        rows = []
+        for (obj_name, mod_name), entry in self._entries.items():
+            if not entry.samples:
+                continue
+            samples = entry.samples
+            rows.append({
+                "object": obj_name,
+                "modifier": mod_name,
+                "kind": entry.kind,
+                "last_ms": entry.last * 1000.0,
+                "min_ms": min(samples) * 1000.0,
+                "mean_ms": sum(samples) / len(samples) * 1000.0,
+                "max_ms": max(samples) * 1000.0,
+                "samples": entry.total_count,
+            })
+        rows.sort(key=lambda row: row["mean_ms"], reverse=True)
+        return rows
+
+    def forget_missing(self):
+        """Удаляет записи модификаторов, которых больше нет в сцене."""
+        objects = bpy.data.objects
+        for key in list(self._entries):
+            obj = objects.get(key[0])
+            if obj is None or key[1] not in obj.modifiers:
+                del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Общий накопитель аддона
+modifier_stats = ModifierTimingStats()
+
+
+def sample_object(obj, depsgraph, stats=modifier_stats):
+    """
+    Считывает время вычисления модификаторов аддона на объекте.
+
+    Args:
+        obj: Исходный (не вычисленный) объект
+        depsgraph: Depsgraph, в котором вычислен объект
+        stats: Накопитель статистики
+
+    Returns:
+        list: Кортежи (объект, модификатор, тип, секунды) для считанных модификаторов
+    """
+    if not obj.modifiers:
+        return []
+
+    try:
+        evaluated = obj.evaluated_get(depsgraph)
+    except (ReferenceError, RuntimeError):
+        return []
+
+    records = []
+    for mod in evaluated.modifiers:
+        kind = classify_modifier(mod)
+        if kind is None:
+            continue
+        seconds = mod.execution_time
+        stats.add(obj.name, mod.name, kind, seconds)
+        records.append((obj.name, mod.name, kind, seconds))
+    return records
+
+
+def sample_scene(scene, depsgraph, stats=modifier_stats):
+    """
+    Считывает время вычисления модификаторов аддона для всех объектов сцены.
+
+    Returns:
+        list: Кортежи (объект, модификатор, тип, секунды)
+    """
+    records = []
+    for obj in scene.objects:
+        if obj.modifiers:
+            records.extend(sample_object(obj, depsgraph, stats))
+    return records
+
+
+def _stats_enabled(scene):
+    return not _collecting and getattr(scene, "cloner_stats_enabled", False)
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def modifier_stats_update_handler(scene, depsgraph):
+    """
+    Сбор статистики после пересчета depsgraph: только объекты с пересчитанной геометрией.
+    """
+    if not _stats_enabled(scene):
+        return
+
+    try:
+        for update in depsgraph.updates:
+            if not update.is_updated_geometry:
+                continue
+            id_data = update.id
+            if isinstance(id_data, bpy.types.Object):
+                sample_object(id_data.original, depsgraph)
+    except Exception as e:
+        log.error("modifier_stats_update_handler: %s", e)
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def modifier_stats_frame_handler(scene, depsgraph=None):
+    """
+    Сбор статистики при смене кадра: анимированные клонеры пересчитываются без depsgraph.updates.
+    """
+    if not _stats_enabled(scene):
+        return
+
+    try:
+        sample_scene(scene, depsgraph or bpy.context.evaluated_depsgraph_get())
+    except Exception as e:
+        log.error("modifier_stats_frame_handler: %s", e)
+
+
+def collect_frame_range(scene, frame_start, frame_end, stats=modifier_stats):
+    """
+    Проходит по диапазону кадров и считывает время вычисления на каждом кадре.
+    Текущий кадр сцены восстанавливается.
+
+    Args:
+        scene: Сцена
+        frame_start: Первый кадр
+        frame_end: Последний кадр (включительно)
+        stats: Накопитель статистики
+
+    Returns:
+        list: Записи {"frame", "object", "modifier", "kind", "time_ms"}
+    """
+    global _collecting
+
+    frame_records = []
+    original_frame = scene.frame_current
+    _collecting = True
+    try:
+        for frame in range(frame_start, frame_end + 1):
+            scene.frame_set(frame)
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            for obj_name, mod_name, kind, seconds in sample_scene(scene, depsgraph, stats):
+                frame_records.append({
+                    "frame": frame,
+                    "object": obj_name,
+                    "modifier": mod_name,
+                    "kind": kind,
+                    "time_ms": seconds * 1000.0,
+                })
+    finally:
+        _collecting = False
+        scene.frame_set(original_frame)
+
+    return frame_records
+
+
+def export_stats(filepath, file_format, summary, frame_records=None):
+    """
+    Записывает статистику в CSV или JSON.
+
+    CSV содержит покадровые записи, если они есть, иначе сводку.
+    JSON содержит сводку и покадровые записи.
+
+    Args:
+        filepath: Путь к файлу
+        file_format: 'CSV' или 'JSON'
+        summary: Результат ModifierTimingStats.rows()
+        frame_records: Результат collect_frame_range или None
+    """
+    if file_format == 'JSON':
+        data = {"summary": summary, "frames": frame_records or []}
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return
+
+    rows = frame_records if frame_records else summary
+    fieldnames = list(rows[0].keys()) if rows else ["object", "modifier", "kind"]
+    with open(filepath, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("depsgraph_update_post", modifier_stats_update_handler),
+    ("frame_change_post", modifier_stats_frame_handler),
+)
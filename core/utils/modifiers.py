@@ -6,4 +6,144 @@ import bpy
 from ..utils.node_utils import find_socket_by_name
 
 # Функция find_socket_by_name теперь импортируется из node_utils
-# Оставляем импорт здесь для обратной совместимости 
\ No newline at end of file
+# Оставляем импорт здесь для обратной совместимости 
+
+# Порядок стека модификаторов
+#
+# Модификаторы перемещаются через ObjectModifiers.move: один вызов RNA на
+# перемещение, без bpy.ops, переопределения контекста и шага отмены.
+
+
+def get_modifier_index(obj, modifier) -> int:
+    """
+    Индекс модификатора в стеке.
+
+    Args:
+        obj: Объект с модификаторами
+        modifier: Модификатор или его имя
+
+    Returns:
+        int: Индекс или -1, если модификатора нет
+    """
+    name = modifier if isinstance(modifier, str) else modifier.name
+    return obj.modifiers.find(name)
+
+
+def move_modifier_to_index(obj, modifier, index) -> bool:
+    """
+    Ставит модификатор на заданную позицию стека одним вызовом.
+
+    Args:
+        obj: Объект с модификаторами
+        modifier: Модификатор или его имя
+        index: Новая позиция (ограничивается размером стека)
+
+    Returns:
+        bool: True, если модификатор найден
+    """
+    current = get_modifier_index(obj, modifier)
+    if current < 0:
+        return False
+    index = max(0, min(index, len(obj.modifiers) - 1))
+    if index != current:
+        obj.modifiers.move(current, index)
+    return True
+
+
+def move_modifier(obj, modifier, direction) -> bool:
+    """
+    Сдвигает модификатор на одну позицию.
+
+    Args:
+        obj: Объект с модификаторами
+        modifier: Модификатор или его имя
+        direction: 'UP' или 'DOWN'
+
+    Returns:
+        bool: True, если модификатор сдвинут
+    """
+    current = get_modifier_index(obj, modifier)
+    if current < 0:
+        return False
+    index = current - 1 if direction == 'UP' else current + 1
+    if index < 0 or index >= len(obj.modifiers):
+        return False
+    obj.modifiers.move(current, index)
+    return True
+
+
+def place_modifier_after(obj, modifier, anchor) -> bool:
+    """
+    Ставит модификатор сразу после anchor.
+
+    Args:
+        obj: Объект с модификаторами
+        modifier: Перемещаемый модификатор или его имя
+        anchor: Модификатор или имя, после которого он встает
+
+    Returns:
+        bool: True, если оба модификатора найдены
+    """
+    current = get_modifier_index(obj, modifier)
+    anchor_index = get_modifier_index(obj, anchor)
+    if current < 0 or anchor_index < 0:
+        return False
+    # После извлечения модификатора выше anchor индекс anchor уменьшается на 1
+    target = anchor_index if current < anchor_index else anchor_index + 1
+    return move_modifier_to_index(obj, modifier, target)
+
+
+def place_modifier_before(obj, modifier, anchor) -> bool:
+    """
+    Ставит модификатор сразу перед anchor.
+
+    Args:
+        obj: Объект с модификаторами
+        modifier: Перемещаемый модификатор или его имя
+        anchor: Модификатор или имя, перед которым он встает
+
+    Returns:
+        bool: True, если оба модификатора найдены
+    """
+    current = get_modifier_index(obj, modifier)
+    anchor_index = get_modifier_index(obj, anchor)
+    if current < 0 or anchor_index < 0:
+        return False
+    target = anchor_index - 1 if current < anchor_index else anchor_index
+    return move_modifier_to_index(obj, modifier, target)
+
+
+def reorder_modifiers(obj, names) -> int:
+    """
+    Переставляет модификаторы в заданном порядке за один проход.
+
+    Перечисленные модификаторы занимают те же позиции стека, что и раньше,
+    но в порядке names; остальные модификаторы остаются на своих местах.
+    Каждый модификатор перемещается не более одного раза.
+
+    Args:
+        obj: Объект с модификаторами
+        names: Имена модификаторов в нужном порядке (неизвестные пропускаются)
+
+    Returns:
+        int: Число перемещений
+    """
+    current = [mod.name for mod in obj.modifiers]
+    present = set(current)
+    names = [name for name in dict.fromkeys(names) if name in present]
+    reordered = set(names)
+
+    # Итоговый порядок: позиции перечисленных модификаторов по очереди занимает names
+    queue = iter(names)
+    target = [next(queue) if name in reordered else name for name in current]
+
+    moves = 0
+    for index, name in enumerate(target):
+        # Позиции до index уже на месте, поэтому перемещение идет снизу вверх
+        # и не сдвигает уже расставленные модификаторы
+        if current[index] != name:
+            from_index = current.index(name, index)
+            obj.modifiers.move(from_index, index)
+            current.insert(index, current.pop(from_index))
+            moves += 1
+    return moves
@@ -0,0 +1,279 @@
+"""
+Удаление структурных дубликатов групп узлов аддона.
+
+Процедурное создание оставляет в файле множество одинаковых вложенных групп
+(RandomEffectorLogic.001, GridClonerLogic.002, ...). Для каждой группы аддона
+строится отпечаток: интерфейс, типы и настройки узлов, значения несвязанных
+входов, связи, пользовательские свойства и драйверы. Вложенные группы входят
+в отпечаток своим отпечатком, а не именем, поэтому родители с одинаковыми
+дубликатами внутри тоже совпадают. Пользователи дубликатов переназначаются
+на каноническую группу (user_remap), дубликаты удаляются.
+
+Объединяются только группы, которые используются узлами Group внутри других
+групп. Группы модификаторов (AdvancedGridCloner, CollectionCloner_*, ...)
+хранят состояние конкретного клонера (linked_effectors, узлы Effector_*),
+которое аддон меняет на месте, поэтому они не объединяются.
+
+Дедупликация запускается оператором object.cloner_deduplicate_node_groups
+или после загрузки файла (load_post), если включена настройка Deduplicate On Load.
+"""
+
+import bpy
+import hashlib
+
+from ..common.constants import (
+    CLONER_NODE_GROUP_PREFIXES,
+    EFFECTOR_NODE_GROUP_PREFIXES,
+    FIELD_NODE_GROUP_PREFIXES,
+)
+from .logging_utils import get_logger
+from .profiling import profiled
+
+log = get_logger("core")
+
+# Имена групп аддона, не входящие в префиксы компонентов
+ADDON_GROUP_MARKERS = (
+    "ClonerLogic", "EffectorLogic", "ObjectCloner_", "CollectionCloner_", "_Stack_",
+    "GridCloner3D_Advanced", "CircleCloner", "EffectorInputGroup",
+)
+
+# Запускать дедупликацию после загрузки файла (задается настройками аддона)
+DEDUP_ON_LOAD = False
+
+# Точность сравнения вещественных значений
+FLOAT_DIGITS = 6
+
+# Свойства узла, не влияющие на результат
+_IGNORED_NODE_PROPS = {"location", "width", "height", "select", "show_options", "show_preview",
+                       "hide", "show_texture", "color", "use_custom_color", "parent", "dimensions",
+                       "width_hidden", "is_active_output", "warning_propagation"}
+
+
+def is_addon_node_group(node_group):
+    """Группа узлов создана аддоном (по имени)."""
+    name = node_group.name
+    prefixes = tuple(CLONER_NODE_GROUP_PREFIXES) + tuple(EFFECTOR_NODE_GROUP_PREFIXES) + tuple(FIELD_NODE_GROUP_PREFIXES)
+    return name.startswith(prefixes) or any(marker in name for marker in ADDON_GROUP_MARKERS)
+
+
+def _normalize(value):
+    """Значение свойства в сравнимом виде."""
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.ID):
+        return ("ID", type(value).__name__, value.name)
+    if hasattr(value, "to_dict"):
+        return repr(value.to_dict())
+    if hasattr(value, "to_list"):
+        return repr(value.to_list())
+    if hasattr(value, "__len__") and not isinstance(value, bpy.types.bpy_struct):
+        try:
+            return tuple(_normalize(v) for v in value)
+        except TypeError:
+            pass
+    return repr(value)
+
+
+def _node_base_props():
+    return {prop.identifier for prop in bpy.types.Node.bl_rna.properties} - {"mute"}
+
+
+def _node_signature(node, tree_fingerprints, base_props):
+    settings = []
+    for prop in node.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in base_props or identifier in _IGNORED_NODE_PROPS or prop.is_readonly:
+            continue
+        value = getattr(node, identifier, None)
+        if identifier == "node_tree" and value is not None:
+            value = ("TREE", tree_fingerprints.get(value.name, value.name))
+        settings.append((identifier, _normalize(value)))
+
+    inputs = []
+    for socket in node.inputs:
+        if not socket.is_linked and hasattr(socket, "default_value"):
+            inputs.append((socket.identifier, _normalize(socket.default_value)))
+    return (node.bl_idname, node.name, node.mute, tuple(settings), tuple(inputs))
+
+
+def _interface_signature(node_group):
+    items = []
+    for item in node_group.interface.items_tree:
+        entry = [item.item_type, item.name]
+        if item.item_type == 'SOCKET':
+            entry += [item.in_out, item.socket_type, item.identifier]
+            for attr in ("default_value", "min_value", "max_value", "subtype"):
+                if hasattr(item, attr):
+                    entry.append(_normalize(getattr(item, attr)))
+        items.append(tuple(entry))
+    return tuple(items)
+
+
+def _drivers_signature(node_group):
+    animation_data = node_group.animation_data
+    if animation_data is None:
+        return ()
+    drivers = []
+    for fcurve in animation_data.drivers:
+        targets = tuple((t.id.name if t.id else None, t.data_path)
+                        for v in fcurve.driver.variables for t in v.targets)
+        drivers.append((fcurve.data_path, fcurve.array_index, fcurve.driver.expression, targets))
+    return tuple(sorted(drivers))
+
+
+def fingerprint_node_group(node_group, tree_fingerprints=None, base_props=None):
+    """
+    Структурный отпечаток группы узлов.
+
+    Args:
+        node_group: Группа узлов
+        tree_fingerprints: {имя группы: отпечаток} уже обработанных вложенных групп
+        base_props: Идентификаторы базовых свойств Node (вычисляются при None)
+
+    Returns:
+        str: SHA-1 отпечатка
+    """
+    tree_fingerprints = tree_fingerprints if tree_fingerprints is not None else {}
+    base_props = base_props if base_props is not None else _node_base_props()
+
+    nodes = tuple(sorted((_node_signature(node, tree_fingerprints, base_props) for node in node_group.nodes),
+                         key=repr))
+    links = tuple(sorted((link.from_node.name, link.from_socket.identifier,
+                          link.to_node.name, link.to_socket.identifier, link.is_muted)
+                         for link in node_group.links))
+    props = tuple(sorted((key, _normalize(node_group[key])) for key in node_group.keys()))
+
+    signature = (node_group.bl_idname, _interface_signature(node_group), nodes, links, props,
+                 _drivers_signature(node_group))
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+
+def _nested_trees(node_group):
+    return [node.node_tree for node in node_group.nodes
+            if node.bl_idname == 'GeometryNodeGroup' and node.node_tree is not None]
+
+
+def _modifier_group_names():
+    """Имена групп, назначенных модификаторам."""
+    names = set()
+    for obj in bpy.data.objects:
+        for mod in obj.modifiers:
+            if mod.type == 'NODES' and mod.node_group is not None:
+                names.add(mod.node_group.name)
+    return names
+
+
+def _children_first(node_groups):
+    """Группы в порядке: вложенные раньше содержащих."""
+    ordered = []
+    visited = set()
+
+    def visit(tree):
+        if tree.name in visited:
+            return
+        visited.add(tree.name)
+        for child in _nested_trees(tree):
+            visit(child)
+        ordered.append(tree)
+
+    for tree in node_groups:
+        visit(tree)
+    return ordered
+
+
+def find_duplicates():
+    """
+    Ищет структурные дубликаты среди вложенных групп аддона.
+
+    Returns:
+        dict: {имя канонической группы: [имена дубликатов]}
+    """
+    base_props = _node_base_props()
+    modifier_groups = _modifier_group_names()
+    tree_fingerprints = {}
+    canonical_by_fingerprint = {}
+    duplicates = {}
+
+    addon_groups = [g for g in bpy.data.node_groups if g.bl_idname == 'GeometryNodeTree' and is_addon_node_group(g)]
+    for tree in _children_first(addon_groups):
+        fingerprint = fingerprint_node_group(tree, tree_fingerprints, base_props)
+        tree_fingerprints[tree.name] = fingerprint
+
+        if not is_addon_node_group(tree) or tree.name in modifier_groups or tree.library is not None:
+            continue
+
+        canonical = canonical_by_fingerprint.get(fingerprint)
+        if canonical is None:
+            canonical_by_fingerprint[fingerprint] = tree.name
+        else:
+            duplicates.setdefault(canonical, []).append(tree.name)
+    return duplicates
+
+
+def deduplicate_node_groups(dry_run=False):
+    """
+    Переназначает пользователей дубликатов на канонические группы и удаляет дубликаты.
+
+    Args:
+        dry_run: Только найти дубликаты, ничего не менять
+
+    Returns:
+        dict: {"groups_before", "duplicates": {каноническая: [дубликаты]}, "removed", "nodes_removed"}
+    """
+    groups_before = len(bpy.data.node_groups)
+    duplicates = find_duplicates()
+
+    removed = 0
+    nodes_removed = 0
+    for canonical_name, duplicate_names in duplicates.items():
+        canonical = bpy.data.node_groups.get(canonical_name)
+        for name in duplicate_names:
+            duplicate = bpy.data.node_groups.get(name)
+            if duplicate is None or canonical is None:
+                continue
+            nodes_removed += len(duplicate.nodes)
+            if dry_run:
+                continue
+            duplicate.user_remap(canonical)
+            bpy.data.node_groups.remove(duplicate)
+            removed += 1
+
+    report = {
+        "groups_before": groups_before,
+        "duplicates": duplicates,
+        "removed": removed,
+        "nodes_removed": nodes_removed,
+    }
+    duplicate_count = sum(len(names) for names in duplicates.values())
+    if duplicate_count:
+        log.info("Node group dedup%s: %s duplicates of %s groups, %s nodes",
+                 " (dry run)" if dry_run else "", duplicate_count, len(duplicates), nodes_removed)
+    return report
+
+
+def set_dedup_on_load(enabled):
+    """Включает дедупликацию групп узлов после загрузки файла."""
+    global DEDUP_ON_LOAD
+    DEDUP_ON_LOAD = bool(enabled)
+
+
+@bpy.app.handlers.persistent
+@profiled(category="handler")
+def node_dedup_load_handler(*args):
+    """
+    Дедупликация групп узлов аддона после загрузки файла.
+    """
+    if not DEDUP_ON_LOAD:
+        return
+    try:
+        deduplicate_node_groups()
+    except Exception as e:
+        log.error("Node group dedup on load failed: %s", e)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("load_post", node_dedup_load_handler),
+)
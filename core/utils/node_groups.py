@@ -4,6 +4,10 @@ Functions for creating and managing node groups.
 
 import bpy
 
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
 def create_independent_node_group(template_creator_func, base_node_name):
     """Создает независимую копию группы узлов"""
     # Создаем базовую группу узлов
@@ -15,12 +19,12 @@ def create_independent_node_group(template_creator_func, base_node_name):
     try:
         independent_node_group = template_node_group.copy()
     except Exception as e:
-        print(f"Failed to copy node group: {e}")
+        log.error("Failed to copy node group: %s", e)
         if template_node_group.users == 0:
             try:
                 bpy.data.node_groups.remove(template_node_group, do_unlink=True)
             except Exception as remove_e:
-                print(f"Warning: Could not remove template node group: {remove_e}")
+                log.warning("Could not remove template node group: %s", remove_e)
         return None
     
     # Удаляем шаблон или переименовываем его
@@ -28,7 +32,7 @@ def create_independent_node_group(template_creator_func, base_node_name):
         try:
             bpy.data.node_groups.remove(template_node_group, do_unlink=True)
         except Exception as e:
-            print(f"Warning: Could not remove template node group: {e}")
+            log.warning("Could not remove template node group: %s", e)
     else:
         template_node_group.name += ".template"
     
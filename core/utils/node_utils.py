@@ -6,6 +6,10 @@ import bpy
 import json
 from typing import Dict, List, Any, Optional, Union, Tuple, Callable, Collection
 
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
 #region РАБОТА С ИМЕНАМИ УЗЛОВ
 
 def create_unique_name(base_name: str, existing_collection: Collection, counter_format: str = "{}.{:03d}") -> str:
@@ -66,12 +70,12 @@ def create_independent_node_group(template_creator_func: Callable, base_node_nam
     try:
         independent_node_group = template_node_group.copy()
     except Exception as e:
-        print(f"Failed to copy node group: {e}")
+        log.error("Failed to copy node group: %s", e)
         if template_node_group.users == 0:
             try:
                 bpy.data.node_groups.remove(template_node_group, do_unlink=True)
             except Exception as remove_e:
-                print(f"Warning: Could not remove template node group: {remove_e}")
+                log.warning("Could not remove template node group: %s", remove_e)
         return None
     
     # Удаляем шаблон или переименовываем его
@@ -79,7 +83,7 @@ def create_independent_node_group(template_creator_func: Callable, base_node_nam
         try:
             bpy.data.node_groups.remove(template_node_group, do_unlink=True)
         except Exception as e:
-            print(f"Warning: Could not remove template node group: {e}")
+            log.warning("Could not remove template node group: %s", e)
     else:
         template_node_group.name += ".template"
     
@@ -191,24 +195,171 @@ class GroupExtender:
     EXTENSION_POINT_POST = "EXTENSION_POINT_POST"
     EXTENSION_POINT_PARAMS = "EXTENSION_POINT_PARAMS"
     
-    # Словарь обновлений для разных типов узлов
+    # Свойства группы: целочисленная версия схемы и тип для поиска миграций
+    SCHEMA_VERSION_KEY = "schema_version"
+    SCHEMA_TYPE_KEY = "schema_type"
+    
+    # Словарь обновлений для разных типов узлов: {тип: {целая версия: функция}}
     _updates_registry = {}
     
+    # Группы, проверенные в этой сессии и не требующие миграций (session_uid)
+    _up_to_date = set()
+    
+    @classmethod
+    def register_migration(cls, node_type: str, version: int, migrate_func):
+        """
+        Регистрирует шаг миграции схемы для типа группы узлов.
+        
+        Args:
+            node_type: Тип группы узлов (например, 'GridCloner', 'RandomEffector');
+                       без явного schema_type тип определяется по вхождению в имя группы
+            version: Целая версия схемы, которую получает группа после шага
+            migrate_func: Функция (node_group), применяющая шаг. Возвращает True,
+                          если структура группы изменена, None, если группа уже
+                          соответствует схеме, и False, если шаг не удался
+        """
+        cls._updates_registry.setdefault(node_type, {})[int(version)] = migrate_func
+        cls._up_to_date.clear()
+        log.debug("Registered migration for %s version %s", node_type, version)
+    
     @classmethod
     def register_update(cls, node_type: str, version: str, update_func):
         """
         Регистрирует функцию обновления для определенного типа узла и версии.
+        Строковая версия 'X.Y.Z' переводится в целую схему (см. version_to_schema).
         
         Args:
             node_type: Тип группы узлов (например, 'GridCloner', 'RandomEffector')
             version: Версия обновления
             update_func: Функция, которая будет применять обновление к группе узлов
         """
-        if node_type not in cls._updates_registry:
-            cls._updates_registry[node_type] = {}
+        cls.register_migration(node_type, cls.version_to_schema(version), update_func)
+    
+    @staticmethod
+    def version_to_schema(version: str) -> int:
+        """
+        Переводит строковую версию 'X.Y.Z' в целую версию схемы X*10000 + Y*100 + Z.
+        """
+        parts = [int(x) for x in str(version).split('.')[:3]]
+        parts += [0] * (3 - len(parts))
+        return parts[0] * 10000 + parts[1] * 100 + parts[2]
+    
+    @classmethod
+    def latest_schema(cls, node_type: str) -> int:
+        """Последняя зарегистрированная версия схемы типа (0 без миграций)."""
+        versions = cls._updates_registry.get(node_type)
+        return max(versions) if versions else 0
+    
+    @classmethod
+    def resolve_node_type(cls, node_group) -> Optional[str]:
+        """
+        Тип группы для миграций: schema_type, тип из старых JSON-метаданных
+        или самый длинный зарегистрированный тип, входящий в имя группы.
+        """
+        node_type = node_group.get(cls.SCHEMA_TYPE_KEY)
+        if node_type:
+            return node_type
+        if "metadata" in node_group:
+            node_type = cls._get_metadata(node_group).get("type")
+            if node_type in cls._updates_registry:
+                return node_type
+        matches = [t for t in cls._updates_registry if t in node_group.name]
+        return max(matches, key=len) if matches else None
+    
+    @classmethod
+    def schema_version(cls, node_group) -> int:
+        """
+        Текущая целая версия схемы группы. Группы без schema_version, в том числе
+        со старыми JSON-метаданными ("version": "1.0"), созданы до целых схем
+        и имеют версию 0: к ним применяются все шаги миграции.
+        """
+        version = node_group.get(cls.SCHEMA_VERSION_KEY)
+        if version is not None:
+            return int(version)
+        return 0
+    
+    @classmethod
+    def stamp_latest_schema(cls, node_group, node_type=None):
+        """
+        Отмечает новую группу последней версией схемы ее типа. Построители создают
+        группы в актуальной структуре, поэтому миграции к ним не применяются.
         
-        cls._updates_registry[node_type][version] = update_func
-        print(f"Registered update for {node_type} version {version}")
+        Args:
+            node_group: Созданная группа узлов
+            node_type: Тип группы (по умолчанию - по имени группы, см. resolve_node_type)
+        """
+        node_type = node_type or cls.resolve_node_type(node_group)
+        if node_type is None:
+            return
+        node_group[cls.SCHEMA_VERSION_KEY] = cls.latest_schema(node_type)
+        node_group[cls.SCHEMA_TYPE_KEY] = node_type
+        cls._up_to_date.add(getattr(node_group, "session_uid", None) or node_group.name)
+    
+    @classmethod
+    def is_up_to_date(cls, node_group) -> bool:
+        """Группа уже проверена в этой сессии и не требует миграций."""
+        return (getattr(node_group, "session_uid", None) or node_group.name) in cls._up_to_date
+    
+    @classmethod
+    def needs_migration(cls, node_group) -> bool:
+        """Версия схемы группы ниже последней зарегистрированной для ее типа."""
+        if cls.is_up_to_date(node_group):
+            return False
+        node_type = cls.resolve_node_type(node_group)
+        return node_type is not None and cls.schema_version(node_group) < cls.latest_schema(node_type)
+    
+    @classmethod
+    def clear_session_cache(cls):
+        """Сбрасывает отметки актуальности групп (после загрузки файла)."""
+        cls._up_to_date.clear()
+    
+    @classmethod
+    def migrate_node_group(cls, node_group, force=False) -> bool:
+        """
+        Применяет к группе только недостающие шаги миграции.
+        Группы, уже проверенные в этой сессии, не читаются повторно.
+        
+        Args:
+            node_group: Группа узлов
+            force: Применить все шаги независимо от версии
+        
+        Returns:
+            bool: True, если хотя бы один шаг изменил структуру группы
+        """
+        key = getattr(node_group, "session_uid", None) or node_group.name
+        if not force and key in cls._up_to_date:
+            return False
+        
+        node_type = cls.resolve_node_type(node_group)
+        if node_type is None:
+            cls._up_to_date.add(key)
+            return False
+        
+        current = 0 if force else cls.schema_version(node_group)
+        migrated = False
+        for version in sorted(cls._updates_registry[node_type]):
+            if version <= current:
+                continue
+            try:
+                changed = cls._updates_registry[node_type][version](node_group)
+            except Exception as e:
+                log.error("Error migrating %s to schema %s: %s", node_group.name, version, e)
+                return migrated
+            if changed is False:
+                log.warning("Migration of %s to schema %s did not apply", node_group.name, version)
+                return migrated
+            node_group[cls.SCHEMA_VERSION_KEY] = version
+            current = version
+            if changed:
+                migrated = True
+                log.debug("Migrated %s to schema %s", node_group.name, version)
+        
+        if node_group.get(cls.SCHEMA_VERSION_KEY) != current:
+            node_group[cls.SCHEMA_VERSION_KEY] = current
+        if node_group.get(cls.SCHEMA_TYPE_KEY) != node_type:
+            node_group[cls.SCHEMA_TYPE_KEY] = node_type
+        cls._up_to_date.add(key)
+        return migrated
     
     @classmethod
     def prepare_node_group_for_extensions(cls, node_group, node_type=None):
@@ -267,7 +418,7 @@ class GroupExtender:
             return True
             
         except Exception as e:
-            print(f"Error preparing node group for extensions: {e}")
+            log.error("Error preparing node group for extensions: %s", e)
             return False
     
     @classmethod
@@ -285,18 +436,18 @@ class GroupExtender:
         # Получаем метаданные
         metadata = cls._get_metadata(node_group)
         if not metadata:
-            print(f"Cannot extend node group: no metadata found")
+            log.debug("Cannot extend node group: no metadata found")
             return False
         
         # Проверяем, не установлено ли уже это расширение
         extension_id = extension_info.get("id", "unknown")
         if extension_id in [ext.get("id") for ext in metadata.get("extensions", [])]:
-            print(f"Extension {extension_id} already installed")
+            log.debug("Extension %s already installed", extension_id)
             return True
         
         # Убеждаемся, что группа подготовлена для расширений
         if not cls.prepare_node_group_for_extensions(node_group, metadata.get("type")):
-            print(f"Failed to prepare node group for extensions")
+            log.error("Failed to prepare node group for extensions")
             return False
         
         try:
@@ -318,7 +469,7 @@ class GroupExtender:
             return True
             
         except Exception as e:
-            print(f"Error extending node group: {e}")
+            log.error("Error extending node group: %s", e)
             return False
     
     @classmethod
@@ -333,44 +484,7 @@ class GroupExtender:
         Returns:
             bool: True, если группа была обновлена
         """
-        # Получаем метаданные
-        metadata = cls._get_metadata(node_group)
-        if not metadata:
-            print(f"Cannot update node group: no metadata found")
-            return False
-        
-        node_type = metadata.get("type", "unknown")
-        current_version = metadata.get("version", "1.0")
-        
-        # Проверяем, есть ли доступные обновления для этого типа узла
-        if node_type not in cls._updates_registry:
-            return False
-        
-        updated = False
-        
-        # Сортируем версии обновлений для правильного порядка применения
-        versions = sorted(cls._updates_registry[node_type].keys(), 
-                           key=lambda v: [int(n) for n in v.split('.')])
-        
-        # Применяем все обновления, начиная с текущей версии
-        for version in versions:
-            # Применяем обновление только если оно новее текущей версии или принудительное
-            if force or cls._compare_versions(version, current_version) > 0:
-                update_func = cls._updates_registry[node_type][version]
-                
-                try:
-                    # Применяем обновление
-                    success = update_func(node_group)
-                    if success:
-                        # Обновляем версию в метаданных
-                        metadata["version"] = version
-                        node_group["metadata"] = json.dumps(metadata)
-                        updated = True
-                        print(f"Updated {node_type} to version {version}")
-                except Exception as e:
-                    print(f"Error updating {node_type} to version {version}: {e}")
-        
-        return updated
+        return cls.migrate_node_group(node_group, force=force)
     
     @classmethod
     def _get_metadata(cls, node_group) -> Dict[str, Any]:
@@ -0,0 +1,289 @@
+"""
+Сборка мусора данных аддона, оставшихся после удаления клонеров и эффекторов.
+
+delete_cloner, CLONER_OT_delete_cloner, EFFECTOR_OT_delete_effector и
+BaseComponentController.remove удаляют группу узлов не во всех путях, а
+вложенные группы логики, коллекции cloner_* и объекты-дубликаты *_dup не
+удаляют совсем. Здесь строится граф владения:
+
+    живой объект -> модификатор -> группа узлов -> вложенные группы
+                                -> коллекции и объекты (свойства cloner_collection,
+                                   duplicate_obj, ... и ID-входы сокетов)
+    коллекция -> объекты и дочерние коллекции
+
+Корни графа - все используемые объекты, кроме дубликатов аддона, группы узлов
+не аддона и группы с fake user. Данные аддона, число ссылок на которые от
+достижимых владельцев равно нулю, удаляются одним вызовом bpy.data.batch_remove.
+Коллекции аддона отмечаются свойством ADDON_COLLECTION_PROP при создании; по имени
+коллекция не считается принадлежащей аддону. Коллекция, в которой остались чужие
+объекты, не удаляется.
+
+Операции удаления вызывают schedule_garbage_collection: серия удалений дает
+один проход сборки в таймере.
+"""
+
+import bpy
+
+from .node_dedup import is_addon_node_group
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Свойства модификатора, хранящие имена объектов
+MODIFIER_OBJECT_KEYS = ("original_object", "previous_cloner_object", "duplicate_obj")
+
+# Свойства модификатора, хранящие имена коллекций
+MODIFIER_COLLECTION_KEYS = ("original_collection", "chain_source_collection", "cloner_collection",
+                            "duplicate_collection")
+
+# Свойство коллекции, созданной аддоном
+ADDON_COLLECTION_PROP = "cloner_addon_collection"
+
+# Свойства модификатора с коллекциями, которые создает аддон
+ADDON_COLLECTION_KEYS = ("cloner_collection", "duplicate_collection")
+
+# Задержка сборки после удаления компонента, с
+GC_DELAY = 0.5
+
+
+def mark_addon_collection(collection):
+    """Отмечает коллекцию как созданную аддоном (клонеры и дубликаты)."""
+    collection[ADDON_COLLECTION_PROP] = True
+
+
+def is_addon_collection(collection):
+    """Коллекция создана аддоном (клонеры и дубликаты)."""
+    return bool(collection.get(ADDON_COLLECTION_PROP)) and collection.library is None
+
+
+def mark_legacy_collections():
+    """
+    Отмечает коллекции файлов, сохраненных до появления ADDON_COLLECTION_PROP:
+    коллекции из свойств ADDON_COLLECTION_KEYS модификаторов клонеров.
+
+    Returns:
+        int: Число отмеченных коллекций
+    """
+    marked = 0
+    for obj in bpy.data.objects:
+        for mod in obj.modifiers:
+            if mod.type != 'NODES':
+                continue
+            for key in ADDON_COLLECTION_KEYS:
+                collection = bpy.data.collections.get(mod.get(key) or "")
+                if (collection is not None and collection.library is None
+                        and not collection.get(ADDON_COLLECTION_PROP)):
+                    mark_addon_collection(collection)
+                    marked += 1
+    return marked
+
+
+def is_addon_duplicate(obj):
+    """Объект - дубликат меша, созданный duplicator.get_mesh_duplicate."""
+    return "original_obj" in obj and obj.library is None
+
+
+def _id_key(id_data):
+    return (type(id_data).__name__, id_data.name)
+
+
+def _socket_ids(node_group):
+    """ID-значения входов узлов (Object Info, Collection Info, ...)."""
+    for node in node_group.nodes:
+        for socket in node.inputs:
+            value = getattr(socket, "default_value", None)
+            if isinstance(value, bpy.types.ID):
+                yield value
+
+
+def _modifier_refs(mod):
+    """
+    Данные, на которые ссылается модификатор.
+
+    Returns:
+        list: ID-блоки
+    """
+    refs = []
+    node_group = getattr(mod, "node_group", None)
+    if node_group is not None:
+        refs.append(node_group)
+
+    for key in mod.keys():
+        value = mod[key]
+        if isinstance(value, bpy.types.ID):
+            refs.append(value)
+        elif isinstance(value, str) and value:
+            if key in MODIFIER_OBJECT_KEYS and value in bpy.data.objects:
+                refs.append(bpy.data.objects[value])
+            elif key in MODIFIER_COLLECTION_KEYS and value in bpy.data.collections:
+                refs.append(bpy.data.collections[value])
+    return refs
+
+
+def _owned(id_data):
+    """Ребра графа владения из ID-блока."""
+    if isinstance(id_data, bpy.types.Object):
+        refs = []
+        for mod in id_data.modifiers:
+            refs.extend(_modifier_refs(mod))
+        return refs
+    if isinstance(id_data, bpy.types.NodeTree):
+        refs = [node.node_tree for node in id_data.nodes
+                if getattr(node, "node_tree", None) is not None]
+        refs.extend(_socket_ids(id_data))
+        return refs
+    if isinstance(id_data, bpy.types.Collection):
+        refs = list(id_data.objects) + list(id_data.children)
+        source = id_data.get("parent_cloner_collection")
+        if source and source in bpy.data.collections:
+            refs.append(bpy.data.collections[source])
+        return refs
+    return []
+
+
+def _candidates():
+    """Данные аддона, которые можно удалить: {ключ: ID}."""
+    candidates = {}
+    for node_group in bpy.data.node_groups:
+        if (node_group.bl_idname == 'GeometryNodeTree' and is_addon_node_group(node_group)
+                and not node_group.use_fake_user and node_group.library is None):
+            candidates[_id_key(node_group)] = node_group
+    for collection in bpy.data.collections:
+        if is_addon_collection(collection):
+            candidates[_id_key(collection)] = collection
+    for obj in bpy.data.objects:
+        if is_addon_duplicate(obj):
+            candidates[_id_key(obj)] = obj
+    return candidates
+
+
+def _roots(candidates):
+    roots = [obj for obj in bpy.data.objects if obj.users > 0 and _id_key(obj) not in candidates]
+    roots.extend(ng for ng in bpy.data.node_groups if _id_key(ng) not in candidates)
+    return roots
+
+
+def find_garbage():
+    """
+    Ищет данные аддона, недостижимые из корней графа владения.
+
+    Returns:
+        dict: {"node_groups", "collections", "objects", "meshes"} - списки ID-блоков
+    """
+    candidates = _candidates()
+
+    # Счетчик ссылок от достижимых владельцев; обход от корней
+    refcount = dict.fromkeys(candidates, 0)
+    visited = set()
+    queue = _roots(candidates)
+    while queue:
+        id_data = queue.pop()
+        key = _id_key(id_data)
+        if key in visited:
+            continue
+        visited.add(key)
+        for ref in _owned(id_data):
+            ref_key = _id_key(ref)
+            if ref_key in refcount:
+                refcount[ref_key] += 1
+            if ref_key not in visited:
+                queue.append(ref)
+
+    garbage_keys = {key for key, count in refcount.items() if count == 0}
+
+    objects = [candidates[key] for key in garbage_keys if isinstance(candidates[key], bpy.types.Object)]
+    garbage_objects = {obj.name for obj in objects}
+
+    collections = []
+    for key in garbage_keys:
+        collection = candidates[key]
+        if not isinstance(collection, bpy.types.Collection):
+            continue
+        # Коллекция с чужими объектами или дочерними коллекциями остается
+        foreign = [o for o in collection.all_objects if o.name not in garbage_objects]
+        children = [c for c in collection.children_recursive if _id_key(c) not in garbage_keys]
+        if not foreign and not children:
+            collections.append(collection)
+
+    node_groups = [candidates[key] for key in garbage_keys if isinstance(candidates[key], bpy.types.NodeTree)]
+
+    # Меши удаляемых дубликатов и меши удаленных объектов клонеров без пользователей
+    meshes = []
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data is not None and obj.data.users == 1:
+            meshes.append(obj.data)
+    for mesh in bpy.data.meshes:
+        if mesh.users == 0 and mesh.name.startswith("Cloner_") and mesh.name.endswith("_Mesh"):
+            meshes.append(mesh)
+
+    return {
+        "node_groups": sorted(node_groups, key=lambda i: i.name),
+        "collections": sorted(collections, key=lambda i: i.name),
+        "objects": sorted(objects, key=lambda i: i.name),
+        "meshes": sorted(meshes, key=lambda i: i.name),
+    }
+
+
+def _forget_duplicates(object_names):
+    """Удаляет ссылки на удаляемые дубликаты из кэшей duplicator."""
+    from . import duplicator
+
+    for key, (obj, _collection) in list(duplicator.mesh_duplicates_cache.items()):
+        try:
+            if obj.name in object_names:
+                duplicator.mesh_duplicates_cache.pop(key, None)
+        except ReferenceError:
+            duplicator.mesh_duplicates_cache.pop(key, None)
+
+    for name in object_names:
+        duplicator.cloner_hierarchy_map.pop(name, None)
+    for name, chain in duplicator.cloner_hierarchy_map.items():
+        duplicator.cloner_hierarchy_map[name] = [e for e in chain if e.get("duplicate") not in object_names]
+
+
+def collect_garbage(dry_run=False):
+    """
+    Удаляет недостижимые данные аддона за один проход.
+
+    Args:
+        dry_run: Только найти мусор, ничего не удалять
+
+    Returns:
+        dict: {тип: [имена]} для "node_groups", "collections", "objects", "meshes"
+    """
+    garbage = find_garbage()
+    report = {kind: [id_data.name for id_data in ids] for kind, ids in garbage.items()}
+    total = sum(len(names) for names in report.values())
+    if not total or dry_run:
+        if total:
+            log.info("Orphan GC (dry run): %s", ", ".join(f"{len(v)} {k}" for k, v in report.items() if v))
+        return report
+
+    _forget_duplicates(set(report["objects"]))
+    ids = [id_data for kind in ("objects", "meshes", "collections", "node_groups") for id_data in garbage[kind]]
+    try:
+        bpy.data.batch_remove(ids)
+    except Exception as e:
+        log.error("Orphan GC batch remove failed: %s", e)
+        return {kind: [] for kind in report}
+
+    log.info("Orphan GC: %s", ", ".join(f"{len(v)} {k}" for k, v in report.items() if v))
+    return report
+
+
+def _collect_garbage_timer():
+    try:
+        collect_garbage()
+    except Exception as e:
+        log.error("Orphan GC failed: %s", e)
+    return None
+
+
+def schedule_garbage_collection():
+    """
+    Откладывает сборку мусора на GC_DELAY секунд после последнего удаления,
+    чтобы несколько удалений подряд давали один обход графа владения.
+    """
+    if bpy.app.timers.is_registered(_collect_garbage_timer):
+        bpy.app.timers.unregister(_collect_garbage_timer)
+    bpy.app.timers.register(_collect_garbage_timer, first_interval=GC_DELAY)
@@ -0,0 +1,470 @@
+"""
+Библиотека пресетов для клонеров, эффекторов и полей.
+
+Все пресеты одного типа хранятся в одном упакованном файле:
+первая строка - JSON-индекс (имя -> смещение, длина, теги),
+далее - конкатенация JSON-блоков пресетов без переводов строк.
+Индекс загружается в память целиком, а сами пресеты декодируются
+только при обращении к ним.
+"""
+
+import bisect
+import json
+import os
+from typing import Dict, List, Any, Optional, Iterable
+
+from .config_utils import get_addon_path, write_json_async, CONFIG_DIR
+
+from .logging_utils import get_logger
+
+log = get_logger("config")
+
+# Директория с упакованными библиотеками пресетов
+PRESETS_DIR = os.path.join(CONFIG_DIR, "presets")
+
+# Версия формата упакованного файла
+PRESET_FORMAT_VERSION = 1
+
+# Поддерживаемые типы конфигураций
+PRESET_CONFIG_TYPES = ('cloners', 'effectors', 'fields')
+
+
+class PresetStore:
+    """
+    Индексированное хранилище пресетов одного типа конфигурации.
+    Поиск по префиксу имени и по тегам выполняется по индексу в памяти.
+    """
+
+    def __init__(self, config_type: str):
+        self.config_type = config_type
+        # Индекс: имя -> {"offset", "length", "tags", "component_type"}
+        self._index = {}
+        # Отсортированный список имён для поиска по префиксу
+        self._names = []
+        # Обратный индекс: тег -> множество имён
+        self._tag_index = {}
+        # Упакованные данные пресетов (байты после строки индекса)
+        self._blob = b""
+        # Уже декодированные пресеты
+        self._decoded = {}
+        # Изменённые, но ещё не упакованные пресеты
+        self._dirty = {}
+        self._loaded = False
+
+    @property
+    def file_path(self) -> str:
+        """Путь к упакованному файлу библиотеки."""
+        return os.path.join(get_addon_path(), PRESETS_DIR, f"{self.config_type}.presets")
+
+    def load(self, force: bool = False) -> bool:
+        """
+        Загружает индекс и упакованные данные из файла. Пресеты не декодируются.
+
+        Args:
+            force: Перечитать файл, даже если библиотека уже загружена
+
+        Returns:
+            bool: True, если библиотека загружена (отсутствующий файл - пустая библиотека)
+        """
+        if self._loaded and not force:
+            return True
+
+        try:
+            library = read_library(self.file_path)
+        except Exception as e:
+            self._set_library(None)
+            log.error("Error loading preset library %s: %s", self.file_path, e)
+            return False
+
+        self._set_library(library)
+        if library is not None and library["version"] != PRESET_FORMAT_VERSION:
+            log.debug("Unsupported preset library version in %s: %s", self.file_path, library["version"])
+            return False
+        return True
+
+    def load_async(self):
+        """
+        Читает файл и строит индекс в пуле рабочих потоков.
+        Если библиотека успеет загрузиться синхронно, результат отбрасывается.
+
+        Returns:
+            Task: Задача пула или None, если библиотека уже загружена
+        """
+        if self._loaded:
+            return None
+
+        from . import worker_pool
+
+        def on_done(task):
+            if self._loaded or task.error is not None:
+                return
+            self._set_library(task.result)
+            log.debug("Preset library '%s' indexed: %s presets", self.config_type, len(self._index))
+
+        return worker_pool.submit(read_library, self.file_path, on_done=on_done,
+                                  name=f"index {self.config_type} presets")
+
+    def _set_library(self, library: Optional[Dict[str, Any]]) -> None:
+        """
+        Заменяет содержимое библиотеки результатом read_library.
+
+        Args:
+            library: Результат read_library или None для пустой библиотеки
+        """
+        self._index = {}
+        self._names = []
+        self._tag_index = {}
+        self._blob = b""
+        self._decoded = {}
+        self._dirty = {}
+        self._loaded = True
+
+        if library is None or library["version"] != PRESET_FORMAT_VERSION:
+            return
+        self._index = library["index"]
+        self._names = library["names"]
+        self._tag_index = library["tag_index"]
+        self._blob = library["blob"]
+
+    def _add_to_index(self, name: str, entry: Dict[str, Any]) -> None:
+        """
+        Добавляет запись в индексы имён и тегов.
+
+        Args:
+            name: Имя пресета
+            entry: Запись индекса
+        """
+        if name in self._index:
+            self._remove_from_index(name)
+
+        self._index[name] = entry
+        bisect.insort(self._names, name)
+        for tag in entry.get("tags", []):
+            self._tag_index.setdefault(tag.lower(), set()).add(name)
+
+    def _remove_from_index(self, name: str) -> None:
+        """
+        Удаляет запись из индексов имён и тегов.
+
+        Args:
+            name: Имя пресета
+        """
+        entry = self._index.pop(name, None)
+        if entry is None:
+            return
+
+        i = bisect.bisect_left(self._names, name)
+        if i < len(self._names) and self._names[i] == name:
+            del self._names[i]
+
+        for tag in entry.get("tags", []):
+            names = self._tag_index.get(tag.lower())
+            if names:
+                names.discard(name)
+                if not names:
+                    del self._tag_index[tag.lower()]
+
+    def __contains__(self, name: str) -> bool:
+        self.load()
+        return name in self._index
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._index)
+
+    def names(self) -> List[str]:
+        """Возвращает отсортированный список имён пресетов."""
+        self.load()
+        return list(self._names)
+
+    def tags(self) -> List[str]:
+        """Возвращает отсортированный список всех тегов."""
+        self.load()
+        return sorted(self._tag_index)
+
+    def get_info(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает метаданные пресета без декодирования его параметров.
+
+        Args:
+            name: Имя пресета
+
+        Returns:
+            dict: {"name", "component_type", "tags"} или None
+        """
+        self.load()
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        return {
+            "name": name,
+            "component_type": entry.get("component_type", ""),
+            "tags": list(entry.get("tags", []))
+        }
+
+    def search(self, prefix: str = "", tags: Optional[Iterable[str]] = None,
+               component_type: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Ищет пресеты по префиксу имени и тегам без декодирования данных.
+
+        Args:
+            prefix: Префикс имени (пустая строка - все пресеты)
+            tags: Теги, которые должны присутствовать у пресета (все сразу)
+            component_type: Тип компонента (например, 'GRID') или None
+            limit: Максимальное количество результатов
+
+        Returns:
+            list: Отсортированный список имён найденных пресетов
+        """
+        self.load()
+
+        # Диапазон имён с заданным префиксом в отсортированном списке
+        start = bisect.bisect_left(self._names, prefix)
+        if prefix:
+            end = bisect.bisect_left(self._names, prefix + "\uffff", lo=start)
+        else:
+            end = len(self._names)
+
+        candidates = None
+        if tags:
+            for tag in tags:
+                names = self._tag_index.get(tag.lower(), set())
+                candidates = set(names) if candidates is None else candidates & names
+                if not candidates:
+                    return []
+
+        result = []
+        for name in self._names[start:end]:
+            if candidates is not None and name not in candidates:
+                continue
+            if component_type and self._index[name].get("component_type") != component_type:
+                continue
+            result.append(name)
+            if limit is not None and len(result) >= limit:
+                break
+
+        return result
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает параметры пресета, декодируя только его блок данных.
+
+        Args:
+            name: Имя пресета
+
+        Returns:
+            dict: Параметры пресета или None, если пресет не найден
+        """
+        self.load()
+
+        if name in self._dirty:
+            return self._dirty[name]
+        if name in self._decoded:
+            return self._decoded[name]
+
+        entry = self._index.get(name)
+        if entry is None or "offset" not in entry:
+            return None
+
+        raw = self._blob[entry["offset"]:entry["offset"] + entry["length"]]
+        try:
+            config = json.loads(raw.decode('utf-8'))
+        except Exception as e:
+            log.error("Error decoding preset %s: %s", name, e)
+            return None
+
+        self._decoded[name] = config
+        return config
+
+    def put(self, name: str, config: Dict[str, Any], component_type: str = "",
+            tags: Optional[Iterable[str]] = None) -> None:
+        """
+        Добавляет или заменяет пресет. Изменения попадают в файл при вызове save().
+
+        Args:
+            name: Имя пресета
+            config: Параметры пресета (имя сокета -> значение)
+            component_type: Тип компонента (например, 'GRID')
+            tags: Теги для поиска
+        """
+        self.load()
+        self._decoded.pop(name, None)
+        self._dirty[name] = dict(config)
+        self._add_to_index(name, {
+            "component_type": component_type,
+            "tags": sorted({t for t in (tags or [])})
+        })
+
+    def remove(self, name: str) -> bool:
+        """
+        Удаляет пресет из библиотеки. Изменения попадают в файл при вызове save().
+
+        Args:
+            name: Имя пресета
+
+        Returns:
+            bool: True, если пресет был удален
+        """
+        self.load()
+        if name not in self._index:
+            return False
+
+        self._remove_from_index(name)
+        self._decoded.pop(name, None)
+        self._dirty.pop(name, None)
+        return True
+
+    def _pack(self) -> tuple:
+        """
+        Упаковывает библиотеку: неизменённые пресеты копируются как есть,
+        изменённые сериализуются заново.
+
+        Returns:
+            tuple: (заголовок, упакованные данные, новый индекс)
+        """
+        chunks = []
+        index = {}
+        offset = 0
+
+        for name in self._names:
+            entry = self._index[name]
+            if name in self._dirty:
+                raw = json.dumps(self._dirty[name], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            else:
+                raw = self._blob[entry["offset"]:entry["offset"] + entry["length"]]
+
+            chunks.append(raw)
+            index[name] = {
+                "offset": offset,
+                "length": len(raw),
+                "component_type": entry.get("component_type", ""),
+                "tags": list(entry.get("tags", []))
+            }
+            offset += len(raw)
+
+        header = {
+            "version": PRESET_FORMAT_VERSION,
+            "config_type": self.config_type,
+            "presets": index
+        }
+        return header, b"".join(chunks), index
+
+    def save(self, callback=None) -> bool:
+        """
+        Упаковывает библиотеку и ставит её атомарную запись в фоновый поток.
+        Индекс в памяти сразу переключается на новые смещения.
+
+        Args:
+            callback: Функция callback(file_path, success), вызываемая в главном потоке после записи
+
+        Returns:
+            bool: True, если запись поставлена в очередь
+        """
+        self.load()
+
+        header, blob, index = self._pack()
+
+        # Данные пресетов не содержат переводов строк, поэтому байтовые смещения
+        # сохраняются при записи в текстовом режиме
+        payload = json.dumps(header, ensure_ascii=False, separators=(',', ':')) + "\n" + blob.decode('utf-8')
+
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        if not write_json_async(self.file_path, payload, callback):
+            return False
+
+        self._blob = blob
+        for name, entry in index.items():
+            self._index[name] = entry
+        self._decoded.update(self._dirty)
+        self._dirty = {}
+        return True
+
+
+def read_library(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Читает упакованный файл и строит индексы имён и тегов.
+    Не обращается к bpy и выполняется в том числе в пуле рабочих потоков.
+
+    Args:
+        file_path: Путь к упакованному файлу
+
+    Returns:
+        dict: {"version", "index", "names", "tag_index", "blob"} или None, если файла нет
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, 'rb') as f:
+        header = json.loads(f.readline().decode('utf-8'))
+        blob = f.read()
+
+    index = dict(header.get("presets", {}))
+    tag_index = {}
+    for name, entry in index.items():
+        for tag in entry.get("tags", []):
+            tag_index.setdefault(tag.lower(), set()).add(name)
+
+    return {
+        "version": header.get("version"),
+        "index": index,
+        "names": sorted(index),
+        "tag_index": tag_index,
+        "blob": blob
+    }
+
+
+# Загруженные библиотеки по типам конфигураций
+_preset_stores = {}
+
+
+def get_preset_store(config_type: str) -> Optional[PresetStore]:
+    """
+    Возвращает библиотеку пресетов для указанного типа конфигурации.
+
+    Args:
+        config_type: Тип конфигурации ('cloners', 'effectors', 'fields')
+
+    Returns:
+        PresetStore: Библиотека пресетов или None для неизвестного типа
+    """
+    if config_type not in PRESET_CONFIG_TYPES:
+        log.debug("Unknown config type: %s", config_type)
+        return None
+
+    store = _preset_stores.get(config_type)
+    if store is None:
+        store = PresetStore(config_type)
+        _preset_stores[config_type] = store
+    return store
+
+
+def load_preset(config_type: str, preset_name: str) -> Dict[str, Any]:
+    """
+    Загружает параметры пресета по имени.
+
+    Args:
+        config_type: Тип конфигурации ('cloners', 'effectors', 'fields')
+        preset_name: Имя пресета
+
+    Returns:
+        dict: Параметры пресета или пустой словарь, если пресет не найден
+    """
+    store = get_preset_store(config_type)
+    if store is None:
+        return {}
+    return store.get(preset_name) or {}
+
+
+def preload_preset_stores() -> None:
+    """
+    Индексирует библиотеки пресетов всех типов в пуле рабочих потоков.
+    """
+    for config_type in PRESET_CONFIG_TYPES:
+        get_preset_store(config_type).load_async()
+
+
+def clear_preset_stores() -> None:
+    """
+    Сбрасывает загруженные библиотеки пресетов.
+    """
+    _preset_stores.clear()
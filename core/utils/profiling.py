@@ -0,0 +1,216 @@
+"""
+Профилирование операторов и обработчиков аддона с экспортом в формат Chrome trace.
+
+Интервалы (span) записываются декоратором profiled или контекстным менеджером
+profile_span и вкладываются друг в друга по времени. Файл, записанный
+write_chrome_trace, открывается в chrome://tracing или https://ui.perfetto.dev.
+
+Профилирование включается в настройках аддона. В выключенном состоянии
+декоратор стоит одну проверку флага на вызов.
+
+Счетчик rna_calls (опция count_rna_calls) считает вызовы, видимые профайлеру Python:
+методы bpy_struct и bpy_prop_collection (get, keys, foreach_get, ...) и вызовы bpy.ops.
+Функции RNA, вызываемые через bpy_func (modifiers.new, update_tag), Python 3.11
+не сообщает профайлеру, поэтому они не учитываются.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Максимальное число хранимых событий; старые события вытесняются
+MAX_EVENTS = 200000
+
+_enabled = False
+_count_rna_calls = False
+
+_events = deque(maxlen=MAX_EVENTS)
+_depth = 0
+_rna_calls = 0
+_previous_profile_hook = None
+_hook_installed = False
+_origin = time.perf_counter()
+
+_BPY_OPS_SUFFIX = os.path.join("bpy", "ops.py")
+
+
+def set_enabled(enabled: bool, count_rna_calls: bool = False) -> None:
+    """
+    Включает или выключает запись интервалов.
+
+    Args:
+        enabled: Записывать интервалы
+        count_rna_calls: Подсчитывать вызовы API Blender внутри интервалов
+    """
+    global _enabled, _count_rna_calls
+    _enabled = bool(enabled)
+    _count_rna_calls = bool(enabled and count_rna_calls)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _rna_call_hook(frame, event, arg):
+    """Хук sys.setprofile: считает вызовы методов bpy-объектов и операторов bpy.ops."""
+    global _rna_calls
+    if event == 'c_call':
+        owner = getattr(arg, "__self__", None)
+        if owner is not None:
+            # Типы RNA живут в bpy.types, коллекции и массивы - встроенные bpy_prop_*
+            owner_type = type(owner)
+            if owner_type.__module__.startswith("bpy") or owner_type.__name__.startswith("bpy_"):
+                _rna_calls += 1
+    elif event == 'call' and frame.f_code.co_name == "__call__" and frame.f_code.co_filename.endswith(_BPY_OPS_SUFFIX):
+        _rna_calls += 1
+
+
+def _begin():
+    global _depth, _previous_profile_hook, _hook_installed
+    if _depth == 0 and _count_rna_calls:
+        _previous_profile_hook = sys.getprofile()
+        sys.setprofile(_rna_call_hook)
+        _hook_installed = True
+    _depth += 1
+    return time.perf_counter(), _rna_calls
+
+
+def _end(name, category, start, rna_start, args):
+    global _depth, _previous_profile_hook, _hook_installed
+    end = time.perf_counter()
+    rna_calls = _rna_calls - rna_start
+    counted = _hook_installed
+
+    _depth -= 1
+    if _depth == 0 and _hook_installed:
+        sys.setprofile(_previous_profile_hook)
+        _previous_profile_hook = None
+        _hook_installed = False
+
+    event_args = dict(args) if args else {}
+    if counted:
+        event_args["rna_calls"] = rna_calls
+
+    _events.append({
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": (start - _origin) * 1e6,
+        "dur": (end - start) * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": event_args,
+    })
+
+
+@contextmanager
+def profile_span(name, category="addon", **args):
+    """
+    Записывает интервал выполнения блока кода.
+
+    Args:
+        name: Имя интервала
+        category: Категория (operator, handler, effector, ...)
+        **args: Дополнительные поля события
+    """
+    if not _enabled:
+        yield
+        return
+
+    start, rna_start = _begin()
+    try:
+        yield
+    finally:
+        _end(name, category, start, rna_start, args)
+
+
+def profiled(name=None, category="addon"):
+    """
+    Декоратор: записывает интервал на каждый вызов функции.
+    Для обработчиков bpy.app.handlers применяется под @persistent.
+    Методы классов Blender (execute, draw) оборачивать нельзя: при регистрации
+    проверяется число аргументов, поэтому в них используется profile_span.
+
+    Args:
+        name: Имя интервала (по умолчанию - квалифицированное имя функции)
+        category: Категория интервала
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start, rna_start = _begin()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _end(span_name, category, start, rna_start, None)
+
+        return wrapper
+    return decorator
+
+
+def get_events():
+    """Возвращает копию записанных событий."""
+    return list(_events)
+
+
+def clear_events() -> None:
+    """Удаляет записанные события."""
+    _events.clear()
+
+
+def build_chrome_trace() -> dict:
+    """
+    Собирает данные Chrome trace-event из записанных событий.
+    Результат - обычные данные Python, их можно записать в фоновом потоке.
+
+    Returns:
+        dict: Данные trace с ключом traceEvents
+    """
+    events = get_events()
+    pid = os.getpid()
+    metadata = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "Blender"}}]
+    for tid in sorted({event["tid"] for event in events}):
+        thread_name = "main" if tid == threading.main_thread().ident else f"thread {tid}"
+        metadata.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+
+    return {
+        "traceEvents": metadata + events,
+        "displayTimeUnit": "ms",
+        "otherData": {"generator": "advanced_cloners", "rna_calls": _count_rna_calls},
+    }
+
+
+def dump_trace(filepath, data) -> None:
+    """Записывает данные build_chrome_trace в файл. Не обращается к bpy."""
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def write_chrome_trace(filepath) -> int:
+    """
+    Записывает события в JSON формата Chrome trace-event.
+
+    Args:
+        filepath: Путь к файлу
+
+    Returns:
+        int: Количество записанных интервалов
+    """
+    data = build_chrome_trace()
+    dump_trace(filepath, data)
+    count = sum(1 for event in data["traceEvents"] if event["ph"] != "M")
+    log.info("Profiling trace written to %s (%s spans)", filepath, count)
+    return count
@@ -8,6 +8,11 @@ import json
 from typing import Dict, List, Any, Optional, Union, Tuple
 from mathutils import Vector
 
+from ..modifiers import place_modifier_after
+from ..logging_utils import get_logger
+
+log = get_logger("core")
+
 
 class ComponentController:
     """
@@ -28,7 +33,7 @@ class ComponentController:
             controller_class: Класс контроллера
         """
         cls._registered_controllers[controller_id] = controller_class
-        print(f"Registered controller: {controller_id}")
+        log.debug("Registered controller: %s", controller_id)
     
     @classmethod
     def create_controller(cls, obj, target_modifier, controller_id: str, **kwargs):
@@ -46,7 +51,7 @@ class ComponentController:
                  или (None, None) в случае ошибки
         """
         if controller_id not in cls._registered_controllers:
-            print(f"Unknown controller type: {controller_id}")
+            log.debug("Unknown controller type: %s", controller_id)
             return None, None
         
         try:
@@ -77,7 +82,7 @@ class ComponentController:
                 return mod, node_group
                 
         except Exception as e:
-            print(f"Error creating controller: {e}")
+            log.error("Error creating controller: %s", e)
         
         return None, None
     
@@ -170,17 +175,8 @@ class BaseComponentController:
         # Устанавливаем группу узлов для модификатора
         mod.node_group = node_group
         
-        # Перемещаем модификатор в нужную позицию в стеке
-        # (рядом с целевым модификатором)
-        target_index = cls._get_modifier_index(obj, target_modifier)
-        current_index = cls._get_modifier_index(obj, mod)
-        
-        # Перемещаем контроллер после целевого модификатора
-        if current_index < target_index:
-            # Контроллер находится выше целевого - перемещаем вниз
-            steps = target_index - current_index
-            for _ in range(steps):
-                bpy.ops.object.modifier_move_down({"object": obj}, modifier=mod.name)
+        # Ставим контроллер сразу после целевого модификатора
+        place_modifier_after(obj, mod, target_modifier)
         
         return mod, node_group
     
@@ -222,11 +218,15 @@ class BaseComponentController:
             # Если группа узлов больше не используется, удаляем её
             if node_group and node_group.users == 0:
                 bpy.data.node_groups.remove(node_group)
+
+            # Вложенные группы и другие данные удаленного компонента
+            from ..orphan_gc import schedule_garbage_collection
+            schedule_garbage_collection()
             
             return True
             
         except Exception as e:
-            print(f"Error removing controller: {e}")
+            log.error("Error removing controller: %s", e)
             return False
     
     @classmethod
@@ -274,7 +274,7 @@ class BaseComponentController:
             return node_group
             
         except Exception as e:
-            print(f"Error creating controller node group: {e}")
+            log.error("Error creating controller node group: %s", e)
             return None
     
     @classmethod
@@ -1,231 +1,694 @@
 """
 Менеджер зависимостей для компонентов аддона.
 Управляет связями между клонерами, эффекторами и полями.
+
+Граф связей - единственный источник истины. Узлы графа - стабильные ключи
+(object.session_uid, modifier.persistent_uid), поэтому переименование объекта
+или модификатора не меняет граф. В памяти хранятся списки смежности в обе
+стороны: поиск клонеров эффектора и проверка связи - O(1).
+
+Граф сериализуется компактно в свойство сцены GRAPH_PROP и загружается один
+раз в load_post (и после отмены). Сохраненные связи объекта ключуются
+UUID из свойства объекта GRAPH_UID_PROP, а не именем, поэтому переименование
+объекта их не теряет. Изменение записывает в сцену только связи затронутого
+объекта, внутри транзакции - один раз при ее завершении; перед сохранением
+файла данные сцен пересобираются полностью. Свойство группы узлов
+клонера linked_effectors остается производным зеркалом: его читает сборка
+дерева узлов и по нему граф восстанавливается для объектов, которых нет в
+сохраненном графе (файлы старых версий, дубликаты объектов).
 """
 
 import bpy
+import json
+import uuid
 from typing import List, Dict, Optional, Any, Union
 
+from ..logging_utils import get_logger
+from ..transaction import in_transaction
+
+log = get_logger("core")
+
+# Свойство сцены с сериализованным графом
+GRAPH_PROP = "cloner_dependency_graph"
+
+# Свойство объекта с UUID, по которому в сцене хранятся его связи
+GRAPH_UID_PROP = "cloner_graph_uid"
+
+# Версия формата сериализации (1 - связи по имени объекта, 2 - по GRAPH_UID_PROP)
+GRAPH_FORMAT_VERSION = 2
+
+# Свойство группы узлов клонера со списком имен эффекторов (зеркало графа)
+LINKED_EFFECTORS_KEY = "linked_effectors"
+
+
+def _object_key(obj):
+    return getattr(obj, "session_uid", None) or obj.name
+
+
+def _modifier_key(mod):
+    return getattr(mod, "persistent_uid", None) or mod.name
+
+
+def component_key(obj: bpy.types.Object, mod: bpy.types.Modifier) -> tuple:
+    """
+    Стабильный ключ компонента в графе.
+
+    Returns:
+        tuple: (ключ объекта, ключ модификатора)
+    """
+    return (_object_key(obj), _modifier_key(mod))
+
+
 class ComponentDependencyManager:
     """
     Управляет связями между компонентами аддона (клонерами, эффекторами, полями).
     Отслеживает зависимости и обновляет компоненты при изменении параметров.
     """
-    
+
     def __init__(self):
-        self.cloner_effector_map = {}  # Связь клонеров с эффекторами
-        self.effector_field_map = {}   # Связь эффекторов с полями
-    
-    def link_effector_to_cloner(self, cloner_mod: bpy.types.Modifier, effector_mod: bpy.types.Modifier) -> bool:
+        # Клонер -> эффекторы; dict вместо set сохраняет порядок цепочки эффекторов
+        self._effectors = {}
+        # Эффектор -> клонеры
+        self._cloners = {}
+        # Эффектор -> поля и поле -> эффекторы
+        self._fields = {}
+        self._field_effectors = {}
+        # Ключи объектов, связи которых уже в графе
+        self._objects = set()
+        # Ключ объекта -> ключи его клонеров и эффекторов, у которых есть связи
+        self._by_object = {}
+        # UUID -> ключ объекта, которому он принадлежит (дубликаты объектов копируют UUID)
+        self._uid_owners = {}
+        # Объекты, связи которых еще не записаны в сцены: ключ объекта -> объект
+        self._dirty = {}
+        # Разобранные данные сцен: ключ сцены -> (строка свойства, данные объектов)
+        self._payloads = {}
+
+    @staticmethod
+    def _modifier(obj, mod_key) -> Optional[bpy.types.Modifier]:
+        for mod in obj.modifiers:
+            if _modifier_key(mod) == mod_key:
+                return mod
+        return None
+
+    def _names(self, obj, keys) -> List[str]:
+        names = []
+        for key in keys:
+            mod = self._modifier(obj, key[1])
+            if mod is not None:
+                names.append(mod.name)
+        return names
+
+    # Загрузка связей объекта
+
+    def ensure_object(self, obj: bpy.types.Object) -> None:
+        """
+        Добавляет в граф связи объекта из зеркал linked_effectors, если объекта
+        еще нет в графе. Только читает данные Blender, поэтому безопасна в draw().
+        """
+        obj_key = _object_key(obj)
+        if obj_key in self._objects:
+            return
+        self._objects.add(obj_key)
+
+        for mod in obj.modifiers:
+            node_group = getattr(mod, "node_group", None)
+            if mod.type != 'NODES' or node_group is None:
+                continue
+            names = node_group.get(LINKED_EFFECTORS_KEY)
+            if not names:
+                continue
+            self._set_edges(component_key(obj, mod),
+                            [component_key(obj, obj.modifiers[name]) for name in names if name in obj.modifiers])
+
+    def _index(self, key) -> None:
+        keys = self._by_object.setdefault(key[0], {})
+        if key in self._effectors or key in self._fields:
+            keys[key] = None
+        else:
+            keys.pop(key, None)
+            if not keys:
+                del self._by_object[key[0]]
+
+    def _set_edges(self, cloner_key, effector_keys) -> None:
+        for effector_key in self._effectors.pop(cloner_key, {}):
+            cloners = self._cloners.get(effector_key)
+            if cloners is not None:
+                cloners.discard(cloner_key)
+                if not cloners:
+                    del self._cloners[effector_key]
+        if effector_keys:
+            self._effectors[cloner_key] = dict.fromkeys(effector_keys)
+            for effector_key in effector_keys:
+                self._cloners.setdefault(effector_key, set()).add(cloner_key)
+        self._index(cloner_key)
+
+    def _set_field_edges(self, effector_key, field_keys) -> None:
+        for field_key in self._fields.pop(effector_key, {}):
+            effectors = self._field_effectors.get(field_key)
+            if effectors is not None:
+                effectors.discard(effector_key)
+                if not effectors:
+                    del self._field_effectors[field_key]
+        if field_keys:
+            self._fields[effector_key] = dict.fromkeys(field_keys)
+            for field_key in field_keys:
+                self._field_effectors.setdefault(field_key, set()).add(effector_key)
+        self._index(effector_key)
+
+    def _commit(self, obj, cloner_mods=()) -> None:
+        """
+        Обновляет зеркала клонеров и отмечает объект для записи в сцены.
+        Вне транзакции связи объекта записываются сразу, внутри - в flush()
+        при завершении транзакции.
+        """
+        for cloner_mod in cloner_mods:
+            self.sync_node_group(obj, cloner_mod)
+        self._dirty[_object_key(obj)] = obj
+        if not in_transaction():
+            self.flush()
+
+    # Связи клонеров и эффекторов
+
+    def set_cloner_effectors(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier,
+                             effector_names: List[str]) -> bool:
+        """
+        Заменяет список эффекторов клонера (порядок задает цепочку эффекторов).
+
+        Args:
+            obj: Объект с модификаторами
+            cloner_mod: Модификатор клонера
+            effector_names: Имена модификаторов эффекторов того же объекта
+
+        Returns:
+            bool: True, если связи изменились
+        """
+        self.ensure_object(obj)
+        cloner_key = component_key(obj, cloner_mod)
+        keys = [component_key(obj, obj.modifiers[name])
+                for name in dict.fromkeys(effector_names) if name in obj.modifiers]
+        if list(self._effectors.get(cloner_key, ())) == keys:
+            self.sync_node_group(obj, cloner_mod)
+            return False
+        self._set_edges(cloner_key, keys)
+        self._commit(obj, (cloner_mod,))
+        return True
+
+    def link_effector_to_cloner(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier,
+                                effector_mod: bpy.types.Modifier) -> bool:
         """
         Связывает эффектор с клонером.
-        
+
         Args:
+            obj: Объект с модификаторами
             cloner_mod: Модификатор клонера
             effector_mod: Модификатор эффектора
-            
+
         Returns:
             bool: True, если связь успешно создана
         """
-        if cloner_mod.name not in self.cloner_effector_map:
-            self.cloner_effector_map[cloner_mod.name] = []
-        
-        if effector_mod.name not in self.cloner_effector_map[cloner_mod.name]:
-            self.cloner_effector_map[cloner_mod.name].append(effector_mod.name)
-            return True
-        return False
-    
-    def unlink_effector_from_cloner(self, cloner_mod: bpy.types.Modifier, effector_mod: bpy.types.Modifier) -> bool:
+        names = self.get_effector_names(obj, cloner_mod)
+        if effector_mod.name in names:
+            return False
+        return self.set_cloner_effectors(obj, cloner_mod, names + [effector_mod.name])
+
+    def unlink_effector_from_cloner(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier,
+                                    effector_mod: Union[bpy.types.Modifier, str]) -> bool:
         """
         Разрывает связь эффектора с клонером.
-        
+
         Args:
+            obj: Объект с модификаторами
             cloner_mod: Модификатор клонера
-            effector_mod: Модификатор эффектора
-            
+            effector_mod: Модификатор эффектора или его имя
+
         Returns:
             bool: True, если связь успешно разорвана
         """
-        if cloner_mod.name in self.cloner_effector_map:
-            if effector_mod.name in self.cloner_effector_map[cloner_mod.name]:
-                self.cloner_effector_map[cloner_mod.name].remove(effector_mod.name)
-                return True
-        return False
-    
-    def link_field_to_effector(self, effector_mod: bpy.types.Modifier, field_mod: bpy.types.Modifier) -> bool:
+        name = effector_mod if isinstance(effector_mod, str) else effector_mod.name
+        names = self.get_effector_names(obj, cloner_mod)
+        if name not in names:
+            return False
+        return self.set_cloner_effectors(obj, cloner_mod, [n for n in names if n != name])
+
+    def is_linked(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier,
+                  effector_mod: bpy.types.Modifier) -> bool:
+        """Проверка связи клонера и эффектора за O(1)."""
+        self.ensure_object(obj)
+        return component_key(obj, effector_mod) in self._effectors.get(component_key(obj, cloner_mod), ())
+
+    def get_effector_names(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier) -> List[str]:
         """
-        Связывает поле с эффектором.
-        
+        Имена эффекторов клонера в порядке цепочки.
+
         Args:
+            obj: Объект с модификаторами
+            cloner_mod: Модификатор клонера
+
+        Returns:
+            list: Имена существующих модификаторов эффекторов
+        """
+        self.ensure_object(obj)
+        return self._names(obj, self._effectors.get(component_key(obj, cloner_mod), ()))
+
+    def get_effectors_for_cloner(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier) -> List[bpy.types.Modifier]:
+        """
+        Получает все эффекторы, связанные с клонером.
+
+        Args:
+            obj: Объект с модификаторами
+            cloner_mod: Модификатор клонера
+
+        Returns:
+            list: Список эффекторов
+        """
+        return [obj.modifiers[name] for name in self.get_effector_names(obj, cloner_mod)]
+
+    def get_cloners_for_effector(self, obj: bpy.types.Object, effector_mod: bpy.types.Modifier) -> List[bpy.types.Modifier]:
+        """
+        Клонеры, связанные с эффектором.
+
+        Args:
+            obj: Объект с модификаторами
             effector_mod: Модификатор эффектора
-            field_mod: Модификатор поля
-            
+
         Returns:
-            bool: True, если связь успешно создана
+            list: Модификаторы клонеров в порядке стека
+        """
+        self.ensure_object(obj)
+        cloner_keys = self._cloners.get(component_key(obj, effector_mod))
+        if not cloner_keys:
+            return []
+        obj_key = _object_key(obj)
+        return [mod for mod in obj.modifiers if (obj_key, _modifier_key(mod)) in cloner_keys]
+
+    def has_effectors(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier) -> bool:
+        """Есть ли у клонера связанные эффекторы."""
+        self.ensure_object(obj)
+        return bool(self._effectors.get(component_key(obj, cloner_mod)))
+
+    def sync_node_group(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier) -> bool:
         """
-        if effector_mod.name not in self.effector_field_map:
-            self.effector_field_map[effector_mod.name] = []
-        
-        if field_mod.name not in self.effector_field_map[effector_mod.name]:
-            self.effector_field_map[effector_mod.name].append(field_mod.name)
-            return True
-        return False
-    
-    def unlink_field_from_effector(self, effector_mod: bpy.types.Modifier, field_mod: bpy.types.Modifier) -> bool:
+        Записывает список имен эффекторов в linked_effectors группы клонера,
+        если он отличается (например, после переименования эффектора).
+
+        Returns:
+            bool: True, если зеркало обновлено
         """
-        Разрывает связь поля с эффектором.
-        
+        node_group = getattr(cloner_mod, "node_group", None)
+        if node_group is None:
+            return False
+        names = self.get_effector_names(obj, cloner_mod)
+        current = node_group.get(LINKED_EFFECTORS_KEY)
+        if current is not None and list(current) == names:
+            return False
+        if current is None and not names:
+            return False
+        node_group[LINKED_EFFECTORS_KEY] = names
+        return True
+
+    # Связи эффекторов и полей
+
+    def link_field_to_effector(self, obj: bpy.types.Object, effector_mod: bpy.types.Modifier,
+                               field_mod: bpy.types.Modifier) -> bool:
+        """
+        Связывает поле с эффектором.
+
         Args:
+            obj: Объект с модификаторами
             effector_mod: Модификатор эффектора
             field_mod: Модификатор поля
-            
+
         Returns:
-            bool: True, если связь успешно разорвана
+            bool: True, если связь успешно создана
         """
-        if effector_mod.name in self.effector_field_map:
-            if field_mod.name in self.effector_field_map[effector_mod.name]:
-                self.effector_field_map[effector_mod.name].remove(field_mod.name)
-                return True
-        return False
-    
-    def get_effectors_for_cloner(self, obj: bpy.types.Object, cloner_mod: bpy.types.Modifier) -> List[bpy.types.Modifier]:
+        self.ensure_object(obj)
+        effector_key = component_key(obj, effector_mod)
+        fields = list(self._fields.get(effector_key, ()))
+        field_key = component_key(obj, field_mod)
+        if field_key in fields:
+            return False
+        self._set_field_edges(effector_key, fields + [field_key])
+        self._commit(obj)
+        return True
+
+    def unlink_field_from_effector(self, obj: bpy.types.Object, effector_mod: bpy.types.Modifier,
+                                   field_mod: Optional[bpy.types.Modifier] = None) -> bool:
         """
-        Получает все эффекторы, связанные с клонером.
-        
+        Разрывает связь поля с эффектором.
+
         Args:
             obj: Объект с модификаторами
-            cloner_mod: Модификатор клонера
-            
+            effector_mod: Модификатор эффектора
+            field_mod: Модификатор поля (None - все поля эффектора)
+
         Returns:
-            list: Список эффекторов
+            bool: True, если связь успешно разорвана
         """
-        if cloner_mod.name in self.cloner_effector_map:
-            return [obj.modifiers.get(name) for name in self.cloner_effector_map[cloner_mod.name] 
-                   if name in obj.modifiers]
-        return []
-    
+        self.ensure_object(obj)
+        effector_key = component_key(obj, effector_mod)
+        fields = list(self._fields.get(effector_key, ()))
+        remaining = [] if field_mod is None else [k for k in fields if k != component_key(obj, field_mod)]
+        if len(remaining) == len(fields):
+            return False
+        self._set_field_edges(effector_key, remaining)
+        self._commit(obj)
+        return True
+
     def get_fields_for_effector(self, obj: bpy.types.Object, effector_mod: bpy.types.Modifier) -> List[bpy.types.Modifier]:
         """
         Получает все поля, связанные с эффектором.
-        
+
         Args:
             obj: Объект с модификаторами
             effector_mod: Модификатор эффектора
-            
+
         Returns:
             list: Список полей
         """
-        if effector_mod.name in self.effector_field_map:
-            return [obj.modifiers.get(name) for name in self.effector_field_map[effector_mod.name] 
-                   if name in obj.modifiers]
-        return []
-    
+        self.ensure_object(obj)
+        return [obj.modifiers[name]
+                for name in self._names(obj, self._fields.get(component_key(obj, effector_mod), ()))]
+
+    # Изменения стека модификаторов
+
     def update_after_modifier_rename(self, obj: bpy.types.Object, old_name: str, new_name: str) -> None:
         """
-        Обновляет связи после переименования модификатора.
-        
+        Обновляет зеркала клонеров после переименования модификатора.
+        Ключи графа от имени не зависят, поэтому сам граф не меняется.
+
         Args:
             obj: Объект с модификаторами
             old_name: Старое имя модификатора
             new_name: Новое имя модификатора
         """
-        # Обновление ключей в словаре клонеров
-        if old_name in self.cloner_effector_map:
-            effectors = self.cloner_effector_map.pop(old_name)
-            self.cloner_effector_map[new_name] = effectors
-        
-        # Обновление значений в словаре клонеров
-        for cloner_name, effectors in self.cloner_effector_map.items():
-            if old_name in effectors:
-                effectors.remove(old_name)
-                effectors.append(new_name)
-                self.cloner_effector_map[cloner_name] = effectors
-        
-        # Обновление ключей в словаре эффекторов
-        if old_name in self.effector_field_map:
-            fields = self.effector_field_map.pop(old_name)
-            self.effector_field_map[new_name] = fields
-        
-        # Обновление значений в словаре эффекторов
-        for effector_name, fields in self.effector_field_map.items():
-            if old_name in fields:
-                fields.remove(old_name)
-                fields.append(new_name)
-                self.effector_field_map[effector_name] = fields
-    
-    def update_after_modifier_removal(self, obj: bpy.types.Object, modifier_name: str) -> None:
-        """
-        Обновляет связи после удаления модификатора.
-        
+        mod = obj.modifiers.get(new_name)
+        if mod is None:
+            return
+        self.ensure_object(obj)
+        key = component_key(obj, mod)
+        affected = set(self._cloners.get(key, ()))
+        if key in self._effectors:
+            affected.add(key)
+        for cloner_key in affected:
+            cloner_mod = self._modifier(obj, cloner_key[1])
+            if cloner_mod is not None:
+                self.sync_node_group(obj, cloner_mod)
+
+    def update_after_modifier_removal(self, obj: bpy.types.Object, modifier_name: str = None) -> None:
+        """
+        Удаляет из графа модификаторы объекта, которых больше нет в стеке.
+
         Args:
             obj: Объект с модификаторами
-            modifier_name: Имя удаляемого модификатора
-        """
-        # Удаление из словаря клонеров
-        if modifier_name in self.cloner_effector_map:
-            del self.cloner_effector_map[modifier_name]
-        
-        # Удаление из значений в словаре клонеров
-        for cloner_name, effectors in list(self.cloner_effector_map.items()):
-            if modifier_name in effectors:
-                effectors.remove(modifier_name)
-                self.cloner_effector_map[cloner_name] = effectors
-        
-        # Удаление из словаря эффекторов
-        if modifier_name in self.effector_field_map:
-            del self.effector_field_map[modifier_name]
-        
-        # Удаление из значений в словаре эффекторов
-        for effector_name, fields in list(self.effector_field_map.items()):
-            if modifier_name in fields:
-                fields.remove(modifier_name)
-                self.effector_field_map[effector_name] = fields
-    
-    def save_to_object(self, obj: bpy.types.Object) -> None:
-        """
-        Сохраняет данные зависимостей в объекте для последующего восстановления.
-        
-        Args:
-            obj: Объект для сохранения данных
-        """
-        import json
-        
-        # Преобразуем словари в строки JSON
-        cloner_data = json.dumps(self.cloner_effector_map)
-        effector_data = json.dumps(self.effector_field_map)
-        
-        # Сохраняем данные в кастомных свойствах объекта
-        obj["cloner_effector_map"] = cloner_data
-        obj["effector_field_map"] = effector_data
-    
-    def load_from_object(self, obj: bpy.types.Object) -> None:
-        """
-        Загружает данные зависимостей из объекта.
-        
-        Args:
-            obj: Объект для загрузки данных
+            modifier_name: Имя удаленного модификатора (для совместимости, не используется)
         """
-        import json
-        
-        # Загружаем данные из кастомных свойств объекта
-        if "cloner_effector_map" in obj:
-            try:
-                self.cloner_effector_map = json.loads(obj["cloner_effector_map"])
-            except:
-                self.cloner_effector_map = {}
-        
-        if "effector_field_map" in obj:
+        self.ensure_object(obj)
+        obj_key = _object_key(obj)
+        present = {_modifier_key(mod) for mod in obj.modifiers}
+
+        def gone(key):
+            return key[0] == obj_key and key[1] not in present
+
+        affected = []
+        for cloner_key, effector_keys in list(self._effectors.items()):
+            if gone(cloner_key) or any(gone(k) for k in effector_keys):
+                self._set_edges(cloner_key, [] if gone(cloner_key) else [k for k in effector_keys if not gone(k)])
+                affected.append(cloner_key)
+        changed = bool(affected)
+        for effector_key, field_keys in list(self._fields.items()):
+            if gone(effector_key) or any(gone(k) for k in field_keys):
+                self._set_field_edges(effector_key, [] if gone(effector_key) else [k for k in field_keys if not gone(k)])
+                changed = True
+        if changed:
+            cloners = [self._modifier(obj, key[1]) for key in affected if not gone(key)]
+            self._commit(obj, cloners)
+
+    # Сериализация
+
+    def _object_data(self, obj_key) -> Dict[str, Any]:
+        effectors = []
+        fields = []
+        for key in self._by_object.get(obj_key, ()):
+            if key in self._effectors:
+                effectors.append([key[1]] + [k[1] for k in self._effectors[key]])
+            if key in self._fields:
+                fields.append([key[1]] + [k[1] for k in self._fields[key]])
+        data = {}
+        if effectors:
+            data["e"] = effectors
+        if fields:
+            data["f"] = fields
+        return data
+
+    def _object_uid(self, obj, obj_key) -> Optional[str]:
+        """
+        UUID объекта для сохраненного графа. Дубликат объекта копирует свойство
+        вместе с UUID оригинала, поэтому занятый другим объектом UUID заменяется.
+
+        Returns:
+            str: UUID или None, если свойство объекта нельзя записать (связанные данные)
+        """
+        uid = obj.get(GRAPH_UID_PROP)
+        if uid and self._uid_owners.setdefault(uid, obj_key) == obj_key:
+            return uid
+        uid = uuid.uuid4().hex
+        try:
+            obj[GRAPH_UID_PROP] = uid
+        except (AttributeError, TypeError, RuntimeError):
+            return None
+        self._uid_owners[uid] = obj_key
+        return uid
+
+    def _write(self, scene, entries) -> None:
+        payload = json.dumps({"v": GRAPH_FORMAT_VERSION, "o": entries}, separators=(',', ':')) if entries else None
+        if payload is None:
+            if GRAPH_PROP in scene:
+                del scene[GRAPH_PROP]
+        elif scene.get(GRAPH_PROP) != payload:
+            scene[GRAPH_PROP] = payload
+        self._payloads[_object_key(scene)] = (payload, entries)
+
+    def _scene_entries(self, scene) -> Optional[Dict[str, Any]]:
+        """
+        Данные объектов из свойства сцены; разбор кэшируется, пока свойство не изменилось.
+
+        Returns:
+            dict: UUID объекта -> связи или None, если свойство в старом формате
+                  или не читается и сцену нужно пересобрать целиком
+        """
+        payload = scene.get(GRAPH_PROP)
+        cached = self._payloads.get(_object_key(scene))
+        if cached is not None and cached[0] == payload:
+            return cached[1]
+        if not payload:
+            return {}
+        try:
+            data = json.loads(payload)
+        except Exception:
+            return None
+        if data.get("v") != GRAPH_FORMAT_VERSION:
+            return None
+        return data.get("o", {})
+
+    def flush(self) -> None:
+        """
+        Записывает в сцены связи объектов, измененных после прошлой записи.
+        Перезаписываются только данные этих объектов, сцена в старом формате
+        пересобирается целиком.
+        """
+        dirty, self._dirty = self._dirty, {}
+        scenes = {}
+        for obj_key, obj in dirty.items():
             try:
-                self.effector_field_map = json.loads(obj["effector_field_map"])
-            except:
-                self.effector_field_map = {}
-    
+                users = getattr(obj, "users_scene", ())
+            except ReferenceError:
+                continue
+            if not users:
+                continue
+            uid = self._object_uid(obj, obj_key)
+            if uid is None:
+                continue
+            data = self._object_data(obj_key)
+            for scene in users:
+                scene_key = _object_key(scene)
+                if scene_key in scenes:
+                    entries = scenes[scene_key][1]
+                else:
+                    entries = self._scene_entries(scene)
+                    if entries is None:
+                        self.save_to_scene(scene)
+                        continue
+                    entries = dict(entries)
+                    scenes[scene_key] = (scene, entries)
+                if data:
+                    entries[uid] = data
+                else:
+                    entries.pop(uid, None)
+        for scene, entries in scenes.values():
+            self._write(scene, entries)
+
+    def save_to_scene(self, scene: bpy.types.Scene) -> None:
+        """
+        Сохраняет связи объектов сцены в свойство сцены.
+        Формат: {"v": версия, "o": {UUID объекта: {"e": [[клонер, эффекторы...]],
+        "f": [[эффектор, поля...]]}}} с persistent_uid модификаторов.
+        """
+        entries = {}
+        for obj in scene.objects:
+            obj_key = _object_key(obj)
+            if obj_key not in self._by_object:
+                continue
+            uid = self._object_uid(obj, obj_key)
+            if uid is not None:
+                entries[uid] = self._object_data(obj_key)
+        self._write(scene, entries)
+
+    def save(self) -> None:
+        """
+        Пересобирает сохраненный граф всех сцен: убирает удаленные объекты
+        и UUID, которые дубликаты объектов скопировали у оригинала.
+        """
+        self._dirty = {}
+        for scene in bpy.data.scenes:
+            self.save_to_scene(scene)
+
+    def _objects_by_uid(self) -> Dict[str, bpy.types.Object]:
+        objects = {}
+        for obj in bpy.data.objects:
+            uid = obj.get(GRAPH_UID_PROP)
+            if not uid:
+                continue
+            if uid in objects:
+                # Дубликат объекта получит новый UUID при следующей записи
+                log.debug("Object %s shares graph UUID with %s", obj.name, objects[uid].name)
+                continue
+            objects[uid] = obj
+            self._uid_owners[uid] = _object_key(obj)
+        return objects
+
+    def load_from_scene(self, scene: bpy.types.Scene,
+                        objects: Optional[Dict[str, bpy.types.Object]] = None) -> int:
+        """
+        Загружает связи из свойства сцены.
+
+        Args:
+            scene: Сцена
+            objects: Объекты по UUID (по умолчанию собираются из bpy.data.objects)
+
+        Returns:
+            int: Число загруженных объектов
+        """
+        payload = scene.get(GRAPH_PROP)
+        if not payload:
+            return 0
+        try:
+            data = json.loads(payload)
+        except Exception as e:
+            log.error("Cannot read dependency graph of scene %s: %s", scene.name, e)
+            return 0
+        version = data.get("v")
+        if version == GRAPH_FORMAT_VERSION:
+            if objects is None:
+                objects = self._objects_by_uid()
+            resolve = objects.get
+            self._payloads[_object_key(scene)] = (payload, data.get("o", {}))
+        elif version == 1:
+            # Файлы первой версии хранят связи по имени объекта
+            resolve = bpy.data.objects.get
+        else:
+            log.debug("Unsupported dependency graph version in scene %s: %s", scene.name, version)
+            return 0
+
+        loaded = 0
+        for obj_id, obj_data in data.get("o", {}).items():
+            obj = resolve(obj_id)
+            if obj is None:
+                continue
+            obj_key = _object_key(obj)
+            if obj_key in self._objects:
+                continue
+            self._objects.add(obj_key)
+            present = {_modifier_key(mod) for mod in obj.modifiers}
+            for row in obj_data.get("e", []):
+                if row and row[0] in present:
+                    self._set_edges((obj_key, row[0]), [(obj_key, k) for k in row[1:] if k in present])
+            for row in obj_data.get("f", []):
+                if row and row[0] in present:
+                    self._set_field_edges((obj_key, row[0]), [(obj_key, k) for k in row[1:] if k in present])
+            loaded += 1
+        return loaded
+
+    def load(self) -> int:
+        """
+        Перезагружает граф из всех сцен. Объекты без сохраненного графа
+        добавляются позже из зеркал linked_effectors (ensure_object).
+
+        Returns:
+            int: Число загруженных объектов
+        """
+        self.clear()
+        objects = self._objects_by_uid()
+        loaded = sum(self.load_from_scene(scene, objects) for scene in bpy.data.scenes)
+        log.debug("Dependency graph loaded: %s objects, %s cloners with effectors", loaded, len(self._effectors))
+        return loaded
+
     def clear(self) -> None:
         """
         Очищает все связи.
         """
-        self.cloner_effector_map = {}
-        self.effector_field_map = {}
+        self._effectors = {}
+        self._cloners = {}
+        self._fields = {}
+        self._field_effectors = {}
+        self._objects = set()
+        self._by_object = {}
+        self._uid_owners = {}
+        self._dirty = {}
+        self._payloads = {}
+
 
 # Создаем глобальный экземпляр для использования во всем аддоне
 dependency_manager = ComponentDependencyManager()
+
+
+@bpy.app.handlers.persistent
+def dependency_graph_load_handler(*args):
+    """
+    Загружает граф зависимостей после загрузки файла и отмены действия.
+    """
+    try:
+        dependency_manager.load()
+    except Exception as e:
+        log.error("Dependency graph load failed: %s", e)
+
+
+@bpy.app.handlers.persistent
+def dependency_graph_save_handler(*args):
+    """
+    Пересобирает сохраненный граф всех сцен перед сохранением файла.
+    """
+    try:
+        dependency_manager.save()
+    except Exception as e:
+        log.error("Dependency graph save failed: %s", e)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("save_pre", dependency_graph_save_handler),
+    ("load_post", dependency_graph_load_handler),
+    ("undo_post", dependency_graph_load_handler),
+    ("redo_post", dependency_graph_load_handler),
+)
+
+
+def load_dependency_graph():
+    """
+    Загружает граф открытого файла при включении аддона. При запуске Blender
+    bpy.data еще недоступен, и граф загрузится в load_post.
+    """
+    try:
+        dependency_manager.load()
+    except AttributeError:
+        pass
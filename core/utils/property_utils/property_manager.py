@@ -7,6 +7,10 @@ import bpy
 import json
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+from ..logging_utils import get_logger
+
+log = get_logger("core")
+
 
 class ComponentPropertyManager:
     """
@@ -20,6 +24,13 @@ class ComponentPropertyManager:
     # Реестр обновляющих функций для свойств
     _update_callbacks = {}
     
+    # Зарегистрированные группы свойств: полный ID -> имя для отображения
+    _property_groups = {}
+    
+    # Кэш типов компонентов: указатель модификатора -> (имя группы узлов, тип)
+    _component_types = {}
+    _component_types_limit = 4096
+    
     @classmethod
     def register_property_type(cls, property_id: str, property_definition: Dict[str, Any]):
         """
@@ -30,7 +41,7 @@ class ComponentPropertyManager:
             property_definition: Определение свойства для bpy.props
         """
         cls._property_types[property_id] = property_definition
-        print(f"Registered property type: {property_id}")
+        log.debug("Registered property type: %s", property_id)
     
     @classmethod
     def register_update_callback(cls, property_id: str, component_type: str, callback):
@@ -44,7 +55,7 @@ class ComponentPropertyManager:
         """
         key = f"{component_type}.{property_id}"
         cls._update_callbacks[key] = callback
-        print(f"Registered update callback for {key}")
+        log.debug("Registered update callback for %s", key)
     
     @classmethod
     def add_property_group_to_object(cls, obj, group_id: str, display_name: str):
@@ -64,6 +75,7 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли уже такая группа
         if hasattr(bpy.types, full_id):
+            cls._property_groups.setdefault(full_id, display_name)
             return full_id
         
         # Создаем класс группы свойств
@@ -81,6 +93,7 @@ class ComponentPropertyManager:
         
         # Добавляем свойство к типу объекта
         setattr(bpy.types.Object, full_id, bpy.props.PointerProperty(type=property_group))
+        cls._property_groups[full_id] = display_name
         
         return full_id
     
@@ -108,7 +121,7 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли группа
         if not hasattr(bpy.types, full_group_id):
-            print(f"Property group {full_group_id} does not exist")
+            log.debug("Property group %s does not exist", full_group_id)
             return False
         
         # Получаем класс группы
@@ -119,12 +132,12 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли уже такое свойство
         if hasattr(group_class, full_property_id):
-            print(f"Property {full_property_id} already exists in group {full_group_id}")
+            log.debug("Property %s already exists in group %s", full_property_id, full_group_id)
             return True
         
         # Проверяем, зарегистрирован ли запрошенный тип свойства
         if property_type not in cls._property_types:
-            print(f"Unknown property type: {property_type}")
+            log.debug("Unknown property type: %s", property_type)
             return False
         
         # Получаем определение свойства
@@ -172,7 +185,7 @@ class ComponentPropertyManager:
         
         # Проверяем, что группа присутствует на объекте
         if not hasattr(obj, full_group_id):
-            print(f"Object does not have property group {full_group_id}")
+            log.debug("Object does not have property group %s", full_group_id)
             return False
         
         return True
@@ -199,18 +212,59 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли группа и свойство
         if not hasattr(obj, full_group_id):
-            print(f"Object does not have property group {full_group_id}")
+            log.debug("Object does not have property group %s", full_group_id)
             return None
         
         group = getattr(obj, full_group_id)
         
         if not hasattr(group, full_property_id):
-            print(f"Property group does not have property {full_property_id}")
+            log.debug("Property group does not have property %s", full_property_id)
             return None
         
         # Возвращаем значение свойства
         return getattr(group, full_property_id)
     
+    @classmethod
+    def get_properties(cls, obj, group_id: str) -> Dict[str, Any]:
+        """
+        Получает значения всех свойств группы за один проход.
+        Свойства компонентов, которых нет на объекте, пропускаются.
+        
+        Args:
+            obj: Объект Blender
+            group_id: ID группы свойств (с префиксом advanced_cloners_ или без)
+        
+        Returns:
+            dict: Полный ID свойства -> значение
+        """
+        full_group_id = group_id if group_id.startswith("advanced_cloners_") else f"advanced_cloners_{group_id}"
+        
+        group = getattr(obj, full_group_id, None)
+        group_cls = getattr(bpy.types, full_group_id, None)
+        if group is None or group_cls is None:
+            return {}
+        
+        values = {}
+        for full_property_id in cls._component_properties(obj, group_cls):
+            try:
+                values[full_property_id] = getattr(group, full_property_id)
+            except AttributeError:
+                pass
+        return values
+    
+    @classmethod
+    def _component_properties(cls, obj, group_cls) -> List[str]:
+        """
+        ID свойств группы, компоненты которых есть на объекте.
+        Имена модификаторов читаются один раз на группу.
+        """
+        properties = getattr(group_cls, "properties", None)
+        if not properties:
+            return []
+        modifier_names = set(obj.modifiers.keys())
+        return [prop_id for prop_id, prop_info in properties.items()
+                if prop_info.get('component', '') in modifier_names]
+    
     @classmethod
     def set_property(cls, obj, group_id: str, property_id: str, component_name: str, value):
         """
@@ -234,13 +288,13 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли группа и свойство
         if not hasattr(obj, full_group_id):
-            print(f"Object does not have property group {full_group_id}")
+            log.debug("Object does not have property group %s", full_group_id)
             return False
         
         group = getattr(obj, full_group_id)
         
         if not hasattr(group, full_property_id):
-            print(f"Property group does not have property {full_property_id}")
+            log.debug("Property group does not have property %s", full_property_id)
             return False
         
         # Устанавливаем значение свойства
@@ -248,7 +302,7 @@ class ComponentPropertyManager:
             setattr(group, full_property_id, value)
             return True
         except Exception as e:
-            print(f"Error setting property value: {e}")
+            log.error("Error setting property value: %s", e)
             return False
     
     @classmethod
@@ -267,7 +321,7 @@ class ComponentPropertyManager:
         
         # Проверяем, существует ли группа
         if not hasattr(bpy.types, full_group_id):
-            print(f"Property group {full_group_id} does not exist")
+            log.debug("Property group %s does not exist", full_group_id)
             return False
         
         # Получаем класс группы
@@ -275,6 +329,7 @@ class ComponentPropertyManager:
         
         # Удаляем свойство из типа объекта
         delattr(bpy.types.Object, full_group_id)
+        cls._property_groups.pop(full_group_id, None)
         
         # Отменяем регистрацию класса группы
         bpy.utils.unregister_class(group_class)
@@ -285,6 +340,8 @@ class ComponentPropertyManager:
     def _get_component_type(cls, obj, component_name: str) -> str:
         """
         Определяет тип компонента по его имени.
+        Тип кэшируется по указателю модификатора и пересчитывается,
+        если у модификатора сменилась группа узлов.
         
         Args:
             obj: Объект Blender
@@ -293,16 +350,45 @@ class ComponentPropertyManager:
         Returns:
             str: Тип компонента или 'unknown'
         """
-        if component_name not in obj.modifiers:
+        mod = obj.modifiers.get(component_name)
+        if mod is None:
             return 'unknown'
         
-        mod = obj.modifiers[component_name]
-        
-        if not hasattr(mod, "node_group") or not mod.node_group:
+        node_group = getattr(mod, "node_group", None)
+        if not node_group:
             return 'unknown'
         
+        key = mod.as_pointer()
+        cached = cls._component_types.get(key)
+        if cached is not None and cached[0] == node_group.name:
+            return cached[1]
+        
+        component_type = cls._classify_node_group(node_group)
+        if len(cls._component_types) >= cls._component_types_limit:
+            cls._component_types.clear()
+        cls._component_types[key] = (node_group.name, component_type)
+        return component_type
+    
+    @classmethod
+    def clear_component_type_cache(cls):
+        """
+        Очищает кэш типов компонентов.
+        """
+        cls._component_types.clear()
+    
+    @staticmethod
+    def _classify_node_group(node_group) -> str:
+        """
+        Определяет тип компонента по группе узлов.
+        
+        Args:
+            node_group: Группа узлов модификатора
+        
+        Returns:
+            str: Тип компонента или 'unknown'
+        """
         # Пытаемся определить тип по имени группы узлов
-        node_group_name = mod.node_group.name.lower()
+        node_group_name = node_group.name.lower()
         
         if 'grid' in node_group_name and 'cloner' in node_group_name:
             return 'grid_cloner'
@@ -316,7 +402,7 @@ class ComponentPropertyManager:
             return 'noise_effector'
         
         # Если не удалось определить по имени, пытаемся получить из метаданных
-        metadata_str = mod.node_group.get("metadata", "{}")
+        metadata_str = node_group.get("metadata", "{}")
         try:
             metadata = json.loads(metadata_str)
             if "type" in metadata:
@@ -414,27 +500,22 @@ class CUSTOM_PT_properties_panel(bpy.types.Panel):
         layout = self.layout
         obj = context.active_object
         
-        # Перебираем все группы свойств объекта
-        for attr in dir(obj):
-            if attr.startswith('advanced_cloners_'):
-                group_id = attr
-                group = getattr(obj, group_id)
-                
-                # Проверяем, есть ли у группы атрибут display_name
-                group_cls = getattr(bpy.types, group_id)
-                if hasattr(group_cls, 'display_name'):
-                    box = layout.box()
-                    box.label(text=group_cls.display_name)
-                    
-                    # Перебираем все свойства группы
-                    if hasattr(group_cls, 'properties'):
-                        for prop_id, prop_info in group_cls.properties.items():
-                            # Проверяем, относится ли свойство к активному компоненту
-                            component_name = prop_info.get('component', '')
-                            if component_name in obj.modifiers:
-                                row = box.row()
-                                row.label(text=prop_info.get('name', prop_id))
-                                row.prop(group, prop_id, text="")
+        # Перебираем зарегистрированные группы вместо dir(obj) на каждой перерисовке
+        for group_id, display_name in ComponentPropertyManager._property_groups.items():
+            group = getattr(obj, group_id, None)
+            group_cls = getattr(bpy.types, group_id, None)
+            if group is None or group_cls is None:
+                continue
+            
+            box = layout.box()
+            box.label(text=display_name)
+            
+            # Свойства компонентов, которые есть на объекте, одним проходом
+            properties = group_cls.properties
+            for prop_id in ComponentPropertyManager._component_properties(obj, group_cls):
+                row = box.row()
+                row.label(text=properties[prop_id].get('name', prop_id))
+                row.prop(group, prop_id, text="")
 
 
 # Функция регистрации
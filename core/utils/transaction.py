@@ -0,0 +1,215 @@
+"""
+Транзакции для пакетного редактирования клонеров.
+
+Внутри транзакции обработчики depsgraph аддона сняты, отложенные обновления
+не планируются, а запросы на обновление клонеров только собираются.
+При выходе из внешней транзакции выполняется одно объединённое обновление:
+каждый затронутый клонер пересобирается один раз, затем один раз обновляется view layer.
+
+Пример:
+    with cloner_transaction(context):
+        for obj, mod in cloners:
+            request_cloner_update(obj, mod)
+"""
+
+import bpy
+from contextlib import contextmanager
+
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Глубина вложенности транзакций (транзакции реентерабельны)
+_transaction_depth = 0
+# Обработчики, снятые внешней транзакцией
+_suspended_handlers = []
+# Клонеры, ожидающие обновления: (имя объекта, имя модификатора) в порядке добавления
+_dirty_cloners = {}
+# Эффекторы, для которых отложено принудительное обновление клонеров
+_dirty_effectors = {}
+# Нужно ли обновить view layer при выходе
+_view_layer_dirty = False
+
+
+def in_transaction() -> bool:
+    """
+    Проверяет, выполняется ли сейчас транзакция.
+
+    Returns:
+        bool: True, если активна хотя бы одна транзакция
+    """
+    return _transaction_depth > 0
+
+
+def handlers_blocked() -> bool:
+    """
+    Проверяет, должны ли обработчики и обновления пропускать работу.
+    В отличие от импорта флага по значению, всегда читает актуальное состояние.
+
+    Returns:
+        bool: True, если активна транзакция или обработчик эффекторов сейчас выполняется
+    """
+    if _transaction_depth > 0:
+        return True
+
+    from . import event_handlers
+    return event_handlers._effector_handler_blocked
+
+
+def mark_cloner_dirty(obj, modifier) -> None:
+    """
+    Отмечает клонер для обновления при выходе из транзакции.
+
+    Args:
+        obj: Объект с модификатором клонера
+        modifier: Модификатор клонера
+    """
+    global _view_layer_dirty
+
+    _dirty_cloners[(obj.name, modifier.name)] = None
+    _view_layer_dirty = True
+
+
+def request_cloner_update(obj, modifier) -> None:
+    """
+    Обновляет клонер с эффекторами сразу или, внутри транзакции, откладывает
+    обновление до её завершения. Повторные запросы для одного клонера объединяются.
+
+    Args:
+        obj: Объект с модификатором клонера
+        modifier: Модификатор клонера
+    """
+    if in_transaction():
+        mark_cloner_dirty(obj, modifier)
+        return
+
+    from .cloner_effector_utils import update_cloner_with_effectors
+    update_cloner_with_effectors(obj, modifier)
+
+
+def request_effector_refresh(effector_obj, effector_name: str) -> None:
+    """
+    Откладывает принудительное обновление клонеров эффектора до конца транзакции.
+
+    Args:
+        effector_obj: Объект с модификатором эффектора
+        effector_name: Имя модификатора эффектора
+    """
+    global _view_layer_dirty
+
+    _dirty_effectors[(effector_obj.name, effector_name)] = None
+    _view_layer_dirty = True
+
+
+def request_view_layer_update(context=None) -> None:
+    """
+    Обновляет view layer сразу или один раз в конце транзакции.
+
+    Args:
+        context: Контекст Blender (по умолчанию bpy.context)
+    """
+    global _view_layer_dirty
+
+    if in_transaction():
+        _view_layer_dirty = True
+        return
+
+    (context or bpy.context).view_layer.update()
+
+
+def begin_transaction() -> None:
+    """
+    Открывает транзакцию. Внешняя транзакция снимает обработчики аддона.
+    """
+    global _transaction_depth, _suspended_handlers
+
+    if _transaction_depth == 0:
+        from .event_handlers import suspend_handlers
+        _suspended_handlers = suspend_handlers()
+    _transaction_depth += 1
+
+
+def end_transaction(context=None) -> None:
+    """
+    Закрывает транзакцию. Внешняя транзакция выполняет объединённое обновление
+    и возвращает обработчики аддона.
+
+    Args:
+        context: Контекст Blender (по умолчанию bpy.context)
+    """
+    global _transaction_depth, _suspended_handlers
+
+    if _transaction_depth == 0:
+        return
+
+    _transaction_depth -= 1
+    if _transaction_depth > 0:
+        return
+
+    try:
+        _flush(context or bpy.context)
+    finally:
+        from .event_handlers import resume_handlers
+        resume_handlers(_suspended_handlers)
+        _suspended_handlers = []
+
+
+def _flush(context) -> None:
+    """
+    Выполняет накопленные обновления: записывает граф зависимостей, каждый клонер
+    обновляется один раз, затем один view layer update.
+    Вызывается при выходе из внешней транзакции, обработчики ещё сняты.
+    """
+    global _dirty_cloners, _dirty_effectors, _view_layer_dirty
+
+    dirty_cloners, _dirty_cloners = _dirty_cloners, {}
+    dirty_effectors, _dirty_effectors = _dirty_effectors, {}
+    view_layer_dirty, _view_layer_dirty = _view_layer_dirty, False
+
+    from .property_utils.dependency_manager import dependency_manager
+    dependency_manager.flush()
+
+    if dirty_cloners:
+        from .cloner_effector_utils import update_cloner_with_effectors
+
+        for obj_name, mod_name in dirty_cloners:
+            obj = bpy.data.objects.get(obj_name)
+            if not obj:
+                continue
+            modifier = obj.modifiers.get(mod_name)
+            if not modifier or not modifier.node_group:
+                continue
+            try:
+                update_cloner_with_effectors(obj, modifier)
+            except Exception as e:
+                log.error("Error updating cloner %s.%s: %s", obj_name, mod_name, e)
+
+    if dirty_effectors:
+        from .service_utils import force_update_cloners
+
+        for obj_name, effector_name in dirty_effectors:
+            effector_obj = bpy.data.objects.get(obj_name)
+            if effector_obj:
+                force_update_cloners(effector_name, effector_obj)
+
+    if view_layer_dirty:
+        try:
+            context.view_layer.update()
+        except Exception as e:
+            log.error("Error updating view layer: %s", e)
+
+
+@contextmanager
+def cloner_transaction(context=None):
+    """
+    Реентерабельная транзакция пакетного редактирования.
+    Вложенные транзакции входят во внешнюю; обновление выполняется один раз при выходе из внешней.
+
+    Args:
+        context: Контекст Blender (по умолчанию bpy.context)
+    """
+    begin_transaction()
+    try:
+        yield
+    finally:
+        end_transaction(context)
@@ -0,0 +1,284 @@
+"""
+Пул рабочих потоков (и, по желанию, процессов) для работы без bpy.
+
+Контракт: функция задачи и ее аргументы не касаются bpy. В задачу передаются
+только обычные данные Python (строки, числа, списки, словари), собранные в
+главном потоке; ссылки на данные Blender отклоняются при постановке задачи.
+Результат передается обратно в главный поток таймером bpy.app.timers, и
+только там вызывается on_done, которому уже можно обращаться к bpy.
+
+Задачи процессов выполняются в отдельном интерпретаторе: функция должна быть
+определена на уровне модуля, который не импортирует bpy, а аргументы и
+результат - сериализуемы pickle. Если пул процессов недоступен, задача
+выполняется в пуле потоков.
+
+Пример:
+    submit(json.loads, text, on_done=lambda task: cache.update(task.result))
+"""
+
+import bpy
+import concurrent.futures
+import itertools
+import os
+import queue
+import threading
+
+from .logging_utils import get_logger
+
+log = get_logger("core")
+
+# Размер пула потоков: фоновая работа не должна занимать все ядра
+MAX_THREADS = min(4, os.cpu_count() or 1)
+MAX_PROCESSES = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Интервал опроса завершенных задач (секунды)
+POLL_INTERVAL = 0.05
+
+_task_ids = itertools.count(1)
+_lock = threading.Lock()
+_thread_pool = None
+_process_pool = None
+_process_pool_failed = False
+
+# Незавершенные задачи по номеру
+_tasks = {}
+# Завершенные задачи, ожидающие передачи в главный поток
+_completed = queue.Queue()
+
+
+class Task:
+    """
+    Задача пула.
+
+    Attributes:
+        id: Номер задачи
+        name: Имя для логов
+        result: Результат функции
+        error: Исключение функции или None
+        cancelled: Задача отменена, on_done не вызывается
+        done: Результат передан в главный поток
+    """
+
+    def __init__(self, name, on_done):
+        self.id = next(_task_ids)
+        self.name = name
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.done = False
+        self._on_done = on_done
+        self._future = None
+
+    def cancel(self):
+        """
+        Отменяет задачу. Еще не начатая задача не выполняется,
+        результат уже выполняющейся отбрасывается.
+        """
+        if self.done:
+            return False
+        self.cancelled = True
+        if self._future is not None:
+            self._future.cancel()
+        return True
+
+
+def _bpy_struct_types():
+    """Базовые типы данных Blender (bpy_struct покрывает и ID, и модификаторы)."""
+    return tuple(getattr(bpy.types, name) for name in ("bpy_struct", "ID") if hasattr(bpy.types, name))
+
+
+def _check_payload(value, struct_types, depth=0):
+    """Отклоняет ссылки на данные Blender в аргументах задачи."""
+    if isinstance(value, struct_types):
+        raise TypeError(f"Worker tasks must not receive Blender data: {value!r}")
+    if depth >= 2:
+        return
+    if isinstance(value, dict):
+        for item in value.values():
+            _check_payload(item, struct_types, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _check_payload(item, struct_types, depth + 1)
+
+
+def _get_thread_pool():
+    global _thread_pool
+    with _lock:
+        if _thread_pool is None:
+            _thread_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_THREADS,
+                thread_name_prefix="AdvancedClonersWorker"
+            )
+        return _thread_pool
+
+
+def _get_process_pool():
+    global _process_pool, _process_pool_failed
+    with _lock:
+        if _process_pool is None and not _process_pool_failed:
+            try:
+                import multiprocessing
+                _process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=MAX_PROCESSES,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            except Exception as e:
+                _process_pool_failed = True
+                log.warning("Process pool unavailable, using threads: %s", e)
+        return _process_pool
+
+
+def _on_future_done(task, future):
+    """Вызывается в рабочем потоке: только кладет задачу в очередь."""
+    if not future.cancelled():
+        error = future.exception()
+        if error is None:
+            task.result = future.result()
+        else:
+            task.error = error
+    _completed.put(task)
+
+
+def _deliver_results():
+    """
+    Таймер главного потока: вызывает on_done завершенных задач.
+
+    Returns:
+        float: Интервал до следующего вызова или None, если задач нет
+    """
+    while True:
+        try:
+            task = _completed.get_nowait()
+        except queue.Empty:
+            break
+
+        with _lock:
+            _tasks.pop(task.id, None)
+        task.done = True
+        if task.cancelled:
+            log.debug("Worker task '%s' cancelled", task.name)
+            continue
+        if task.error is not None:
+            log.error("Worker task '%s' failed: %s", task.name, task.error)
+        if task._on_done is not None:
+            try:
+                task._on_done(task)
+            except Exception as e:
+                log.error("Worker task '%s' callback failed: %s", task.name, e)
+
+    with _lock:
+        has_tasks = bool(_tasks)
+    if has_tasks or not _completed.empty():
+        return POLL_INTERVAL
+    return None
+
+
+def _schedule_delivery():
+    try:
+        if not bpy.app.timers.is_registered(_deliver_results):
+            bpy.app.timers.register(_deliver_results, first_interval=POLL_INTERVAL)
+    except Exception as e:
+        log.error("Error scheduling worker result timer: %s", e)
+
+
+def submit(func, *args, on_done=None, name=None, use_process=False):
+    """
+    Выполняет func(*args) в пуле. Вызывать только из главного потока.
+
+    Args:
+        func: Функция без обращений к bpy
+        *args: Обычные данные Python
+        on_done: Функция (task), вызывается в главном потоке с task.result или task.error
+        name: Имя задачи для логов
+        use_process: Выполнить в пуле процессов (функция уровня модуля без bpy)
+
+    Returns:
+        Task: Поставленная задача
+    """
+    _check_payload(args, _bpy_struct_types())
+
+    task = Task(name or getattr(func, "__name__", "task"), on_done)
+    pool = _get_process_pool() if use_process else None
+    if pool is None:
+        pool = _get_thread_pool()
+
+    with _lock:
+        _tasks[task.id] = task
+    try:
+        task._future = pool.submit(func, *args)
+    except Exception as e:
+        with _lock:
+            _tasks.pop(task.id, None)
+        log.error("Cannot submit worker task '%s': %s", task.name, e)
+        raise
+
+    task._future.add_done_callback(lambda future: _on_future_done(task, future))
+    _schedule_delivery()
+    return task
+
+
+def cancel_all():
+    """
+    Отменяет все незавершенные задачи и убирает их из списка незавершенных.
+    Результаты уже выполняющихся задач отбрасываются при передаче.
+
+    Returns:
+        int: Число отмененных задач
+    """
+    with _lock:
+        tasks = list(_tasks.values())
+        _tasks.clear()
+    for task in tasks:
+        task.cancel()
+    return len(tasks)
+
+
+def pending_tasks():
+    """Незавершенные задачи."""
+    with _lock:
+        return list(_tasks.values())
+
+
+def shutdown(timeout=5.0):
+    """
+    Отменяет задачи и останавливает пулы. Вызывается при отключении аддона.
+
+    Args:
+        timeout: Максимальное время ожидания выполняющихся задач в секундах
+
+    Returns:
+        bool: True, если все выполняющиеся задачи завершились
+    """
+    global _thread_pool, _process_pool, _process_pool_failed
+
+    with _lock:
+        futures = [task._future for task in _tasks.values() if task._future is not None]
+    cancel_all()
+    with _lock:
+        pools = [pool for pool in (_thread_pool, _process_pool) if pool is not None]
+        _thread_pool = None
+        _process_pool = None
+        _process_pool_failed = False
+
+    _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    for pool in pools:
+        pool.shutdown(wait=not not_done, cancel_futures=True)
+
+    # Отмененные задачи не передаются в главный поток
+    while True:
+        try:
+            _completed.get_nowait()
+        except queue.Empty:
+            break
+    with _lock:
+        _tasks.clear()
+
+    try:
+        if bpy.app.timers.is_registered(_deliver_results):
+            bpy.app.timers.unregister(_deliver_results)
+    except Exception:
+        pass
+
+    if not_done:
+        log.warning("%s worker tasks still running at shutdown", len(not_done))
+    return not not_done
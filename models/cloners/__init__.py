@@ -2,9 +2,16 @@
 Cloner models for Advanced Cloners addon.
 """
 
-from .grid_cloner import GridCloner
-from .linear_cloner import LinearCloner
-from .circle_cloner import CircleCloner
+from ...core.factories.lazy_import import lazy_exports, LazyClassMap, class_loader, attribute_loader
+
+# Классы моделей импортируются при первом обращении
+_LAZY_CLASSES = {
+    "GridCloner": ".grid_cloner",
+    "LinearCloner": ".linear_cloner",
+    "CircleCloner": ".circle_cloner",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_CLASSES)
 
 # Константы для типов клонеров и их названий
 CLONER_TYPES = [
@@ -14,18 +21,18 @@ CLONER_TYPES = [
 ]
 
 # Словарь классов клонеров
-AVAILABLE_CLONERS = {
-    "GRID": GridCloner,
-    "LINEAR": LinearCloner,
-    "CIRCLE": CircleCloner,
-}
+AVAILABLE_CLONERS = LazyClassMap({
+    "GRID": class_loader(__name__, _LAZY_CLASSES["GridCloner"], "GridCloner"),
+    "LINEAR": class_loader(__name__, _LAZY_CLASSES["LinearCloner"], "LinearCloner"),
+    "CIRCLE": class_loader(__name__, _LAZY_CLASSES["CircleCloner"], "CircleCloner"),
+})
 
 # Словарь функций для создания групп узлов
-NODE_GROUP_CREATORS = {
-    "GRID": GridCloner.create_node_group,
-    "LINEAR": LinearCloner.create_node_group,
-    "CIRCLE": CircleCloner.create_node_group,
-}
+NODE_GROUP_CREATORS = LazyClassMap({
+    "GRID": attribute_loader(__name__, _LAZY_CLASSES["GridCloner"], "GridCloner", "create_node_group"),
+    "LINEAR": attribute_loader(__name__, _LAZY_CLASSES["LinearCloner"], "LinearCloner", "create_node_group"),
+    "CIRCLE": attribute_loader(__name__, _LAZY_CLASSES["CircleCloner"], "CircleCloner", "create_node_group"),
+})
 
 # Словарь имен групп узлов
 CLONER_GROUP_NAMES = {
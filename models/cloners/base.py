@@ -1,6 +1,11 @@
 import bpy
 from abc import ABC, abstractmethod
 
+from ...core.utils.logging_utils import get_logger
+from ...core.utils.node_utils import GroupExtender
+
+log = get_logger("models")
+
 class ClonerBase(ABC):
     """Base abstract class for all cloners.
 
@@ -8,6 +13,10 @@ class ClonerBase(ABC):
     Each cloner implementation should extend this class and implement abstract methods.
     """
 
+    # Вход и узел прореживания инстансов во вьюпорте (setup_viewport_density)
+    VIEWPORT_DENSITY_SOCKET = "Viewport Density"
+    VIEWPORT_DENSITY_NODE = "Viewport Density Cull"
+
     @classmethod
     @abstractmethod
     def create_logic_group(cls, name_suffix=""):
@@ -42,7 +51,8 @@ class ClonerBase(ABC):
         This method implements the template pattern:
         1. Create the logic group
         2. Create the main group
-        3. Return the main group
+        3. Stamp the main group with the latest schema version
+        4. Return the main group
 
         Args:
             name_suffix: Optional suffix to append to the node group names
@@ -56,6 +66,9 @@ class ClonerBase(ABC):
         # Create the main interface group that uses the logic group
         main_group = cls.create_main_group(logic_group, name_suffix)
 
+        # New groups already have the current structure and need no migrations
+        GroupExtender.stamp_latest_schema(main_group)
+
         return main_group
 
     @staticmethod
@@ -134,15 +147,15 @@ class ClonerBase(ABC):
         # Эта опция есть в Blender 4.0+
         if hasattr(object_info, 'instance_mode'):
             object_info.instance_mode = True  # Используем инстансы объекта вместо его геометрии
-            print("Set GeometryNodeObjectInfo to instance mode for proper cloning")
+            log.debug("Set GeometryNodeObjectInfo to instance mode for proper cloning")
 
         # Соединяем вход Object с группой, чтобы он получал значение извне
         if 'Object' in group_input.outputs:
             try:
                 links.new(group_input.outputs['Object'], object_info.inputs['Object'])
-                print("Connected Object input to ObjectInfo node")
+                log.debug("Connected Object input to ObjectInfo node")
             except Exception as e:
-                print(f"Warning: Could not connect Object to ObjectInfo: {e}")
+                log.warning("Could not connect Object to ObjectInfo: %s", e)
 
         # Для совместимости с методом клонирования коллекций,
         # мы возвращаем выход инстансов вместо геометрии
@@ -163,4 +176,75 @@ class ClonerBase(ABC):
             return object_info, realize_node.outputs['Geometry']
         else:
             # Return both the node and its instances output for further connections
-            return object_info, object_info.outputs[output_socket]
\ No newline at end of file
+            return object_info, object_info.outputs[output_socket]
+
+    @staticmethod
+    def setup_viewport_density(node_group):
+        """Add a viewport-only density input that culls output instances.
+
+        A Delete Geometry node on the instance domain is inserted before the active
+        Group Output. An instance is removed when Is Viewport is true and a random
+        value fails the Viewport Density probability, so renders are unchanged.
+        Realized geometry (Realize Instances) is not culled. The node group is
+        modified, so this is called from the density_scheduler timer rather than
+        from a depsgraph handler. The effector chain is inserted before this node
+        (see cloner_effector_utils._output_target).
+
+        Args:
+            node_group: The cloner node group
+
+        Returns:
+            bool: True if the density input exists after the call
+        """
+        if ClonerBase.VIEWPORT_DENSITY_NODE in node_group.nodes:
+            return True
+
+        output_node = next((n for n in node_group.nodes
+                            if n.bl_idname == 'NodeGroupOutput' and n.is_active_output), None)
+        if output_node is None or 'Geometry' not in output_node.inputs:
+            return False
+        geometry_input = output_node.inputs['Geometry']
+        if not geometry_input.is_linked:
+            return False
+
+        density_input = node_group.interface.new_socket(
+            name=ClonerBase.VIEWPORT_DENSITY_SOCKET, in_out='INPUT', socket_type='NodeSocketFloat')
+        density_input.default_value = 1.0
+        density_input.min_value = 0.0
+        density_input.max_value = 1.0
+        density_input.subtype = 'FACTOR'
+        density_input.description = "Share of instances shown in the viewport; render always shows all"
+
+        nodes = node_group.nodes
+        links = node_group.links
+        source_socket = geometry_input.links[0].from_socket
+        x, y = output_node.location
+
+        group_input = nodes.new('NodeGroupInput')
+        group_input.location = (x - 600, y - 250)
+
+        is_viewport = nodes.new('GeometryNodeIsViewport')
+        is_viewport.location = (x - 600, y - 150)
+
+        keep = nodes.new('FunctionNodeRandomValue')
+        keep.data_type = 'BOOLEAN'
+        keep.location = (x - 400, y - 250)
+
+        cull = nodes.new('FunctionNodeBooleanMath')
+        cull.operation = 'NIMPLY'
+        cull.location = (x - 200, y - 150)
+
+        delete = nodes.new('GeometryNodeDeleteGeometry')
+        delete.domain = 'INSTANCE'
+        delete.name = ClonerBase.VIEWPORT_DENSITY_NODE
+        delete.location = (x - 100, y)
+        output_node.location = (x + 100, y)
+
+        links.new(group_input.outputs[ClonerBase.VIEWPORT_DENSITY_SOCKET], keep.inputs['Probability'])
+        links.new(is_viewport.outputs[0], cull.inputs[0])
+        # Выход Random Value типа BOOLEAN - четвертый
+        links.new(keep.outputs[3], cull.inputs[1])
+        links.new(source_socket, delete.inputs['Geometry'])
+        links.new(cull.outputs[0], delete.inputs['Selection'])
+        links.new(delete.outputs['Geometry'], geometry_input)
+        return True
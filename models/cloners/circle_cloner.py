@@ -2,6 +2,10 @@ import bpy
 import math
 from .base import ClonerBase
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("models")
+
 class CircleCloner(ClonerBase):
     """Circle Cloner implementation"""
 
@@ -360,7 +364,7 @@ class CircleCloner(ClonerBase):
 
         # Соединяем выход переключателя с входом логики клонера
         links.new(switch_realize.outputs[0], cloner_logic_node.inputs['Instance Source'])
-        print("Connected instance source with realize instances option to cloner logic")
+        log.debug("Connected instance source with realize instances option to cloner logic")
 
         # Connect the main inputs to the logic subgroup
         links.new(group_input.outputs['Count'], cloner_logic_node.inputs['Count'])
@@ -2,6 +2,10 @@ import bpy
 import mathutils
 from .base import ClonerBase
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("models")
+
 class GridCloner(ClonerBase):
     """Grid Cloner implementation"""
 
@@ -516,13 +520,13 @@ class GridCloner(ClonerBase):
 
         # Соединяем выход переключателя с входом логики клонера
         links.new(switch_realize.outputs[0], cloner_logic_node.inputs['Instance Source'])
-        print("Connected instance source with realize instances option to cloner logic")
+        log.debug("Connected instance source with realize instances option to cloner logic")
 
         # Дополнительное подключение параметра Realize Instances к логике клонера
         # Это необходимо для корректной работы анти-рекурсии в грид-клонере
         if 'Realize Instances' in cloner_logic_node.inputs:
             links.new(group_input.outputs['Realize Instances'], cloner_logic_node.inputs['Realize Instances'])
-            print("Connected Realize Instances parameter to cloner logic node")
+            log.debug("Connected Realize Instances parameter to cloner logic node")
 
         # Connect the main inputs to the logic subgroup
         links.new(group_input.outputs['Count X'], cloner_logic_node.inputs['Count X'])
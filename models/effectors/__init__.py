@@ -2,8 +2,15 @@
 Effector models for Advanced Cloners addon.
 """
 
-from .random_effector import RandomEffector
-from .noise_effector import NoiseEffector
+from ...core.factories.lazy_import import lazy_exports, LazyClassMap, class_loader, attribute_loader
+
+# Классы моделей импортируются при первом обращении
+_LAZY_CLASSES = {
+    "RandomEffector": ".random_effector",
+    "NoiseEffector": ".noise_effector",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_CLASSES)
 
 # Константы для типов эффекторов и их названий
 EFFECTOR_TYPES = [
@@ -12,16 +19,16 @@ EFFECTOR_TYPES = [
 ]
 
 # Словарь классов эффекторов
-AVAILABLE_EFFECTORS = {
-    "RANDOM": RandomEffector,
-    "NOISE": NoiseEffector,
-}
+AVAILABLE_EFFECTORS = LazyClassMap({
+    "RANDOM": class_loader(__name__, _LAZY_CLASSES["RandomEffector"], "RandomEffector"),
+    "NOISE": class_loader(__name__, _LAZY_CLASSES["NoiseEffector"], "NoiseEffector"),
+})
 
 # Словарь функций для создания групп узлов
-EFFECTOR_CREATORS = {
-    "RANDOM": RandomEffector.create_node_group,
-    "NOISE": NoiseEffector.create_node_group,
-}
+EFFECTOR_CREATORS = LazyClassMap({
+    "RANDOM": attribute_loader(__name__, _LAZY_CLASSES["RandomEffector"], "RandomEffector", "create_node_group"),
+    "NOISE": attribute_loader(__name__, _LAZY_CLASSES["NoiseEffector"], "NoiseEffector", "create_node_group"),
+})
 
 # Словарь имен групп узлов
 EFFECTOR_GROUP_NAMES = {
@@ -5,6 +5,10 @@ from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty, FloatProperty, FloatVectorProperty, EnumProperty, IntProperty
 from .base import EffectorBase
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("models")
+
 class NoiseEffector(EffectorBase):
     """Реализация шумового эффектора на основе базового класса"""
     
@@ -609,7 +613,7 @@ class CE_OT_Edit_NoiseEffector(Operator):
                             self.speed = mod["Input_16"]  # Speed
                             self.seed = mod["Input_17"]  # Seed
                         except Exception as e:
-                            print(f"Error reading NoiseEffector values: {e}")
+                            log.error("Error reading NoiseEffector values: %s", e)
                         break
         
         return self.execute(context)
@@ -643,7 +647,7 @@ class CE_OT_Edit_NoiseEffector(Operator):
                             mod["Input_16"] = self.speed  # Speed
                             mod["Input_17"] = self.seed  # Seed
                         except Exception as e:
-                            print(f"Error updating NoiseEffector values: {e}")
+                            log.error("Error updating NoiseEffector values: %s", e)
                         break
         
         return {'FINISHED'}
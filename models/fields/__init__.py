@@ -2,7 +2,14 @@
 Field models for Advanced Cloners addon.
 """
 
-from .sphere_field import SphereField
+from ...core.factories.lazy_import import lazy_exports, LazyClassMap, class_loader, attribute_loader
+
+# Классы моделей импортируются при первом обращении
+_LAZY_CLASSES = {
+    "SphereField": ".sphere_field",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_CLASSES)
 
 # Константы для типов полей и их названий
 FIELD_TYPES = [
@@ -10,14 +17,14 @@ FIELD_TYPES = [
 ]
 
 # Словарь классов полей
-AVAILABLE_FIELDS = {
-    "SPHERE": SphereField,
-}
+AVAILABLE_FIELDS = LazyClassMap({
+    "SPHERE": class_loader(__name__, _LAZY_CLASSES["SphereField"], "SphereField"),
+})
 
 # Словарь функций для создания групп узлов
-FIELD_CREATORS = {
-    "SPHERE": SphereField.create_node_group,
-}
+FIELD_CREATORS = LazyClassMap({
+    "SPHERE": attribute_loader(__name__, _LAZY_CLASSES["SphereField"], "SphereField", "create_node_group"),
+})
 
 # Словарь имен групп узлов
 FIELD_GROUP_NAMES = {
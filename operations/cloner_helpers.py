@@ -1,35 +1,4 @@
-import bpy
-import bmesh
-from ..core.common.constants import CLONER_MOD_NAMES
-from ..core.utils.cloner_utils import get_cloner_chain_for_object
-from ..core.utils.node_utils import find_socket_by_name
-from ..core.factories.component_factory import ComponentFactory
-from ..models.cloners.grid_cloner import GridCloner
-from ..models.cloners.linear_cloner import LinearCloner
-from ..models.cloners.circle_cloner import CircleCloner
-from ..core.utils.collection_cloner import create_collection_cloner_nodetree
-from ..core.utils.cloner_effector_utils import update_cloner_with_effectors
-
-# Импортируем функции из новых модулей
-from .helpers.object_cloner import (
-    create_object_cloner,
-    create_standard_object_cloner, 
-    setup_basic_node_structure
-)
-from .helpers.collection_cloner import create_collection_cloner
-from .helpers.chain_utils import (
-    delete_cloner,
-    move_cloner_modifier,
-    ClonerChainUpdateHandler,
-    select_previous_cloner_in_chain
-)
-from .helpers.params_utils import (
-    setup_grid_cloner_params,
-    setup_linear_cloner_params,
-    setup_circle_cloner_params
-)
-from .helpers.stacked_cloner import create_stacked_cloner
-from .helpers.common_utils import find_layer_collection
+from ..core.factories.lazy_import import lazy_exports
 
 # Функции для создания и управления клонерами
 # Объединяет функциональность из:
@@ -39,9 +8,32 @@ from .helpers.common_utils import find_layer_collection
 # - chain_utils.py
 # - cloner_params.py
 # - stacked_cloner.py
-
-
-
-
-
-
+#
+# Модули импортируются при первом обращении к имени, а не при включении аддона
+_LAZY_EXPORTS = {
+    "CLONER_MOD_NAMES": "..core.common.constants",
+    "get_cloner_chain_for_object": "..core.utils.cloner_utils",
+    "find_socket_by_name": "..core.utils.node_utils",
+    "ComponentFactory": "..core.factories.component_factory",
+    "GridCloner": "..models.cloners.grid_cloner",
+    "LinearCloner": "..models.cloners.linear_cloner",
+    "CircleCloner": "..models.cloners.circle_cloner",
+    "create_collection_cloner_nodetree": "..core.utils.collection_cloner",
+    "update_cloner_with_effectors": "..core.utils.cloner_effector_utils",
+
+    "create_object_cloner": ".helpers.object_cloner",
+    "create_standard_object_cloner": ".helpers.object_cloner",
+    "setup_basic_node_structure": ".helpers.object_cloner",
+    "create_collection_cloner": ".helpers.collection_cloner",
+    "delete_cloner": ".helpers.chain_utils",
+    "move_cloner_modifier": ".helpers.chain_utils",
+    "ClonerChainUpdateHandler": ".helpers.chain_handler",
+    "select_previous_cloner_in_chain": ".helpers.chain_utils",
+    "setup_grid_cloner_params": ".helpers.params_utils",
+    "setup_linear_cloner_params": ".helpers.params_utils",
+    "setup_circle_cloner_params": ".helpers.params_utils",
+    "create_stacked_cloner": ".helpers.stacked_cloner",
+    "find_layer_collection": ".helpers.common_utils",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
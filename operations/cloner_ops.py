@@ -9,16 +9,13 @@ from bpy.props import EnumProperty, StringProperty, BoolProperty
 from ..core.common.constants import CLONER_MOD_NAMES
 from ..ui.common.cloner_utils import force_select_object
 from ..core.utils.cloner_effector_utils import get_effector_modifiers
-from .cloner_helpers import (
-    create_object_cloner,
-    create_collection_cloner,
-    move_cloner_modifier,
-    delete_cloner,
-    ClonerChainUpdateHandler,
-)
+from ..core.utils.orphan_gc import schedule_garbage_collection
+# Помощники создания и удаления клонеров импортируются в операторах при первом вызове
+
+from ..core.utils.logging_utils import get_logger
+from ..core.utils.profiling import profile_span
 
-# Реэкспорт для обратной совместимости с __init__.py
-register, unregister = ClonerChainUpdateHandler.register, ClonerChainUpdateHandler.unregister
+log = get_logger("operations")
 
 class CLONER_OT_create_cloner(bpy.types.Operator):
     """Create a new cloner"""
@@ -88,10 +85,14 @@ class CLONER_OT_create_cloner(bpy.types.Operator):
         layout.prop(self, "use_custom_group")
     
     def execute(self, context):
+        with profile_span("CLONER_OT_create_cloner.execute", "operator", cloner_type=self.cloner_type):
+            return self._create_cloner(context)
+
+    def _create_cloner(self, context):
         # Сбрасываем выбор активного клонера в цепочке, чтобы предотвратить конфликты
         # между разными режимами клонеров
         if hasattr(context.scene, "active_cloner_in_chain") and context.scene.active_cloner_in_chain:
-            print(f"[DEBUG] Сбрасываем выбор клонера в цепочке при создании нового клонера")
+            log.debug("Сбрасываем выбор клонера в цепочке при создании нового клонера")
             context.scene.active_cloner_in_chain = ""
             
         # Сбрасываем глобальные переменные из event_handlers.py, управляющие выбором объектов
@@ -106,7 +107,7 @@ class CLONER_OT_create_cloner(bpy.types.Operator):
             if hasattr(mod, "_last_selected_object"):
                 setattr(mod, "_last_selected_object", None)
         except (KeyError, AttributeError) as e:
-            print(f"[DEBUG] Ошибка при сбросе глобальных переменных: {e}")
+            log.debug("Ошибка при сбросе глобальных переменных: %s", e)
         
         # Теперь просто выполняем создание клонера без манипуляций с выделением
         if self.source_type == 'OBJECT':
@@ -114,6 +115,8 @@ class CLONER_OT_create_cloner(bpy.types.Operator):
                 self.report({'ERROR'}, "Please select an object for cloning")
                 return {'CANCELLED'}
             
+            from .helpers.object_cloner import create_object_cloner
+
             # Вызываем соответствующую функцию в зависимости от режима (стековый или обычный)
             result = create_object_cloner(
                 context,
@@ -135,6 +138,8 @@ class CLONER_OT_create_cloner(bpy.types.Operator):
                 self.report({'ERROR'}, "Please select a valid collection for cloning")
                 return {'CANCELLED'}
             
+            from .helpers.collection_cloner import create_collection_cloner
+
             # Для коллекций игнорируем опцию стековых модификаторов, только обычный режим
             result = create_collection_cloner(
                 context,
@@ -161,7 +166,7 @@ class CLONER_OT_delete_cloner(bpy.types.Operator):
     def execute(self, context):
         obj = context.active_object
         if obj and self.modifier_name in obj.modifiers:
-            print(f"[OPERATOR] Начало выполнения оператора удаления клонера: {self.modifier_name}")
+            log.debug("[OPERATOR] Начало выполнения оператора удаления клонера: %s", self.modifier_name)
             
             # Сбрасываем глобальные переменные из event_handlers.py для предотвращения проблем с выбором
             from ..core.utils.event_handlers import _last_selection_time, _last_selected_object
@@ -174,7 +179,7 @@ class CLONER_OT_delete_cloner(bpy.types.Operator):
                 if hasattr(mod, "_last_selected_object"):
                     setattr(mod, "_last_selected_object", None)
             except (KeyError, AttributeError) as e:
-                print(f"[DEBUG] Ошибка при сбросе глобальных переменных: {e}")
+                log.debug("Ошибка при сбросе глобальных переменных: %s", e)
             
             # Ищем предыдущий объект до удаления текущего
             previous_obj_name = None
@@ -183,7 +188,7 @@ class CLONER_OT_delete_cloner(bpy.types.Operator):
                 modifier = obj.modifiers[self.modifier_name]
                 if "previous_cloner_object" in modifier and modifier["previous_cloner_object"] in bpy.data.objects:
                     previous_obj_name = modifier["previous_cloner_object"]
-                    print(f"[OPERATOR] Найден предыдущий объект: {previous_obj_name}")
+                    log.debug("[OPERATOR] Найден предыдущий объект: %s", previous_obj_name)
             except:
                 pass
                 
@@ -191,8 +196,9 @@ class CLONER_OT_delete_cloner(bpy.types.Operator):
             obj_name = obj.name
             
             # Вызываем функцию удаления клонера
-            print(f"[OPERATOR] Вызываем функцию delete_cloner для {obj.name}.{self.modifier_name}")
+            log.debug("[OPERATOR] Вызываем функцию delete_cloner для %s.%s", obj.name, self.modifier_name)
             try:
+                from .helpers.chain_utils import delete_cloner
                 result = delete_cloner(context, obj, self.modifier_name)
                 
                 # Проверяем тип результата
@@ -205,23 +211,26 @@ class CLONER_OT_delete_cloner(bpy.types.Operator):
                     # Для обратной совместимости
                     success = bool(result)
             except Exception as e:
-                print(f"[OPERATOR] Ошибка при вызове delete_cloner: {e}")
+                log.error("[OPERATOR] Ошибка при вызове delete_cloner: %s", e)
                 success = False
                 
             if success:
                 self.report({'INFO'}, f"Deleted cloner: {self.modifier_name}")
-                print(f"[OPERATOR] Клонер успешно удален")
+                log.debug("[OPERATOR] Клонер успешно удален")
+
+                # Группы логики, коллекции и дубликаты удаленного клонера
+                schedule_garbage_collection()
                 
                 # Выбираем предыдущий объект в цепочке, если он существует
                 if previous_obj_name and previous_obj_name in bpy.data.objects:
                     # Используем новую функцию для гарантированного выделения
                     force_select_object(context, previous_obj_name)
-                    print(f"[OPERATOR] Вызвана функция форсированного выделения для {previous_obj_name}")
+                    log.debug("[OPERATOR] Вызвана функция форсированного выделения для %s", previous_obj_name)
                 
                 return {'FINISHED'}
             else:
                 self.report({'ERROR'}, f"Failed to delete cloner: {self.modifier_name}")
-                print(f"[OPERATOR] Ошибка при удалении клонера {self.modifier_name}")
+                log.error("[OPERATOR] Ошибка при удалении клонера %s", self.modifier_name)
                 return {'CANCELLED'}
                 
         self.report({'ERROR'}, "No active object with the specified modifier")
@@ -244,6 +253,7 @@ class CLONER_OT_move_modifier(bpy.types.Operator):
     def execute(self, context):
         obj = context.active_object
         if obj and self.modifier_name in obj.modifiers:
+            from .helpers.chain_utils import move_cloner_modifier
             success = move_cloner_modifier(context, obj, self.modifier_name, self.direction)
             if success:
                 return {'FINISHED'}
@@ -262,7 +272,7 @@ def register():
         bpy.utils.register_class(cls)
     
     # Регистрация обработчика цепочки клонеров уже выполняется в __init__.py
-    print("Зарегистрирован обработчик цепочки клонеров")
+    log.debug("Зарегистрирован обработчик цепочки клонеров")
 
 def unregister():
     # Отмена регистрации обработчика цепочки клонеров уже выполняется в __init__.py
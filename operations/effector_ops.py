@@ -11,6 +11,13 @@ from ..core.factories.component_factory import ComponentFactory
 from ..core.common.constants import EFFECTOR_MOD_NAMES, CLONER_NODE_GROUP_PREFIXES
 from ..models.effectors import EFFECTOR_TYPES
 from .helpers.effector_params_utils import setup_effector_params
+from ..core.utils.orphan_gc import schedule_garbage_collection
+from ..core.utils.modifiers import move_modifier
+from ..core.utils.property_utils.dependency_manager import dependency_manager
+
+from ..core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
 
 class EFFECTOR_OT_create_effector(bpy.types.Operator):
     """Create a new effector"""
@@ -34,7 +41,7 @@ class EFFECTOR_OT_create_effector(bpy.types.Operator):
         has_cloner = False
 
         # Отладочная информация
-        print(f"[DEBUG] Searching for cloners. CLONER_NODE_GROUP_PREFIXES = {CLONER_NODE_GROUP_PREFIXES}")
+        log.debug("Searching for cloners. CLONER_NODE_GROUP_PREFIXES = %s", CLONER_NODE_GROUP_PREFIXES)
 
         # Функция для определения является ли группа узлов клонером
         def is_cloner_node_group(node_group_name):
@@ -57,21 +64,21 @@ class EFFECTOR_OT_create_effector(bpy.types.Operator):
         for mod in obj.modifiers:
             if mod.type == 'NODES' and mod.node_group:
                 if is_cloner_node_group(mod.node_group.name):
-                    print(f"[DEBUG] Found cloner on current object: {mod.name}, node_group: {mod.node_group.name}")
+                    log.debug("Found cloner on current object: %s, node_group: %s", mod.name, mod.node_group.name)
                     has_cloner = True
                     break
                 else:
-                    print(f"[DEBUG] Modifier {mod.name} with node_group {mod.node_group.name} is not a cloner")
+                    log.debug("Modifier %s with node_group %s is not a cloner", mod.name, mod.node_group.name)
 
         # Если на активном объекте нет клонера, проверяем всю сцену
         if not has_cloner:
-            print("[DEBUG] No cloners found on active object, checking scene...")
+            log.debug("No cloners found on active object, checking scene...")
             for scene_obj in bpy.context.scene.objects:
                 if scene_obj.modifiers:
                     for mod in scene_obj.modifiers:
                         if mod.type == 'NODES' and mod.node_group:
                             if is_cloner_node_group(mod.node_group.name):
-                                print(f"[DEBUG] Found cloner in scene on object {scene_obj.name}: {mod.name}, node_group: {mod.node_group.name}")
+                                log.debug("Found cloner in scene on object %s: %s, node_group: %s", scene_obj.name, mod.name, mod.node_group.name)
                                 has_cloner = True
                                 break
                     if has_cloner:
@@ -80,7 +87,7 @@ class EFFECTOR_OT_create_effector(bpy.types.Operator):
         # Если нет клонеров ни на текущем объекте, ни в сцене вообще, показываем сообщение
         if not has_cloner:
             # Как временное решение - пропустим проверку, чтобы дать пользователю возможность создать эффектор
-            print("[DEBUG] No cloners found in scene")
+            log.debug("No cloners found in scene")
             self.report({'ERROR'}, "Please create a cloner first. Effectors can only affect cloners.")
             return {'CANCELLED'}
 
@@ -136,7 +143,7 @@ class EFFECTOR_OT_create_effector(bpy.types.Operator):
                     except:
                         pass
         except Exception as e:
-            print(f"Ошибка при установке параметров эффектора: {e}")
+            log.error("Ошибка при установке параметров эффектора: %s", e)
 
         # По Cinema 4D подходу, эффекторы не имеют эффекта сами по себе,
         # они должны быть связаны с клонером, чтобы работать.
@@ -148,7 +155,7 @@ class EFFECTOR_OT_create_effector(bpy.types.Operator):
         # Это предотвратит зацикливание интерфейса, когда в меню цепочки
         # выбран клонер, не соответствующий активному объекту, на котором создается эффектор
         if hasattr(context.scene, "active_cloner_in_chain") and context.scene.active_cloner_in_chain:
-            print(f"[DEBUG] Сбрасываем выбор клонера в цепочке при создании эффектора")
+            log.debug("Сбрасываем выбор клонера в цепочке при создании эффектора")
             context.scene.active_cloner_in_chain = ""
 
         self.report({'INFO'}, f"{base_mod_name} '{modifier_name}' создан. Свяжите его с клонером для использования.")
@@ -169,13 +176,16 @@ class EFFECTOR_OT_delete_effector(bpy.types.Operator):
             modifier = obj.modifiers[self.modifier_name]
             node_group = modifier.node_group
 
-            # Удаляем модификатор
+            # Удаляем модификатор и его связи с клонерами
             obj.modifiers.remove(modifier)
+            dependency_manager.update_after_modifier_removal(obj, self.modifier_name)
 
             # Удаляем группу узлов, если она больше не используется
             if node_group and node_group.users == 0:
                 bpy.data.node_groups.remove(node_group)
 
+            schedule_garbage_collection()
+
         return {'FINISHED'}
 
 
@@ -196,10 +206,7 @@ class EFFECTOR_OT_move_modifier(bpy.types.Operator):
     def execute(self, context):
         obj = context.active_object
         if obj and self.modifier_name in obj.modifiers:
-            if self.direction == 'UP':
-                bpy.ops.object.modifier_move_up(modifier=self.modifier_name)
-            else:
-                bpy.ops.object.modifier_move_down(modifier=self.modifier_name)
+            move_modifier(obj, self.modifier_name, self.direction)
         return {'FINISHED'}
 
 # Список классов для регистрации
@@ -9,6 +9,8 @@ from bpy.props import EnumProperty, StringProperty, BoolProperty
 from ..models.fields import FIELD_TYPES
 from ..core.common.constants import FIELD_MOD_NAMES
 from ..core.factories.component_factory import ComponentFactory
+from ..core.utils.modifiers import move_modifier
+from ..core.utils.property_utils.dependency_manager import dependency_manager
 
 class FIELD_OT_create_field(bpy.types.Operator):
     """Create a new field"""
@@ -75,10 +77,7 @@ class FIELD_OT_move_modifier(bpy.types.Operator):
     def execute(self, context):
         obj = context.active_object
         if obj and self.modifier_name in obj.modifiers:
-            if self.direction == 'UP':
-                bpy.ops.object.modifier_move_up(modifier=self.modifier_name)
-            else:
-                bpy.ops.object.modifier_move_down(modifier=self.modifier_name)
+            move_modifier(obj, self.modifier_name, self.direction)
         return {'FINISHED'}
 
 
@@ -104,8 +103,9 @@ class FIELD_OT_delete_field(bpy.types.Operator):
             except:
                 pass
             
-            # Удаляем модификатор
+            # Удаляем модификатор и его связи с эффекторами
             obj.modifiers.remove(modifier)
+            dependency_manager.update_after_modifier_removal(obj, self.modifier_name)
             
             # Удаляем группу узлов, если она больше не используется
             if node_group and node_group.users == 0:
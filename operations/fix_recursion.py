@@ -5,7 +5,11 @@ Operators for fixing recursion depth issues in cloners.
 import bpy
 from bpy.types import Operator
 from bpy.props import BoolProperty
-from ..core.utils.cloner_effector_utils import update_cloner_with_effectors
+from .helpers.bulk_jobs import cloner_items, resolve_cloner, update_effectors_step, submit_cloner_job
+
+from ..core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
 
 class CLONER_OT_fix_recursion_depth(Operator):
     """Fix recursion depth issues in cloners by adding a more robust anti-recursion system"""
@@ -21,47 +25,18 @@ class CLONER_OT_fix_recursion_depth(Operator):
     )
 
     def execute(self, context):
-        # Collect objects to update
-        objects_to_update = []
-        if self.update_all:
-            objects_to_update = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-        else:
-            objects_to_update = [obj for obj in context.selected_objects if obj.type == 'MESH']
-
-        # Count of updated cloners
-        updated_count = 0
-
-        # Update each object
-        for obj in objects_to_update:
-            # Find all geometry nodes modifiers that are cloners
-            for modifier in obj.modifiers:
-                if modifier.type == 'NODES' and modifier.node_group:
-                    node_group = modifier.node_group
-
-                    # Check if this is a cloner node group
-                    is_cloner = False
-                    for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner"]:
-                        if prefix in node_group.name:
-                            is_cloner = True
-                            break
-
-                    if not is_cloner:
-                        continue
-
-                    # Apply improved anti-recursion
-                    if self.apply_improved_anti_recursion_fix(node_group, context):
-                        updated_count += 1
-                        print(f"Applied improved anti-recursion fix to {node_group.name}")
-
-        # Show result
-        if updated_count > 0:
-            self.report({'INFO'}, f"Applied improved anti-recursion fix to {updated_count} cloners")
-        else:
-            self.report({'INFO'}, "No cloners needed updating")
-
+        # Cloners are processed by a background job in bounded time slices
+        submit_cloner_job(
+            self, "Fix Recursion",
+            cloner_items(context, selected_only=not self.update_all),
+            _fix_recursion_step,
+            "Applied improved anti-recursion fix to {count} cloners",
+            "No cloners needed updating"
+        )
         return {'FINISHED'}
 
-    def apply_improved_anti_recursion_fix(self, node_group, context):
+    @staticmethod
+    def apply_improved_anti_recursion_fix(node_group, context):
         """Apply improved anti-recursion fix to the node group"""
         nodes = node_group.nodes
         links = node_group.links
@@ -180,6 +155,23 @@ class CLONER_OT_fix_recursion_depth(Operator):
         return self.apply_improved_anti_recursion_fix(node_group, bpy.context)
 
 
+def _fix_recursion_step(item):
+    """Job step: apply the improved anti-recursion fix to one cloner."""
+    obj, modifier = resolve_cloner(item)
+    if modifier is None:
+        return False
+    node_group = modifier.node_group
+
+    # Object cloners are not handled by this fixer
+    if not any(prefix in node_group.name for prefix in ("GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner")):
+        return False
+
+    if CLONER_OT_fix_recursion_depth.apply_improved_anti_recursion_fix(node_group, bpy.context):
+        log.debug("Applied improved anti-recursion fix to %s", node_group.name)
+        return True
+    return False
+
+
 # Function to apply anti-recursion to a new cloner
 def apply_anti_recursion_to_cloner(node_group):
     """
@@ -229,7 +221,7 @@ def apply_anti_recursion_to_cloner(node_group):
         
         # Если найден Switch узел и Group Input, исправим связи
         if switch_node and group_input:
-            print(f"[DEBUG] Найден Switch узел в {node_group.name}, исправляем связи...")
+            log.debug("Найден Switch узел в %s, исправляем связи...", node_group.name)
             
             # Удаляем любые неправильные связи к Switch входу
             wrong_links = []
@@ -243,7 +235,7 @@ def apply_anti_recursion_to_cloner(node_group):
             # Удаляем неправильные связи
             for link in wrong_links:
                 node_group.links.remove(link)
-                print(f"[DEBUG] Удалена неправильная связь: {link.from_node.name}.{link.from_socket.name} -> Switch")
+                log.debug("Удалена неправильная связь: %s.%s -> Switch", link.from_node.name, link.from_socket.name)
             
             # Найдем правильный выход Realize Instances
             realize_output = None
@@ -265,22 +257,22 @@ def apply_anti_recursion_to_cloner(node_group):
                 if not already_connected:
                     # Подключаем правильную связь
                     node_group.links.new(realize_output, switch_node.inputs['Switch'])
-                    print(f"[DEBUG] Подключен {realize_output.name} к Switch входу")
+                    log.debug("Подключен %s к Switch входу", realize_output.name)
                 else:
-                    print(f"[DEBUG] Switch вход уже правильно подключен")
+                    log.debug("Switch вход уже правильно подключен")
                 
                 return True
             else:
-                print(f"[DEBUG] Не найден выход Realize Instances")
+                log.debug("Не найден выход Realize Instances")
                 return False
         else:
-            print(f"[DEBUG] Switch узел или Group Input не найдены")
+            log.debug("Switch узел или Group Input не найдены")
             # Используем старый метод
             fixer = CLONER_OT_fix_recursion_depth()
             return fixer.apply_improved_anti_recursion_fix(node_group, bpy.context)
 
     except Exception as e:
-        print(f"Error applying anti-recursion to cloner: {e}")
+        log.error("Error applying anti-recursion to cloner: %s", e)
         return False
 
 
@@ -292,47 +284,13 @@ class CLONER_OT_update_all_effectors(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Count of updated cloners
-        updated_count = 0
-
-        # Update each object
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-
-            # Find all geometry nodes modifiers that are cloners
-            for modifier in obj.modifiers:
-                if modifier.type != 'NODES' or not modifier.node_group:
-                    continue
-
-                node_group = modifier.node_group
-
-                # Check if this is a cloner node group
-                is_cloner = False
-                for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                    if prefix in node_group.name:
-                        is_cloner = True
-                        break
-
-                if not is_cloner:
-                    continue
-
-                # Check if the cloner has linked effectors
-                if "linked_effectors" not in node_group or not node_group["linked_effectors"]:
-                    continue
-
-                # Update the cloner with effectors using improved method
-                update_cloner_with_effectors(obj, modifier)
-                updated_count += 1
-
-                print(f"Updated cloner {modifier.name} with effectors")
-
-        # Show result
-        if updated_count > 0:
-            self.report({'INFO'}, f"Updated {updated_count} cloners with effectors")
-        else:
-            self.report({'INFO'}, "No cloners with effectors found")
-
+        submit_cloner_job(
+            self, "Update Effectors",
+            cloner_items(context, with_effectors=True),
+            update_effectors_step,
+            "Updated {count} cloners with effectors",
+            "No cloners with effectors found"
+        )
         return {'FINISHED'}
 
 
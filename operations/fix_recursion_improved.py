@@ -6,7 +6,13 @@ import bpy
 from bpy.types import Operator
 from bpy.props import BoolProperty
 from ..core.utils.cloner_effector_utils import update_cloner_with_effectors
+from ..core.utils import job_queue
 from ..core.utils.anti_recursion_utils import diagnose_all_cloners, fix_unhealthy_cloner
+from .helpers.bulk_jobs import cloner_items, resolve_cloner, update_effectors_step, submit_cloner_job, log_finished
+
+from ..core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
 
 class CLONER_OT_fix_recursion_depth_improved(Operator):
     """Fix recursion depth issues using improved anti-recursion system"""
@@ -21,7 +27,8 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
         default=True
     )
 
-    def apply_improved_anti_recursion_fix(self, node_group, context):
+    @staticmethod
+    def apply_improved_anti_recursion_fix(node_group, context):
         """
         Применяет улучшенную систему анти-рекурсии, которая совместима с эффекторами.
 
@@ -35,7 +42,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
         nodes = node_group.nodes
         links = node_group.links
 
-        print(f"[DEBUG] Применение улучшенной анти-рекурсии к {node_group.name}")
+        log.debug("Применение улучшенной анти-рекурсии к %s", node_group.name)
 
         # Найти выходной узел
         output_node = None
@@ -45,7 +52,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
                 break
 
         if not output_node:
-            print("[ERROR] Не найден выходной узел")
+            log.error("Не найден выходной узел")
             return False
 
         # Найти входной узел группы
@@ -56,7 +63,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
                 break
 
         if not group_input:
-            print("[ERROR] Не найден входной узел группы")
+            log.error("Не найден входной узел группы")
             return False
 
         # Получить настройку анти-рекурсии
@@ -83,14 +90,14 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
             )
             realize_instances_input.default_value = use_anti_recursion
             realize_instances_input.description = "Enable to prevent recursion depth issues when creating chains of cloners"
-            print("[DEBUG] Добавлен параметр Realize Instances")
+            log.debug("Добавлен параметр Realize Instances")
 
         # Удалить проблемные узлы старой системы анти-рекурсии
         problematic_nodes = []
         for node in nodes:
             if node.name in ["Anti-Recursion Join Geometry", "Effector_Input"]:
                 problematic_nodes.append(node)
-                print(f"[DEBUG] Найден проблемный узел: {node.name}")
+                log.debug("Найден проблемный узел: %s", node.name)
 
         # Сохранить связи перед удалением проблемных узлов
         connections_to_restore = []
@@ -105,7 +112,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
         # Удалить проблемные узлы
         for node in problematic_nodes:
             nodes.remove(node)
-            print(f"[DEBUG] Удален проблемный узел: {node.name}")
+            log.debug("Удален проблемный узел: %s", node.name)
 
         # Найти или создать узел Switch для анти-рекурсии
         switch_node = None
@@ -122,7 +129,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
 
             # Позиционировать узел
             switch_node.location = (output_node.location.x - 200, output_node.location.y)
-            print("[DEBUG] Создан новый Switch узел")
+            log.debug("Создан новый Switch узел")
 
         # Найти узел, который должен быть подключен к выходу (обычно это последний в цепочке)
         source_node = None
@@ -147,7 +154,7 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
                     break
 
         if source_node and source_socket:
-            print(f"[DEBUG] Найден исходный узел: {source_node.name}")
+            log.debug("Найден исходный узел: %s", source_node.name)
 
             # Создать узел Realize Instances для True пути
             realize_node = None
@@ -160,14 +167,14 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
                 realize_node = nodes.new('GeometryNodeRealizeInstances')
                 realize_node.name = "Anti-Recursion Realize"
                 realize_node.location = (switch_node.location.x - 150, switch_node.location.y + 100)
-                print("[DEBUG] Создан узел Realize Instances")
+                log.debug("Создан узел Realize Instances")
 
             # Подключить источник к обоим путям Switch
             links.new(source_socket, switch_node.inputs[False])  # Прямой путь (без реализации)
             links.new(source_socket, realize_node.inputs['Geometry'])  # Путь через реализацию
             links.new(realize_node.outputs['Geometry'], switch_node.inputs[True])  # Реализованный путь
 
-            print("[DEBUG] Подключены пути Switch узла")
+            log.debug("Подключены пути Switch узла")
 
         # Подключить управление Switch от параметра Realize Instances
         realize_output = None
@@ -188,79 +195,62 @@ class CLONER_OT_fix_recursion_depth_improved(Operator):
 
             # Подключить правильное управление
             links.new(realize_output, switch_node.inputs['Switch'])
-            print("[DEBUG] Подключено управление Switch")
+            log.debug("Подключено управление Switch")
 
         # Подключить Switch к выходу
         links.new(switch_node.outputs[0], output_node.inputs['Geometry'])
-        print("[DEBUG] Switch подключен к выходу")
+        log.debug("Switch подключен к выходу")
 
         return True
 
     def execute(self, context):
         # First diagnose all cloners
-        print("[INFO] Диагностика клонеров...")
+        log.info("Диагностика клонеров...")
         summary = diagnose_all_cloners(context)
 
-        print(f"[INFO] Найдено {summary['total_cloners']} клонеров:")
-        print(f"  - Здоровых: {summary['healthy_cloners']}")
-        print(f"  - Требующих исправления: {summary['unhealthy_cloners']}")
-        print(f"  - С эффекторами: {summary['cloners_with_effectors']}")
+        log.info("Найдено %s клонеров:", summary['total_cloners'])
+        log.debug("  - Здоровых: %s", summary['healthy_cloners'])
+        log.debug("  - Требующих исправления: %s", summary['unhealthy_cloners'])
+        log.debug("  - С эффекторами: %s", summary['cloners_with_effectors'])
 
         if summary['issues_found']:
-            print("[INFO] Найдены проблемы:")
-            for issue in summary['issues_found']:
-                print(f"  - {issue}")
-
-        # Собираем объекты для обновления
-        objects_to_update = []
-        if self.update_all:
-            objects_to_update = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-        else:
-            objects_to_update = [obj for obj in context.selected_objects if obj.type == 'MESH']
-
-        # Счетчик обновленных клонеров
-        updated_count = 0
-
-        # Обновляем каждый объект
-        for obj in objects_to_update:
-            for modifier in obj.modifiers:
-                if modifier.type == 'NODES' and modifier.node_group:
-                    node_group = modifier.node_group
-
-                    # Проверяем, является ли это клонером
-                    is_cloner = False
-                    for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                        if prefix in node_group.name:
-                            is_cloner = True
-                            break
-
-                    if not is_cloner:
-                        continue
-
-                    # Применяем улучшенную анти-рекурсию напрямую
-                    if self.apply_improved_anti_recursion_fix(node_group, context):
-                        updated_count += 1
-                        print(f"[INFO] Применена улучшенная анти-рекурсия к {node_group.name}")
-
-                        # Обновляем эффекторы, если они есть
-                        if "linked_effectors" in node_group and node_group["linked_effectors"]:
-                            try:
-                                update_cloner_with_effectors(obj, modifier)
-                                print(f"[INFO] Обновлены эффекторы для {node_group.name}")
-                            except Exception as e:
-                                print(f"[ERROR] Не удалось обновить эффекторы: {e}")
-
-        # Показываем результат
-        if updated_count > 0:
-            self.report({'INFO'}, f"Успешно улучшено {updated_count} клонеров")
-            print(f"[SUCCESS] Улучшено {updated_count} клонеров с новой системой анти-рекурсии")
-        else:
-            self.report({'INFO'}, "Все клонеры уже здоровы")
-            print("[INFO] Все клонеры уже используют улучшенную систему")
-
+            log.info("Найдены проблемы:")
+            if log.debug_enabled:
+                for issue in summary['issues_found']:
+                    log.debug("  - %s", issue)
+
+        # Клонеры обрабатываются фоновой задачей по кусочкам времени
+        submit_cloner_job(
+            self, "Fix Recursion",
+            cloner_items(context, selected_only=not self.update_all),
+            _fix_recursion_step,
+            "Успешно улучшено {count} клонеров",
+            "Все клонеры уже здоровы"
+        )
         return {'FINISHED'}
 
 
+def _fix_recursion_step(item):
+    """Шаг задачи: улучшенная анти-рекурсия и обновление эффекторов клонера."""
+    obj, modifier = resolve_cloner(item)
+    if modifier is None:
+        return False
+
+    node_group = modifier.node_group
+    if not CLONER_OT_fix_recursion_depth_improved.apply_improved_anti_recursion_fix(node_group, bpy.context):
+        return False
+    log.info("Применена улучшенная анти-рекурсия к %s", node_group.name)
+
+    # Обновляем эффекторы, если они есть
+    if "linked_effectors" in node_group and node_group["linked_effectors"]:
+        try:
+            update_cloner_with_effectors(obj, modifier)
+            log.info("Обновлены эффекторы для %s", node_group.name)
+        except Exception as e:
+            log.error("Не удалось обновить эффекторы: %s", e)
+    return True
+
+
 class CLONER_OT_diagnose_cloners(Operator):
     """Diagnose all cloners for anti-recursion issues"""
     bl_idname = "object.diagnose_cloners"
@@ -286,12 +276,7 @@ class CLONER_OT_diagnose_cloners(Operator):
                 message_lines.append(f"• ... and {len(summary['issues_found']) - 5} more")
 
         # Print detailed report to console
-        print("\n" + "="*50)
-        print("CLONER DIAGNOSIS REPORT")
-        print("="*50)
-        for line in message_lines:
-            print(line)
-        print("="*50 + "\n")
+        log.info("CLONER DIAGNOSIS REPORT\n%s\n%s", '=' * 50, '\n'.join(message_lines))
 
         # Show summary in UI
         if summary['unhealthy_cloners'] > 0:
@@ -364,7 +349,7 @@ def apply_anti_recursion_to_cloner(node_group):
         return fixer.apply_improved_anti_recursion_fix(node_group, bpy.context)
 
     except Exception as e:
-        print(f"Error applying anti-recursion to cloner: {e}")
+        log.error("Error applying anti-recursion to cloner: %s", e)
         return False
 
 
@@ -376,49 +361,13 @@ class CLONER_OT_update_all_effectors(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Count of updated cloners
-        updated_count = 0
-
-        # Update each object
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-
-            # Find all geometry nodes modifiers that are cloners
-            for modifier in obj.modifiers:
-                if modifier.type != 'NODES' or not modifier.node_group:
-                    continue
-
-                node_group = modifier.node_group
-
-                # Check if this is a cloner node group
-                is_cloner = False
-                for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                    if prefix in node_group.name:
-                        is_cloner = True
-                        break
-
-                if not is_cloner:
-                    continue
-
-                # Check if the cloner has linked effectors
-                if "linked_effectors" not in node_group or not node_group["linked_effectors"]:
-                    continue
-
-                # Update the cloner with effectors using improved method
-                try:
-                    update_cloner_with_effectors(obj, modifier)
-                    updated_count += 1
-                    print(f"Updated cloner {modifier.name} with effectors")
-                except Exception as e:
-                    print(f"Error updating cloner {modifier.name}: {e}")
-
-        # Show result
-        if updated_count > 0:
-            self.report({'INFO'}, f"Updated {updated_count} cloners with effectors")
-        else:
-            self.report({'INFO'}, "No cloners with effectors found")
-
+        submit_cloner_job(
+            self, "Update Effectors",
+            cloner_items(context, with_effectors=True),
+            update_effectors_step,
+            "Updated {count} cloners with effectors",
+            "No cloners with effectors found"
+        )
         return {'FINISHED'}
 
 
@@ -430,92 +379,73 @@ class CLONER_OT_fix_red_connections(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        fixed_count = 0
-
-        for obj in bpy.data.objects:
-            if obj.type != 'MESH':
-                continue
-
-            for modifier in obj.modifiers:
-                if modifier.type != 'NODES' or not modifier.node_group:
-                    continue
-
-                node_group = modifier.node_group
-
-                # Проверить, является ли это клонером
-                is_cloner = False
-                for prefix in ["GridCloner", "LinearCloner", "CircleCloner", "CollectionCloner", "ObjectCloner"]:
-                    if prefix in node_group.name:
-                        is_cloner = True
-                        break
-
-                if not is_cloner:
-                    continue
-
-                # Найти узел Anti-Recursion Switch
-                switch_node = None
-                for node in node_group.nodes:
-                    if node.name == "Anti-Recursion Switch":
-                        switch_node = node
-                        break
-
-                if not switch_node:
-                    continue
-
-                # Проверить наличие неправильных связей
-                has_wrong_connection = False
-                wrong_links = []
-
-                for link in node_group.links:
-                    if (link.to_node == switch_node and
-                        link.to_socket.name == 'Switch' and
-                        hasattr(link.from_socket, 'type') and
-                        link.from_socket.type == 'GEOMETRY'):
-                        has_wrong_connection = True
-                        wrong_links.append(link)
-
-                if not has_wrong_connection:
-                    continue
-
-                # Исправить связи
-                print(f"[FIX] Fixing red connections in {node_group.name}")
-
-                # Найти Group Input
-                group_input = None
-                for node in node_group.nodes:
-                    if node.type == 'GROUP_INPUT':
-                        group_input = node
-                        break
-
-                if not group_input:
-                    continue
-
-                # Удалить неправильные связи
-                for link in wrong_links:
-                    node_group.links.remove(link)
-                    print(f"[FIX] Removed wrong link: {link.from_node.name}.{link.from_socket.name} -> Switch")
-
-                # Найти правильный выход Realize Instances
-                realize_output = None
-                for output in group_input.outputs:
-                    if 'Realize' in output.name:
-                        realize_output = output
-                        break
-
-                if realize_output:
-                    # Подключить правильную связь
-                    node_group.links.new(realize_output, switch_node.inputs['Switch'])
-                    print(f"[FIX] Connected {realize_output.name} to Switch input")
-                    fixed_count += 1
-
-        if fixed_count > 0:
-            self.report({'INFO'}, f"Fixed red connections in {fixed_count} cloners")
-        else:
-            self.report({'INFO'}, "No red connections found")
-
+        submit_cloner_job(
+            self, "Fix Red Connections",
+            cloner_items(context),
+            _fix_red_connections_step,
+            "Fixed red connections in {count} cloners",
+            "No red connections found"
+        )
         return {'FINISHED'}
 
 
+def _fix_red_connections_step(item):
+    """Шаг задачи: переподключает вход Switch узла Anti-Recursion Switch клонера."""
+    obj, modifier = resolve_cloner(item)
+    if modifier is None:
+        return False
+    node_group = modifier.node_group
+
+    # Найти узел Anti-Recursion Switch
+    switch_node = node_group.nodes.get("Anti-Recursion Switch")
+    if not switch_node:
+        return False
+
+    # Проверить наличие неправильных связей
+    wrong_links = [
+        link for link in node_group.links
+        if (link.to_node == switch_node and
+            link.to_socket.name == 'Switch' and
+            hasattr(link.from_socket, 'type') and
+            link.from_socket.type == 'GEOMETRY')
+    ]
+    if not wrong_links:
+        return False
+
+    # Исправить связи
+    log.debug("[FIX] Fixing red connections in %s", node_group.name)
+
+    # Найти Group Input
+    group_input = None
+    for node in node_group.nodes:
+        if node.type == 'GROUP_INPUT':
+            group_input = node
+            break
+
+    if not group_input:
+        return False
+
+    # Удалить неправильные связи
+    for link in wrong_links:
+        log.debug("[FIX] Removed wrong link: %s.%s -> Switch", link.from_node.name, link.from_socket.name)
+        node_group.links.remove(link)
+
+    # Найти правильный выход Realize Instances
+    realize_output = None
+    for output in group_input.outputs:
+        if 'Realize' in output.name:
+            realize_output = output
+            break
+
+    if not realize_output:
+        return False
+
+    # Подключить правильную связь
+    node_group.links.new(realize_output, switch_node.inputs['Switch'])
+    log.debug("[FIX] Connected %s to Switch input", realize_output.name)
+    return True
+
+
 class CLONER_OT_fix_effector_issues(Operator):
     """Fix issues with effectors on cloners with anti-recursion"""
     bl_idname = "object.fix_effector_issues"
@@ -524,24 +454,14 @@ class CLONER_OT_fix_effector_issues(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        fixed_count = 0
+        # Две задачи очереди выполняются по порядку: сначала анти-рекурсия, затем эффекторы
+        job_queue.submit("Fix Recursion", cloner_items(context), _fix_recursion_step,
+                         on_finish=log_finished("Улучшено %s клонеров с новой системой анти-рекурсии"))
+        job_queue.submit("Update Effectors", cloner_items(context, with_effectors=True), update_effectors_step,
+                         on_finish=log_finished("Updated %s cloners with effectors"))
 
-        # Сначала исправляем анти-рекурсию
-        fixer = CLONER_OT_fix_recursion_depth_improved()
-        fixer.update_all = True
-        result = fixer.execute(context)
-
-        if result == {'FINISHED'}:
-            # Затем обновляем все эффекторы
-            effector_updater = CLONER_OT_update_all_effectors()
-            effector_result = effector_updater.execute(context)
-
-            if effector_result == {'FINISHED'}:
-                self.report({'INFO'}, "Исправлены проблемы с эффекторами и анти-рекурсией")
-                return {'FINISHED'}
-
-        self.report({'WARNING'}, "Не удалось полностью исправить проблемы")
-        return {'CANCELLED'}
+        self.report({'INFO'}, "Исправлены проблемы с эффекторами и анти-рекурсией")
+        return {'FINISHED'}
 
 
 def register():
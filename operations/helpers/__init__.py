@@ -2,54 +2,39 @@
 Вспомогательные функции для операций клонирования.
 """
 
-# Реэкспорт всех функций для обратной совместимости
-from .object_cloner import (
-    create_object_cloner,
-    create_standard_object_cloner,
-    setup_basic_node_structure
-)
-
-from .collection_cloner import (
-    create_collection_cloner
-)
-
-from .chain_utils import (
-    delete_cloner,
-    move_cloner_modifier,
-    ClonerChainUpdateHandler,
-    update_cloner_chain,
-    select_previous_cloner_in_chain
-)
-
-from .params_utils import (
-    setup_grid_cloner_params,
-    setup_linear_cloner_params,
-    setup_circle_cloner_params
-)
-
-from .stacked_cloner import (
-    create_stacked_cloner
-)
-
-from .common_utils import (
-    find_layer_collection,
-    register_chain_update
-)
-
-# Импортируем функции для работы с эффекторами и полями
-try:
-    from .effector_params_utils import (
-        setup_random_effector_params,
-        setup_noise_effector_params,
-        setup_effector_params
-    )
-except ImportError:
-    pass
-
-try:
-    from .field_params_utils import (
-        setup_sphere_field_params,
-        setup_field_params
-    )
-except ImportError:
-    pass
\ No newline at end of file
+from ...core.factories.lazy_import import lazy_exports
+
+# Реэкспорт всех функций для обратной совместимости.
+# Модули помощников тяжёлые, поэтому импортируются при первом обращении к имени
+_LAZY_EXPORTS = {
+    "create_object_cloner": ".object_cloner",
+    "create_standard_object_cloner": ".object_cloner",
+    "setup_basic_node_structure": ".object_cloner",
+
+    "create_collection_cloner": ".collection_cloner",
+
+    "delete_cloner": ".chain_utils",
+    "move_cloner_modifier": ".chain_utils",
+    "update_cloner_chain": ".chain_utils",
+    "select_previous_cloner_in_chain": ".chain_utils",
+    "ClonerChainUpdateHandler": ".chain_handler",
+
+    "setup_grid_cloner_params": ".params_utils",
+    "setup_linear_cloner_params": ".params_utils",
+    "setup_circle_cloner_params": ".params_utils",
+
+    "create_stacked_cloner": ".stacked_cloner",
+
+    "find_layer_collection": ".common_utils",
+    "register_chain_update": ".common_utils",
+
+    # Функции для работы с эффекторами и полями
+    "setup_random_effector_params": ".effector_params_utils",
+    "setup_noise_effector_params": ".effector_params_utils",
+    "setup_effector_params": ".effector_params_utils",
+
+    "setup_sphere_field_params": ".field_params_utils",
+    "setup_field_params": ".field_params_utils",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
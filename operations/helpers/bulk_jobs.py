@@ -0,0 +1,103 @@
+"""
+Общие шаги фоновых задач для операторов, обрабатывающих все клонеры сцены.
+
+Элементы задач - пары (имя объекта, имя модификатора); шаги разрешают их
+заново, потому что между тиками очереди клонеры могут быть удалены.
+"""
+
+import bpy
+
+from ...core.utils.anti_recursion_utils import iter_cloner_modifiers
+from ...core.utils import job_queue
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
+
+def cloner_items(context, selected_only=False, with_effectors=False):
+    """
+    Элементы задачи для клонеров сцены.
+
+    Args:
+        context: Контекст Blender
+        selected_only: Только выделенные объекты
+        with_effectors: Только клонеры со связанными эффекторами
+
+    Returns:
+        list: [(имя объекта, имя модификатора)]
+    """
+    selected = {obj.name for obj in context.selected_objects} if selected_only else None
+    items = []
+    for obj, modifier in iter_cloner_modifiers():
+        if selected is not None and obj.name not in selected:
+            continue
+        if with_effectors and not modifier.node_group.get("linked_effectors"):
+            continue
+        items.append((obj.name, modifier.name))
+    return items
+
+
+def resolve_cloner(item):
+    """
+    Объект и модификатор клонера по элементу задачи.
+
+    Returns:
+        tuple: (объект, модификатор) или (None, None), если клонер удален
+    """
+    obj = bpy.data.objects.get(item[0])
+    modifier = obj.modifiers.get(item[1]) if obj else None
+    if modifier is None or modifier.node_group is None:
+        return None, None
+    return obj, modifier
+
+
+def update_effectors_step(item):
+    """Шаг задачи: пересобрать цепочку эффекторов клонера."""
+    obj, modifier = resolve_cloner(item)
+    if modifier is None or not modifier.node_group.get("linked_effectors"):
+        return False
+    from ...core.utils.cloner_effector_utils import update_cloner_with_effectors
+    update_cloner_with_effectors(obj, modifier)
+    log.debug("Updated cloner %s with effectors", modifier.name)
+    return True
+
+
+def log_finished(message):
+    """
+    Функция завершения задачи, пишущая итог в лог.
+
+    Args:
+        message: Формат с одним %s - числом измененных клонеров
+    """
+    def on_finish(job):
+        if job.cancelled:
+            log.info("%s cancelled after %s of %s cloners", job.name, job.done, job.total)
+        elif job.changed:
+            log.info(message, job.changed)
+    return on_finish
+
+
+def submit_cloner_job(operator, name, items, step, message, empty_message):
+    """
+    Ставит задачу и сообщает результат оператора.
+    Небольшие задачи завершаются сразу, и отчет совпадает с прежним синхронным.
+
+    Args:
+        operator: Оператор для report()
+        name: Имя задачи
+        items: Элементы задачи
+        step: Шаг задачи
+        message: Итог с одним {count} - числом измененных клонеров
+        empty_message: Сообщение, если ничего не изменено
+
+    Returns:
+        Job: Задача очереди
+    """
+    job = job_queue.submit(name, items, step, on_finish=log_finished(message.replace("{count}", "%s")))
+    if not job.finished:
+        operator.report({'INFO'}, f"{name}: processing {job.total} cloners in the background")
+    elif job.changed:
+        operator.report({'INFO'}, message.format(count=job.changed))
+    else:
+        operator.report({'INFO'}, empty_message)
+    return job
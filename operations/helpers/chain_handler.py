@@ -0,0 +1,61 @@
+"""
+Обработчик depsgraph для цепочек клонеров.
+
+Вынесен из chain_utils, чтобы регистрация обработчика при включении аддона
+не импортировала помощники удаления и перемещения клонеров.
+"""
+
+import bpy
+
+from ...core.utils.logging_utils import get_logger
+from ...core.utils.profiling import profiled
+
+log = get_logger("operations")
+
+
+class ClonerChainUpdateHandler:
+
+    """Обработчик для обновления цепочки клонеров при изменении параметров"""
+    
+    @staticmethod
+    @profiled(category="handler")
+    def depsgraph_update_post(scene, depsgraph):
+        """Обрабатывает обновления depsgraph и передает изменения через цепочку клонеров"""
+        # Отслеживаем только изменения объектов
+        for update in depsgraph.updates:
+            if update.id.__class__ == bpy.types.Object:
+                obj = update.id
+                if obj.name.startswith("Cloner_"):
+                    # Проверяем, есть ли модификаторы-клонеры с флагом is_chained_cloner
+                    for mod in obj.modifiers:
+                        if mod.type == 'NODES' and mod.get("is_chained_cloner"):
+                            # Проверяем, есть ли следующие клонеры в цепочке
+                            if "next_cloners" in mod and mod["next_cloners"]:
+                                # Зарегистрируем отложенное обновление для следующих клонеров
+                                # для предотвращения блокировки интерфейса
+                                if hasattr(bpy.app, "timers"):
+                                    def update_next_cloners():
+                                        for next_cloner_name in mod["next_cloners"]:
+                                            if next_cloner_name in bpy.data.objects:
+                                                next_cloner_obj = bpy.data.objects[next_cloner_name]
+                                                # Делаем минимальное обновление, чтобы запустить recalc
+                                                if next_cloner_obj.hide_viewport:
+                                                    next_cloner_obj.hide_viewport = False
+                                                else:
+                                                    # Можно использовать любое свойство
+                                                    # для вызова обновления
+                                                    current_loc = next_cloner_obj.location.copy()
+                                                    next_cloner_obj.location = current_loc
+                                        
+                                        # Обновляем depsgraph
+                                        bpy.context.view_layer.update()
+                                        return None  # Запуск только один раз
+                                    
+                                    # Используем таймер с небольшой задержкой
+                                    bpy.app.timers.register(update_next_cloners, first_interval=0.05)
+
+
+# Обработчики модуля; устанавливаются по манифесту регистрации
+app_handlers = (
+    ("depsgraph_update_post", ClonerChainUpdateHandler.depsgraph_update_post),
+)
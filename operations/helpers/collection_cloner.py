@@ -10,7 +10,13 @@ from .params_utils import (
     setup_circle_cloner_params
 )
 
-def create_collection_cloner(context, cloner_type, target_collection_name, use_custom_group=True):
+from ...core.utils.logging_utils import get_logger
+from ...core.utils.orphan_gc import mark_addon_collection
+
+log = get_logger("operations")
+
+def create_collection_cloner(context, cloner_type, target_collection_name, use_custom_group=True,
+                             update_view_layer=True):
     # Параметр use_custom_group сохранен для обратной совместимости, но больше не используется
 
     """
@@ -21,6 +27,7 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
         cloner_type: Тип клонера (GRID, LINEAR, CIRCLE)
         target_collection_name: Имя коллекции для клонирования
         use_custom_group: Использовать кастомную группу узлов
+        update_view_layer: Обновлять view layer после создания (False при пакетном создании)
 
     Returns:
         bool: True если клонер успешно создан, False в случае ошибки
@@ -31,7 +38,7 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
 
         # Check if collection has objects
         if len(target_collection.objects) == 0:
-            print("Selected collection is empty")
+            log.debug("Selected collection is empty")
             return False
 
         # Get base modifier name
@@ -77,6 +84,7 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
             counter += 1
 
         cloner_collection = bpy.data.collections.new(cloner_collection_name)
+        mark_addon_collection(cloner_collection)
 
         # Сохраняем ссылку на объект клонера в коллекции
         cloner_collection["cloner_obj"] = cloner_obj.name
@@ -89,7 +97,7 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
             try:
                 bpy.context.scene.collection.children.link(cloner_collection)
             except Exception as e:
-                print(f"Ошибка при добавлении коллекции в сцену: {e}")
+                log.error("Ошибка при добавлении коллекции в сцену: %s", e)
 
                 # Функция find_layer_collection импортирована из common_utils
 
@@ -163,9 +171,9 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
                             try:
                                 node.inputs['Object'].default_value = cloner_obj
                             except Exception as e:
-                                print(f"Warning: Could not set object in ObjectInfo node: {e}")
+                                log.warning("Could not set object in ObjectInfo node: %s", e)
                 except Exception as e:
-                    print(f"Warning: Could not set Object parameter: {e}")
+                    log.warning("Could not set Object parameter: %s", e)
                 break
 
         # Устанавливаем параметры клонера
@@ -219,10 +227,11 @@ def create_collection_cloner(context, cloner_type, target_collection_name, use_c
         context.view_layer.objects.active = cloner_obj
 
         # Обновляем UI
-        context.view_layer.update()
+        if update_view_layer:
+            context.view_layer.update()
 
         return True
 
     except Exception as e:
-        print(f"Error creating collection cloner: {e}")
+        log.error("Error creating collection cloner: %s", e)
         return False
\ No newline at end of file
@@ -1,5 +1,9 @@
 import bpy
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
 def find_layer_collection(layer_coll, coll_name):
     """
     Рекурсивно находит layer_collection по имени коллекции.
@@ -13,6 +17,10 @@ def find_layer_collection(layer_coll, coll_name):
     """
     if layer_coll.collection.name == coll_name:
         return layer_coll
+    # Быстрый путь: коллекции клонеров обычно лежат прямо в корне сцены
+    direct_child = layer_coll.children.get(coll_name)
+    if direct_child:
+        return direct_child
     for child in layer_coll.children:
         result = find_layer_collection(child, coll_name)
         if result:
@@ -74,9 +82,9 @@ def register_chain_update(previous_cloner_object, cloner_obj):
                             mod["next_cloners"].append(cloner_obj.name)
             elif isinstance(chain_obj, dict) and chain_obj.get('name') != cloner_obj.name:
                 # Обработка случая, когда chain_obj является словарем
-                print(f"Обнаружен chain_obj типа dict: {chain_obj}")
+                log.debug("Обнаружен chain_obj типа dict: %s", chain_obj)
     except Exception as e:
-        print(f"Ошибка при регистрации цепочки обновлений: {e}")
+        log.error("Ошибка при регистрации цепочки обновлений: %s", e)
     
     # Принудительное обновление
     bpy.context.view_layer.update()
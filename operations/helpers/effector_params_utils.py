@@ -6,6 +6,10 @@ import bpy
 from ...core.utils.node_utils import find_socket_by_name
 from ...core.utils.config_utils import apply_effector_config, load_config
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
 def setup_random_effector_params(modifier):
     """
     Устанавливает параметры для Random эффектора.
@@ -15,11 +19,11 @@ def setup_random_effector_params(modifier):
     """
     # Пытаемся применить конфигурацию из JSON файла
     if apply_effector_config(modifier, "RANDOM"):
-        print("Applied RANDOM effector config from JSON file")
+        log.debug("Applied RANDOM effector config from JSON file")
         return
     
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default RANDOM effector parameters")
+    log.debug("Using default RANDOM effector parameters")
     
     # Устанавливаем базовые параметры
     enable_id = find_socket_by_name(modifier, "Enable")
@@ -71,11 +75,11 @@ def setup_noise_effector_params(modifier):
     """
     # Пытаемся применить конфигурацию из JSON файла
     if apply_effector_config(modifier, "NOISE"):
-        print("Applied NOISE effector config from JSON file")
+        log.debug("Applied NOISE effector config from JSON file")
         return
     
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default NOISE effector parameters")
+    log.debug("Using default NOISE effector parameters")
     
     # Устанавливаем базовые параметры
     enable_id = find_socket_by_name(modifier, "Enable")
@@ -174,4 +178,4 @@ def setup_effector_params(modifier, effector_type):
     elif effector_type == "NOISE":
         setup_noise_effector_params(modifier)
     else:
-        print(f"Unknown effector type: {effector_type}")
+        log.debug("Unknown effector type: %s", effector_type)
@@ -6,6 +6,10 @@ import bpy
 from ...core.utils.node_utils import find_socket_by_name
 from ...core.utils.config_utils import apply_field_config, load_config
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
 def setup_sphere_field_params(modifier):
     """
     Устанавливает параметры для Sphere поля.
@@ -15,11 +19,11 @@ def setup_sphere_field_params(modifier):
     """
     # Пытаемся применить конфигурацию из JSON файла
     if apply_field_config(modifier, "SPHERE"):
-        print("Applied SPHERE field config from JSON file")
+        log.debug("Applied SPHERE field config from JSON file")
         return
     
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default SPHERE field parameters")
+    log.debug("Using default SPHERE field parameters")
     
     # Устанавливаем базовые параметры
     falloff_id = find_socket_by_name(modifier, "Falloff")
@@ -55,4 +59,4 @@ def setup_field_params(modifier, field_type):
     if field_type == "SPHERE":
         setup_sphere_field_params(modifier)
     else:
-        print(f"Unknown field type: {field_type}")
+        log.debug("Unknown field type: %s", field_type)
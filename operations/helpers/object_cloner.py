@@ -5,7 +5,7 @@ from ...models.cloners.grid_cloner import GridCloner
 from ...models.cloners.linear_cloner import LinearCloner
 from ...models.cloners.circle_cloner import CircleCloner
 from ...core.utils.cloner_utils import get_cloner_chain_for_object
-from ...core.utils.node_utils import find_socket_by_name
+from ...core.utils.node_utils import find_socket_by_name, GroupExtender
 
 from .common_utils import find_layer_collection
 from .params_utils import (
@@ -13,9 +13,15 @@ from .params_utils import (
     setup_linear_cloner_params,
     setup_circle_cloner_params
 )
-from .stacked_cloner import create_stacked_cloner
 
-def create_object_cloner(context, cloner_type, orig_obj, use_stacked_modifiers=False, use_custom_group=True):
+from ...core.utils.logging_utils import get_logger
+from ...core.utils.orphan_gc import mark_addon_collection
+from ...core.utils.graph_profiler import tracks_graph_build
+
+log = get_logger("operations")
+
+def create_object_cloner(context, cloner_type, orig_obj, use_stacked_modifiers=False, use_custom_group=True,
+                         logic_group=None, update_view_layer=True):
     """
     Создает клонер для объекта.
 
@@ -25,25 +31,32 @@ def create_object_cloner(context, cloner_type, orig_obj, use_stacked_modifiers=F
         orig_obj: Исходный объект для клонирования
         use_stacked_modifiers: Использовать стековые модификаторы
         use_custom_group: Использовать кастомную группу узлов
+        logic_group: Готовая группа логики клонера для повторного использования (None - создать новую)
+        update_view_layer: Обновлять view layer после создания (False при пакетном создании)
 
     Returns:
         bool: True если клонер успешно создан, False в случае ошибки
     """
     # Проверяем режим работы - стековые модификаторы или обычные клонеры
     is_stacked_mode = use_stacked_modifiers
-    print(f"DEBUG: use_stacked_modifiers = {use_stacked_modifiers}, is_stacked_mode = {is_stacked_mode}")
+    log.debug("use_stacked_modifiers = %s, is_stacked_mode = %s", use_stacked_modifiers, is_stacked_mode)
 
     # В зависимости от режима вызываем соответствующую функцию
     if is_stacked_mode:
         # Создаем стековый клонер на том же объекте
+        from .stacked_cloner import create_stacked_cloner
         modifier, success = create_stacked_cloner(context, cloner_type, orig_obj)
         return success
     else:
         # Создаем обычный клонер (новый объект с модификатором)
-        success = create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_group)
+        success = create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_group,
+                                                logic_group=logic_group,
+                                                update_view_layer=update_view_layer)
         return success
 
-def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_group=True):
+@tracks_graph_build("object_cloner", "cloner_type")
+def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_group=True,
+                                  logic_group=None, update_view_layer=True):
     """
     Создает обычный (не стековый) клонер для объекта.
 
@@ -52,6 +65,8 @@ def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_gro
         cloner_type: Тип клонера (GRID, LINEAR, CIRCLE)
         orig_obj: Исходный объект для клонирования
         use_custom_group: Использовать кастомную группу узлов
+        logic_group: Готовая группа логики клонера для повторного использования (None - создать новую)
+        update_view_layer: Обновлять view layer после создания (False при пакетном создании)
 
     Returns:
         bool: True если клонер успешно создан, False в случае ошибки
@@ -79,6 +94,7 @@ def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_gro
             counter += 1
 
         cloner_collection = bpy.data.collections.new(cloner_collection_name)
+        mark_addon_collection(cloner_collection)
         bpy.context.scene.collection.children.link(cloner_collection)
 
         # Добавляем клонер-объект в коллекцию
@@ -136,13 +152,16 @@ def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_gro
         node_group = bpy.data.node_groups.new(node_group_name, 'GeometryNodeTree')
 
         # Настраиваем базовую структуру узлов
-        setup_basic_node_structure(node_group, orig_obj, cloner_type)
+        setup_basic_node_structure(node_group, orig_obj, cloner_type, logic_group=logic_group)
 
         # Применяем анти-рекурсию, если включена соответствующая опция
         if context.scene.use_anti_recursion:
             from ...operations.fix_recursion import apply_anti_recursion_to_cloner
             apply_anti_recursion_to_cloner(node_group)
 
+        # Новая группа уже в актуальной структуре и не требует миграций
+        GroupExtender.stamp_latest_schema(node_group, "ObjectCloner")
+
         # Устанавливаем свойства для клонера
         modifier["is_chained_cloner"] = True
         modifier["source_type"] = "OBJECT"
@@ -205,15 +224,16 @@ def create_standard_object_cloner(context, cloner_type, orig_obj, use_custom_gro
         modifier["next_cloners"] = []
 
         # Обновляем UI
-        context.view_layer.update()
+        if update_view_layer:
+            context.view_layer.update()
 
         return True
 
     except Exception as e:
-        print(f"Error creating object cloner: {e}")
+        log.error("Error creating object cloner: %s", e)
         return False
 
-def setup_basic_node_structure(node_group, orig_obj, cloner_type):
+def setup_basic_node_structure(node_group, orig_obj, cloner_type, logic_group=None):
 
     """
     Настраивает базовую структуру узлов для клонера объекта.
@@ -222,6 +242,7 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         node_group: Группа узлов для настройки
         orig_obj: Исходный объект для клонирования
         cloner_type: Тип клонера (GRID, LINEAR, CIRCLE)
+        logic_group: Готовая группа логики клонера (None - создать новую)
     """
     # Объявляем переменные на уровне функции для всех типов клонеров
     has_z_instances = False
@@ -239,10 +260,11 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         offset_socket.default_value = (3.0, 0.0, 0.0)
     elif cloner_type == "GRID":
         # Используем готовую логику из класса GridCloner
-        print(f"Создание Grid клонера с использованием логики из GridCloner для объекта {orig_obj.name}")
+        log.debug("Создание Grid клонера с использованием логики из GridCloner для объекта %s", orig_obj.name)
 
-        # Создаем logic_group с основной логикой клонера
-        logic_group = GridCloner.create_logic_group(f"_{orig_obj.name}")
+        # Создаем logic_group с основной логикой клонера (или используем общую)
+        if logic_group is None:
+            logic_group = GridCloner.create_logic_group(f"_{orig_obj.name}")
 
         # Очищаем текущую группу узлов и добавляем только необходимые интерфейсные сокеты
         for socket in list(node_group.interface.items_tree):
@@ -353,7 +375,7 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         # Добавляем соединение для параметра Realize Instances
         if 'Realize Instances' in group_in.outputs and 'Realize Instances' in cloner_logic_node.inputs:
             links.new(group_in.outputs['Realize Instances'], cloner_logic_node.inputs['Realize Instances'])
-            print("Connected Realize Instances parameter to Grid Cloner Logic")
+            log.debug("Connected Realize Instances parameter to Grid Cloner Logic")
 
         # Глобальные трансформации
         transform = nodes.new('GeometryNodeTransform')
@@ -399,7 +421,7 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
             # Если анти-рекурсия выключена, просто соединяем трансформ с выходом
             links.new(transform.outputs['Geometry'], group_out.inputs['Geometry'])
 
-        print(f"Grid клонер создан успешно с параметрами: Count X={count_x_socket.default_value}, Count Y={count_y_socket.default_value}, Count Z={count_z_socket.default_value}")
+        log.debug("Grid клонер создан успешно с параметрами: Count X=%s, Count Y=%s, Count Z=%s", count_x_socket.default_value, count_y_socket.default_value, count_z_socket.default_value)
 
     elif cloner_type == "CIRCLE":
         count_socket = node_group.interface.new_socket("Count", in_out='INPUT', socket_type='NodeSocketInt')
@@ -488,9 +510,10 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         line_node.location = (-400, 200)
 
         # Выводим доступные входы для отладки
-        print("Available inputs for MeshLine node:")
-        for input_name in line_node.inputs.keys():
-            print(f"  - {input_name}")
+        log.debug("Available inputs for MeshLine node:")
+        if log.debug_enabled:
+            for input_name in line_node.inputs.keys():
+                log.debug("  - %s", input_name)
 
         # Соединяем параметры Count и Offset
         links.new(group_in.outputs['Count'], line_node.inputs['Count'])
@@ -500,13 +523,13 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         for name in ['Offset', 'End Point', 'Length']:
             if name in line_node.inputs:
                 offset_input = name
-                print(f"Using '{offset_input}' as offset input for MeshLine")
+                log.debug("Using '%s' as offset input for MeshLine", offset_input)
                 break
 
         if offset_input:
             links.new(group_in.outputs['Offset'], line_node.inputs[offset_input])
         else:
-            print("WARNING: Could not find appropriate offset input for MeshLine.")
+            log.warning("Could not find appropriate offset input for MeshLine.")
 
         # Преобразуем меш в точки
         mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
@@ -645,9 +668,10 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         grid_node.location = (-400, 200)
 
         # Выводим доступные входы для отладки
-        print("Available inputs for MeshGrid node:")
-        for input_name in grid_node.inputs.keys():
-            print(f"  - {input_name}")
+        log.debug("Available inputs for MeshGrid node:")
+        if log.debug_enabled:
+            for input_name in grid_node.inputs.keys():
+                log.debug("  - %s", input_name)
 
         # Соединяем сокеты группы с узлами сетки
         links.new(group_in.outputs['Count X'], grid_node.inputs['Vertices X'])
@@ -689,11 +713,11 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
                 break
 
         if size_x_name and size_y_name:
-            print(f"Using '{size_x_name}' and '{size_y_name}' as size inputs for MeshGrid")
+            log.debug("Using '%s' and '%s' as size inputs for MeshGrid", size_x_name, size_y_name)
             links.new(math_x.outputs[0], grid_node.inputs[size_x_name])
             links.new(math_y.outputs[0], grid_node.inputs[size_y_name])
         else:
-            print("WARNING: Could not find appropriate size inputs for MeshGrid")
+            log.warning("Could not find appropriate size inputs for MeshGrid")
 
         # Преобразуем сетку в точки для базового использования
         mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
@@ -740,7 +764,7 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
             # Подключаем смещение
             if "Offset" in line_z.inputs:
                 links.new(combine_z_offset.outputs['Vector'], line_z.inputs['Offset'])
-                print("Подключен вектор смещения к линии Z")
+                log.debug("Подключен вектор смещения к линии Z")
 
             # Преобразуем линию Z в точки
             line_z_to_points = nodes.new('GeometryNodeMeshToPoints')
@@ -849,11 +873,11 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         if has_z_instances:
             # Если у нас есть 3D-инстансы для Grid клонера, используем их
             links.new(instances_on_z.outputs['Instances'], translate_instances.inputs['Instances'])
-            print("Подключены 3D инстансы для Grid Cloner")
+            log.debug("Подключены 3D инстансы для Grid Cloner")
         else:
             # В противном случае используем обычные инстансы
             links.new(instance_on_points.outputs['Instances'], translate_instances.inputs['Instances'])
-            print("Подключены 2D инстансы для Grid Cloner")
+            log.debug("Подключены 2D инстансы для Grid Cloner")
 
         links.new(random_pos_node.outputs['Value'], translate_instances.inputs['Translation'])
 
@@ -882,9 +906,9 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
 
         # Добавляем диагностические сообщения для отладки
         if has_z_instances and instances_on_z is not None:
-            print(f"Создана 3D сетка с параметрами: Count X={count_x_socket.default_value}, Count Y={count_y_socket.default_value}, Count Z={count_z_socket.default_value}")
+            log.debug("Создана 3D сетка с параметрами: Count X=%s, Count Y=%s, Count Z=%s", count_x_socket.default_value, count_y_socket.default_value, count_z_socket.default_value)
         else:
-            print(f"Создана 2D сетка с параметрами: Count X={count_x_socket.default_value}, Count Y={count_y_socket.default_value}")
+            log.debug("Создана 2D сетка с параметрами: Count X=%s, Count Y=%s", count_x_socket.default_value, count_y_socket.default_value)
 
     elif cloner_type == "CIRCLE":
         # Создаем узлы для окружности
@@ -892,9 +916,10 @@ def setup_basic_node_structure(node_group, orig_obj, cloner_type):
         circle_node.location = (-400, 200)
 
         # Выводим доступные входы для отладки
-        print("Available inputs for MeshCircle node:")
-        for input_name in circle_node.inputs.keys():
-            print(f"  - {input_name}")
+        log.debug("Available inputs for MeshCircle node:")
+        if log.debug_enabled:
+            for input_name in circle_node.inputs.keys():
+                log.debug("  - %s", input_name)
 
         # Соединяем сокеты группы с узлами
         links.new(group_in.outputs['Count'], circle_node.inputs['Vertices'])
@@ -2,15 +2,19 @@ import bpy
 from ...core.utils.node_utils import find_socket_by_name
 from ...core.utils.config_utils import apply_cloner_config, load_config
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
 def setup_grid_cloner_params(modifier):
     """Устанавливает параметры для Grid клонера"""
     # Пытаемся применить конфигурацию из JSON файла
     if apply_cloner_config(modifier, "GRID"):
-        print("Applied GRID cloner config from JSON file")
+        log.debug("Applied GRID cloner config from JSON file")
         return
 
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default GRID cloner parameters")
+    log.debug("Using default GRID cloner parameters")
 
     # Найдем и установим параметры для grid клонера
     count_x_id = find_socket_by_name(modifier, "Count X")
@@ -39,11 +43,11 @@ def setup_linear_cloner_params(modifier):
     """Устанавливает параметры для Linear клонера"""
     # Пытаемся применить конфигурацию из JSON файла
     if apply_cloner_config(modifier, "LINEAR"):
-        print("Applied LINEAR cloner config from JSON file")
+        log.debug("Applied LINEAR cloner config from JSON file")
         return
 
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default LINEAR cloner parameters")
+    log.debug("Using default LINEAR cloner parameters")
 
     # Найдем и установим параметры для linear клонера
     count_id = find_socket_by_name(modifier, "Count")
@@ -63,11 +67,11 @@ def setup_linear_cloner_params(modifier):
 
             # Используем значения напрямую без множителей
             modifier[offset_id] = (offset, 0.0, 0.0)
-            print(f"LINEAR: устанавливаем offset {(offset, 0.0, 0.0)}")
+            log.debug("LINEAR: устанавливаем offset %s", (offset, 0.0, 0.0))
         else:
             # Стандартные значения без множителей
             modifier[offset_id] = (3.0, 0.0, 0.0)
-            print(f"LINEAR: устанавливаем стандартный offset {(3.0, 0.0, 0.0)}")
+            log.debug("LINEAR: устанавливаем стандартный offset %s", (3.0, 0.0, 0.0))
 
         # Устанавливаем Use Effector в True для стекового клонера
         if is_stacked_cloner:
@@ -79,11 +83,11 @@ def setup_circle_cloner_params(modifier):
     """Устанавливает параметры для Circle клонера"""
     # Пытаемся применить конфигурацию из JSON файла
     if apply_cloner_config(modifier, "CIRCLE"):
-        print("Applied CIRCLE cloner config from JSON file")
+        log.debug("Applied CIRCLE cloner config from JSON file")
         return
 
     # Если не удалось применить конфигурацию, используем стандартные значения
-    print("Using default CIRCLE cloner parameters")
+    log.debug("Using default CIRCLE cloner parameters")
 
     # Найдем и установим параметры для circle клонера
     count_id = find_socket_by_name(modifier, "Count")
@@ -108,21 +112,21 @@ def setup_circle_cloner_params(modifier):
             # Используем значения напрямую без множителей
             if isinstance(modifier[radius_id], tuple):
                 modifier[radius_id] = (radius, radius, radius)
-                print(f"CIRCLE: устанавливаем radius (tuple) {(radius, radius, radius)}")
+                log.debug("CIRCLE: устанавливаем radius (tuple) %s", (radius, radius, radius))
             else:
                 modifier[radius_id] = radius
-                print(f"CIRCLE: устанавливаем radius {radius}")
+                log.debug("CIRCLE: устанавливаем radius %s", radius)
         else:
             # Стандартные значения без множителей
             if isinstance(modifier[radius_id], tuple):
                 modifier[radius_id] = (4.0, 4.0, 4.0)
-                print(f"CIRCLE: устанавливаем стандартный radius (tuple) {(4.0, 4.0, 4.0)}")
+                log.debug("CIRCLE: устанавливаем стандартный radius (tuple) %s", (4.0, 4.0, 4.0))
             else:
                 modifier[radius_id] = 4.0
-                print(f"CIRCLE: устанавливаем стандартный radius {4.0}")
+                log.debug("CIRCLE: устанавливаем стандартный radius %s", 4.0)
 
         # Настраиваем параметр Height для 3D позиционирования
         height_id = find_socket_by_name(modifier, "Height")
         if height_id:
-            print(f"CIRCLE: устанавливаем height {0.0}")
+            log.debug("CIRCLE: устанавливаем height %s", 0.0)
             modifier[height_id] = 0.0
\ No newline at end of file
@@ -13,12 +13,18 @@ from .params_utils import (
     setup_circle_cloner_params
 )
 
+from ...core.utils.logging_utils import get_logger
+from ...core.utils.graph_profiler import tracks_graph_build
+
+log = get_logger("operations")
+
+@tracks_graph_build("stacked_cloner", "cloner_type")
 def create_stacked_cloner(context, cloner_type, orig_obj):
     """
     Создает стековый клонер на том же объекте с улучшенной обработкой параметров.
     """
-    print(f"=== СОЗДАНИЕ УЛУЧШЕННОГО СТЕКОВОГО КЛОНЕРА ===")
-    print(f"Тип: {cloner_type}, Объект: {orig_obj.name}")
+    log.debug("=== СОЗДАНИЕ УЛУЧШЕННОГО СТЕКОВОГО КЛОНЕРА ===")
+    log.debug("Тип: %s, Объект: %s", cloner_type, orig_obj.name)
 
     # Получаем базовое имя модификатора
     base_mod_name = CLONER_MOD_NAMES[cloner_type]
@@ -35,7 +41,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
 
     # Проверяем тип клонера
     if cloner_type not in CLONER_CLASSES:
-        print(f"Unknown cloner type: {cloner_type}")
+        log.debug("Unknown cloner type: %s", cloner_type)
         return None, False
 
     # Создаем уникальное имя для модификатора, сохраняя тип в имени
@@ -46,7 +52,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         modifier_name = f"{base_mod_name}_Cloner_{counter:03d}"
         counter += 1
 
-    print(f"Имя модификатора: {modifier_name}")
+    log.debug("Имя модификатора: %s", modifier_name)
 
     # Получаем класс клонера
     cloner_class = CLONER_CLASSES[cloner_type]
@@ -62,7 +68,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         }.get(cloner_type, base_mod_name)
 
         node_group = bpy.data.node_groups.new(type='GeometryNodeTree', name=f"{type_name}_Stack_{orig_obj.name}")
-        print(f"Создана нод-группа: {node_group.name}")
+        log.debug("Создана нод-группа: %s", node_group.name)
 
         # --- ПРОСТАЯ СТРУКТУРА ДЛЯ ОБЪЕКТНОГО СТЕКОВОГО КЛОНЕРА ---
         # Выход геометрии
@@ -80,7 +86,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         realize_instances_socket.default_value = context.scene.use_anti_recursion
         realize_instances_socket.description = "Enable to prevent recursion depth issues when creating chains of cloners"
 
-        print("Добавлены входной и выходной сокеты для геометрии")
+        log.debug("Добавлены входной и выходной сокеты для геометрии")
 
         # Копируем основные сокеты из класса клонера
         if cloner_type == "GRID":
@@ -95,7 +101,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
 
             spacing_input = node_group.interface.new_socket(name="Spacing", in_out='INPUT', socket_type='NodeSocketVector')
             spacing_input.default_value = (1.0, 1.0, 1.0)
-            print("Добавлены параметры Grid клонера")
+            log.debug("Добавлены параметры Grid клонера")
 
         elif cloner_type == "LINEAR":
             count_input = node_group.interface.new_socket(name="Count", in_out='INPUT', socket_type='NodeSocketInt')
@@ -103,7 +109,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
 
             offset_input = node_group.interface.new_socket(name="Offset", in_out='INPUT', socket_type='NodeSocketVector')
             offset_input.default_value = (1.0, 0.0, 0.0)
-            print("Добавлены параметры Linear клонера")
+            log.debug("Добавлены параметры Linear клонера")
 
         elif cloner_type == "CIRCLE":
             count_input = node_group.interface.new_socket(name="Count", in_out='INPUT', socket_type='NodeSocketInt')
@@ -111,7 +117,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
 
             radius_input = node_group.interface.new_socket(name="Radius", in_out='INPUT', socket_type='NodeSocketFloat')
             radius_input.default_value = 5.0
-            print("Добавлены параметры Circle клонера")
+            log.debug("Добавлены параметры Circle клонера")
 
         # Добавляем общие параметры
         global_pos_input = node_group.interface.new_socket(name="Global Position", in_out='INPUT', socket_type='NodeSocketVector')
@@ -145,7 +151,7 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         # Добавляем сокет для эффекторов и устанавливаем его в True для LINEAR клонера
         use_effector_socket = node_group.interface.new_socket(name="Use Effector", in_out='INPUT', socket_type='NodeSocketBool')
         use_effector_socket.default_value = True
-        print("Добавлены общие параметры")
+        log.debug("Добавлены общие параметры")
 
         # Построение базовой структуры узлов
         nodes = node_group.nodes
@@ -156,14 +162,16 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         group_out = nodes.new('NodeGroupOutput')
 
         # ДОПОЛНИТЕЛЬНАЯ ОТЛАДОЧНАЯ ИНФОРМАЦИЯ
-        print(f"=== АНАЛИЗ СОКЕТОВ ГРУППЫ ===")
-        print(f"Интерфейс группы items_tree:")
-        for i, item in enumerate(node_group.interface.items_tree):
-            print(f"  [{i}] Имя: {item.name}, Тип: {item.socket_type}, Направление: {item.in_out}")
-
-        print(f"Доступные выходы group_in:")
-        for i, output_name in enumerate(group_in.outputs.keys()):
-            print(f"  [{i}] {output_name}")
+        log.debug("=== АНАЛИЗ СОКЕТОВ ГРУППЫ ===")
+        log.debug("Интерфейс группы items_tree:")
+        if log.debug_enabled:
+            for i, item in enumerate(node_group.interface.items_tree):
+                log.debug("  [%s] Имя: %s, Тип: %s, Направление: %s", i, item.name, item.socket_type, item.in_out)
+
+        log.debug("Доступные выходы group_in:")
+        if log.debug_enabled:
+            for i, output_name in enumerate(group_in.outputs.keys()):
+                log.debug("  [%s] %s", i, output_name)
 
         if cloner_type == "GRID":
             # Создаем узлы для сетки точек
@@ -354,9 +362,10 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             links.new(center_geometry.outputs['Geometry'], instance_on_points.inputs['Points'])
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные входные сокеты
-            print("Доступные входы узла InstanceOnPoints для GRID клонера:")
-            for input_name in instance_on_points.inputs.keys():
-                print(f"  - {input_name}")
+            log.debug("Доступные входы узла InstanceOnPoints для GRID клонера:")
+            if log.debug_enabled:
+                for input_name in instance_on_points.inputs.keys():
+                    log.debug("  - %s", input_name)
 
             # Соединяем входную геометрию с инстансами
             links.new(group_in.outputs[0], instance_on_points.inputs['Instance'])
@@ -533,14 +542,16 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные выходные сокеты mesh_to_points
-            print("Доступные выходы узла MeshToPoints для LINEAR клонера:")
-            for output_name in mesh_to_points.outputs.keys():
-                print(f"  - {output_name}")
+            log.debug("Доступные выходы узла MeshToPoints для LINEAR клонера:")
+            if log.debug_enabled:
+                for output_name in mesh_to_points.outputs.keys():
+                    log.debug("  - %s", output_name)
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные входные сокеты
-            print("Доступные входы узла InstanceOnPoints для LINEAR клонера:")
-            for input_name in instance_on_points.inputs.keys():
-                print(f"  - {input_name}")
+            log.debug("Доступные входы узла InstanceOnPoints для LINEAR клонера:")
+            if log.debug_enabled:
+                for input_name in instance_on_points.inputs.keys():
+                    log.debug("  - %s", input_name)
 
             # Соединяем линию с точками
             links.new(line_node.outputs['Mesh'], mesh_to_points.inputs['Mesh'])
@@ -551,13 +562,13 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             elif 'Geometry' in mesh_to_points.outputs and 'Points' in instance_on_points.inputs:
                 links.new(mesh_to_points.outputs['Geometry'], instance_on_points.inputs['Points'])
             else:
-                print("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения mesh_to_points с instance_on_points")
+                log.warning("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения mesh_to_points с instance_on_points")
                 # Перебираем доступные сочетания
                 for out_name in mesh_to_points.outputs.keys():
                     for in_name in instance_on_points.inputs.keys():
                         if ('point' in out_name.lower() and 'point' in in_name.lower()) or \
                            ('geometry' in out_name.lower() and 'point' in in_name.lower()):
-                            print(f"Пробуем соединить {out_name} -> {in_name}")
+                            log.debug("Пробуем соединить %s -> %s", out_name, in_name)
                             links.new(mesh_to_points.outputs[out_name], instance_on_points.inputs[in_name])
                             break
 
@@ -565,25 +576,26 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             if 'Instance' in instance_on_points.inputs:
                 # Используем индекс 0 вместо имени для доступа к сокету
                 geometry_input_index = 0
-                print(f"Используем индекс сокета geometry_input_index={geometry_input_index}")
+                log.debug("Используем индекс сокета geometry_input_index=%s", geometry_input_index)
                 # Получаем полный список имен сокетов для отладки
-                print(f"Индексы выходов group_in:")
-                for i, name in enumerate(group_in.outputs):
-                    print(f"  [{i}] {name}")
+                log.debug("Индексы выходов group_in:")
+                if log.debug_enabled:
+                    for i, name in enumerate(group_in.outputs):
+                        log.debug("  [%s] %s", i, name)
 
                 # Пробуем использовать индекс вместо имени
                 try:
                     links.new(group_in.outputs[geometry_input_index], instance_on_points.inputs['Instance'])
-                    print(f"Успешно соединили сокеты по индексу {geometry_input_index}")
+                    log.debug("Успешно соединили сокеты по индексу %s", geometry_input_index)
                 except Exception as e:
-                    print(f"Ошибка при соединении по индексу: {e}")
+                    log.error("Ошибка при соединении по индексу: %s", e)
                     try:
                         # Альтернативный метод - через имя первого сокета в интерфейсе
                         first_socket_name = list(group_in.outputs.keys())[0]
-                        print(f"Пробуем с именем первого сокета: {first_socket_name}")
+                        log.warning("Пробуем с именем первого сокета: %s", first_socket_name)
                         links.new(group_in.outputs[first_socket_name], instance_on_points.inputs['Instance'])
                     except Exception as e2:
-                        print(f"Вторая попытка тоже не удалась: {e2}")
+                        log.warning("Вторая попытка тоже не удалась: %s", e2)
 
             # Расчет интерполяции для Scale Start/End и Rotation Start/End удален
             # Но создаем узел индекса для генерации случайных значений
@@ -720,9 +732,10 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
                 links.new(transform.outputs['Geometry'], group_out.inputs['Geometry'])
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные входные сокеты
-            print("Доступные входы узла InstanceOnPoints для LINEAR клонера:")
-            for input_name in instance_on_points.inputs.keys():
-                print(f"  - {input_name}")
+            log.debug("Доступные входы узла InstanceOnPoints для LINEAR клонера:")
+            if log.debug_enabled:
+                for input_name in instance_on_points.inputs.keys():
+                    log.debug("  - %s", input_name)
 
         elif cloner_type == "CIRCLE":
             # Создаем узлы для окружности
@@ -767,14 +780,16 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные выходные сокеты mesh_to_points
-            print("Доступные выходы узла MeshToPoints для CIRCLE клонера:")
-            for output_name in mesh_to_points.outputs.keys():
-                print(f"  - {output_name}")
+            log.debug("Доступные выходы узла MeshToPoints для CIRCLE клонера:")
+            if log.debug_enabled:
+                for output_name in mesh_to_points.outputs.keys():
+                    log.debug("  - %s", output_name)
 
             # ОТЛАДОЧНЫЙ КОД: выводим все доступные входные сокеты
-            print("Доступные входы узла InstanceOnPoints для CIRCLE клонера:")
-            for input_name in instance_on_points.inputs.keys():
-                print(f"  - {input_name}")
+            log.debug("Доступные входы узла InstanceOnPoints для CIRCLE клонера:")
+            if log.debug_enabled:
+                for input_name in instance_on_points.inputs.keys():
+                    log.debug("  - %s", input_name)
 
             # Соединяем окружность с точками
             links.new(circle_node.outputs['Mesh'], mesh_to_points.inputs['Mesh'])
@@ -785,11 +800,11 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             elif 'Geometry' in mesh_to_points.outputs and 'Geometry' in set_height.inputs:
                 links.new(mesh_to_points.outputs['Geometry'], set_height.inputs['Geometry'])
             else:
-                print("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения mesh_to_points с set_height")
+                log.warning("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения mesh_to_points с set_height")
                 # Перебираем доступные сочетания
                 for out_name in mesh_to_points.outputs.keys():
                     if 'Geometry' in set_height.inputs:
-                        print(f"Пробуем соединить {out_name} -> Geometry")
+                        log.debug("Пробуем соединить %s -> Geometry", out_name)
                         links.new(mesh_to_points.outputs[out_name], set_height.inputs['Geometry'])
                         break
 
@@ -799,12 +814,12 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             if 'Geometry' in set_height.outputs and 'Points' in instance_on_points.inputs:
                 links.new(set_height.outputs['Geometry'], instance_on_points.inputs['Points'])
             else:
-                print("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения set_height с instance_on_points")
+                log.warning("ВНИМАНИЕ: Не найдены подходящие сокеты для соединения set_height с instance_on_points")
                 # Перебираем доступные сочетания
                 for out_name in set_height.outputs.keys():
                     for in_name in instance_on_points.inputs.keys():
                         if ('point' in in_name.lower()):
-                            print(f"Пробуем соединить {out_name} -> {in_name}")
+                            log.debug("Пробуем соединить %s -> %s", out_name, in_name)
                             links.new(set_height.outputs[out_name], instance_on_points.inputs[in_name])
                             break
 
@@ -812,25 +827,26 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             if 'Instance' in instance_on_points.inputs:
                 # Используем индекс 0 вместо имени для доступа к сокету
                 geometry_input_index = 0
-                print(f"Используем индекс сокета для CIRCLE: geometry_input_index={geometry_input_index}")
+                log.debug("Используем индекс сокета для CIRCLE: geometry_input_index=%s", geometry_input_index)
                 # Получаем полный список имен сокетов для отладки
-                print(f"Индексы выходов group_in для CIRCLE:")
-                for i, name in enumerate(group_in.outputs):
-                    print(f"  [{i}] {name}")
+                log.debug("Индексы выходов group_in для CIRCLE:")
+                if log.debug_enabled:
+                    for i, name in enumerate(group_in.outputs):
+                        log.debug("  [%s] %s", i, name)
 
                 # Пробуем использовать индекс вместо имени
                 try:
                     links.new(group_in.outputs[geometry_input_index], instance_on_points.inputs['Instance'])
-                    print(f"Успешно соединили сокеты CIRCLE по индексу {geometry_input_index}")
+                    log.debug("Успешно соединили сокеты CIRCLE по индексу %s", geometry_input_index)
                 except Exception as e:
-                    print(f"Ошибка при соединении CIRCLE по индексу: {e}")
+                    log.error("Ошибка при соединении CIRCLE по индексу: %s", e)
                     try:
                         # Альтернативный метод - через имя первого сокета в интерфейсе
                         first_socket_name = list(group_in.outputs.keys())[0]
-                        print(f"Пробуем с именем первого сокета CIRCLE: {first_socket_name}")
+                        log.warning("Пробуем с именем первого сокета CIRCLE: %s", first_socket_name)
                         links.new(group_in.outputs[first_socket_name], instance_on_points.inputs['Instance'])
                     except Exception as e2:
-                        print(f"Вторая попытка для CIRCLE тоже не удалась: {e2}")
+                        log.warning("Вторая попытка для CIRCLE тоже не удалась: %s", e2)
 
             # Добавляем поворот к центру (лицом внутрь)
             face_center = nodes.new('GeometryNodeRotateInstances')
@@ -848,21 +864,23 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             links.new(group_in.outputs['Instance Rotation'], rotate_user.inputs['Rotation'])
 
             # ОТЛАДКА ROTATE_USER
-            print("Доступные входы узла rotate_user для CIRCLE клонера:")
-            for i, input_name in enumerate(rotate_user.inputs.keys()):
-                print(f"  [{i}] {input_name}")
+            log.debug("Доступные входы узла rotate_user для CIRCLE клонера:")
+            if log.debug_enabled:
+                for i, input_name in enumerate(rotate_user.inputs.keys()):
+                    log.debug("  [%s] %s", i, input_name)
 
             # Выводим информацию о сокетах group_in
-            print("Доступные выходы узла group_in для CIRCLE клонера:")
-            for i, output_name in enumerate(group_in.outputs.keys()):
-                print(f"  [{i}] {output_name}")
+            log.debug("Доступные выходы узла group_in для CIRCLE клонера:")
+            if log.debug_enabled:
+                for i, output_name in enumerate(group_in.outputs.keys()):
+                    log.debug("  [%s] %s", i, output_name)
 
             # Найдем индекс сокета Instance Scale в group_in
             scale_socket_index = None
             for i, name in enumerate(group_in.outputs.keys()):
                 if name == "Instance Scale":
                     scale_socket_index = i
-                    print(f"Найден сокет Instance Scale по индексу {i}")
+                    log.debug("Найден сокет Instance Scale по индексу %s", i)
                     break
 
             # Найдем индекс сокета Scale в rotate_user
@@ -870,26 +888,26 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
             for i, name in enumerate(rotate_user.inputs.keys()):
                 if name == "Scale":
                     rotate_scale_index = i
-                    print(f"Найден сокет Scale в rotate_user по индексу {i}")
+                    log.debug("Найден сокет Scale в rotate_user по индексу %s", i)
                     break
 
             # Пробуем соединить по индексам
             if scale_socket_index is not None and rotate_scale_index is not None:
                 try:
                     links.new(group_in.outputs[scale_socket_index], rotate_user.inputs[rotate_scale_index])
-                    print(f"Успешно соединили сокеты масштаба по индексам")
+                    log.debug("Успешно соединили сокеты масштаба по индексам")
                 except Exception as e:
-                    print(f"Ошибка при соединении сокетов масштаба по индексам: {e}")
+                    log.error("Ошибка при соединении сокетов масштаба по индексам: %s", e)
             else:
-                print(f"ВНИМАНИЕ: Не найдены индексы для сокетов масштаба")
+                log.warning("ВНИМАНИЕ: Не найдены индексы для сокетов масштаба")
 
             # Прямое соединение по имени - более надежное решение
             if "Scale" in rotate_user.inputs and "Instance Scale" in [s.name for s in group_in.outputs]:
                 try:
                     links.new(group_in.outputs["Instance Scale"], rotate_user.inputs["Scale"])
-                    print(f"Успешно соединили сокеты масштаба по имени")
+                    log.debug("Успешно соединили сокеты масштаба по имени")
                 except Exception as e:
-                    print(f"Ошибка при соединении сокетов масштаба по имени: {e}")
+                    log.error("Ошибка при соединении сокетов масштаба по имени: %s", e)
 
             # Настройка случайности
             # Индекс для ID случайности
@@ -1050,20 +1068,20 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
                 try:
                     modifier[use_effector_id] = True
                 except Exception as e:
-                    print(f"Warning: Could not set Use Effector for LINEAR cloner: {e}")
+                    log.warning("Could not set Use Effector for LINEAR cloner: %s", e)
         elif cloner_type == "CIRCLE":
             modifier["cloner_display_type"] = "Circle"
 
         # Теперь безопасно устанавливаем группу узлов
         modifier.node_group = node_group
-        print(f"Установлена группа узлов {node_group.name} в модификатор {modifier_name}")
+        log.debug("Установлена группа узлов %s в модификатор %s", node_group.name, modifier_name)
 
         # Обновляем с эффекторами (изначально пустой список)
         try:
             # В update_cloner_with_effectors тоже проверим использование имени 'Geometry'
             update_cloner_with_effectors(target_obj, modifier)
         except Exception as e:
-            print(f"Ошибка при обновлении эффекторов: {e}")
+            log.error("Ошибка при обновлении эффекторов: %s", e)
 
         # Пытаемся установить параметры клонера на основе типа
         if cloner_type == "GRID":
@@ -1073,11 +1091,11 @@ def create_stacked_cloner(context, cloner_type, orig_obj):
         elif cloner_type == "CIRCLE":
             setup_circle_cloner_params(modifier)
 
-        print(f"Created {base_mod_name} using stacked modifiers")
+        log.debug("Created %s using stacked modifiers", base_mod_name)
         return modifier, True
 
     except Exception as e:
-        print(f"Ошибка при создании стекового клонера: {e}")
+        log.error("Ошибка при создании стекового клонера: %s", e)
         import traceback
         traceback.print_exc()
         return None, False
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Operators for file maintenance: merging duplicate add-on node groups, removing orphaned add-on data
+and cancelling background jobs.
+"""
+
+import bpy
+from bpy.types import Operator
+from bpy.props import BoolProperty, IntProperty
+
+from ..core.utils.node_dedup import deduplicate_node_groups
+from ..core.utils.orphan_gc import collect_garbage
+from ..core.utils import job_queue
+from ..core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
+
+class CLONER_OT_deduplicate_node_groups(Operator):
+    """Merge structurally identical add-on node groups and remove the duplicates"""
+    bl_idname = "object.cloner_deduplicate_node_groups"
+    bl_label = "Deduplicate Node Groups"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only report duplicates without changing the file",
+        default=False
+    )
+
+    def execute(self, context):
+        try:
+            report = deduplicate_node_groups(dry_run=self.dry_run)
+        except Exception as e:
+            log.error("Node group dedup failed: %s", e)
+            self.report({'ERROR'}, f"Deduplication failed: {e}")
+            return {'CANCELLED'}
+
+        duplicates = sum(len(names) for names in report["duplicates"].values())
+        if not duplicates:
+            self.report({'INFO'}, "No duplicate node groups found")
+        elif self.dry_run:
+            self.report({'INFO'}, f"{duplicates} duplicate node groups ({report['nodes_removed']} nodes) "
+                                  f"in {len(report['duplicates'])} sets")
+        else:
+            self.report({'INFO'}, f"Removed {report['removed']} of {report['groups_before']} node groups "
+                                  f"({report['nodes_removed']} nodes)")
+        return {'FINISHED'}
+
+
+class CLONER_OT_collect_garbage(Operator):
+    """Remove node groups, collections and duplicate objects left behind by deleted cloners and effectors"""
+    bl_idname = "object.cloner_collect_garbage"
+    bl_label = "Remove Orphaned Data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only report orphaned data without removing it",
+        default=False
+    )
+
+    def execute(self, context):
+        try:
+            report = collect_garbage(dry_run=self.dry_run)
+        except Exception as e:
+            log.error("Orphan GC failed: %s", e)
+            self.report({'ERROR'}, f"Cleanup failed: {e}")
+            return {'CANCELLED'}
+
+        summary = ", ".join(f"{len(names)} {kind.replace('_', ' ')}" for kind, names in report.items() if names)
+        if not summary:
+            self.report({'INFO'}, "No orphaned data found")
+        elif self.dry_run:
+            for kind, names in report.items():
+                if names:
+                    log.info("Orphaned %s: %s", kind, ", ".join(names))
+            self.report({'INFO'}, f"Orphaned: {summary}")
+        else:
+            self.report({'INFO'}, f"Removed {summary}")
+        return {'FINISHED'}
+
+
+class CLONER_OT_cancel_job(Operator):
+    """Cancel a running background job"""
+    bl_idname = "object.cloner_cancel_job"
+    bl_label = "Cancel Job"
+
+    job_id: IntProperty(
+        name="Job",
+        description="Job to cancel (0 cancels all jobs)",
+        default=0
+    )
+
+    def execute(self, context):
+        count = job_queue.cancel(job_id=self.job_id or None)
+        if count:
+            self.report({'INFO'}, f"Cancelled {count} job(s)")
+        return {'FINISHED'}
+
+
+classes = (
+    CLONER_OT_deduplicate_node_groups,
+    CLONER_OT_collect_garbage,
+    CLONER_OT_cancel_job,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,227 @@
+"""
+Operators for modifier evaluation timing statistics, instance accounting and profiling traces.
+"""
+
+import bpy
+from bpy.types import Operator
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty
+
+from ..core.utils.modifier_stats import (
+    modifier_stats,
+    collect_frame_range,
+    export_stats,
+)
+
+from ..core.utils import profiling
+from ..core.utils import worker_pool
+from ..core.utils import instance_accounting
+from ..core.utils.instance_guard import update_guard_mode
+from ..core.utils.logging_utils import get_logger
+
+log = get_logger("operations")
+
+
+def write_in_background(operator, func, filepath, *args, message):
+    """
+    Записывает файл в пуле рабочих потоков; данные уже собраны в главном потоке.
+
+    Args:
+        operator: Оператор для report()
+        func: Функция записи (filepath, *args) без обращений к bpy
+        filepath: Путь к файлу
+        *args: Данные для записи
+        message: Сообщение в лог после записи
+    """
+    def on_done(task):
+        if task.error is None:
+            log.info(message, filepath)
+
+    worker_pool.submit(func, filepath, *args, on_done=on_done, name=f"write {filepath}")
+    operator.report({'INFO'}, f"Writing {filepath}")
+
+
+class CLONER_OT_reset_modifier_stats(Operator):
+    """Clear collected modifier evaluation timings"""
+    bl_idname = "object.cloner_reset_modifier_stats"
+    bl_label = "Reset Timings"
+
+    def execute(self, context):
+        modifier_stats.clear()
+        return {'FINISHED'}
+
+
+class CLONER_OT_export_modifier_stats(Operator):
+    """Export cloner, effector and field evaluation timings to CSV or JSON"""
+    bl_idname = "object.cloner_export_modifier_stats"
+    bl_label = "Export Timings"
+
+    filepath: StringProperty(subtype='FILE_PATH')
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('CSV', "CSV", "Comma-separated values"),
+            ('JSON', "JSON", "Summary and per-frame records"),
+        ],
+        default='CSV'
+    )
+
+    use_frame_range: BoolProperty(
+        name="Frame Range",
+        description="Step through the frame range and record timings on every frame",
+        default=True
+    )
+
+    frame_start: IntProperty(name="Start", default=1)
+    frame_end: IntProperty(name="End", default=250)
+
+    def invoke(self, context, event):
+        scene = context.scene
+        self.frame_start = scene.frame_start
+        self.frame_end = scene.frame_end
+        if not self.filepath:
+            self.filepath = bpy.path.abspath("//cloner_timings")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame is before start frame")
+            return {'CANCELLED'}
+
+        extension = "." + self.file_format.lower()
+        filepath = bpy.path.ensure_ext(self.filepath, extension)
+
+        frame_records = None
+        if self.use_frame_range:
+            frame_records = collect_frame_range(context.scene, self.frame_start, self.frame_end)
+
+        modifier_stats.forget_missing()
+        write_in_background(self, export_stats, filepath, self.file_format, modifier_stats.rows(), frame_records,
+                            message="Exported modifier timings to %s")
+        return {'FINISHED'}
+
+
+class CLONER_OT_analyze_instances(Operator):
+    """Count instances, realized geometry and estimated memory of every cloner in the scene"""
+    bl_idname = "object.cloner_analyze_instances"
+    bl_label = "Analyze Instances"
+
+    def execute(self, context):
+        depsgraph = context.evaluated_depsgraph_get()
+        report = instance_accounting.analyze_scene(context.scene, depsgraph)
+        totals = report["totals"]
+
+        message = (f"{totals['cloners']} cloners, {totals['instances']} instances, "
+                   f"{instance_accounting.format_bytes(totals['estimated_bytes'])}")
+        if totals["flagged"]:
+            self.report({'WARNING'}, f"{message}; {totals['flagged']} realize memory warnings")
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class CLONER_OT_export_instance_report(Operator):
+    """Export the instance and memory report as JSON for render farm preflight"""
+    bl_idname = "object.cloner_export_instance_report"
+    bl_label = "Export Report"
+
+    filepath: StringProperty(subtype='FILE_PATH')
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.abspath("//cloner_instances.json")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.ensure_ext(self.filepath, ".json")
+
+        # Отчет всегда актуален на момент экспорта
+        report = instance_accounting.analyze_scene(context.scene, context.evaluated_depsgraph_get())
+        write_in_background(self, instance_accounting.export_report, filepath, report,
+                            message="Exported instance report to %s")
+        return {'FINISHED'}
+
+
+class CLONER_OT_export_profile_trace(Operator):
+    """Write recorded profiling spans as Chrome trace JSON (chrome://tracing, Perfetto)"""
+    bl_idname = "object.cloner_export_profile_trace"
+    bl_label = "Export Trace"
+
+    filepath: StringProperty(subtype='FILE_PATH')
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.abspath("//cloner_trace.json")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.ensure_ext(self.filepath, ".json")
+        write_in_background(self, profiling.dump_trace, filepath, profiling.build_chrome_trace(),
+                            message="Profiling trace written to %s")
+        return {'FINISHED'}
+
+
+class CLONER_OT_clear_profile_trace(Operator):
+    """Discard recorded profiling spans"""
+    bl_idname = "object.cloner_clear_profile_trace"
+    bl_label = "Clear Trace"
+
+    def execute(self, context):
+        profiling.clear_events()
+        return {'FINISHED'}
+
+
+classes = (
+    CLONER_OT_reset_modifier_stats,
+    CLONER_OT_export_modifier_stats,
+    CLONER_OT_analyze_instances,
+    CLONER_OT_export_instance_report,
+    CLONER_OT_export_profile_trace,
+    CLONER_OT_clear_profile_trace,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    bpy.types.Scene.cloner_stats_enabled = BoolProperty(
+        name="Collect Timings",
+        description="Record evaluation time of cloner, effector and field modifiers after every update",
+        default=False
+    )
+
+    bpy.types.Scene.cloner_instance_guard = EnumProperty(
+        name="Instance Guard",
+        description="What to do when the estimated instance count of chained and stacked cloners exceeds the budget",
+        items=[
+            ('OFF', "Off", "Do not estimate instance counts"),
+            ('WARN', "Warn", "Log a warning when the budget is exceeded"),
+            ('SCALE', "Scale", "Lower viewport density of cloners in proportion to their cost to fit the budget; render is unaffected"),
+            ('CLAMP', "Clamp", "Hide the largest cloners in the viewport until the estimate fits the budget"),
+        ],
+        default='OFF',
+        update=update_guard_mode
+    )
+
+    bpy.types.Scene.cloner_instance_budget = IntProperty(
+        name="Instance Budget",
+        description="Maximum estimated number of instances of all visible cloners in the scene",
+        default=10000000,
+        min=1
+    )
+
+
+def unregister():
+    if hasattr(bpy.types.Scene, "cloner_stats_enabled"):
+        del bpy.types.Scene.cloner_stats_enabled
+    if hasattr(bpy.types.Scene, "cloner_instance_guard"):
+        del bpy.types.Scene.cloner_instance_guard
+    if hasattr(bpy.types.Scene, "cloner_instance_budget"):
+        del bpy.types.Scene.cloner_instance_budget
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
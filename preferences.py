@@ -0,0 +1,222 @@
+"""
+Настройки аддона (Edit > Preferences > Add-ons > Advanced Cloners).
+"""
+
+import bpy
+from bpy.types import AddonPreferences
+from bpy.props import EnumProperty, BoolProperty
+
+from .core.utils.logging_utils import SUBSYSTEMS, set_default_level, set_level
+from .core.utils import profiling
+from .core.utils import node_dedup
+
+ADDON_PACKAGE = __package__
+
+LOG_LEVEL_ITEMS = [
+    ('ERROR', "Error", "Only errors"),
+    ('WARNING', "Warning", "Errors and warnings (release default)"),
+    ('INFO', "Info", "Errors, warnings and informational messages"),
+    ('DEBUG', "Debug", "Everything, including per-update debug output (slow)"),
+    ('OFF', "Off", "No console output"),
+]
+
+SUBSYSTEM_LEVEL_ITEMS = [('DEFAULT', "Default", "Use the global log level")] + LOG_LEVEL_ITEMS
+
+
+def update_logging_preferences(self, context):
+    """
+    Применяет настройки журналирования из настроек аддона.
+    """
+    apply_logging_preferences(self)
+
+
+def apply_logging_preferences(prefs=None) -> None:
+    """
+    Применяет уровни журналирования из настроек аддона.
+
+    Args:
+        prefs: Настройки аддона (по умолчанию читаются из контекста)
+    """
+    if prefs is None:
+        prefs = get_preferences()
+        if prefs is None:
+            return
+
+    set_default_level(prefs.log_level if prefs.enable_logging else 'OFF')
+
+    for subsystem in SUBSYSTEMS:
+        level = getattr(prefs, f"log_level_{subsystem}", 'DEFAULT')
+        if not prefs.enable_logging:
+            level = 'OFF'
+        set_level(subsystem, level)
+
+
+def update_profiling_preferences(self, context):
+    """
+    Применяет настройки профилирования из настроек аддона.
+    """
+    apply_profiling_preferences(self)
+
+
+def apply_profiling_preferences(prefs=None) -> None:
+    """
+    Включает или выключает запись интервалов профилирования.
+
+    Args:
+        prefs: Настройки аддона (по умолчанию читаются из контекста)
+    """
+    if prefs is None:
+        prefs = get_preferences()
+        if prefs is None:
+            return
+
+    profiling.set_enabled(prefs.enable_profiling, prefs.profile_rna_calls)
+
+
+def update_maintenance_preferences(self, context):
+    """
+    Применяет настройки обслуживания файла из настроек аддона.
+    """
+    apply_maintenance_preferences(self)
+
+
+def apply_maintenance_preferences(prefs=None) -> None:
+    """
+    Включает или выключает дедупликацию групп узлов при загрузке файла.
+
+    Args:
+        prefs: Настройки аддона (по умолчанию читаются из контекста)
+    """
+    if prefs is None:
+        prefs = get_preferences()
+        if prefs is None:
+            return
+
+    node_dedup.set_dedup_on_load(prefs.dedup_on_load)
+
+
+def get_preferences():
+    """
+    Возвращает настройки аддона или None, если аддон не зарегистрирован.
+    """
+    addon = bpy.context.preferences.addons.get(ADDON_PACKAGE)
+    return addon.preferences if addon else None
+
+
+class ADVANCED_CLONERS_preferences(AddonPreferences):
+    bl_idname = ADDON_PACKAGE
+
+    enable_logging: BoolProperty(
+        name="Console Logging",
+        description="Print add-on messages to the system console",
+        default=True,
+        update=update_logging_preferences
+    )
+
+    log_level: EnumProperty(
+        name="Log Level",
+        description="Minimum level of messages printed to the console",
+        items=LOG_LEVEL_ITEMS,
+        default='WARNING',
+        update=update_logging_preferences
+    )
+
+    show_subsystem_levels: BoolProperty(
+        name="Per-Subsystem Levels",
+        description="Show log level overrides for individual subsystems",
+        default=False
+    )
+
+    enable_profiling: BoolProperty(
+        name="Record Profiling Spans",
+        description="Record timing of add-on operators and handlers for export as a Chrome trace",
+        default=False,
+        update=update_profiling_preferences
+    )
+
+    profile_rna_calls: BoolProperty(
+        name="Count API Calls",
+        description="Count Blender API calls inside each span (adds noticeable overhead)",
+        default=False,
+        update=update_profiling_preferences
+    )
+
+    dedup_on_load: BoolProperty(
+        name="Deduplicate On Load",
+        description="Merge structurally identical add-on node groups after a file is loaded",
+        default=False,
+        update=update_maintenance_preferences
+    )
+
+    # Уровни подсистем объявляются ниже в цикле
+    __annotations__.update({
+        f"log_level_{subsystem}": EnumProperty(
+            name=subsystem.capitalize(),
+            description=f"Log level for the '{subsystem}' subsystem",
+            items=SUBSYSTEM_LEVEL_ITEMS,
+            default='DEFAULT',
+            update=update_logging_preferences
+        )
+        for subsystem in SUBSYSTEMS
+    })
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Logging", icon='CONSOLE')
+        row = box.row()
+        row.prop(self, "enable_logging")
+        sub = row.row()
+        sub.enabled = self.enable_logging
+        sub.prop(self, "log_level", text="")
+
+        box.prop(self, "show_subsystem_levels")
+        if self.show_subsystem_levels:
+            col = box.column(align=True)
+            col.enabled = self.enable_logging
+            for subsystem in SUBSYSTEMS:
+                col.prop(self, f"log_level_{subsystem}")
+
+        box = layout.box()
+        box.label(text="Profiling", icon='TIME')
+        row = box.row()
+        row.prop(self, "enable_profiling")
+        sub = row.row()
+        sub.enabled = self.enable_profiling
+        sub.prop(self, "profile_rna_calls")
+        row = box.row(align=True)
+        row.operator("object.cloner_export_profile_trace", icon='EXPORT')
+        row.operator("object.cloner_clear_profile_trace", icon='TRASH')
+
+        box = layout.box()
+        box.label(text="Maintenance", icon='NODETREE')
+        box.prop(self, "dedup_on_load")
+        row = box.row(align=True)
+        row.operator("object.cloner_deduplicate_node_groups", icon='NODETREE')
+        op = row.operator("object.cloner_deduplicate_node_groups", text="Dry Run", icon='VIEWZOOM')
+        op.dry_run = True
+        row = box.row(align=True)
+        row.operator("object.cloner_collect_garbage", icon='TRASH')
+        op = row.operator("object.cloner_collect_garbage", text="Dry Run", icon='VIEWZOOM')
+        op.dry_run = True
+
+
+classes = (
+    ADVANCED_CLONERS_preferences,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    apply_logging_preferences()
+    apply_profiling_preferences()
+    apply_maintenance_preferences()
+
+
+def unregister():
+    profiling.set_enabled(False)
+    node_dedup.set_dedup_on_load(False)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,17 @@
+"""
+Тесты выполняются на фальшивом bpy (benchmarks/fake_bpy.py).
+
+Корень репозитория - пакет аддона, и pytest импортирует его __init__.py по имени
+каталога. Фальшивый bpy ставится до этого, а аддон, загруженный как advanced_cloners,
+регистрируется и под именем каталога, чтобы не импортировать его второй раз.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import fake_bpy  # noqa: E402
+
+fake_bpy.install()
+sys.modules.setdefault(os.path.basename(fake_bpy.ADDON_DIR), fake_bpy.load_addon())
@@ -0,0 +1,96 @@
+"""
+Определение компонентов аддона по модификаторам: classify_modifier (статистика,
+защита бюджета) и ComponentPropertyManager._get_component_type с кэшем по модификатору.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+import fake_bpy
+
+
+@pytest.fixture
+def addon():
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    yield addon
+    fake_bpy.reset()
+
+
+@pytest.fixture
+def classify_modifier(addon):
+    return importlib.import_module(f"{addon.__name__}.core.utils.modifier_stats").classify_modifier
+
+
+@pytest.fixture
+def property_manager(addon):
+    module = importlib.import_module(f"{addon.__name__}.core.utils.property_utils.property_manager")
+    module.ComponentPropertyManager.clear_component_type_cache()
+    yield module.ComponentPropertyManager
+    module.ComponentPropertyManager.clear_component_type_cache()
+
+
+def _object_with_modifier(group_name, modifier_name="Modifier", mod_type='NODES'):
+    bpy = sys.modules["bpy"]
+    obj = bpy.data.objects.new("Object")
+    if mod_type != 'NODES':
+        return obj, obj.modifiers.new(modifier_name, mod_type)
+    return obj, fake_bpy.add_nodes_modifier(obj, modifier_name, fake_bpy.add_node_group(group_name))
+
+
+@pytest.mark.parametrize("group_name, expected", [
+    ("AdvancedGridCloner.001", 'CLONER'),
+    ("AdvancedCircleCloner", 'CLONER'),
+    ("ObjectCloner_GRID_Cube", 'CLONER'),
+    ("CollectionCloner_LINEAR_Set", 'CLONER'),
+    ("RandomEffector.003", 'EFFECTOR'),
+    ("NoiseEffector", 'EFFECTOR'),
+    ("SphereField", 'FIELD'),
+    ("UserGeometryNodes", None),
+])
+def test_classify_modifier_by_node_group(classify_modifier, group_name, expected):
+    _, mod = _object_with_modifier(group_name)
+    assert classify_modifier(mod) == expected
+
+
+def test_classify_modifier_ignores_other_modifiers(classify_modifier):
+    _, mod = _object_with_modifier(None, "Subdivision", 'SUBSURF')
+    assert classify_modifier(mod) is None
+
+    _, nodes = _object_with_modifier("AdvancedGridCloner")
+    nodes.node_group = None
+    assert classify_modifier(nodes) is None
+
+
+@pytest.mark.parametrize("group_name, expected", [
+    ("AdvancedGridCloner", 'grid_cloner'),
+    ("AdvancedLinearCloner.002", 'linear_cloner'),
+    ("CircleCloner_Stack_Cube", 'circle_cloner'),
+    ("RandomEffector", 'random_effector'),
+    ("NoiseEffector.001", 'noise_effector'),
+    ("UserGeometryNodes", 'unknown'),
+])
+def test_component_type_by_node_group_name(property_manager, group_name, expected):
+    obj, mod = _object_with_modifier(group_name)
+    assert property_manager._get_component_type(obj, mod.name) == expected
+
+
+def test_component_type_from_metadata(property_manager):
+    obj, mod = _object_with_modifier("CustomGroup")
+    mod.node_group["metadata"] = '{"type": "Sphere_Field"}'
+    assert property_manager._get_component_type(obj, mod.name) == 'sphere_field'
+
+
+def test_component_type_cache_follows_node_group(property_manager):
+    obj, mod = _object_with_modifier("AdvancedGridCloner")
+    assert property_manager._get_component_type(obj, mod.name) == 'grid_cloner'
+
+    mod.node_group = fake_bpy.add_node_group("RandomEffector")
+    assert property_manager._get_component_type(obj, mod.name) == 'random_effector'
+
+
+def test_component_type_of_missing_modifier(property_manager):
+    obj, _ = _object_with_modifier("AdvancedGridCloner")
+    assert property_manager._get_component_type(obj, "Missing") == 'unknown'
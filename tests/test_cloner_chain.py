@@ -0,0 +1,97 @@
+"""
+Обход цепочек клонеров (core/utils/duplicator.get_cloner_chain_for_object):
+цепочки клонеров коллекций через chain_source_collection и клонеров объектов
+через previous_cloner_object.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+import fake_bpy
+
+
+@pytest.fixture
+def chain_for_object():
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    yield importlib.import_module(f"{addon.__name__}.core.utils.duplicator").get_cloner_chain_for_object
+    fake_bpy.reset()
+
+
+def _collection_chain(length):
+    """Цепочка клонеров коллекций: звено клонирует коллекцию, созданную предыдущим."""
+    bpy = sys.modules["bpy"]
+    objects = []
+    for i in range(length):
+        obj = bpy.data.objects.new(f"Cloner_{i}")
+        group = fake_bpy.add_node_group(f"CollectionCloner_GRID_{i}", ("Count X",))
+        mod = fake_bpy.add_nodes_modifier(obj, "Grid Cloner", group,
+                                          cloner_collection=f"ClonerTo_{i}",
+                                          original_collection=f"ClonerFrom_{i}")
+        if i:
+            mod["is_chained_cloner"] = True
+            mod["chain_source_collection"] = f"ClonerTo_{i - 1}"
+        objects.append(obj)
+    return objects
+
+
+def _object_chain(length):
+    """Цепочка клонеров объекта: звено ссылается на предыдущий объект клонера."""
+    bpy = sys.modules["bpy"]
+    source = bpy.data.objects.new("Cube")
+    objects = []
+    for i in range(length):
+        obj = bpy.data.objects.new(f"Cloner_Cube_{i}")
+        group = fake_bpy.add_node_group(f"ObjectCloner_GRID_Cube_{i}", ("Count X",))
+        mod = fake_bpy.add_nodes_modifier(obj, "Grid Cloner", group, original_object=source.name)
+        if objects:
+            mod["is_chained_cloner"] = True
+            mod["previous_cloner_object"] = objects[-1].name
+        objects.append(obj)
+    return objects
+
+
+def _chain_objects(chain):
+    return [link["object"] for link in chain]
+
+
+def test_collection_chain_is_listed_from_source(chain_for_object):
+    objects = _collection_chain(3)
+
+    chain = chain_for_object(objects[-1])
+
+    assert _chain_objects(chain) == ["Cloner_0", "Cloner_1", "Cloner_2"]
+    assert all(link["is_collection_cloner"] for link in chain)
+    assert all(link["modifier"] == "Grid Cloner" for link in chain)
+
+
+def test_first_link_has_no_predecessors(chain_for_object):
+    objects = _collection_chain(3)
+    assert _chain_objects(chain_for_object(objects[0])) == ["Cloner_0"]
+
+
+def test_object_chain_follows_previous_cloner(chain_for_object):
+    objects = _object_chain(3)
+
+    chain = chain_for_object(objects[-1])
+
+    assert _chain_objects(chain) == ["Cloner_Cube_0", "Cloner_Cube_1", "Cloner_Cube_2"]
+    assert not any(link["is_collection_cloner"] for link in chain)
+
+
+def test_cyclic_chain_lists_each_link_once(chain_for_object):
+    objects = _collection_chain(3)
+    first = objects[0].modifiers["Grid Cloner"]
+    first["is_chained_cloner"] = True
+    first["chain_source_collection"] = "ClonerTo_2"
+
+    chain = chain_for_object(objects[-1])
+
+    assert sorted(_chain_objects(chain)) == ["Cloner_0", "Cloner_1", "Cloner_2"]
+
+
+def test_object_without_cloners_has_empty_chain(chain_for_object):
+    bpy = sys.modules["bpy"]
+    assert chain_for_object(bpy.data.objects.new("Plain")) == []
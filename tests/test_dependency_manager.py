@@ -0,0 +1,157 @@
+"""
+Граф связей компонентов (core/utils/property_utils/dependency_manager.py):
+связывание и отвязывание, переименование и удаление модификаторов, запись в сцену
+и загрузка сохраненного графа форматов 1 и 2.
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+import fake_bpy
+
+
+def _clear_saved_graph(module):
+    # fake_bpy.reset() очищает bpy.data, но свойства сцены остаются
+    scene = sys.modules["bpy"].context.scene
+    if module.GRAPH_PROP in scene:
+        del scene[module.GRAPH_PROP]
+
+
+@pytest.fixture
+def dm():
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    module = importlib.import_module(f"{addon.__name__}.core.utils.property_utils.dependency_manager")
+    _clear_saved_graph(module)
+    yield module
+    _clear_saved_graph(module)
+    fake_bpy.reset()
+
+
+@pytest.fixture
+def manager(dm):
+    return dm.ComponentDependencyManager()
+
+
+@pytest.fixture
+def stack():
+    """Объект сцены с клонером и двумя эффекторами."""
+    bpy = sys.modules["bpy"]
+    obj = bpy.data.objects.new("Cloner_Cube")
+    bpy.context.scene.collection.objects.link(obj)
+    cloner = fake_bpy.add_nodes_modifier(obj, "Grid Cloner", fake_bpy.add_node_group("AdvancedGridCloner"))
+    random = fake_bpy.add_nodes_modifier(obj, "Random Effector", fake_bpy.add_node_group("RandomEffector"))
+    noise = fake_bpy.add_nodes_modifier(obj, "Noise Effector", fake_bpy.add_node_group("NoiseEffector"))
+    return obj, cloner, random, noise
+
+
+def _saved_graph(dm):
+    return json.loads(sys.modules["bpy"].context.scene[dm.GRAPH_PROP])
+
+
+def test_link_updates_both_directions_and_mirror(dm, manager, stack):
+    obj, cloner, random, noise = stack
+
+    assert manager.link_effector_to_cloner(obj, cloner, random)
+    assert manager.link_effector_to_cloner(obj, cloner, noise)
+    assert not manager.link_effector_to_cloner(obj, cloner, random)
+
+    assert manager.get_effector_names(obj, cloner) == ["Random Effector", "Noise Effector"]
+    assert manager.get_cloners_for_effector(obj, noise) == [cloner]
+    assert manager.is_linked(obj, cloner, random)
+    assert list(cloner.node_group[dm.LINKED_EFFECTORS_KEY]) == ["Random Effector", "Noise Effector"]
+
+
+def test_unlink_removes_reverse_edge(dm, manager, stack):
+    obj, cloner, random, noise = stack
+    manager.set_cloner_effectors(obj, cloner, ["Random Effector", "Noise Effector"])
+
+    assert manager.unlink_effector_from_cloner(obj, cloner, random)
+    assert not manager.unlink_effector_from_cloner(obj, cloner, "Random Effector")
+
+    assert manager.get_effector_names(obj, cloner) == ["Noise Effector"]
+    assert manager.get_cloners_for_effector(obj, random) == []
+    assert list(cloner.node_group[dm.LINKED_EFFECTORS_KEY]) == ["Noise Effector"]
+
+
+def test_rename_keeps_links_and_updates_mirror(dm, manager, stack):
+    obj, cloner, random, _ = stack
+    manager.link_effector_to_cloner(obj, cloner, random)
+
+    obj.modifiers.rename(random, "Jitter")
+    manager.update_after_modifier_rename(obj, "Random Effector", "Jitter")
+
+    assert manager.get_effector_names(obj, cloner) == ["Jitter"]
+    assert manager.get_cloners_for_effector(obj, random) == [cloner]
+    assert list(cloner.node_group[dm.LINKED_EFFECTORS_KEY]) == ["Jitter"]
+
+
+def test_removed_effector_leaves_graph_and_saved_data(dm, manager, stack):
+    obj, cloner, random, noise = stack
+    manager.set_cloner_effectors(obj, cloner, ["Random Effector", "Noise Effector"])
+
+    obj.modifiers.remove(random)
+    manager.update_after_modifier_removal(obj, "Random Effector")
+
+    assert manager.get_effector_names(obj, cloner) == ["Noise Effector"]
+    assert list(cloner.node_group[dm.LINKED_EFFECTORS_KEY]) == ["Noise Effector"]
+    (entry,) = _saved_graph(dm)["o"].values()
+    assert entry["e"] == [[cloner.persistent_uid, noise.persistent_uid]]
+
+
+def test_removed_cloner_drops_object_from_saved_graph(dm, manager, stack):
+    obj, cloner, random, _ = stack
+    manager.link_effector_to_cloner(obj, cloner, random)
+
+    obj.modifiers.remove(cloner)
+    manager.update_after_modifier_removal(obj, "Grid Cloner")
+
+    assert manager.get_cloners_for_effector(obj, random) == []
+    assert dm.GRAPH_PROP not in sys.modules["bpy"].context.scene
+
+
+def test_load_from_scene_v2_resolves_objects_by_uid(dm, manager, stack):
+    obj, cloner, random, noise = stack
+    manager.set_cloner_effectors(obj, cloner, ["Noise Effector", "Random Effector"])
+    saved = _saved_graph(dm)
+    assert saved["v"] == dm.GRAPH_FORMAT_VERSION
+    assert list(saved["o"]) == [obj[dm.GRAPH_UID_PROP]]
+
+    # Переименование объекта не теряет сохраненные связи
+    sys.modules["bpy"].data.objects.rename(obj, "Renamed")
+    del cloner.node_group[dm.LINKED_EFFECTORS_KEY]
+    loaded = dm.ComponentDependencyManager()
+    assert loaded.load_from_scene(sys.modules["bpy"].context.scene) == 1
+
+    assert loaded.get_effector_names(obj, cloner) == ["Noise Effector", "Random Effector"]
+    assert loaded.get_cloners_for_effector(obj, random) == [cloner]
+
+
+def test_load_from_scene_v1_resolves_objects_by_name(dm, stack):
+    obj, cloner, random, _ = stack
+    scene = sys.modules["bpy"].context.scene
+    scene[dm.GRAPH_PROP] = json.dumps({"v": 1, "o": {
+        obj.name: {"e": [[cloner.persistent_uid, random.persistent_uid]]},
+        "Deleted Object": {"e": [[1, 2]]},
+    }})
+
+    manager = dm.ComponentDependencyManager()
+    assert manager.load_from_scene(scene) == 1
+
+    assert manager.get_effector_names(obj, cloner) == ["Random Effector"]
+
+
+def test_load_skips_unknown_version(dm, manager):
+    scene = sys.modules["bpy"].context.scene
+    scene[dm.GRAPH_PROP] = json.dumps({"v": 99, "o": {}})
+    assert manager.load_from_scene(scene) == 0
+
+
+def test_graph_is_rebuilt_from_mirror_without_saved_data(dm, manager, stack):
+    obj, cloner, random, _ = stack
+    cloner.node_group[dm.LINKED_EFFECTORS_KEY] = ["Random Effector"]
+
+    assert manager.get_cloners_for_effector(obj, random) == [cloner]
@@ -0,0 +1,100 @@
+"""
+Обработчик параметров эффекторов (event_handlers.effector_parameter_update_handler):
+первый вызов запоминает значения сокетов, клонеры обновляются только после изменения
+значения, и только связанные с измененным эффектором.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+import fake_bpy
+
+EFFECTOR_SOCKETS = ("Enable", "Strength", "Position")
+
+
+@pytest.fixture
+def handlers():
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    module = importlib.import_module(f"{addon.__name__}.core.utils.event_handlers")
+    module._effector_last_parameters.clear()
+    module._effector_handler_blocked = False
+    module._effector_handler_call_count = 0
+    module.dependency_manager.clear()
+    yield module
+    module._effector_last_parameters.clear()
+    module.dependency_manager.clear()
+    fake_bpy.reset()
+
+
+def _cloner_with_effector(name):
+    bpy = sys.modules["bpy"]
+    obj = bpy.data.objects.new(name)
+    effector = fake_bpy.add_nodes_modifier(obj, "Random Effector",
+                                           fake_bpy.add_node_group(f"RandomEffector_{name}", EFFECTOR_SOCKETS))
+    fake_bpy.add_nodes_modifier(obj, "Grid Cloner", fake_bpy.add_node_group(
+        f"AdvancedGridCloner_{name}", ("Count X",), linked_effectors=[effector.name]))
+    return obj, effector
+
+
+def _refreshes():
+    return sys.modules["bpy"].context.view_layer.update_count
+
+
+def test_first_call_only_records_parameters(handlers):
+    obj, effector = _cloner_with_effector("Cloner_A")
+
+    handlers.effector_parameter_update_handler(None, fake_bpy.Depsgraph([obj]))
+
+    assert handlers._effector_last_parameters[f"{obj.name}__{effector.name}"] == {
+        "Socket_0": 0.0, "Socket_1": 0.0, "Socket_2": 0.0}
+    assert obj.tag_count == 0
+    assert _refreshes() == 0
+
+
+def test_unchanged_parameters_do_not_refresh_cloners(handlers):
+    obj, _ = _cloner_with_effector("Cloner_A")
+    depsgraph = fake_bpy.Depsgraph([obj])
+
+    handlers.effector_parameter_update_handler(None, depsgraph)
+    handlers.effector_parameter_update_handler(None, depsgraph)
+
+    assert obj.tag_count == 0
+    assert _refreshes() == 0
+
+
+def test_changed_parameter_refreshes_linked_cloner(handlers):
+    obj, effector = _cloner_with_effector("Cloner_A")
+    other, _ = _cloner_with_effector("Cloner_B")
+    depsgraph = fake_bpy.Depsgraph([obj, other])
+    handlers.effector_parameter_update_handler(None, depsgraph)
+
+    effector["Socket_1"] = 0.5
+    handlers.effector_parameter_update_handler(None, depsgraph)
+
+    assert obj.tag_count == 1
+    assert other.tag_count == 0
+    assert _refreshes() == 1
+    assert handlers._effector_last_parameters[f"{obj.name}__{effector.name}"]["Socket_1"] == 0.5
+
+    # То же значение повторно не считается изменением
+    handlers.effector_parameter_update_handler(None, depsgraph)
+    assert obj.tag_count == 1
+
+
+def test_handler_skips_while_blocked(handlers):
+    obj, effector = _cloner_with_effector("Cloner_A")
+    depsgraph = fake_bpy.Depsgraph([obj])
+    handlers.effector_parameter_update_handler(None, depsgraph)
+
+    effector["Socket_1"] = 0.5
+    handlers._effector_handler_blocked = True
+    try:
+        handlers.effector_parameter_update_handler(None, depsgraph)
+    finally:
+        handlers._effector_handler_blocked = False
+
+    assert obj.tag_count == 0
+    assert handlers._effector_last_parameters[f"{obj.name}__{effector.name}"]["Socket_1"] == 0.0
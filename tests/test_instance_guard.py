@@ -0,0 +1,108 @@
+"""
+Защита бюджета инстансов (core/utils/instance_guard.py): обработчик depsgraph
+повторяет проверку только тогда, когда обновление сбросило оценки.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+import fake_bpy
+
+
+@pytest.fixture
+def guard(monkeypatch):
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    module = importlib.import_module(f"{addon.__name__}.core.utils.instance_guard")
+    module.scene_estimates.clear()
+    module.last_estimate.update(total=0, budget=0, over_budget=False, clamped=[])
+    monkeypatch.setattr(module, "_check_pending", False)
+    monkeypatch.setattr(module, "handlers_blocked", lambda: False)
+    yield module
+    module.scene_estimates.clear()
+    fake_bpy.reset()
+
+
+@pytest.fixture
+def checks(guard, monkeypatch):
+    """Сцены, для которых обработчик выполнил check_instance_budget."""
+    calls = []
+    real_check = guard.check_instance_budget
+
+    def check(scene, estimates_cache=None):
+        calls.append(scene.name)
+        return real_check(scene, estimates_cache)
+
+    monkeypatch.setattr(guard, "check_instance_budget", check)
+    return calls
+
+
+@pytest.fixture
+def scene():
+    bpy = sys.modules["bpy"]
+    scene = bpy.context.scene
+    scene.cloner_instance_guard = 'WARN'
+    scene.cloner_instance_budget = 1000
+    return scene
+
+
+def _add_object(scene, name):
+    bpy = sys.modules["bpy"]
+    obj = bpy.data.objects.new(name, bpy.data.meshes.new(f"{name}_Mesh"))
+    scene.collection.objects.link(obj)
+    return obj
+
+
+def _add_cloner(scene, name, source, count):
+    obj = _add_object(scene, name)
+    group = fake_bpy.add_node_group(f"ObjectCloner_GRID_{name}", ("Count X",))
+    fake_bpy.add_nodes_modifier(obj, "Cloner", group, Socket_0=count, original_object=source.name)
+    return obj
+
+
+def test_handler_checks_only_when_estimates_change(guard, checks, scene):
+    source = _add_object(scene, "Source")
+    cloner = _add_cloner(scene, "Cloner", source, 10)
+    other = _add_object(scene, "Other")
+
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph())
+    assert checks == ["Scene"]
+    assert guard.last_estimate["total"] == 10
+
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph([other]))
+    assert checks == ["Scene"]
+
+    cloner.modifiers["Cloner"]["Socket_0"] = 20
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph([cloner]))
+    assert checks == ["Scene", "Scene"]
+    assert guard.last_estimate["total"] == 20
+
+
+def test_budget_change_repeats_check(guard, checks, scene):
+    source = _add_object(scene, "Source")
+    _add_cloner(scene, "Cloner", source, 10)
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph())
+
+    scene.cloner_instance_budget = 5
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph([scene]))
+
+    assert len(checks) == 2
+    assert guard.last_estimate["over_budget"]
+
+
+def test_check_is_deferred_while_handlers_blocked(guard, checks, scene, monkeypatch):
+    source = _add_object(scene, "Source")
+    cloner = _add_cloner(scene, "Cloner", source, 10)
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph())
+
+    monkeypatch.setattr(guard, "handlers_blocked", lambda: True)
+    cloner.modifiers["Cloner"]["Socket_0"] = 30
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph([cloner]))
+    assert len(checks) == 1
+
+    monkeypatch.setattr(guard, "handlers_blocked", lambda: False)
+    guard.instance_guard_handler(scene, fake_bpy.Depsgraph())
+    assert len(checks) == 2
+    assert guard.last_estimate["total"] == 30
@@ -0,0 +1,77 @@
+"""
+Миграции схемы групп клонеров (core/utils/migrations.py, GroupExtender):
+шаг, которому нечего исправлять, только отмечает версию схемы и не считается изменением.
+"""
+
+import importlib
+
+import pytest
+
+import fake_bpy
+
+
+@pytest.fixture
+def migrations():
+    addon = fake_bpy.load_addon()
+    fake_bpy.reset()
+    module = importlib.import_module(f"{addon.__name__}.core.utils.migrations")
+    module.register_migrations()
+    module.GroupExtender.clear_session_cache()
+    yield module
+    module.GroupExtender.clear_session_cache()
+    fake_bpy.reset()
+
+
+def test_group_without_fix_is_stamped_but_not_changed(migrations):
+    extender = migrations.GroupExtender
+    group = fake_bpy.add_node_group("GridCloner_Test", ("Realize Instances",))
+    assert extender.needs_migration(group)
+
+    assert extender.migrate_node_group(group) is False
+
+    assert group[extender.SCHEMA_VERSION_KEY] == migrations.SCHEMA_ANTI_RECURSION
+    assert group[extender.SCHEMA_TYPE_KEY] == "GridCloner"
+    assert not extender.needs_migration(group)
+
+
+def test_failed_step_leaves_schema_unstamped(migrations, monkeypatch):
+    extender = migrations.GroupExtender
+    group = fake_bpy.add_node_group("GridCloner_Broken")
+    monkeypatch.setitem(extender._updates_registry["GridCloner"], migrations.SCHEMA_ANTI_RECURSION,
+                        lambda node_group: False)
+
+    assert extender.migrate_node_group(group) is False
+    assert extender.SCHEMA_VERSION_KEY not in group
+
+
+def test_changing_step_reports_migration(migrations, monkeypatch):
+    extender = migrations.GroupExtender
+    group = fake_bpy.add_node_group("LinearCloner_Old")
+    monkeypatch.setitem(extender._updates_registry["LinearCloner"], migrations.SCHEMA_ANTI_RECURSION,
+                        lambda node_group: True)
+
+    assert extender.migrate_node_group(group) is True
+    assert group[extender.SCHEMA_VERSION_KEY] == migrations.SCHEMA_ANTI_RECURSION
+
+
+def test_legacy_metadata_version_gets_all_steps(migrations):
+    extender = migrations.GroupExtender
+    group = fake_bpy.add_node_group("CircleCloner_Legacy", ("Realize Instances",),
+                                    metadata='{"version": "1.0", "extensions": [], "type": "CircleCloner"}')
+
+    assert extender.schema_version(group) == 0
+    assert extender.needs_migration(group)
+    extender.migrate_node_group(group)
+    assert group[extender.SCHEMA_VERSION_KEY] == migrations.SCHEMA_ANTI_RECURSION
+
+
+def test_new_group_is_stamped_with_latest_schema(migrations):
+    extender = migrations.GroupExtender
+    group = fake_bpy.add_node_group("ObjectCloner_GRID_Cube")
+
+    extender.stamp_latest_schema(group, "ObjectCloner")
+
+    assert group[extender.SCHEMA_VERSION_KEY] == extender.latest_schema("ObjectCloner")
+    assert group[extender.SCHEMA_TYPE_KEY] == "ObjectCloner"
+    assert not extender.needs_migration(group)
+    assert extender.migrate_node_group(group) is False
@@ -0,0 +1,100 @@
+"""
+Регистрация аддона на фальшивом bpy (benchmarks/fake_bpy.py): register() ставит
+обработчики из манифеста регистрации, unregister() снимает все обработчики аддона,
+а модели и помощники операторов, загружаемые лениво, при регистрации не импортируются.
+
+Запуск из корня репозитория:
+    python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import fake_bpy
+
+
+# Модули, которые импортируются только при первом использовании
+LAZY_MODULES = (
+    "models.cloners.grid_cloner",
+    "models.cloners.linear_cloner",
+    "models.cloners.circle_cloner",
+    "models.effectors.random_effector",
+    "models.fields.sphere_field",
+    "operations.helpers.object_cloner",
+    "operations.helpers.stacked_cloner",
+    "operations.helpers.chain_utils",
+)
+
+
+@pytest.fixture(scope="module")
+def addon():
+    return fake_bpy.load_addon()
+
+
+def _installed_handlers():
+    handlers = sys.modules["bpy"].app.handlers
+    return {name: list(getattr(handlers, name)) for name in fake_bpy.HANDLER_LISTS if getattr(handlers, name)}
+
+
+def _manifest_handlers(addon):
+    from importlib import import_module
+
+    registration = import_module(f"{addon.__name__}.core.factories.registration")
+    return registration._manifest_handlers(addon.__name__)
+
+
+def test_register_installs_manifest_handlers(addon):
+    expected = _manifest_handlers(addon)
+    assert expected
+
+    addon.register()
+    try:
+        installed = _installed_handlers()
+        for handler_list, handler in expected:
+            assert installed.get(handler_list, []).count(handler) == 1, (handler_list, handler.__name__)
+    finally:
+        addon.unregister()
+
+
+def test_unregister_removes_all_handlers(addon):
+    addon.register()
+    addon.unregister()
+    assert _installed_handlers() == {}
+
+
+def test_reregister_does_not_duplicate_handlers(addon):
+    addon.register()
+    addon.unregister()
+    addon.register()
+    try:
+        installed = _installed_handlers()
+        for handler_list, handler in _manifest_handlers(addon):
+            assert installed[handler_list].count(handler) == 1, (handler_list, handler.__name__)
+    finally:
+        addon.unregister()
+    assert _installed_handlers() == {}
+
+
+def test_register_leaves_lazy_modules_unimported():
+    # Другие тесты сессии импортируют эти модули, поэтому аддон загружается в отдельном процессе
+    script = textwrap.dedent(f"""
+        import sys
+        sys.path.insert(0, {os.path.dirname(fake_bpy.__file__)!r})
+        import fake_bpy
+        fake_bpy.install()
+        addon = fake_bpy.load_addon()
+        addon.register()
+        try:
+            for module in {LAZY_MODULES!r}:
+                if addon.__name__ + "." + module in sys.modules:
+                    print(module)
+        finally:
+            addon.unregister()
+    """)
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == []
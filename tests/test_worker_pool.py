@@ -0,0 +1,120 @@
+"""
+Пул рабочих потоков (core/utils/worker_pool.py): отмена задач и остановка пула
+при отключении аддона.
+"""
+
+import importlib
+import sys
+import threading
+
+import pytest
+
+import fake_bpy
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def worker_pool(monkeypatch):
+    addon = fake_bpy.load_addon()
+    module = importlib.import_module(f"{addon.__name__}.core.utils.worker_pool")
+    module.shutdown()
+    # Один поток: вторая задача гарантированно ждет в очереди пула
+    monkeypatch.setattr(module, "MAX_THREADS", 1)
+    yield module
+    module.shutdown()
+
+
+def _pool_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("AdvancedClonersWorker") and t.is_alive()]
+
+
+def _blocking_task(worker_pool, started=None):
+    release = threading.Event()
+
+    def block():
+        if started is not None:
+            started.set()
+        release.wait(TIMEOUT)
+        return "blocked"
+
+    return worker_pool.submit(block), release
+
+
+def test_cancel_before_start_skips_on_done(worker_pool):
+    delivered = []
+    blocker, release = _blocking_task(worker_pool)
+    task = worker_pool.submit(lambda: "result", on_done=delivered.append)
+
+    assert task.cancel()
+    release.set()
+    blocker._future.result(TIMEOUT)
+    worker_pool._deliver_results()
+
+    assert task._future.cancelled()
+    assert delivered == []
+
+
+def test_cancel_while_running_skips_on_done(worker_pool):
+    delivered = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def work():
+        started.set()
+        release.wait(TIMEOUT)
+        return "result"
+
+    task = worker_pool.submit(work, on_done=delivered.append)
+    assert started.wait(TIMEOUT)
+
+    assert task.cancel()
+    release.set()
+    task._future.result(TIMEOUT)
+    worker_pool._deliver_results()
+
+    assert task.done
+    assert delivered == []
+
+
+def test_cancel_all_empties_pending(worker_pool):
+    blocker, release = _blocking_task(worker_pool)
+    worker_pool.submit(lambda: None)
+    worker_pool.submit(lambda: None)
+    assert len(worker_pool.pending_tasks()) == 3
+
+    assert worker_pool.cancel_all() == 3
+    assert worker_pool.pending_tasks() == []
+    release.set()
+    assert blocker.cancelled
+
+
+def test_shutdown_joins_workers_and_unregisters_timer(worker_pool):
+    timers = sys.modules["bpy"].app.timers
+    started = threading.Event()
+    _, release = _blocking_task(worker_pool, started)
+    worker_pool.submit(lambda: None)
+    assert started.wait(TIMEOUT)
+    assert _pool_threads()
+    assert timers.is_registered(worker_pool._deliver_results)
+
+    release.set()
+    assert worker_pool.shutdown(timeout=TIMEOUT)
+
+    assert _pool_threads() == []
+    assert worker_pool.pending_tasks() == []
+    assert not timers.is_registered(worker_pool._deliver_results)
+
+
+def test_unregister_leaves_no_pool_threads(worker_pool):
+    addon = fake_bpy.load_addon()
+    addon.register()
+    try:
+        task = worker_pool.submit(lambda: "result")
+        task._future.result(TIMEOUT)
+        assert _pool_threads()
+    finally:
+        addon.unregister()
+
+    assert _pool_threads() == []
+    assert worker_pool.pending_tasks() == []
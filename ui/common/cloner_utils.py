@@ -1,6 +1,11 @@
 import bpy
 from ..common.ui_utils import display_socket_prop, find_socket_by_name, get_stacked_cloner_info
 
+from ...core.utils.property_utils.dependency_manager import dependency_manager
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("ui")
+
 # Moved from cloner_settings_panel.py
 def draw_collection_cloner_settings(layout, modifier, cloner_type):
     """Отображает настройки клонера коллекций"""
@@ -310,7 +315,7 @@ def draw_common_cloner_settings(layout, modifier, context, is_chain_menu=False):
 
     # Получаем информацию о подключенных эффекторах
     if modifier.node_group and "linked_effectors" in modifier.node_group:
-        linked_effectors = list(modifier.node_group["linked_effectors"])
+        linked_effectors = dependency_manager.get_effector_names(modifier.id_data, modifier)
 
         if linked_effectors:
             effector_box.label(text="Linked Effectors:")
@@ -383,7 +388,7 @@ def force_select_object(context, obj_name):
         bool: True если объект выбран успешно
     """
     if not obj_name or obj_name not in bpy.data.objects:
-        print(f"[SELECT] Ошибка: объект '{obj_name}' не найден")
+        log.error("[SELECT] Ошибка: объект '%s' не найден", obj_name)
         return False
 
     try:
@@ -403,10 +408,10 @@ def force_select_object(context, obj_name):
             for area in window.screen.areas:
                 area.tag_redraw()
 
-        print(f"[SELECT] Объект '{obj_name}' успешно выбран и установлен активным")
+        log.debug("[SELECT] Объект '%s' успешно выбран и установлен активным", obj_name)
         return True
     except Exception as e:
-        print(f"[SELECT] Ошибка при выборе объекта '{obj_name}': {e}")
+        log.error("[SELECT] Ошибка при выборе объекта '%s': %s", obj_name, e)
         import traceback
         traceback.print_exc()
         return False
\ No newline at end of file
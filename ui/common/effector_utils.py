@@ -1,5 +1,6 @@
 import bpy
 from ..common.ui_utils import display_socket_prop, is_element_expanded
+from ...core.utils.property_utils.dependency_manager import dependency_manager
 
 def draw_effector_ui(context, layout, obj, mod):
     """
@@ -59,26 +60,16 @@ def draw_effector_expanded_ui(context, box, obj, mod):
     Перемещен из effector_panel.py
     """
     # --- Показываем связи с клонерами ---
-    # Находим обычные клонеры, связанные с этим эффектором
+    # Клонеры, связанные с этим эффектором, из обратного индекса графа зависимостей
     linked_cloners = []
-    for cloner_mod in obj.modifiers:
-        if cloner_mod.type == 'NODES' and cloner_mod.node_group and cloner_mod.node_group.get("linked_effectors") is not None:
-            if mod.name in cloner_mod.node_group.get("linked_effectors", []):
-                linked_cloners.append(cloner_mod)
-
-    # Находим стековые клонеры, связанные с этим эффектором
     stacked_linked_cloners = []
-    for cloner_mod in obj.modifiers:
-        if (cloner_mod.type == 'NODES' and cloner_mod.node_group and
-            (cloner_mod.get("is_stacked_cloner") or
-             (cloner_mod.node_group and cloner_mod.node_group.get("is_stacked_cloner"))) and
-            cloner_mod.node_group.get("linked_effectors") is not None):
-
-            # Преобразуем значение linked_effectors в список Python
-            linked_effectors = list(cloner_mod.node_group.get("linked_effectors", []))
-
-            if mod.name in linked_effectors:
-                stacked_linked_cloners.append(cloner_mod)
+    for cloner_mod in dependency_manager.get_cloners_for_effector(obj, mod):
+        if not cloner_mod.node_group:
+            continue
+        if cloner_mod.get("is_stacked_cloner") or cloner_mod.node_group.get("is_stacked_cloner"):
+            stacked_linked_cloners.append(cloner_mod)
+        else:
+            linked_cloners.append(cloner_mod)
 
     # Информация о связанных клонерах
     if linked_cloners or stacked_linked_cloners:
@@ -40,6 +40,18 @@ UI_CHAIN_ACTIVE_ICON = "RADIOBUT_ON"
 UI_CHAIN_INACTIVE_ICON = "RADIOBUT_OFF"
 UI_CHAIN_BOX_PADDING = 5
 
+# Modifier timing statistics constants
+UI_STATS_MAX_ROWS = 10
+ICON_STATS = "TIME"
+
+# Instance and memory report constants
+ICON_INSTANCES = "MEMORY"
+ICON_REALIZE_WARNING = "ERROR"
+
+# Background job progress constants
+ICON_JOB = "SORTTIME"
+ICON_JOB_CANCEL = "CANCEL"
+
 # Effector panel constants
 UI_EFFECTOR_PANEL_CATEGORY = "Cloners"
 UI_EFFECTOR_PANEL_REGION = "UI"
@@ -4,9 +4,14 @@ from bpy.props import StringProperty, BoolProperty, EnumProperty
 
 from ..common.ui_utils import is_element_expanded, set_element_expanded, find_socket_by_name
 from ...core.utils.cloner_effector_utils import update_cloner_with_effectors
+from ...core.utils.property_utils.dependency_manager import dependency_manager
 from ...models.cloners import CLONER_NODE_GROUP_PREFIXES
 from ...models.effectors import EFFECTOR_NODE_GROUP_PREFIXES
 
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("ui")
+
 class CLONER_OT_add_effector(Operator):
     bl_idname = "object.cloner_add_effector"
     bl_label  = "Add Effector to Cloner"
@@ -55,25 +60,11 @@ class CLONER_OT_remove_effector(Operator):
         mod = obj.modifiers.get(self.cloner_name)
         if not mod or not mod.node_group:
             return {'CANCELLED'}
-        grp = mod.node_group
-        linked = list(grp.get("linked_effectors", []))
-        if self.effector_name in linked:
-            linked.remove(self.effector_name)
-            grp["linked_effectors"] = linked
-            
-            # Проверим, нужно ли отключить эффектор полностью
-            # Проверяем, связан ли эффектор с другими клонерами
-            effector_still_used = False
-            for m in obj.modifiers:
-                if m != mod and m.type == 'NODES' and m.node_group and m.node_group.get("linked_effectors") is not None:
-                    if self.effector_name in m.node_group.get("linked_effectors", []):
-                        effector_still_used = True
-                        break
-            
-            # Если эффектор больше не используется нигде, отключаем его
-            if not effector_still_used:
-                effector_mod = obj.modifiers.get(self.effector_name)
-                if effector_mod and effector_mod.node_group:
+        if dependency_manager.unlink_effector_from_cloner(obj, mod, self.effector_name):
+            # Если эффектор больше не связан ни с одним клонером, отключаем его
+            effector_mod = obj.modifiers.get(self.effector_name)
+            if effector_mod and not dependency_manager.get_cloners_for_effector(obj, effector_mod):
+                if effector_mod.node_group:
                     # Отключаем видимость эффектора, так как он больше не привязан ни к одному клонеру
                     effector_mod.show_viewport = False
                     
@@ -161,7 +152,7 @@ class CLONER_OT_link_effector(Operator):
                     if is_cloner:
                         cloner_mod = mod
                         self.cloner_name = mod.name
-                        print(f"[DEBUG] link_effector: Найден клонер {mod.name} в активном объекте")
+                        log.debug("link_effector: Найден клонер %s в активном объекте", mod.name)
                         break
             
             # Ищем эффектор в выделенных объектах
@@ -187,7 +178,7 @@ class CLONER_OT_link_effector(Operator):
                             
                             if is_effector:
                                 self.effector_name = mod.name
-                                print(f"[DEBUG] link_effector: Найден эффектор {mod.name} в выделенном объекте {sel_obj.name}")
+                                log.debug("link_effector: Найден эффектор %s в выделенном объекте %s", mod.name, sel_obj.name)
                                 break
                     
                     if self.effector_name:
@@ -197,7 +188,7 @@ class CLONER_OT_link_effector(Operator):
             self.report({'ERROR'}, "Please select cloner and effector objects")
             return {'CANCELLED'}
         
-        print(f"[DEBUG] link_effector: Linking effector {self.effector_name} to cloner {self.cloner_name}")
+        log.debug("link_effector: Linking effector %s to cloner %s", self.effector_name, self.cloner_name)
         
         # Находим объект клонера и эффектора
         cloner_obj = obj
@@ -281,22 +272,16 @@ class CLONER_OT_unlink_effector(Operator):
             self.report({'ERROR'}, f"Cloner '{self.cloner_name}' not found")
             return {'CANCELLED'}
         
-        # Получаем список связанных эффекторов
-        if "linked_effectors" not in cloner_mod.node_group:
+        # Проверяем наличие связанных эффекторов
+        if not dependency_manager.has_effectors(obj, cloner_mod):
             self.report({'WARNING'}, f"Cloner '{self.cloner_name}' has no linked effectors")
             return {'CANCELLED'}
         
-        linked_effectors = list(cloner_mod.node_group["linked_effectors"])
-        
-        # Проверяем, что эффектор действительно связан
-        if self.effector_name not in linked_effectors:
+        # Удаляем эффектор из графа зависимостей
+        if not dependency_manager.unlink_effector_from_cloner(obj, cloner_mod, self.effector_name):
             self.report({'WARNING'}, f"Effector '{self.effector_name}' is not linked to this cloner")
             return {'CANCELLED'}
         
-        # Удаляем эффектор из списка
-        linked_effectors.remove(self.effector_name)
-        cloner_mod.node_group["linked_effectors"] = linked_effectors
-        
         # Обновляем нод-группу клонера
         update_cloner_with_effectors(obj, cloner_mod)
         
@@ -347,13 +332,7 @@ class CLONER_OT_add_effector_to_cloner(Operator):
                 
                 if is_effector:
                     # Проверяем, не привязан ли эффектор уже к активному клонеру
-                    already_linked = False
-                    if "linked_effectors" in active_cloner.node_group:
-                        linked_effectors = active_cloner.node_group["linked_effectors"]
-                        if mod.name in linked_effectors:
-                            already_linked = True
-                    
-                    if not already_linked:
+                    if not dependency_manager.is_linked(obj, active_cloner, mod):
                         available_effectors.append((mod.name, mod.name, ""))
         
         # Если нет доступных эффекторов, предлагаем создать новый
@@ -394,11 +373,11 @@ class CLONER_OT_set_active_in_chain(Operator):
         if context.scene.active_cloner_in_chain == new_active_cloner:
             # Если клонер уже активен, сбрасываем свойство (сворачиваем меню)
             context.scene.active_cloner_in_chain = ""
-            print(f"Свернуто меню клонера: {new_active_cloner}")
+            log.debug("Свернуто меню клонера: %s", new_active_cloner)
         else:
             # Если клонер не был активен, делаем его активным
             context.scene.active_cloner_in_chain = new_active_cloner
-            print(f"Выбран активный клонер: {new_active_cloner}")
+            log.debug("Выбран активный клонер: %s", new_active_cloner)
         
         return {'FINISHED'}
 
@@ -440,7 +419,7 @@ class CLONER_OT_refresh_effector(Operator):
                 return {'CANCELLED'}
                 
             # Check if the effector is linked to the cloner
-            if "linked_effectors" not in cloner_mod.node_group or self.effector_name not in cloner_mod.node_group["linked_effectors"]:
+            if not dependency_manager.is_linked(obj, cloner_mod, effector_mod):
                 self.report({'WARNING'}, f"Effector '{self.effector_name}' is not linked to '{self.cloner_name}'")
                 return {'CANCELLED'}
             
@@ -455,7 +434,7 @@ class CLONER_OT_refresh_effector(Operator):
                 
         else:
             # Refresh all linked effectors
-            if "linked_effectors" not in cloner_mod.node_group or not cloner_mod.node_group["linked_effectors"]:
+            if not dependency_manager.has_effectors(obj, cloner_mod):
                 self.report({'WARNING'}, f"No effectors linked to '{self.cloner_name}'")
                 return {'CANCELLED'}
                 
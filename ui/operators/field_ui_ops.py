@@ -4,6 +4,11 @@ from bpy.props import StringProperty, EnumProperty, FloatProperty, BoolProperty
 
 from ..common.ui_utils import is_element_expanded, set_element_expanded
 from ...operations.helpers.field_params_utils import setup_field_params
+from ...core.utils.modifiers import move_modifier_to_index
+
+from ...core.utils.logging_utils import get_logger
+
+log = get_logger("ui")
 
 class FIELD_OT_toggle_expanded(Operator):
     """Toggle expanded state of a field"""
@@ -27,14 +32,14 @@ class FIELD_OT_create_field(Operator):
     field_type: StringProperty(default="SPHERE")
 
     def execute(self, context):
-        print("Создание сферического поля...")
+        log.debug("Создание сферического поля...")
 
         if not context.active_object:
             self.report({'ERROR'}, "Пожалуйста, выберите объект")
             return {'CANCELLED'}
 
         obj = context.active_object
-        print(f"Создание поля на объекте: {obj.name}")
+        log.debug("Создание поля на объекте: %s", obj.name)
 
         try:
             # Создаем уникальное имя для модификатора
@@ -65,7 +70,7 @@ class FIELD_OT_create_field(Operator):
             # Привязываем пустой объект к полю
             try:
                 mod["Sphere"] = field_empty
-                print(f"Создан пустой объект {field_empty.name} для визуализации поля")
+                log.debug("Создан пустой объект %s для визуализации поля", field_empty.name)
 
                 # Настраиваем размер гизмо в зависимости от параметров поля
                 field_empty.empty_display_size = 2.0  # Базовый размер
@@ -74,13 +79,13 @@ class FIELD_OT_create_field(Operator):
                 field_empty["field_name"] = modifier_name
                 field_empty["field_owner"] = obj.name
             except Exception as e:
-                print(f"Ошибка привязки пустого объекта к полю: {e}")
+                log.error("Ошибка привязки пустого объекта к полю: %s", e)
 
             # Устанавливаем параметры поля из конфигурационного файла
             try:
                 setup_field_params(mod, self.field_type)
             except Exception as e:
-                print(f"Ошибка установки параметров поля: {e}")
+                log.error("Ошибка установки параметров поля: %s", e)
 
             # Перемещаем модификатор поля перед эффекторами
             # для правильного порядка выполнения
@@ -93,11 +98,7 @@ class FIELD_OT_create_field(Operator):
 
             # Если есть эффектор, перемещаем поле перед ним
             if effector_index > 0:
-                # В Blender перемещение происходит последовательно на одну позицию
-                current_index = len(obj.modifiers) - 1  # индекс нового модификатора (последний)
-                while current_index > effector_index:
-                    bpy.ops.object.modifier_move_up(modifier=mod.name)
-                    current_index -= 1
+                move_modifier_to_index(obj, mod, effector_index)
 
             # Выбираем созданный гизмо для удобства
             bpy.ops.object.select_all(action='DESELECT')
@@ -109,7 +110,7 @@ class FIELD_OT_create_field(Operator):
 
         except Exception as e:
             self.report({'ERROR'}, f"Error creating field: {str(e)}")
-            print(f"ERROR: {str(e)}")
+            log.error("%s", str(e))
             return {'CANCELLED'}
 
 
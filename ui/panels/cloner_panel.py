@@ -14,14 +14,20 @@ from ..common.ui_constants import (
     UI_SCALE_Y_LARGE, UI_SCALE_Y_XLARGE,
     UI_STACKED_LABEL_TEXT, UI_STACKED_CHECKBOX_SCALE_Y,
     UI_STACK_PADDING, UI_STACK_RIGHT_PADDING, UI_STACK_ALIGNMENT,
-    UI_CLONER_PANEL_CATEGORY,
-    ICON_LINK, ICON_CLONER,
+    UI_CLONER_PANEL_CATEGORY, UI_STATS_MAX_ROWS,
+    ICON_LINK, ICON_CLONER, ICON_EFFECTOR, ICON_FIELD, ICON_STATS,
+    ICON_INSTANCES, ICON_REALIZE_WARNING, ICON_JOB, ICON_JOB_CANCEL,
     ICON_GRID_CLONER, ICON_LINEAR_CLONER, ICON_CIRCLE_CLONER
 )
 
 from ...models.cloners import CLONER_GROUP_NAMES, CLONER_TYPES, CLONER_NODE_GROUP_PREFIXES
 from ...core.utils.cloner_utils import get_cloner_chain_for_object
 from ...core.common.constants import CLONER_MOD_NAMES
+from ...core.utils.modifier_stats import modifier_stats
+from ...core.utils import instance_accounting
+from ...core.utils import instance_guard
+from ...core.utils import density_scheduler
+from ...core.utils import job_queue
 
 # Обработчик изменения типа источника клонирования
 def update_source_type(self, context):
@@ -53,6 +59,24 @@ def update_source_type(self, context):
     # Сохраняем новый тип в модификаторе
     active_cloner["source_type"] = new_type
 
+def draw_job_progress(layout):
+    """Прогресс и отмена фоновых задач очереди."""
+    jobs = job_queue.active_jobs()
+    if not jobs:
+        return
+
+    box = layout.box()
+    for job in jobs:
+        row = box.row(align=True)
+        text = f"{job.name}: {job.done}/{job.total}"
+        if hasattr(row, "progress"):
+            row.progress(factor=job.progress, type='BAR', text=text)
+        else:
+            row.label(text=f"{text} ({job.progress:.0%})", icon=ICON_JOB)
+        op = row.operator("object.cloner_cancel_job", text="", icon=ICON_JOB_CANCEL)
+        op.job_id = job.id
+
+
 class CLONERS_PT_Main(Panel):
     """Cloners main panel"""
     bl_label = "Cloners"
@@ -64,6 +88,8 @@ class CLONERS_PT_Main(Panel):
     def draw(self, context):
         layout = self.layout
 
+        draw_job_progress(layout)
+
         obj = context.active_object
 
         if obj is None:
@@ -687,6 +713,103 @@ class CLONERS_PT_Main(Panel):
             # Common settings for all cloners
             draw_common_cloner_settings(box, modifier, context)
 
+class CLONERS_PT_Stats(Panel):
+    """Evaluation time of cloner, effector and field modifiers"""
+    bl_label = "Performance"
+    bl_idname = "CLONERS_PT_Stats"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = UI_CLONER_PANEL_CATEGORY
+    bl_parent_id = "CLONERS_PT_Main"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.prop(context.scene, "cloner_stats_enabled", text="")
+
+    def draw(self, context):
+        layout = self.layout
+
+        row = layout.row(align=True)
+        row.operator("object.cloner_reset_modifier_stats", icon='TRASH')
+        row.operator("object.cloner_export_modifier_stats", icon='EXPORT')
+
+        rows = modifier_stats.rows()
+        if not rows:
+            text = "No timings yet" if context.scene.cloner_stats_enabled else "Enable to collect timings"
+            layout.label(text=text, icon=ICON_STATS)
+            return
+
+        kind_icons = {'CLONER': ICON_CLONER, 'EFFECTOR': ICON_EFFECTOR, 'FIELD': ICON_FIELD}
+
+        col = layout.column(align=True)
+        header = col.row()
+        header.label(text="Modifier")
+        header.label(text="Mean / Max, ms")
+        for row_data in rows[:UI_STATS_MAX_ROWS]:
+            row = col.box().row()
+            row.label(text=f"{row_data['object']}: {row_data['modifier']}", icon=kind_icons[row_data['kind']])
+            row.label(text=f"{row_data['mean_ms']:.2f} / {row_data['max_ms']:.2f}")
+
+        if len(rows) > UI_STATS_MAX_ROWS:
+            layout.label(text=f"{len(rows) - UI_STATS_MAX_ROWS} more in export")
+
+
+class CLONERS_PT_Instances(Panel):
+    """Instance counts, realized geometry and estimated memory per cloner"""
+    bl_label = "Instances & Memory"
+    bl_idname = "CLONERS_PT_Instances"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = UI_CLONER_PANEL_CATEGORY
+    bl_parent_id = "CLONERS_PT_Main"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+
+        scene = context.scene
+        guard = layout.box()
+        row = guard.row(align=True)
+        row.prop(scene, "cloner_instance_guard", text="")
+        row.prop(scene, "cloner_instance_budget", text="Budget")
+        estimate = instance_guard.last_estimate
+        if scene.cloner_instance_guard != 'OFF' and estimate["budget"]:
+            icon = ICON_REALIZE_WARNING if estimate["over_budget"] else ICON_INSTANCES
+            guard.label(text=f"Estimated: {estimate['total']} instances", icon=icon)
+            for name in estimate["clamped"][:UI_STATS_MAX_ROWS]:
+                guard.label(text=f"Hidden: {name}", icon='HIDE_ON')
+            if scene.cloner_instance_guard == 'SCALE':
+                scaled = [(name, density) for name, density in density_scheduler.last_allocation.items() if density < 1.0]
+                for name, density in sorted(scaled, key=lambda item: item[1])[:UI_STATS_MAX_ROWS]:
+                    guard.label(text=f"{name}: {density:.0%} in viewport", icon='MOD_DECIM')
+
+        row = layout.row(align=True)
+        row.operator("object.cloner_analyze_instances", icon='VIEWZOOM')
+        row.operator("object.cloner_export_instance_report", icon='EXPORT')
+
+        report = instance_accounting.last_report
+        if report is None or report["scene"] != context.scene.name:
+            layout.label(text="Run analysis to see instance counts", icon=ICON_INSTANCES)
+            return
+
+        totals = report["totals"]
+        box = layout.box()
+        box.label(text=f"Frame {report['frame']}: {totals['instances']} instances, "
+                       f"{totals['realized_vertices']} vertices", icon=ICON_INSTANCES)
+        box.label(text=f"Estimated memory: {instance_accounting.format_bytes(totals['estimated_bytes'])}")
+
+        col = layout.column(align=True)
+        for record in report["cloners"][:UI_STATS_MAX_ROWS]:
+            row = col.box().row()
+            icon = ICON_REALIZE_WARNING if record["flagged"] else ICON_CLONER
+            row.label(text=record["object"], icon=icon)
+            row.label(text=instance_accounting.format_bytes(record["estimated_bytes"]))
+            if record["flagged"]:
+                row.label(text=f"Realize x{record['realize_factor']:.0f}")
+
+        if len(report["cloners"]) > UI_STATS_MAX_ROWS:
+            layout.label(text=f"{len(report['cloners']) - UI_STATS_MAX_ROWS} more in export")
+
 # Регистрация свойств для кастомных групп и состояний UI
 def register_cloner_properties():
     # Keep the property for backwards compatibility, but make it True by default
@@ -750,9 +873,13 @@ def register_cloner_properties():
 # Функции регистрации и отмены регистрации
 def register():
     bpy.utils.register_class(CLONERS_PT_Main)
+    bpy.utils.register_class(CLONERS_PT_Stats)
+    bpy.utils.register_class(CLONERS_PT_Instances)
     register_cloner_properties()
 
 def unregister():
+    bpy.utils.unregister_class(CLONERS_PT_Instances)
+    bpy.utils.unregister_class(CLONERS_PT_Stats)
     bpy.utils.unregister_class(CLONERS_PT_Main)
 
     # Удаление свойств при отмене регистрации